@@ -0,0 +1,117 @@
+"""Benchmarks of the command line chains and of the plotting."""
+import os.path
+import shutil
+import tempfile
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+from click.testing import CliRunner
+
+import postgkyl as pg
+from postgkyl.pgkyl import cli
+from .generate import writeDynvector, writeFrames
+
+
+def _run(args):
+  res = CliRunner().invoke(cli, args)
+  if res.exit_code != 0:
+    raise RuntimeError(res.output)
+  #end
+#end
+
+
+class Chain:
+  """Command chains on a series of 2D p2 frames."""
+  params = (['ev', 'collect', 'integrate', 'interpolate-stream'],)
+  param_names = ['chain']
+  timeout = 300
+
+  def setup(self, chain):
+    self.path = tempfile.mkdtemp()
+    writeFrames(self.path, 'f', 20, (64, 64), poly_order=2)
+    self.files = os.path.join(self.path, 'f_*.gkyl')
+    # Warm up the interpolation matrices
+    _run([os.path.join(self.path, 'f_0.gkyl'), 'interp'])
+  #end
+
+  def teardown(self, chain):
+    shutil.rmtree(self.path)
+  #end
+
+  def time_chain(self, chain):
+    if chain == 'ev':
+      _run([self.files, 'ev', 'f[0:10] f[10:20] - abs 2 pow sqrt'])
+    elif chain == 'collect':
+      _run([self.files, 'collect'])
+    elif chain == 'integrate':
+      _run([self.files, 'interp', 'integrate', '0,1'])
+    else:
+      _run(['--stream', self.files, 'interp', 'integrate', '1',
+            'collect'])
+    #end
+  #end
+#end
+
+
+class FFT:
+  """FFT of a long time trace."""
+  def setup(self):
+    self.path = tempfile.mkdtemp()
+    self.file_name = os.path.join(self.path, 'energy.gkyl')
+    time = np.linspace(0.0, 100.0, 2**18)
+    writeDynvector(self.file_name, time,
+                   np.sin(time)[:, np.newaxis]*np.ones((1, 6)))
+  #end
+
+  def teardown(self):
+    shutil.rmtree(self.path)
+  #end
+
+  def time_fft(self):
+    _run([self.file_name, 'fft'])
+  #end
+#end
+
+
+class Plot:
+  """Rendering of interpolated frames."""
+  params = ([1, 2],)
+  param_names = ['dim']
+
+  def setup(self, dim):
+    self.path = tempfile.mkdtemp()
+    cells = (256,) if dim == 1 else (64, 64)
+    files = writeFrames(self.path, 'f', 4, cells, poly_order=2)
+    self.data = []
+    for fn in files:
+      dat = pg.GData(fn)
+      pg.GInterpModal(dat).interpolate(overwrite=True)
+      self.data.append(dat)
+    #end
+  #end
+
+  def teardown(self, dim):
+    plt.close('all')
+    shutil.rmtree(self.path)
+  #end
+
+  def time_frame(self, dim):
+    fig = plt.figure()
+    pg.output.plot(self.data[0], figure=fig)
+    fig.canvas.draw()
+    plt.close(fig)
+  #end
+
+  def time_frames(self, dim):
+    # Redrawing the same figure, as done for the animations
+    fig = plt.figure()
+    for dat in self.data:
+      fig.clf()
+      pg.output.plot(dat, figure=fig)
+      fig.canvas.draw()
+    #end
+    plt.close(fig)
+  #end
+#end
@@ -0,0 +1,87 @@
+"""Benchmarks of the modal DG interpolation."""
+import numpy as np
+
+import postgkyl as pg
+from postgkyl.data import dg as _dg
+from postgkyl.data.basis import getInterpMatrix
+from postgkyl.data.computeInterpolationMatrices import createInterpMatrix
+
+
+def _makeData(cells, poly_order, basis_type):
+  num_dims = len(cells)
+  num_basis = _dg._getNumNodes(num_dims, poly_order, basis_type)
+  rng = np.random.default_rng(42)
+  data = pg.GData()
+  data.push([np.linspace(0.0, 1.0, c+1) for c in cells],
+            rng.random(tuple(cells) + (num_basis,)))
+  data.ctx['poly_order'] = poly_order
+  data.ctx['basis_type'] = basis_type
+  return data
+#end
+
+
+class InterpMatrix:
+  """Generation of the interpolation matrices."""
+  params = ([(2, 2, 'serendipity', 6), (3, 2, 'serendipity', 4),
+             (4, 1, 'gkhybrid', 4)],)
+  param_names = ['case']
+
+  def time_sympy(self, case):
+    createInterpMatrix(case[0], case[1], case[2], case[3], True)
+  #end
+
+  def time_numeric(self, case):
+    getInterpMatrix(*case)
+  #end
+#end
+
+
+class Interpolate:
+  """Interpolation of the whole dataset."""
+  params = (['sympy', 'numeric', 'kernels'],)
+  param_names = ['engine']
+
+  def setup(self, engine):
+    self.data = _makeData((32, 32, 16), 2, 'serendipity')
+    # Warm up the matrix caches
+    self.time_interpolate(engine)
+  #end
+
+  def time_interpolate(self, engine):
+    if engine == 'kernels':
+      pg.modalDG.interpolate(self.data, overwrite=False)
+    else:
+      dg = pg.GInterpModal(self.data, engine=engine)
+      dg.interpolate()
+    #end
+  #end
+#end
+
+
+class InterpolateND:
+  """Interpolation across the dimensions and polynomial orders.
+
+  The number of cells is chosen for about 2^18 interpolation points.
+  """
+  params = ([1, 2, 3, 4, 5, 6], [1, 2, 3])
+  param_names = ['dim', 'poly_order']
+  timeout = 600
+
+  def setup(self, dim, poly_order):
+    if dim == 6 and poly_order > 1:
+      # Only p1 is available for the 6D modal serendipity basis
+      raise NotImplementedError
+    elif dim == 5 and poly_order == 3:
+      # The (one-off) symbolic generation of this basis takes too long
+      raise NotImplementedError
+    #end
+    num_cells = max(1, int(round(2**(18/dim)/(poly_order+1))))
+    self.data = _makeData((num_cells,)*dim, poly_order, 'serendipity')
+    self.dg = pg.GInterpModal(self.data)
+    self.dg.interpolate() # Warm up the matrix caches
+  #end
+
+  def time_interpolate(self, dim, poly_order):
+    self.dg.interpolate()
+  #end
+#end
@@ -0,0 +1,42 @@
+"""Benchmarks of reading the .gkyl files."""
+import os.path
+import shutil
+import tempfile
+
+import numpy as np
+
+import postgkyl as pg
+from .generate import writeDynvector, writeField, writeModal
+
+
+class ReadGkyl:
+  """Load of a field, a multi-range field, and a dynvector."""
+  params = (['field', 'multirange', 'dynvector'],)
+  param_names = ['file_type']
+
+  def setup(self, file_type):
+    self.path = tempfile.mkdtemp()
+    self.file_name = os.path.join(self.path, 'data.gkyl')
+    if file_type == 'field':
+      writeModal(self.file_name, (64, 64, 16), 2, 'ms')
+    elif file_type == 'multirange':
+      writeModal(self.file_name, (64, 64, 16), 2, 'ms', num_ranges=8)
+    else:
+      time = np.linspace(0.0, 1.0, 200000)
+      writeDynvector(self.file_name, time, np.ones((len(time), 6)),
+                     num_blocks=20)
+    #end
+  #end
+
+  def teardown(self, file_type):
+    shutil.rmtree(self.path)
+  #end
+
+  def time_load(self, file_type):
+    pg.GData(self.file_name)
+  #end
+
+  def time_preload(self, file_type):
+    pg.GData(self.file_name, load=False)
+  #end
+#end
@@ -0,0 +1,106 @@
+"""Generators of synthetic Gkeyll data for the benchmarks.
+
+The files follow the version 1 of the .gkyl format (see
+postgkyl/data/read_gkyl.py): fields (type 1), dynvectors (type 2),
+and multi-range fields (type 3).
+"""
+import os.path
+
+import msgpack as mp
+import numpy as np
+
+from postgkyl.data import dg as _dg
+
+_basisNames = {'ms': 'serendipity', 'mo': 'maximal-order', 'mt': 'tensor'}
+
+
+def _header(fh, file_type, meta):
+  meta = mp.packb(meta) if meta else b''
+  fh.write(b'gkyl0')
+  np.array([1, file_type, len(meta)], np.uint64).tofile(fh)
+  fh.write(meta)
+  np.array([2], np.uint64).tofile(fh) # double
+#end
+
+def _domain(fh, cells, lower, upper, num_comps):
+  num_dims = len(cells)
+  np.array([num_dims], np.uint64).tofile(fh)
+  np.array(cells, np.uint64).tofile(fh)
+  np.array(lower, np.float64).tofile(fh)
+  np.array(upper, np.float64).tofile(fh)
+  np.array([8*num_comps, np.prod(cells)], np.uint64).tofile(fh)
+#end
+
+def writeField(file_name, values, lower, upper, meta=None, num_ranges=1):
+  """Writes a field (type 1) or, with num_ranges > 1, a multi-range
+  field (type 3) split along the first direction.
+
+  Args:
+    file_name (str): Output file name
+    values (ndarray): Array of shape (cells..., num_comps)
+    lower, upper (list): Domain bounds
+    meta (dict): Optional meta data, e.g., 'polyOrder', 'basisType',
+      'time', and 'frame'
+    num_ranges (int): Number of ranges
+  """
+  values = np.ascontiguousarray(values, np.float64)
+  cells = values.shape[:-1]
+  with open(file_name, 'wb') as fh:
+    _header(fh, 1 if num_ranges == 1 else 3, meta)
+    _domain(fh, cells, lower, upper, values.shape[-1])
+    if num_ranges == 1:
+      values.tofile(fh)
+    else:
+      np.array([num_ranges], np.uint64).tofile(fh)
+      bounds = np.linspace(0, cells[0], num_ranges+1).astype(int)
+      for r in range(num_ranges):
+        # The indices are 1-based and inclusive
+        lo = [bounds[r]+1] + [1]*(len(cells)-1)
+        up = [bounds[r+1]] + list(cells[1:])
+        block = values[bounds[r]:bounds[r+1]]
+        np.array(lo + up, np.uint64).tofile(fh)
+        np.array([np.prod(block.shape[:-1])], np.uint64).tofile(fh)
+        np.ascontiguousarray(block).tofile(fh)
+      #end
+    #end
+  #end
+#end
+
+def writeDynvector(file_name, time, values, num_blocks=1):
+  """Writes a dynvector (type 2) in 'num_blocks' appended blocks."""
+  values = np.ascontiguousarray(values, np.float64)
+  bounds = np.linspace(0, len(time), num_blocks+1).astype(int)
+  with open(file_name, 'wb') as fh:
+    for b in range(num_blocks):
+      lo, up = bounds[b], bounds[b+1]
+      _header(fh, 2, None)
+      np.array([8*values.shape[-1], up-lo], np.uint64).tofile(fh)
+      np.asarray(time[lo:up], np.float64).tofile(fh)
+      values[lo:up].tofile(fh)
+    #end
+  #end
+#end
+
+def writeModal(file_name, cells, poly_order=1, basis_type='ms', frame=0,
+               num_ranges=1, seed=0):
+  """Writes random modal DG data with the basis in the meta data."""
+  num_basis = _dg._getNumNodes(len(cells), poly_order,
+                               _basisNames[basis_type])
+  rng = np.random.default_rng(seed + frame)
+  values = rng.standard_normal(tuple(cells) + (num_basis,))
+  meta = {'time': 0.1*frame, 'frame': frame, 'polyOrder': poly_order,
+          'basisType': _basisNames[basis_type]}
+  writeField(file_name, values, [0.0]*len(cells), [1.0]*len(cells),
+             meta, num_ranges)
+#end
+
+def writeFrames(path, name, num_frames, cells, **kwargs):
+  """Writes a series of frames 'name_<frame>.gkyl' into 'path'."""
+  files = []
+  for frame in range(num_frames):
+    fn = os.path.join(path, '{:s}_{:d}.gkyl'.format(name, frame))
+    writeModal(fn, cells, frame=frame, **kwargs)
+    files.append(fn)
+  #end
+  return files
+#end
@@ -0,0 +1,145 @@
+"""Runs the benchmarks and compares them with the stored baselines.
+
+The benchmark classes follow the airspeed velocity (asv) conventions
+('params', 'param_names', 'setup', 'teardown', and the 'time_'
+methods) so the suite can be run with asv as well. This runner is a
+lightweight alternative which does not need a separate environment:
+
+  python -m benchmarks.run                 # run and compare
+  python -m benchmarks.run -k interpolate  # only the matching ones
+  python -m benchmarks.run --save          # update the baselines
+
+The baselines (benchmarks/baselines.json) are machine-dependent; they
+should be updated on the same machine before and after a change so
+that the regressions show up in the review.
+"""
+import argparse
+import importlib
+import itertools
+import json
+import os.path
+import platform
+import re
+import sys
+import timeit
+
+import numpy as np
+
+import postgkyl
+
+path = os.path.dirname(os.path.realpath(__file__))
+baselineFile = os.path.join(path, 'baselines.json')
+
+
+def _benchmarks(pattern):
+  for fn in sorted(os.listdir(path)):
+    if not (fn.startswith('bench_') and fn.endswith('.py')):
+      continue
+    #end
+    module = importlib.import_module('benchmarks.' + fn[:-3])
+    for name, cls in sorted(vars(module).items()):
+      if not isinstance(cls, type) or cls.__module__ != module.__name__:
+        continue
+      #end
+      params = getattr(cls, 'params', [])
+      if params and not isinstance(params[0], (list, tuple)):
+        params = [params]
+      #end
+      for param in itertools.product(*params):
+        for method in sorted(dir(cls)):
+          if not method.startswith('time_'):
+            continue
+          #end
+          key = '{:s}.{:s}.{:s}({:s})'.format(
+            module.__name__.split('.')[-1], name, method,
+            ', '.join(str(p) for p in param))
+          if pattern is None or re.search(pattern, key):
+            yield key, cls, method, param
+          #end
+        #end
+      #end
+    #end
+  #end
+#end
+
+def _time(cls, method, param, repeat):
+  obj = cls()
+  if hasattr(obj, 'setup'):
+    obj.setup(*param)
+  #end
+  try:
+    func = getattr(obj, method)
+    func(*param) # Warm-up
+    return min(timeit.repeat(lambda: func(*param), number=1, repeat=repeat))
+  finally:
+    if hasattr(obj, 'teardown'):
+      obj.teardown(*param)
+    #end
+  #end
+#end
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+  parser.add_argument('-k', dest='pattern',
+                      help='Run only the benchmarks matching the regex')
+  parser.add_argument('-r', '--repeat', type=int, default=3,
+                      help='Number of the timed repeats (default: 3)')
+  parser.add_argument('--threshold', type=float, default=1.5,
+                      help='Slowdown ratio reported as a regression (default: 1.5)')
+  parser.add_argument('--save', action='store_true',
+                      help='Store the results as the new baselines')
+  args = parser.parse_args(argv)
+
+  baselines = {}
+  if os.path.isfile(baselineFile):
+    with open(baselineFile) as fh:
+      baselines = json.load(fh)['results']
+    #end
+  #end
+
+  results = {}
+  regressions = []
+  failures = []
+  for key, cls, method, param in _benchmarks(args.pattern):
+    try:
+      t = _time(cls, method, param, args.repeat)
+    except NotImplementedError: # Skipped, following asv
+      continue
+    except Exception as err:
+      print('{:<60s} FAILED ({:s})'.format(key, str(err).strip()), flush=True)
+      failures.append(key)
+      continue
+    #end
+    results[key] = t
+    line = '{:<60s} {:10.4f} s'.format(key, t)
+    if key in baselines:
+      ratio = t/baselines[key]
+      line += '  {:6.2f}x'.format(ratio)
+      if ratio > args.threshold:
+        line += '  REGRESSION'
+        regressions.append(key)
+      #end
+    #end
+    print(line, flush=True)
+  #end
+
+  if args.save:
+    # Only the benchmarks which were run are updated
+    baselines.update(results)
+    with open(baselineFile, 'w') as fh:
+      json.dump({'machine': {'platform': platform.platform(),
+                             'processor': platform.processor(),
+                             'python': platform.python_version(),
+                             'numpy': np.__version__,
+                             'postgkyl': postgkyl.__version__},
+                 'results': dict(sorted(baselines.items()))},
+                fh, indent=1)
+    #end
+  #end
+  return 1 if regressions or failures else 0
+#end
+
+
+if __name__ == '__main__':
+  sys.exit(main())
+#end
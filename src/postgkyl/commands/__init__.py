@@ -1,51 +1,103 @@
+from importlib import import_module
+
 from .data_space import DataSpace
 
 from . import util
 from . import ev_cmd
 
-from .agyro import agyro
-from .agyro import mom_agyro
-from .animate import animate
-from .bparrotate import bparrotate
-from .bperprotate import bperprotate
-from .collect import collect
-from .current import current
-from .differentiate import differentiate
-from .energetics import energetics
-from .euler import euler
-from .ev import ev
-from .extractinput import extractinput
-from .fft import fft
-from .growth import growth
-from .info import info
-from .integrate import integrate
-from .interpolate import interpolate
-from .laguerre_compose import laguerrecompose
-from .listoutputs import listoutputs
-from .load import load
-from .magsq import magsq
-from .mask import mask
-from .mhd import mhd
-from .parrotate import parrotate
-from .perprotate import perprotate
-from .plot import plot
-from .pr import pr
-from .recovery import recovery
-from .relchange import relchange
-from .select import select
-from .status import activate
-from .status import deactivate
-from .style import style
-from .tenmoment import tenmoment
-from .trajectory import trajectory
-from .val2coord import val2coord
-from .velocity import velocity
-from .write import write
-from .transform_frame import transformframe
-from .gkyl_pkpm import pkpm
-
-from . import temp
+# The commands are imported only when they are used (or when their
+# help is printed) rather than all at once with the package. This
+# keeps the start of 'pgkyl' fast since the commands import the heavy
+# dependencies of the (other) commands in the chain only when needed.
+# For the same reason, the heavy dependencies (matplotlib, scipy,
+# sympy, tables) are imported across the package in the functions
+# which use them.
+# The table maps the pgkyl command names to the module and the
+# function implementing it.
+_commands = {
+  'activate': ('status', 'activate'),
+  'agyro': ('agyro', 'agyro'),
+  'cache': ('result_cache', 'cache'),
+  'animate': ('animate', 'animate'),
+  'collect': ('collect', 'collect'),
+  'current': ('current', 'current'),
+  'deactivate': ('status', 'deactivate'),
+  'dgintegrate': ('dgintegrate', 'dgintegrate'),
+  'differentiate': ('differentiate', 'differentiate'),
+  'energetics': ('energetics', 'energetics'),
+  'euler': ('euler', 'euler'),
+  'ev': ('ev', 'ev'),
+  'extractinput': ('extractinput', 'extractinput'),
+  'fft': ('fft', 'fft'),
+  'growth': ('growth', 'growth'),
+  'info': ('info', 'info'),
+  'integrate': ('integrate', 'integrate'),
+  'interpolate': ('interpolate', 'interpolate'),
+  'laguerrecompose': ('laguerre_compose', 'laguerrecompose'),
+  'listoutputs': ('listoutputs', 'listoutputs'),
+  'load': ('load', 'load'),
+  'magsq': ('magsq', 'magsq'),
+  'mask': ('mask', 'mask'),
+  'mhd': ('mhd', 'mhd'),
+  'mom-agyro': ('agyro', 'mom_agyro'),
+  'pkpm': ('gkyl_pkpm', 'pkpm'),
+  'plot': ('plot', 'plot'),
+  'pr': ('pr', 'pr'),
+  'recovery': ('recovery', 'recovery'),
+  'relchange': ('relchange', 'relchange'),
+  'select': ('select', 'select'),
+  'style': ('style', 'style'),
+  'tenmoment': ('tenmoment', 'tenmoment'),
+  'trajectory': ('trajectory', 'trajectory'),
+  'transformframe': ('transform_frame', 'transformframe'),
+  'val2coord': ('val2coord', 'val2coord'),
+  'velocity': ('velocity', 'velocity'),
+  'write': ('write', 'write'),
+}
+
+# Functions available in the package which are not pgkyl commands
+_functions = {
+  'bparrotate': ('bparrotate', 'bparrotate'),
+  'bperprotate': ('bperprotate', 'bperprotate'),
+  'mom_agyro': ('agyro', 'mom_agyro'),
+  'parrotate': ('parrotate', 'parrotate'),
+  'perprotate': ('perprotate', 'perprotate'),
+}
 
+def _load(name, module, attr):
+  obj = getattr(import_module('.' + module, __name__), attr)
+  # Importing a submodule binds it to the package namespace; most of
+  # the commands share the name with their module so the function is
+  # bound again
+  globals()[name] = obj
+  return obj
+#end
 
+def list_commands():
+  """Returns the names of all the pgkyl commands."""
+  return sorted(_commands)
+#end
 
+def get_command(name):
+  """Returns the pgkyl command 'name' or None if it does not exist."""
+  if name not in _commands:
+    return None
+  #end
+  module, attr = _commands[name]
+  return _load(attr, module, attr)
+#end
 
+def __getattr__(name):
+  for module, attr in _commands.values():
+    if attr == name:
+      return _load(name, module, attr)
+    #end
+  #end
+  if name in _functions:
+    return _load(name, *_functions[name])
+  #end
+  if name == 'temp':
+    return import_module('.temp', __name__)
+  #end
+  raise AttributeError("module '{:s}' has no attribute '{:s}'".format(__name__, name))
+#end
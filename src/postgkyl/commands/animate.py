@@ -1,37 +1,389 @@
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
 import numpy as np
 
 import click
 
 import postgkyl.output.plot as gplot
+from postgkyl.output.plot import _get_nodal_grid
 import postgkyl.data.select as select
+from postgkyl.commands import parallel
 from postgkyl.commands.util import verb_print
 
-def _update(i, data, fig, offsets, kwargs):
-  fig.clear()
+# Maximal number of frames rendered by a worker at once
+_chunkSize = 16
+
+def _title(dat, kwargs):
+  title = ''
+  if not kwargs['notitle']:
+    if dat.ctx['frame'] is not None:
+      title = title + 'F: {:d} '.format(dat.ctx['frame'])
+    #end
+    if dat.ctx['time'] is not None:
+      title = title + 'T: {:.4e}'.format(dat.ctx['time'])
+    #end
+  #end
+  return title
+#end
+
+def _plot(dat, fig, kwargs):
   kwargs['figure'] = fig
+  kwargs['title'] = _title(dat, kwargs)
+  if kwargs['arg'] is not None:
+    return gplot(dat, kwargs['arg'], **kwargs)
+  else:
+    return gplot(dat, **kwargs)
+  #end
+#end
+
+def _squeezed(dat):
+  # The same squeeze of the collapsed dimensions as in 'output.plot'
+  grid = dat.get_grid()
+  values = dat.get_values()
+  cells = dat.get_num_cells()
+  idx = [d for d, c in enumerate(cells) if c <= 1]
+  if bool(idx) and len(idx) < len(cells):
+    grid = [g.squeeze() for d, g in enumerate(grid) if d not in idx]
+    cells = np.delete(cells, idx)
+    values = np.squeeze(values, tuple(idx))
+  #end
+  return grid, cells, values
+#end
+
+
+class Animator(object):
+  """Animates by updating the artists of the first frame in place.
+
+  The figure is plotted once with 'output.plot'; the following frames
+  only swap the data of the lines ('Line2D.set_ydata') and color
+  meshes ('QuadMesh.set_array') and regenerate contours with fixed
+  levels. Frames with a different grid and the modes which cannot be
+  updated (streamlines, quivers, lineouts, contours with automatic
+  levels) are redrawn from scratch.
+  """
+  def __init__(self, data, fig, offsets, kwargs):
+    self.data = data
+    self.fig = fig
+    self.offsets = offsets
+    self.kwargs = kwargs
+    self._records = None
+    self._titles = []
+    # Blitting only redraws the inside of the axes, i.e., the titles,
+    # axis limits, and colorbars have to stay the same
+    shapes = set(dat.get_values().shape for dat in data)
+    self.blit = bool(kwargs['notitle'] and len(shapes) == 1
+                     and not kwargs['redraw']
+                     and not kwargs['float'] and not kwargs['diverging']
+                     and self._kind(data[0]) is not None)
+  #end
+
+  def _kind(self, dat):
+    kw = self.kwargs
+    if kw['streamline'] or kw['quiver'] or kw['group'] is not None:
+      return None
+    elif dat.get_num_dims(squeeze=True) == 1:
+      return 'line'
+    elif kw['contour']:
+      # Contours with automatic levels differ from frame to frame
+      return 'contour' if kw['clevels'] and not kw['float'] else None
+    elif kw['diverging'] and kw['logz']:
+      return None
+    else:
+      return 'mesh'
+    #end
+  #end
+
+  def _artists(self, kind, before):
+    from matplotlib.collections import QuadMesh
+    from matplotlib.contour import ContourSet
+    if kind == 'line':
+      return [l for ax in self.fig.axes for l in ax.lines
+              if l not in before]
+    #end
+    cls = QuadMesh if kind == 'mesh' else ContourSet
+    new = [c for ax in self.fig.axes for c in ax.collections
+           if isinstance(c, cls) and c not in before]
+    # Colorbars of the meshes are QuadMeshes as well
+    cbars = [c.colorbar.ax for c in new if c.colorbar is not None]
+    return [c for c in new if c.axes not in cbars]
+  #end
+
+  def _redraw(self, i):
+    self.fig.clear()
+    self._records = []
+    for n in self.offsets:
+      dat = self.data[i+n]
+      before = set(a for ax in self.fig.axes
+                   for a in list(ax.lines) + list(ax.collections))
+      _plot(dat, self.fig, self.kwargs)
+      kind = self._kind(dat)
+      artists = self._artists(kind, before) if kind else []
+      if self._records is not None and len(artists) == dat.get_num_comps():
+        self._records.append((kind, artists, dat))
+      else:
+        self._records = None
+      #end
+    #end
+    title = self.fig.axes[0].get_title() if self.fig.axes else ''
+    self._titles = [ax.title for ax in self.fig.axes
+                    if title and ax.get_title() == title]
+  #end
 
-  for n in offsets:
-    dat = data[i+n]
-    kwargs['title'] = ''
-    if not kwargs['notitle']:
-      if dat.ctx['frame'] is not None:
-        kwargs['title'] = kwargs['title'] + 'F: {:d} '.format(dat.ctx['frame'])
+  def _matches(self, i):
+    if self._records is None or self.kwargs['redraw']:
+      return False
+    #end
+    for n, (_, _, ref) in zip(self.offsets, self._records):
+      dat = self.data[i+n]
+      if dat.get_values().shape != ref.get_values().shape:
+        return False
       #end
-      if dat.ctx['time'] is not None:
-        kwargs['title'] = kwargs['title'] + 'T: {:.4e}'.format(dat.ctx['time'])
+      for g, gref in zip(dat.get_grid(), ref.get_grid()):
+        if g is not gref and not np.array_equal(g, gref):
+          return False
+        #end
       #end
     #end
-    if kwargs['arg'] is not None:
-      im = gplot(dat, kwargs['arg'], **kwargs)
-    else:
-      im = gplot(dat, **kwargs)
+    return True
+  #end
+
+  def _update_line(self, lines, values):
+    kw = self.kwargs
+    for comp, line in enumerate(lines):
+      line.set_ydata((values[..., comp] + kw['yshift']) * kw['yscale'])
+    #end
+    if kw['ymin'] is None or kw['ymax'] is None:
+      for ax in set(line.axes for line in lines):
+        ax.relim()
+        ax.autoscale_view(scalex=False)
+        if kw['ymin'] is not None or kw['ymax'] is not None:
+          ax.set_ylim(kw['ymin'], kw['ymax'])
+        #end
+      #end
+      self._relayout = True
+    #end
+    return lines
+  #end
+
+  def _update_mesh(self, meshes, values):
+    kw = self.kwargs
+    for comp, mesh in enumerate(meshes):
+      z = (values[..., comp].transpose() + kw['zshift']) * kw['zscale']
+      mesh.set_array(z)
+      if kw['diverging']:
+        zmax = np.abs(z).max()
+        mesh.set_clim(-zmax, zmax)
+        self._relayout = True
+      elif kw['zmin'] is None or kw['zmax'] is None:
+        mesh.norm.vmin, mesh.norm.vmax = kw['zmin'], kw['zmax']
+        mesh.autoscale_None()
+        self._relayout = True
+      #end
+    #end
+    return meshes
+  #end
+
+  def _update_contour(self, contours, dat):
+    kw = self.kwargs
+    grid, cells, values = _squeezed(dat)
+    nodal_grid = _get_nodal_grid(grid, cells)
+    x = (nodal_grid[0] + kw['xshift']) * kw['xscale']
+    y = (nodal_grid[1] + kw['yshift']) * kw['yscale']
+    out = []
+    for comp, cs in enumerate(contours):
+      # Contour lines are not data which could be swapped; the set is
+      # regenerated with the same levels and colors
+      z = (values[..., comp].transpose() + kw['zshift']) * kw['zscale']
+      new = cs.axes.contour(x, y, z, cs.levels, origin='lower',
+                       colors=kw['color'], linewidths=kw['linewidth'],
+                       cmap=None if kw['color'] else cs.cmap,
+                       norm=None if kw['color'] else cs.norm)
+      new.set_animated(cs.get_animated())
+      cs.remove()
+      out.append(new)
+    #end
+    contours[:] = out
+    return out
+  #end
+
+  def __call__(self, i):
+    if not self._matches(i):
+      self._redraw(i)
+      if self._records is None:
+        return self.fig.axes
+      #end
+      return [a for _, artists, _ in self._records for a in artists]
+    #end
+    title = _title(self.data[i+self.offsets[0]], self.kwargs)
+    for t in self._titles:
+      t.set_text(title)
+    #end
+    out = list(self._titles)
+    self._relayout = False
+    for n, (kind, artists, _) in zip(self.offsets, self._records):
+      dat = self.data[i+n]
+      if kind == 'line':
+        out += self._update_line(artists, _squeezed(dat)[2])
+      elif kind == 'mesh':
+        out += self._update_mesh(artists, _squeezed(dat)[2])
+      else:
+        out += self._update_contour(artists, dat)
+      #end
     #end
+    if self._relayout:
+      # The tick labels change with the limits; the layout starts from
+      # the default subplot parameters as for a newly plotted frame so
+      # the result does not depend on the previous frames
+      import matplotlib as mpl
+      self.fig.subplots_adjust(**{k: mpl.rcParams['figure.subplot.' + k]
+                                  for k in ('left', 'right', 'bottom',
+                                            'top', 'wspace', 'hspace')})
+      self.fig.tight_layout()
+    #end
+    return out
+  #end
+#end
+
+def _chunks(num, jobs):
+  # Contiguous chunks of frames; every chunk starts with a full redraw
+  # and holds its frames in memory until they are piped to ffmpeg
+  size = max(1, min(_chunkSize, int(np.ceil(num/jobs))))
+  return [(start, min(start+size, num)) for start in range(0, num, size)]
+#end
+
+def _render(dataList, offsets, kwargs, figsize, numFrames, fName=None):
+  """Renders the frames in the worker processes on the Agg backend.
+
+  Each worker plots its chunks of frames with its own figure. With
+  'fName', the RGBA buffers are piped in order into a single ffmpeg
+  process (set up the same way as the Matplotlib ffmpeg writer);
+  otherwise, the workers write the PNGs of '--saveframes' directly.
+  """
+  import io
+  import multiprocessing
+  import subprocess
+  import matplotlib as mpl
+
+  if fName:
+    from matplotlib.animation import FFMpegWriter, adjusted_figsize
+    fps = kwargs['fps'] or 1000.0/kwargs['interval']
+    writer = FFMpegWriter(fps=fps)
+    writer.outfile = fName
+    outputArgs = writer.output_args # Sets the codec, e.g., for GIFs
+    dpi = kwargs['dpi'] or mpl.rcParams['savefig.dpi']
+    if dpi == 'figure':
+      dpi = mpl.rcParams['figure.dpi']
+    #end
+    w, h = figsize or mpl.rcParams['figure.figsize']
+    w, h = int(w*dpi + 1e-8)/dpi, int(h*dpi + 1e-8)/dpi
+    if writer.codec == 'h264':
+      w, h = adjusted_figsize(w, h, dpi, 2)
+    #end
+    frameSize = (int(w*dpi + 1e-8), int(h*dpi + 1e-8))
+    command = [writer.bin_path(), '-f', 'rawvideo', '-vcodec', 'rawvideo',
+               '-s', '{:d}x{:d}'.format(*frameSize), '-pix_fmt', 'rgba',
+               '-framerate', str(fps), '-loglevel', 'error',
+               '-i', 'pipe:'] + outputArgs
+  #end
+
+  def task(chunk):
+    import matplotlib.pyplot as plt
+    if multiprocessing.parent_process() is not None:
+      plt.switch_backend('agg')
+    #end
+    fig = plt.figure(figsize=figsize)
+    if fName:
+      fig.set_size_inches(w, h)
+    #end
+    animator = Animator(dataList, fig, offsets, kwargs)
+    frames = []
+    for i in range(*chunk):
+      animator(i)
+      if fName:
+        buf = io.BytesIO()
+        fig.savefig(buf, format='rgba', dpi=dpi, transparent=False)
+        frames.append(np.frombuffer(buf.getbuffer(), np.uint8))
+      else:
+        fig.savefig('{:s}_{:d}.png'.format(kwargs['saveframes'], i),
+                    dpi=kwargs['dpi'])
+      #end
+    #end
+    plt.close(fig)
+    return frames
+  #end
+
+  chunks = _chunks(numFrames, kwargs['jobs'])
+  if not fName:
+    for _ in parallel.imap(task, chunks, kwargs['jobs'], arrays=True):
+      pass
+    #end
+    return
+  #end
+  proc = subprocess.Popen(command, stdin=subprocess.PIPE,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+  try:
+    for frames in parallel.imap(task, chunks, kwargs['jobs'], arrays=True):
+      for frame in frames:
+        proc.stdin.write(frame)
+      #end
+    #end
+  except BaseException:
+    proc.kill()
+    proc.wait()
+    raise
+  #end
+  _, err = proc.communicate()
+  if proc.returncode != 0:
+    raise click.ClickException('ffmpeg failed: {:s}'.format(
+      err.decode(errors='replace').strip()))
   #end
-  return(im)
 #end
 
+def _animate(dataList, offsets, kwargs, figsize, fName, figNum, minSize):
+  import matplotlib.pyplot as plt
+  from matplotlib.animation import FFMpegWriter, FuncAnimation
+
+  numFrames = int(np.nanmin((minSize, len(dataList))))
+  if kwargs['saveas']:
+    fName = str(kwargs['saveas'])
+  #end
+  save = bool(kwargs['save'] or kwargs['saveas'])
+  if kwargs['jobs'] > 1 and (kwargs['saveframes'] or
+                             (save and FFMpegWriter.isAvailable())):
+    # Rendered before any figure is created in this process, i.e.,
+    # the workers do not inherit the GUI state
+    _render(dataList, offsets, kwargs, figsize, numFrames,
+            None if kwargs['saveframes'] else fName)
+    save = False
+  #end
+
+  if kwargs['saveframes']:
+    if kwargs['jobs'] <= 1:
+      fig = plt.figure(figNum, figsize=figsize)
+      animator = Animator(dataList, fig, offsets, kwargs)
+      for i in range(numFrames):
+        animator(i)
+        fig.savefig('{:s}_{:d}.png'.format(kwargs['saveframes'], i),
+                    dpi=kwargs['dpi'])
+      #end
+    #end
+    kwargs['show'] = False # do not show in this case
+    return None
+  #end
+
+  if not (save or kwargs['show']):
+    return None
+  #end
+  fig = plt.figure(figNum, figsize=figsize)
+  animator = Animator(dataList, fig, offsets, kwargs)
+  anim = FuncAnimation(fig, animator, numFrames,
+                       interval=kwargs['interval'], blit=animator.blit)
+  if save:
+    anim.save(fName, writer='ffmpeg',
+              fps=kwargs['fps'], dpi=kwargs['dpi'])
+  #end
+  return anim
+#end
+
+
 @click.command()
 @click.option('--use', '-u', default=None,
               help="Specify a tag to plot.")
@@ -151,8 +503,12 @@ def _update(i, data, fig, offsets, kwargs):
               help="Turns on the pgkyl hashtag!")
 @click.option('--show/--no-show', default=True,
               help="Turn showing of the plot ON and OFF (default: ON).")
+@click.option('--redraw', is_flag=True,
+              help="Redraw the whole figure for each frame instead of updating the plotted data.")
 @click.option('--saveframes', type=click.STRING,
               help="Save individual frames as PNGS instead of an animation")
+@click.option('--jobs', '-j', type=click.INT, default=1,
+              help="Render the frames for '--save' and '--saveframes' in parallel processes.")
 @click.option('--figsize',
               help="Comma-separated values for x and y size.")
 @click.pass_context
@@ -163,6 +519,7 @@ def animate(ctx, **kwargs):
   animation ffmpeg needs to be installed.
 
   """
+  import matplotlib.pyplot as plt
   verb_print(ctx, 'Starting animate')
   data = ctx.obj['data']
 
@@ -183,7 +540,7 @@ def animate(ctx, **kwargs):
     vmin = float('inf')
     vmax = float('-inf')
     for dat in ctx.obj['data'].iterator(kwargs['use']):
-      num_dims = dat.get_num_dims()
+      num_dims = dat.get_num_dims(squeeze=True)
       if num_dims == 1:
         val = dat.get_values()*kwargs['yscale']
       else:
@@ -214,7 +571,6 @@ def animate(ctx, **kwargs):
   #end
 
   anims = []
-  figs = []
   kwargs['legend'] = False
 
   figsize = None
@@ -226,7 +582,7 @@ def animate(ctx, **kwargs):
   offsets = [0]
   tagIterator = list(data.tagIterator(kwargs['use']))
   setFigure = False
-  minSize = np.NAN
+  minSize = np.nan
 
   if kwargs['grouptags']:
     for tag in data.tagIterator(kwargs['use']):
@@ -242,68 +598,23 @@ def animate(ctx, **kwargs):
 
     for tag in tagIterator:
       dataList = list(data.iterator(tag=tag))
-      if setFigure:
-        figs.append(plt.figure(figNum, figsize=figsize))
+      if tag is not None:
+        fName = 'anim_{:s}.mp4'.format(tag)
       else:
-        figs.append(plt.figure(figsize=figsize))
+        fName = 'anim.mp4'
       #end
-      if not kwargs['saveframes']:
-        anims.append(FuncAnimation(figs[-1], _update,
-                                   int(np.nanmin((minSize, len(dataList)))),
-                                   fargs=(dataList, figs[-1],
-                                          offsets, kwargs),
-                                   interval=kwargs['interval'], blit=False))
-
-        if tag is not None:
-          fName = 'anim_{:s}.mp4'.format(tag)
-        else:
-          fName = 'anim.mp4'
-        #end
-        if kwargs['saveas']:
-          fName = str(kwargs['saveas'])
-        #end
-        if kwargs['save'] or kwargs['saveas']:
-          anims[-1].save(fName, writer='ffmpeg',
-                         fps=kwargs['fps'], dpi=kwargs['dpi'])
-        #end
-      else:
-        for i in range(int(np.nanmin((minSize, len(dataList))))):
-          _update(i, dataList, figs[-1], offsets, kwargs)
-          plt.savefig('{:s}_{:d}.png'.format(kwargs['saveframes'], i),
-                      dpi=kwargs['dpi'])
-        #end
-        kwargs['show'] = False # do not show in this case
+      anim = _animate(dataList, offsets, kwargs, figsize, fName,
+                      figNum if setFigure else None, minSize)
+      if anim is not None:
+        anims.append(anim)
       #end
     #end
   else:
     dataList = list(data.iterator(tag=kwargs['use']))
-    if setFigure:
-      figs.append(plt.figure(figNum, figsize=figsize))
-    else:
-      figs.append(plt.figure(figsize=figsize))
-    #end
-    if not kwargs['saveframes']:
-      anims.append(FuncAnimation(figs[-1], _update,
-                                 int(np.nanmin((minSize, len(dataList)))),
-                                 fargs=(dataList, figs[-1],
-                                        offsets, kwargs),
-                                 interval=kwargs['interval'], blit=False))
-
-      fName = 'anim.mp4'
-      if kwargs['saveas']:
-        fName = str(kwargs['saveas'])
-      #end
-      if kwargs['save'] or kwargs['saveas']:
-        anims[-1].save(fName, writer='ffmpeg',
-                       fps=kwargs['fps'], dpi=kwargs['dpi'])
-      #end
-    else:
-      for i in range(int(np.nanmin((minSize, len(dataList))))):
-        _update(i, dataList, figs[-1], offsets, kwargs)
-        plt.savefig('{:s}_{:d}.png'.format(kwargs['saveframes'], i),
-                    dpi=kwargs['dpi'])
-      #end
-      kwargs['show'] = False # do not show in this case
+    anim = _animate(dataList, offsets, kwargs, figsize, 'anim.mp4',
+                    None, minSize)
+    if anim is not None:
+      anims.append(anim)
     #end
   #end
 
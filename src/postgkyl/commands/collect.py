@@ -1,9 +1,162 @@
 import click
 import numpy as np
+import tempfile
 
 from postgkyl.data import GData
 from postgkyl.commands.util import verb_print
 
+def _permute(values, order):
+  # In-place 'values[:] = values[order]' with a buffer of a single
+  # frame; the permutation is applied cycle by cycle
+  done = np.zeros(len(order), bool)
+  for start in range(len(order)):
+    if done[start] or order[start] == start:
+      continue
+    #end
+    tmp = values[start].copy()
+    k = start
+    while order[k] != start:
+      done[k] = True
+      values[k] = values[order[k]]
+      k = order[k]
+    #end
+    done[k] = True
+    values[k] = tmp
+  #end
+#end
+
+def _time(dat, i):
+  if dat.ctx['time']:
+    return dat.ctx['time']
+  elif dat.ctx['frame']:
+    return dat.ctx['frame']
+  else:
+    return i
+  #end
+#end
+
+
+class Collector(object):
+  """Collects datasets into a preallocated time-major array.
+
+  Each dataset is written into its slot of the '(num, ...)' array (or
+  its sum with 'sumdata') and can be released afterwards. The array is
+  optionally memory-mapped to a temporary file and it grows when more
+  than 'num' datasets are added.
+  """
+  def __init__(self, num, sumdata=False, memmap=False):
+    self.time = []
+    self.grid = None
+    self.values = None
+    self._num = max(num, 1)
+    self._sumdata = sumdata
+    self._memmap = memmap
+  #end
+
+  def _allocate(self, shape, dtype):
+    if self._memmap:
+      return np.memmap(tempfile.TemporaryFile(), dtype=dtype, mode='w+',
+                       shape=shape)
+    #end
+    return np.empty(shape, dtype)
+  #end
+
+  def add(self, dat, time):
+    values = dat.get_values()
+    if self._sumdata:
+      values = np.nansum(values, axis=tuple(range(dat.get_num_dims())))
+    #end
+    cnt = len(self.time)
+    if self.values is None:
+      self.values = self._allocate((self._num,) + values.shape,
+                                   values.dtype)
+    elif values.shape != self.values.shape[1:]:
+      raise ValueError("Collected datasets need to have the same shape; {} does not match {}".format(values.shape, self.values.shape[1:]))
+    elif cnt == self.values.shape[0]:
+      grown = self._allocate((2*cnt,) + values.shape, self.values.dtype)
+      grown[:cnt] = self.values
+      self.values = grown
+    #end
+    if self.grid is None:
+      self.grid = dat.get_grid().copy()
+    #end
+    self.values[cnt] = values
+    self.time.append(time)
+  #end
+
+  def finish(self, period=None, offset=0.0, sort=True):
+    """Returns the time, the grid, and the values sorted by the time."""
+    time = np.array(self.time)
+    values = self.values[:len(time)]
+    if period is not None:
+      time = (time - offset) % period
+    #end
+    if sort:
+      sortIdx = np.argsort(time)
+      time = time[sortIdx]
+      _permute(values, sortIdx)
+    #end
+    if self._sumdata:
+      grid = [time]
+    else:
+      grid = [np.array(time)] + self.grid
+    #end
+    return time, grid, values
+  #end
+#end
+
+
+class StreamCollect(object):
+  """Collects the frames of the streaming mode as they are processed.
+
+  Used by the streaming ('pgkyl --stream') when 'collect' follows the
+  streamed part of the chain, so that the frames do not need to be
+  kept until the whole series is processed. The datasets with the tags
+  which are not collected are returned to the DataSpace.
+  """
+  def __init__(self, params, numFrames):
+    self._params = params
+    self._numFrames = numFrames
+    self._use = params['use'].split(',') if params['use'] else None
+    self._chunks = {}
+    self._labels = {}
+  #end
+
+  def add(self, datasets, data):
+    for dat in datasets:
+      tag = dat.get_tag()
+      if self._use is not None and tag not in self._use:
+        data.add(dat)
+        continue
+      #end
+      chunks = self._chunks.setdefault(tag, [])
+      chunk = self._params['chunk']
+      cnt = sum(len(c.time) for c in chunks)
+      if not chunks or (chunk and len(chunks[-1].time) == chunk):
+        # Without chunks, the size is estimated from the first frame
+        numPerFrame = len([d for d in datasets if d.get_tag() == tag])
+        num = chunk or self._numFrames*numPerFrame
+        chunks.append(Collector(num, self._params['sumdata'],
+                                self._params['memmap']))
+      #end
+      chunks[-1].add(dat, _time(dat, cnt))
+      self._labels[tag] = dat.get_custom_label()
+    #end
+  #end
+
+  def tags(self):
+    return self._use if self._use is not None else list(self._chunks)
+  #end
+
+  def finish(self, tag):
+    """Returns the list of the collected chunks and the label."""
+    chunks = [c.finish(self._params['period'], self._params['offset'])
+              for c in self._chunks.get(tag, [])]
+    return chunks, self._labels.get(tag)
+  #end
+#end
+
+
 @click.command()
 @click.option('-s', '--sumdata',
               is_flag=True,
@@ -18,6 +171,8 @@ from postgkyl.commands.util import verb_print
               help="Collect into chunks with specified length rather than into a single dataset")
 @click.option('--use', '-u', default=None,
               help='Specify a \'tag\' to apply to (default all tags).')
+@click.option('--memmap', '-m', is_flag=True,
+              help="Collect into a memory-mapped temporary file instead of the memory.")
 @click.option('--tag', '-t', default=None,
               help='Specify a \'tag\' for the result.')
 @click.option('--label', '-l', default=None,
@@ -32,50 +187,27 @@ def collect(ctx, **kwargs):
   """
   verb_print(ctx, 'Starting collect')
   data = ctx.obj['data']
+  # Frames already collected in the streaming mode
+  stream = ctx.obj.pop('collect', None)
 
   if kwargs['tag']:
     outTags = kwargs['tag'].split(',')
   #end
 
   tagCnt = 0
-  for tag in data.tagIterator(kwargs['use']):
-    time = [[]]
-    values = [[]]
-    grid = [[]]
-    cnt = 0
-    label = None
-
-    for i, dat in data.iterator(tag, enum=True):
-      cnt += 1
-      if kwargs['chunk'] and cnt > kwargs['chunk']:
-        cnt = 1
-        time.append([])
-        values.append([])
-        grid.append([])
-      #end
-      if dat.ctx['time']:
-        time[-1].append(dat.ctx['time'])
-      elif dat.ctx['frame']:
-        time[-1].append(dat.ctx['frame'])
-      else:
-        time[-1].append(i)
-      #end
-      val = dat.get_values()
-      if kwargs['sumdata']:
-        numDims = dat.get_num_dims()
-        axis = tuple(range(numDims))
-        values[-1].append(np.nansum(val, axis=axis))
+  tags = stream.tags() if stream else data.tagIterator(kwargs['use'])
+  for tag in tags:
+    try:
+      if stream:
+        chunks, label = stream.finish(tag)
       else:
-        values[-1].append(val)
+        chunks, label = _collect(data, tag, kwargs)
+        data.deactivateAll(tag)
       #end
-      if not grid[-1]:
-        grid[-1] = dat.get_grid().copy()
-      #end
-      label = dat.get_custom_label()
+    except ValueError as err:
+      ctx.fail(click.style("ERROR in collect: {}".format(err), fg='red'))
     #end
 
-    data.deactivateAll(tag)
-
     outTag = tag
     if kwargs['tag']:
       if len(outTags) > 1:
@@ -93,31 +225,41 @@ def collect(ctx, **kwargs):
       label = kwargs['label']
     #end
 
-    for i in range(len(time)):
-      time[i] = np.array(time[i])
-      values[i] = np.array(values[i])
-
-      if kwargs['period'] is not None:
-        time[i] = (time[i] - kwargs['offset']) % kwargs['period']
-      #end
-
-      sortIdx = np.argsort(time[i])
-      time[i] = time[i][sortIdx]
-      values[i] = values[i][sortIdx]
-
-      if kwargs['sumdata']:
-        grid[i] = [time[i]]
-      else:
-        grid[i].insert(0, np.array(time[i]))
-      #end
-
+    for time, grid, values in chunks:
       out = GData(tag=outTag,
                   label=label,
                   comp_grid=ctx.obj['compgrid'])
-      out.push(grid[i], values[i])
+      out.push(grid, values)
       data.add(out)
     #end
   #end
 
   verb_print(ctx, 'Finishing collect')
 #end
+
+def _collect(data, tag, kwargs):
+  # The times are sorted up front and the datasets are written
+  # directly into their slots
+  datasets = list(data.iterator(tag, enum=True))
+  label = None
+  if datasets:
+    label = datasets[-1][1].get_custom_label()
+  #end
+  chunk = kwargs['chunk'] or max(len(datasets), 1)
+  chunks = []
+  for lo in range(0, len(datasets), chunk):
+    part = datasets[lo:lo+chunk]
+    time = np.array([_time(dat, i) for i, dat in part])
+    if kwargs['period'] is not None:
+      time = (time - kwargs['offset']) % kwargs['period']
+    #end
+    sortIdx = np.argsort(time)
+    coll = Collector(len(part), kwargs['sumdata'], kwargs['memmap'])
+    coll.grid = part[0][1].get_grid().copy()
+    for idx in sortIdx:
+      coll.add(part[idx][1], time[idx])
+    #end
+    chunks.append(coll.finish(sort=False))
+  #end
+  return chunks, label
+#end
@@ -0,0 +1,64 @@
+import click
+
+from postgkyl.data import GInterpModal
+from postgkyl.commands.util import verb_print
+from postgkyl.data import GData
+
+@click.command(help='Integrate modal DG data exactly over a specified axis or axes')
+@click.argument('axis', nargs=1, type=click.STRING)
+@click.option('--average', '-a', is_flag=True,
+              help='Divide by the extents of the integrated directions')
+@click.option('--moments', '-m', is_flag=True,
+              help='Compute the M0, M1i, and M2 moments over the (velocity) axes')
+@click.option('--basis_type', '-b',
+              type=click.Choice(['ms', 'mo', 'mt', 'gkhyb', 'pkpmhyb']),
+              help='Specify DG basis.')
+@click.option('--poly_order', '-p', type=click.INT,
+              help='Specify polynomial order.')
+@click.option('--use', '-u',
+              help='Specify a \'tag\' to apply to (default all tags).')
+@click.option('--tag', '-t',
+              help='Optional tag for the resulting array')
+@click.option('--label', '-l',
+              help="Custom label for the result")
+@click.pass_context
+def dgintegrate(ctx, **kwargs):
+  r"""Integrate modal DG data over AXIS (an int, comma separated ints,
+  or a slice 'int:int') directly from the expansion coefficients. The
+  result is the modal DG expansion of the integral in the remaining
+  directions, i.e., it can be interpolated afterwards.
+
+  """
+  verb_print(ctx, 'Starting dgintegrate')
+  data = ctx.obj['data']
+
+  for dat in data.iterator(kwargs['use']):
+    if kwargs['basis_type'] is None and dat.ctx['basis_type'] is None:
+      ctx.fail(click.style("ERROR in dgintegrate: no 'basis_type' was specified and dataset {:s} does not have required ctxdata".format(dat.get_label()), fg='red'))
+    #end
+
+    if kwargs['tag']:
+      # The new dataset shares the coefficients with the original one
+      # until it is overwritten with the integral
+      out = GData(tag=kwargs['tag'],
+                  label=kwargs['label'],
+                  comp_grid=ctx.obj['compgrid'],
+                  ctx=dat.ctx)
+      out.push(dat.get_grid(), dat.get_values())
+      data.add(out)
+    else:
+      out = dat
+    #end
+
+    dg = GInterpModal(out, kwargs['poly_order'], kwargs['basis_type'])
+    out.ctx['poly_order'] = dg.poly_order
+    if kwargs['moments']:
+      dg.moments(kwargs['axis'], overwrite=True)
+    else:
+      dg.integrate(kwargs['axis'], average=kwargs['average'],
+                   overwrite=True)
+    #end
+  #end
+
+  verb_print(ctx, 'Finishing dgintegrate')
+#end
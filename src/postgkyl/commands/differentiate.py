@@ -7,7 +7,7 @@ from postgkyl.data import GData
 
 @click.command(help='Interpolate a derivative of DG data on a uniform mesh')
 @click.option('--basis_type', '-b',
-              type=click.Choice(['ms', 'ns', 'mo']),
+              type=click.Choice(['ms', 'ns', 'mo', 'mt']),
               help='Specify DG basis')
 @click.option('--poly_order', '-p', type=click.INT,
               help='Specify polynomial order')
@@ -54,23 +54,28 @@ def differentiate(ctx, **kwargs):
     if is_modal or dat.ctx['is_modal']:
       dg = GInterpModal(dat,
                         kwargs['poly_order'], kwargs['basis_type'],
-                        kwargs['interp'], kwargs['read'])
+                        kwargs['interp'], read=kwargs['read'])
     else:
       dg = GInterpNodal(dat,
                         kwargs['poly_order'], basis_type,
                         kwargs['interp'], kwargs['read'])
     #end
 
+    numComps = int(dat.get_num_comps() / dg.numNodes)
+    comps = tuple(range(numComps))
+
     if kwargs['tag']:
       out = GData(tag=kwargs['tag'],
                   label=kwargs['label'],
                   comp_grid=ctx.obj['compgrid'],
                   ctx=dat.ctx)
-      grid, values = dg.differentiate(direction=kwargs['direction'])
+      grid, values = dg.differentiate(direction=kwargs['direction'],
+                                      comp=comps)
       out.push(grid, values)
       data.add(out)
     else:
-      dg.differentiate(direction=kwargs['direction'], overwrite=True)
+      dg.differentiate(direction=kwargs['direction'], comp=comps,
+                       overwrite=True)
     #end
   verb_print(ctx, 'Finishing differentiate')
 #end
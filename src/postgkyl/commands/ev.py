@@ -1,6 +1,9 @@
 import click
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import numpy as np
 import importlib
+import os
 from os import path
 import sys
 
@@ -14,69 +17,227 @@ for s in cmdBase.cmds.keys():
   helpStr += " '{:s}',".format(s)
 #end
 
-def _data(ctx, grid_stack, value_stack, ctx_stack, strIn, tags, only_active):
-  strInSplit = strIn.split('[')
-  if strIn[0] == 'f' or strInSplit[0] in tags:
-    tag_nm = None
-    if strInSplit[0] in tags:
-      tag_nm = strInSplit[0]
-      only_active = False
+# The chain is compiled once into expression trees (see '_compile')
+# and the same trees are then evaluated for all the datasets. The
+# maximal subtrees of element-wise operators ('ev_cmd.ufuncs') are
+# fused into single kernels evaluated either with numexpr, when
+# available, or block by block with NumPy so that the temporaries are
+# only of the size of a block instead of the full arrays. Small
+# datasets of the same shape (e.g., a long series of frames) are
+# stacked and evaluated in a single batch; otherwise, the datasets are
+# evaluated in a thread pool.
+try:
+  import numexpr
+except ImportError:
+  numexpr = None
+#end
+
+_blockSize = 2**16 # Number of elements per block of the fused kernels
+_numThreads = os.cpu_count() or 1 # Threads for the datasets
+
+
+class _Node(object):
+  """Node of a compiled chain.
+
+  The 'kind' is one of 'data' (a dataset reference), 'value' (a
+  literal), 'cmd' (an 'ev_cmd.cmds' command), or 'ufunc' (an
+  element-wise operator). The identical subexpressions are compiled
+  into a single node, so the trees are in general acyclic graphs and
+  'uses' holds the kinds of all the parents of a node. The roots of the
+  fused element-wise subtrees additionally hold their 'leaves' and the
+  numexpr 'expr'.
+  """
+  def __init__(self, kind, token, args=(), value=None):
+    self.kind = kind
+    self.token = token
+    self.args = list(args)
+    self.value = value
+    self.uses = []
+    self.leaves = None
+    self.expr = None
+  #end
+
+  def isRoot(self):
+    # The shared element-wise nodes are evaluated once as roots of
+    # their own kernels and enter the kernels of their parents as
+    # leaves
+    return self.kind == 'ufunc' \
+      and (len(self.uses) != 1 or self.uses[0] != 'ufunc')
+  #end
+#end
+
+def _isData(strIn, tags):
+  return strIn[0] == 'f' or strIn.split('[')[0] in tags
+#end
+
+def _literal(strIn):
+  if '(' in strIn or '[' in strIn:
+    return eval(strIn)
+  elif ':' in strIn or ',' in strIn:
+    return str(strIn)
+  else:
+    return np.array(float(strIn))
+  #end
+#end
+
+def _fuse(root):
+  # Collects the leaves of the element-wise subtree and builds the
+  # numexpr expression
+  leaves = {}
+  def walk(node):
+    if node is not root and (node.kind != 'ufunc' or node.isRoot()):
+      if node not in leaves:
+        leaves[node] = len(leaves)
+      #end
+      return 'v{:d}'.format(leaves[node])
     #end
-    setIdx = None
-    if len(strInSplit) >= 2:
-      setIdx = strInSplit[1].split(']')[0]
+    args = [walk(arg) for arg in node.args]
+    template = cmdBase.ufuncs[node.token][1]
+    if template is None or None in args:
+      return None
     #end
-    compIdx = None
-    if len(strInSplit) == 3:
-      compIdx = strInSplit[2].split(']')[0]
+    return template.format(*args)
+  #end
+  root.expr = walk(root)
+  root.leaves = list(leaves)
+#end
+
+@functools.lru_cache(maxsize=32)
+def _compile(chain, tags):
+  """Compiles an RPN chain into expression trees.
+
+  The identical data references and subexpressions become a single
+  node. Returns the tuple of the trees left on the stack and the tuple
+  of the unique data references, which are indexed by the 'ref' of the
+  data nodes; raises ValueError for the invalid chains.
+  """
+  stack, refs, nodes = [], [], {}
+  def push(key, *args, **kwargs):
+    if key not in nodes:
+      nodes[key] = _Node(*args, **kwargs)
     #end
-    ctx_key = None
-    if len(strIn.split('.')) == 2:
-      ctx_key = strIn.split('.')[1]
+    stack.append(nodes[key])
+  #end
+
+  for strIn in filter(None, chain.split(' ')):
+    if _isData(strIn, tags):
+      if ('data', strIn) not in nodes:
+        refs.append(strIn)
+      #end
+      push(('data', strIn), 'data', strIn)
+      stack[-1].ref = refs.index(strIn)
+      continue
     #end
+    try:
+      push(('value', strIn), 'value', strIn, value=_literal(strIn))
+      continue
+    except Exception:
+      pass
+    #end
+    if strIn not in cmdBase.cmds:
+      raise ValueError("Evaluate input '{:s}' represents neither data nor commad".format(strIn))
+    #end
+    numIn = cmdBase.cmds[strIn]['numIn']
+    if len(stack) < numIn:
+      raise ValueError("Evaluate command '{:s}' requires {:d} input(s)".format(strIn, numIn))
+    #end
+    kind = 'ufunc' if strIn in cmdBase.ufuncs else 'cmd'
+    args = stack[len(stack)-numIn:]
+    del stack[len(stack)-numIn:]
+    key = (strIn,) + tuple(id(arg) for arg in args)
+    if key not in nodes:
+      for arg in args:
+        arg.uses.append(kind)
+      #end
+    #end
+    push(key, kind, strIn, args)
+  #end
 
-    grid_stack.append([])
-    value_stack.append([])
-    ctx_stack.append([])
+  visited = set()
+  def mark(node):
+    if node in visited:
+      return
+    #end
+    visited.add(node)
+    if node.isRoot():
+      _fuse(node)
+    #end
+    for arg in node.args:
+      mark(arg)
+    #end
+  #end
+  for node in stack:
+    mark(node)
+  #end
+  return tuple(stack), tuple(refs)
+#end
 
-    for dat in ctx.obj['data'].iterator(tag=tag_nm, select=setIdx,
-                                        only_active=only_active):
-      tag_nm = dat.get_tag()
-      if ctx_key:
-        grid = None
-        if ctx_key in dat.ctx:
-          values = np.array(dat.ctx[ctx_key])
-        else:
-          ctx.fail(click.style("Wrong ctx key '{:s}' specified".format(ctx_key), fg='red'))
-        #end
+def _frameLocal(chain):
+  """Checks whether the chain can be evaluated one frame at a time.
+
+  This is the case when the chain does not select the datasets with an
+  explicit index and references a single tag; otherwise, it combines
+  the datasets of different frames.
+  """
+  names = set()
+  for strIn in filter(None, chain.split(' ')):
+    if strIn[0] != 'f':
+      if strIn in cmdBase.cmds:
+        continue
+      #end
+      try:
+        _literal(strIn)
+        continue
+      except Exception:
+        pass
+      #end
+    #end
+    strInSplit = strIn.split('.')[0].split('[')
+    if len(strInSplit) >= 2 and strInSplit[1].split(']')[0] not in ('', ':'):
+      return False
+    #end
+    names.add(strInSplit[0])
+  #end
+  return len(names) <= 1
+#end
+
+def _data(ctx, strIn, tags, only_active):
+  strInSplit = strIn.split('[')
+  tag_nm = None
+  if strInSplit[0] in tags:
+    tag_nm = strInSplit[0]
+    only_active = False
+  #end
+  setIdx = None
+  if len(strInSplit) >= 2:
+    setIdx = strInSplit[1].split(']')[0]
+  #end
+  compIdx = None
+  if len(strInSplit) == 3:
+    compIdx = strInSplit[2].split(']')[0]
+  #end
+  ctx_key = None
+  if len(strIn.split('.')) == 2:
+    ctx_key = strIn.split('.')[1]
+  #end
+
+  sets = []
+  for dat in ctx.obj['data'].iterator(tag=tag_nm, select=setIdx,
+                                      only_active=only_active):
+    tag_nm = dat.get_tag()
+    if ctx_key:
+      grid = None
+      if ctx_key in dat.ctx:
+        values = np.array(dat.ctx[ctx_key])
       else:
-        grid, values = pselect(dat, comp=compIdx)
+        ctx.fail(click.style("Wrong ctx key '{:s}' specified".format(ctx_key), fg='red'))
       #end
-      grid_stack[-1].append(grid)
-      value_stack[-1].append(values)
-      ctx_stack[-1].append(dat.ctx)
-    #end
-    return True, (tag_nm, setIdx)
-  elif '(' in strIn or '[' in strIn:
-    value_stack.append([eval(strIn)])
-    grid_stack.append([None])
-    ctx_stack.append([{}])
-    return True, ()
-  elif ':' in strIn or ',' in strIn:
-    value_stack.append([str(strIn)])
-    grid_stack.append([None])
-    ctx_stack.append([{}])
-    return True, ()
-  else:
-    try:
-      value_stack.append([np.array(float(strIn))])
-      grid_stack.append([None])
-      ctx_stack.append([{}])
-      return True, ()
-    except Exception:
-      return False, ()
+    else:
+      grid, values = pselect(dat, comp=compIdx)
     #end
+    sets.append((grid, values, dat.ctx))
   #end
+  return sets, (tag_nm, setIdx)
 #end
 
 def _compare(a, b) -> bool:
@@ -87,72 +248,213 @@ def _compare(a, b) -> bool:
   #end
 #end
 
-def _command(ctx, grid_stack, value_stack, ctx_stack, strIn):
-  if strIn in cmdBase.cmds:
-    numIn = cmdBase.cmds[strIn]['numIn']
-    numOut = cmdBase.cmds[strIn]['numOut']
-    func = cmdBase.cmds[strIn]['func']
-  else:
-    return False
+def _merge_ctx(in_ctx):
+  # Compare the ctx data of all the inputs and copy them to a
+  # ctx data dictionary of the output
+  in_ctx = list({id(tmp_ctx): tmp_ctx for tmp_ctx in in_ctx}.values())
+  if len(in_ctx) == 1: # Typically, components of the same dataset
+    return dict(in_ctx[0])
   #end
+  out_ctx = {}
+  remove_list = []
+  for tmp_ctx in in_ctx:
+    for key in tmp_ctx:
+      if key in out_ctx and _compare(tmp_ctx[key], out_ctx[key]):
+        pass # This key has been already copied and
+             # matches the output; no action needed
+      elif key in out_ctx:
+        remove_list.append(key) # There is a discrepancy between
+                                # the ctxdata; set it to remove later
+      else:
+        out_ctx[key] = tmp_ctx[key] # Copy the ctx data
+      #end
+    #end
+  #end
+  # Remove the discrepancies
+  for k in dict.fromkeys(remove_list):
+    out_ctx.pop(k)
+  #end
+  return out_ctx
+#end
 
-  inGrid, inValues, in_ctx, numSets = [], [], [], []
-  for i in range(numIn):
-    inGrid.append(grid_stack.pop())
-    inValues.append(value_stack.pop())
-    in_ctx.append(ctx_stack.pop())
-    numSets.append(len(inValues[-1]))
+def _apply(node, args):
+  # Applies a command to the (grid, values, ctx) of its inputs; the
+  # 'ev_cmd' functions expect the inputs in the stack order, i.e.,
+  # reversed
+  args = args[::-1]
+  outGrid, outValues = cmdBase.cmds[node.token]['func'](
+    [arg[0] for arg in args], [arg[1] for arg in args])
+  return outGrid[0], outValues[0], _merge_ctx([arg[2] for arg in args])
+#end
+
+def _walk(node, leaves, values=True):
+  # Evaluates an element-wise subtree operator by operator; with
+  # 'values=False' only the output grid and ctx are determined
+  if node in leaves:
+    return leaves[node]
+  #end
+  args = [_walk(arg, leaves, values) for arg in node.args]
+  if values:
+    return _apply(node, args)
   #end
-  for i in range(numOut):
-    grid_stack.append([])
-    value_stack.append([])
-    ctx_stack.append([])
+  if len(args) == 1 or node.token == 'pow':
+    grid = args[0][0]
+  else:
+    grid = cmdBase._get_grid(args[1][0], args[0][0])
   #end
+  return grid, None, _merge_ctx([arg[2] for arg in args[::-1]])
+#end
 
-  for setIdx in range(max(numSets)):
-    tmpGrid, tmpValues, tmp_ctx  = [], [], []
-    for i in range(numIn):
-      tmpGrid.append(inGrid[i][min(setIdx,numSets[i]-1)])
-      tmpValues.append(inValues[i][min(setIdx,numSets[i]-1)])
-      tmp_ctx.append(in_ctx[i][min(setIdx,numSets[i]-1)])
-    #end
-    try:
-      outGrid, outValues = func(tmpGrid, tmpValues)
-    except Exception as err:
-      ctx.fail(click.style("{}".format(err), fg='red'))
-    #end
-
-    # Compare the ctx data of all the inputs and copy them to a
-    # ctx data dictionary of the output
-    out_ctx = {}
-    remove_list = []
-    for i in range(numIn):
-      for key in tmp_ctx[i]:
-        if key in out_ctx and _compare(tmp_ctx[i][key], out_ctx[key]): #tmp_ctx[i][k] == out_ctx[k]:
-          pass # This key has been already copied and
-               # matches the output; no action needed
-        elif key in out_ctx:
-          remove_list.append(key) # There is a discrepancy between
-                                # the ctxdata; set it to remove later
-        else:
-          out_ctx[key] = tmp_ctx[i][key] # Copy the ctx data
-        #end
+def _block(node, leaves, out=None):
+  # Evaluates an element-wise subtree on a block; returns the values
+  # and whether they are a temporary which can be reused as the output
+  # buffer
+  if node in leaves:
+    return leaves[node], False
+  #end
+  args = [_block(arg, leaves) for arg in node.args]
+  values = [arg[0] for arg in args]
+  if out is None:
+    shape = np.broadcast_shapes(*(np.shape(v) for v in values))
+    dtype = np.result_type(*values)
+    for v, is_tmp in args:
+      if is_tmp and v.shape == shape and v.dtype == dtype \
+         and dtype.kind in 'fc':
+        out = v
+        break
       #end
     #end
-    # Remove duplicates
-    remove_list = list(dict.fromkeys(remove_list))
-    # Remove the discrepancies
-    for k in remove_list:
-      out_ctx.pop(k)
+  #end
+  return cmdBase.ufuncs[node.token][0](*values, out=out), True
+#end
+
+def _kernel(root, values):
+  # Fused evaluation of an element-wise subtree
+  if numexpr is not None and root.expr is not None \
+     and all(v.dtype.kind in 'fc' for v in values):
+    local_dict = {'v{:d}'.format(i): v for i, v in enumerate(values)}
+    return numexpr.evaluate(root.expr, local_dict=local_dict)
+  #end
+  shape = np.broadcast_shapes(*(v.shape for v in values))
+  if len(shape) == 0:
+    return _block(root, dict(zip(root.leaves, values)))[0]
+  #end
+  step = max(1, _blockSize // max(1, int(np.prod(shape[1:]))))
+  out = None
+  for lo in range(0, shape[0], step):
+    blk = slice(lo, lo+step)
+    leaves = {leaf: v[blk] if v.ndim else v
+              for leaf, v in zip(root.leaves, values)}
+    if out is None:
+      tmp = _block(root, leaves)[0]
+      out = np.empty(shape, tmp.dtype)
+      out[blk] = tmp
+    else:
+      _block(root, leaves, out[blk])
+    #end
+  #end
+  return out
+#end
+
+def _fusable(values):
+  # The fused kernels use the NumPy broadcasting, which matches the
+  # 'ev_cmd' operators only for the same shapes and scalars
+  shapes = set(v.shape for v in values
+               if isinstance(v, np.ndarray) and v.ndim > 0)
+  return len(shapes) <= 1 \
+    and all(isinstance(v, np.ndarray) and v.dtype.kind in 'biufc'
+            for v in values)
+#end
+
+def _evalSet(node, inputs, args):
+  # Evaluates a node for a single dataset
+  if node.kind == 'cmd':
+    return _apply(node, args)
+  elif _fusable([arg[1] for arg in args]):
+    grid, _, out_ctx = _walk(node, dict(zip(inputs, args)), False)
+    return grid, _kernel(node, [arg[1] for arg in args]), out_ctx
+  else:
+    return _walk(node, dict(zip(inputs, args)))
+  #end
+#end
+
+def _batchable(inSets, numSets):
+  # Small inputs of the same shape are evaluated in a batch
+  values = [s[1] for sets in inSets for s in sets]
+  if numSets < 2 or not _fusable(values):
+    return False
+  #end
+  return all(v.size <= _blockSize for v in values)
+#end
+
+def _batch(node, inputs, inSets, numSets):
+  # Stacks the inputs along a new first axis and evaluates the fused
+  # kernel once for all the datasets; the results are its views
+  values = []
+  for sets in inSets:
+    if len(sets) > 1:
+      values.append(np.stack([sets[min(setIdx, len(sets)-1)][1]
+                              for setIdx in range(numSets)]))
+    elif sets[0][1].ndim > 0:
+      values.append(np.broadcast_to(sets[0][1],
+                                    (numSets,) + sets[0][1].shape))
+    else:
+      values.append(sets[0][1])
     #end
+  #end
+  outValues = _kernel(node, values)
+  out = []
+  for setIdx in range(numSets):
+    args = [sets[min(setIdx, len(sets)-1)] for sets in inSets]
+    grid, _, out_ctx = _walk(node, dict(zip(inputs, args)), False)
+    out.append((grid, outValues[setIdx], out_ctx))
+  #end
+  return out
+#end
+
+def _map(func, items):
+  # Evaluates the datasets in threads; NumPy releases the GIL in most
+  # of the array operations
+  if len(items) < 2 or _numThreads < 2:
+    return [func(item) for item in items]
+  #end
+  with ThreadPoolExecutor(min(_numThreads, len(items))) as pool:
+    return list(pool.map(func, items))
+  #end
+#end
+
+def _evaluate(ctx, node, refs, memo):
+  """Evaluates a compiled tree.
 
-    for i in range(numOut):
-      grid_stack[-numOut+i].append(outGrid[i])
-      value_stack[-numOut+i].append(outValues[i])
-      ctx_stack[-numOut+i].append(out_ctx)
+  Returns the list of (grid, values, ctx) for each dataset. The inputs
+  with fewer datasets are broadcast using their last one. The results
+  of the shared nodes are kept in 'memo'.
+  """
+  if node.kind == 'data':
+    return refs[node.ref]
+  elif node.kind == 'value':
+    return [(None, node.value, {})]
+  elif node in memo:
+    return memo[node]
+  #end
+  inputs = node.leaves if node.kind == 'ufunc' else node.args
+  inSets = [_evaluate(ctx, arg, refs, memo) for arg in inputs]
+  numSets = max(len(sets) for sets in inSets)
+  def evalSet(setIdx):
+    args = [sets[min(setIdx, len(sets)-1)] for sets in inSets]
+    return _evalSet(node, inputs, args)
+  #end
+  try:
+    if node.kind == 'ufunc' and _batchable(inSets, numSets):
+      out = _batch(node, inputs, inSets, numSets)
+    else:
+      out = _map(evalSet, range(numSets))
     #end
+  except Exception as err:
+    ctx.fail(click.style("{}".format(err), fg='red'))
   #end
-  return True
+  memo[node] = out
+  return out
 #end
 
 @click.command(help="Manipulate datasets using math expressions. Expressions are specified using Reverse Polish Notation (RPN).\n Supported operators are:" + helpStr[:-1] + ". User-specifed commands can also be used.")
@@ -169,10 +471,6 @@ def ev(ctx, **kwargs):
   verb_print(ctx, 'Starting evaluate')
   data = ctx.obj['data']
 
-  grid_stack, value_stack, ctx_stack = [], [], []
-  chainSplit = kwargs['chain'].split(' ')
-  chainSplit = list(filter(None, chainSplit))
-
   only_active = True
   if kwargs['all']:
     only_active = False
@@ -192,34 +490,44 @@ def ev(ctx, **kwargs):
     label = kwargs['chain']
   #end
 
+  try:
+    trees, refs = _compile(kwargs['chain'], tuple(tags))
+  except ValueError as err:
+    ctx.fail(click.style(str(err), fg='red'))
+  #end
+
+  refSets, refIds = [], []
+  for s in refs:
+    sets, dataId = _data(ctx, s, tags, only_active)
+    refSets.append(sets)
+    refIds.append(dataId)
+  #end
+  # The output goes to the last dataset of the chain
   numDatasetsInChain = 0
   outDataId = ()
-  for s in chainSplit:
-    isData, dataId = _data(ctx, grid_stack, value_stack, ctx_stack, s, tags,
-                           only_active)
-    if isData and len(dataId) > 0 and dataId != outDataId:
-      numDatasetsInChain += 1
-      outDataId = dataId
-    #end
-    if not isData:
-      isCommand = _command(ctx, grid_stack, value_stack, ctx_stack, s)
-    #end
-    if not isData and not isCommand:
-      ctx.fail(click.style("Evaluate input '{:s}' represents neither data nor commad".format(s), fg='red'))
+  for s in filter(None, kwargs['chain'].split(' ')):
+    if _isData(s, tags):
+      dataId = refIds[refs.index(s)]
+      if dataId != outDataId:
+        numDatasetsInChain += 1
+        outDataId = dataId
+      #end
     #end
   #end
 
-  if len(value_stack) == 0:
+  if len(trees) == 0:
     ctx.fail(click.style("Evaluate stack is empty, there is nothing to return", fg='red'))
-  elif len(value_stack) > 1:
+  elif len(trees) > 1:
     click.echo(click.style("WARNING: Length of the evaluate stack is bigger than 1, there is a posibility of unintended behavior", fg='yellow'))
   #end
+  result = _evaluate(ctx, trees[-1], refSets, {})
+
   if numDatasetsInChain == 1 and kwargs['tag'] is None:
     cnt = 0
     tag = outDataId[0]
     for out in ctx.obj['data'].iterator(tag=tag, select=outDataId[1],
                                         only_active=only_active):
-      out.push(grid_stack[-1][cnt], value_stack[-1][cnt])
+      out.push(result[cnt][0], result[cnt][1])
       cnt += 1
     #end
   else:
@@ -229,7 +537,7 @@ def ev(ctx, **kwargs):
     else:
       data.deactivateAll()
     #end
-    for grid, values, data_ctx in zip(grid_stack[-1], value_stack[-1], ctx_stack[-1]):
+    for grid, values, data_ctx in result:
       out = GData(tag=tag,
                   #comp_grid=ctx.obj['compgrid'],
                   label=label,
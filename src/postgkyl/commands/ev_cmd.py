@@ -1,6 +1,8 @@
 import click
 import numpy as np
 
+from postgkyl.tools.calculus import _integrate
+
 
 def _get_grid(grid0, grid1):
   if grid0 is not None and grid1 is not None:
@@ -211,7 +213,7 @@ def grad2(inGrid, inValues):
 
 def integrate(inGrid, inValues, avg=False):
   grid = inGrid[1].copy()
-  values = np.array(inValues[1])
+  values = inValues[1]
 
   axis = inValues[0]
   if isinstance(axis, float):
@@ -226,7 +228,7 @@ def integrate(inGrid, inValues, avg=False):
       axis = tuple([int(a) for a in axes])
     elif len(axis.split(':')) == 2:
       bounds = axis.split(':')
-      axis = tuple(range(bounds[0], bounds[1]))
+      axis = tuple(range(int(bounds[0]), int(bounds[1])))
     elif axis == 'all':
       numDims = len(grid)
       axis = tuple(range(numDims))
@@ -235,22 +237,10 @@ def integrate(inGrid, inValues, avg=False):
     raise TypeError("'axis' needs to be integer, tuple, string of comma separated integers, or a slice ('int:int')")
   #end
 
-  dz = []
-  for d, coord in enumerate(grid):
-    dz.append(coord[1:] - coord[:-1])
-    if len(coord) == values.shape[d]:
-      dz[-1] = np.append(dz[-1], dz[-1][-1])
-    #end
-
-  # Integration assuming values are cell centered averages
-  # Should work for nonuniform meshes
-  for ax in sorted(axis, reverse=True):
-    values = np.moveaxis(values, ax, -1)
-    values = np.dot(values, dz[ax])
-  #end
+  # Single contraction over all the axes; see 'tools.calculus'
+  values = _integrate(grid, values, axis)
   for ax in sorted(axis):
     grid[ax] = np.array([0])
-    values = np.expand_dims(values, ax)
     if avg:
       length = inGrid[1][ax][-1] - inGrid[1][ax][0]
       if len(inGrid[1][ax]) == inValues[1].shape[ax]:
@@ -360,3 +350,26 @@ cmds = { '+' : { 'numIn' : 2, 'numOut' : 1, 'func' : add },
          'div' : { 'numIn' : 1, 'numOut' : 1, 'func' : divergence },
          'curl' : { 'numIn' : 1, 'numOut' : 1, 'func' : curl },
 }
+
+
+# Element-wise operators which 'ev' fuses into a single kernel. The
+# arguments are in the order of the chain, i.e., 'a b -' is 'a - b'.
+# Each entry has the NumPy ufunc and the numexpr template (None when
+# numexpr does not support the operator).
+ufuncs = { '+' : (np.add, '({0} + {1})'),
+           '-' : (np.subtract, '({0} - {1})'),
+           '*' : (np.multiply, '({0} * {1})'),
+           '/' : (np.divide, '({0} / {1})'),
+           'pow' : (np.power, '({0} ** {1})'),
+           'max2' : (np.fmax, None),
+           'min2' : (np.fmin, None),
+           'sqrt' : (np.sqrt, 'sqrt({0})'),
+           'sin' : (np.sin, 'sin({0})'),
+           'cos' : (np.cos, 'cos({0})'),
+           'tan' : (np.tan, 'tan({0})'),
+           'abs' : (np.abs, 'abs({0})'),
+           'log' : (np.log, 'log({0})'),
+           'log10' : (np.log10, 'log10({0})'),
+           'sq' : (np.square, '({0} ** 2)'),
+           'exp' : (np.exp, 'exp({0})'),
+}
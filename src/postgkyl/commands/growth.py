@@ -1,7 +1,6 @@
 import os
 import click
 import numpy as np
-import matplotlib.pyplot as plt
 
 from postgkyl.commands.util import verb_print
 from postgkyl.tools.growth import fitGrowth, exp2
@@ -32,6 +31,7 @@ def growth(ctx, **kwargs):
   data, typically an integrated quantity like electric or magnetic
   field energy.
   """
+  import matplotlib.pyplot as plt
   verb_print(ctx, 'Starting growth')
   data = ctx.obj['data']
 
@@ -1,10 +1,54 @@
 import click
 import numpy as np
+import tempfile
 
 from postgkyl.data import GInterpModal, GInterpNodal
 from postgkyl.commands.util import verb_print
 from postgkyl.data import GData
 
+def _fixedCoord(ctx, value, grid):
+  # Integers are interpreted as cell indices (the cell center is
+  # used) and floats as coordinates
+  try:
+    idx = int(value)
+  except ValueError:
+    coord = float(value)
+    if not grid[0] <= coord <= grid[-1]:
+      ctx.fail(click.style("ERROR in interpolate: coordinate {:s} is outside of the grid ({:e}, {:e})".format(value, grid[0], grid[-1]), fg='red'))
+    #end
+    return coord
+  #end
+  numCells = len(grid)-1
+  if idx < -numCells or idx >= numCells:
+    ctx.fail(click.style("ERROR in interpolate: index {:d} is out of the range of {:d} cells".format(idx, numCells), fg='red'))
+  #end
+  idx = idx % numCells
+  return 0.5*(grid[idx] + grid[idx+1])
+#end
+
+def _atPoints(ctx, dg, zs, numPoints):
+  # Points of a lineout (or a plane); the directions with a fixed
+  # coordinate are reduced to a single point and the free directions
+  # are sampled at the cell centers of the interpolation mesh
+  comp_grid = dg._getCompGrid()
+  grid = []
+  for d in range(dg.numDims):
+    if zs[d] is not None:
+      grid.append(np.array([_fixedCoord(ctx, zs[d], comp_grid[d])]))
+    else:
+      num_cells = len(comp_grid[d])-1
+      num_points = numPoints or num_cells*(dg.poly_order+1)
+      lo, up = comp_grid[d][0], comp_grid[d][-1]
+      dz = (up-lo)/num_points
+      grid.append(np.linspace(lo+0.5*dz, up-0.5*dz, num_points))
+    #end
+  #end
+  mesh = np.meshgrid(*grid, indexing='ij')
+  points = np.stack([m.ravel() for m in mesh], axis=-1)
+  values = dg.evaluate(points)
+  return grid, values.reshape([len(g) for g in grid] + [values.shape[-1]])
+#end
+
 @click.command(help='Interpolate DG data onto a uniform mesh.')
 @click.option('--basis_type', '-b',
               type=click.Choice(['ms', 'ns', 'mo', 'mt', 'gkhyb', 'pkpmhyb']),
@@ -21,11 +65,35 @@ from postgkyl.data import GData
               help="Custom label for the result")
 @click.option('--read', '-r', type=click.BOOL,
               help='Read from general interpolation file.')
+@click.option('--out-of-core', 'outofcore', is_flag=True,
+              help='Stream the interpolation in slabs of cells into a temporary memory-mapped file.')
+@click.option('--jobs', '-j', type=click.INT,
+              help='Number of threads to interpolate with (default: 1).')
+@click.option('--engine', type=click.Choice(['sympy', 'numeric']),
+              default='sympy',
+              help='How the modal interpolation matrices are generated (default: sympy).')
+@click.option('--cellavg', is_flag=True,
+              help='Only return the cell averages of modal data (no interpolation).')
+@click.option('--at', is_flag=True,
+              help='Evaluate modal data only along a line (or a plane) given by the fixed coordinates --z0 to --z5.')
+@click.option('--z0', help='Fixed 0th coordinate for --at (either int index or float coordinate)')
+@click.option('--z1', help='Fixed 1st coordinate for --at (either int index or float coordinate)')
+@click.option('--z2', help='Fixed 2nd coordinate for --at (either int index or float coordinate)')
+@click.option('--z3', help='Fixed 3rd coordinate for --at (either int index or float coordinate)')
+@click.option('--z4', help='Fixed 4th coordinate for --at (either int index or float coordinate)')
+@click.option('--z5', help='Fixed 5th coordinate for --at (either int index or float coordinate)')
+@click.option('--npoints', '-n', type=click.INT,
+              help='Number of points along each free direction for --at (default: cells*(poly_order+1)).')
 @click.pass_context
 def interpolate(ctx, **kwargs):
   verb_print(ctx, 'Starting interpolate')
   data = ctx.obj['data']
 
+  zs = [kwargs['z{:d}'.format(d)] for d in range(6)]
+  if not kwargs['at'] and any(z is not None for z in zs):
+    ctx.fail(click.style("ERROR in interpolate: the fixed coordinates require '--at'", fg='red'))
+  #end
+
   basis_type = None
   is_modal = None
   if kwargs['basis_type'] is not None:
@@ -58,26 +126,73 @@ def interpolate(ctx, **kwargs):
     if is_modal or dat.ctx['is_modal']:
       dg = GInterpModal(dat,
                         kwargs['poly_order'], kwargs['basis_type'],
-                        kwargs['interp'], kwargs['read'])
+                        kwargs['interp'], read=kwargs['read'],
+                        workers=kwargs['jobs'], engine=kwargs['engine'])
     else:
       dg = GInterpNodal(dat,
                         kwargs['poly_order'], basis_type,
-                        kwargs['interp'], kwargs['read'])
+                        kwargs['interp'], kwargs['read'],
+                        workers=kwargs['jobs'])
     #end
 
     numNodes = dg.numNodes
     numComps = int(dat.get_num_comps() / numNodes)
+    comps = tuple(range(numComps))
+
+    if kwargs['cellavg']:
+      if not isinstance(dg, GInterpModal):
+        ctx.fail(click.style("ERROR in interpolate: '--cellavg' requires modal data", fg='red'))
+      #end
+      if kwargs['tag']:
+        out = GData(tag=kwargs['tag'],
+                    label=kwargs['label'],
+                    comp_grid=ctx.obj['compgrid'],
+                    ctx=dat.ctx)
+        grid, values = dg.cell_average(comps)
+        out.push(grid, values)
+        data.add(out)
+      else:
+        dg.cell_average(comps, overwrite=True)
+      #end
+      continue
+    #end
+
+    if kwargs['at']:
+      # Only the cells containing the points are evaluated
+      if not isinstance(dg, GInterpModal):
+        ctx.fail(click.style("ERROR in interpolate: '--at' requires modal data", fg='red'))
+      #end
+      grid, values = _atPoints(ctx, dg, zs, kwargs['npoints'])
+      if kwargs['tag']:
+        out = GData(tag=kwargs['tag'],
+                    label=kwargs['label'],
+                    comp_grid=ctx.obj['compgrid'],
+                    ctx=dat.ctx)
+        out.push(grid, values)
+        data.add(out)
+      else:
+        dat.push(grid, values)
+      #end
+      continue
+    #end
+
+    values_out = None
+    if kwargs['outofcore']:
+      # The temporary file is removed as soon as the memmap is released
+      values_out = np.memmap(tempfile.TemporaryFile(), dtype=np.float64,
+                             mode='w+', shape=dg.getInterpShape(comps))
+    #end
 
     if kwargs['tag']:
       out = GData(tag=kwargs['tag'],
                   label=kwargs['label'],
                   comp_grid=ctx.obj['compgrid'],
                   ctx=dat.ctx)
-      grid, values = dg.interpolate(tuple(range(numComps)))
+      grid, values = dg.interpolate(comps, out=values_out)
       out.push(grid, values)
       data.add(out)
     else:
-      dg.interpolate(tuple(range(numComps)), overwrite=True)
+      dg.interpolate(comps, overwrite=True, out=values_out)
     #end
   #end
   verb_print(ctx, 'Finishing interpolate')
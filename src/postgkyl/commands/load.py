@@ -34,7 +34,26 @@ def _crush(s): # Temp function used as a sorting key
   return tuple(splitted)
 #end
 
-@click.command(hidden=True)
+def get_files(inDataString):
+  """Returns the sorted list of files matching the data string."""
+  # Handling the wildcard characters
+  if '*' in inDataString or '?' in inDataString or '!' in inDataString:
+    files = glob.glob(str(inDataString))
+    files = [f for f in files if f.find('restart') < 0]
+    try:
+      files = sorted(files, key=_crush)
+    except Exception:
+      click.echo(click.style(
+        'WARNING: The loaded files appear to be of different types. Sorting is turned off.',
+        fg='yellow'))
+    #end
+  else:
+    files = [inDataString]
+  #end
+  return files
+#end
+
+@click.command(hidden=True, help='Load the data sets (added automatically for file names).')
 @click.option('--z0', help='Partial file load: 0th coord (either int or slice)')
 @click.option('--z1', help='Partial file load: 1st coord (either int or slice)')
 @click.option('--z2', help='Partial file load: 2nd coord (either int or slice)')
@@ -65,22 +84,7 @@ def load(ctx, **kwargs):
   data = ctx.obj['data']
 
   idx = ctx.obj['inDataStringsLoaded']
-  inDataString = ctx.obj['inDataStrings'][idx]
-
-  # Handling the wildcard characters
-  if '*' in inDataString or '?' in inDataString or '!' in inDataString:
-    files = glob.glob(str(inDataString))
-    files = [f for f in files if f.find('restart') < 0]
-    try:
-      files = sorted(files, key=_crush)
-    except Exception:
-      click.echo(click.style(
-        'WARNING: The loaded files appear to be of different types. Sorting is turned off.',
-        fg='yellow'))
-    #end
-  else:
-    files = [inDataString]
-  #end
+  files = get_files(ctx.obj['inDataStrings'][idx])
 
   # Resolve the local/global variable names and partial loading
   # The local settings take a precedents but a warning is going to appear
@@ -0,0 +1,173 @@
+import ctypes
+import multiprocessing
+from multiprocessing import resource_tracker
+from multiprocessing import shared_memory
+
+import click
+import numpy as np
+
+from postgkyl.commands.util import join_gdata, split_gdata
+
+# Parallel execution of the frame-local part of the command chain
+# ('pgkyl --jobs N'). The worker processes are forked so the parsed
+# command chain does not need to be pickled; the resulting datasets
+# are sent back with their arrays in shared memory and only the small
+# remaining state is pickled.
+
+_task = None
+_arrays = False
+_stop = None
+
+
+class _Block(object):
+  """Shared memory block owned by the array which views it.
+
+  The array keeps this object as its base and, therefore, the block
+  stays mapped as long as the array is alive.
+  """
+  def __init__(self, shm, shape, dtype):
+    self._shm = shm
+    address = ctypes.addressof(ctypes.c_char.from_buffer(shm.buf))
+    self.__array_interface__ = {'shape': tuple(shape), 'typestr': dtype,
+                                'data': (address, False), 'version': 3}
+  #end
+#end
+
+
+def _share(arr):
+  if arr is None:
+    return None
+  #end
+  arr = np.ascontiguousarray(arr)
+  if arr.nbytes == 0:
+    return (None, arr.shape, arr.dtype.str)
+  #end
+  shm = shared_memory.SharedMemory(create=True, size=arr.nbytes)
+  np.ndarray(arr.shape, arr.dtype, buffer=shm.buf)[...] = arr
+  shm.close()
+  return (shm.name, arr.shape, arr.dtype.str)
+#end
+
+def _unshare(desc):
+  if desc is None:
+    return None
+  #end
+  name, shape, dtype = desc
+  if name is None:
+    return np.empty(shape, dtype)
+  #end
+  # The block is unlinked right away; the memory is released once the
+  # array (and its views) are gone
+  shm = shared_memory.SharedMemory(name=name)
+  shm.unlink()
+  return np.asarray(_Block(shm, shape, dtype))
+#end
+
+def _discard(desc):
+  if desc is None or desc[0] is None:
+    return
+  #end
+  shm = shared_memory.SharedMemory(name=desc[0])
+  shm.close()
+  shm.unlink()
+#end
+
+
+def _pack(dat):
+  state, grid, values = split_gdata(dat)
+  if grid is not None:
+    grid = [_share(g) for g in grid]
+  #end
+  return state, grid, _share(values)
+#end
+
+def _unpack(packed):
+  state, grid, values = packed
+  if grid is not None:
+    grid = [_unshare(g) for g in grid]
+  #end
+  return join_gdata(state, grid, _unshare(values))
+#end
+
+def _free(packed):
+  _, grid, values = packed
+  for desc in (grid or []) + [values]:
+    _discard(desc)
+  #end
+#end
+
+def _worker(item):
+  # Exceptions are returned rather than raised; the click ones hold
+  # a context which cannot be pickled and the exit of a pool worker
+  # would leave the pool waiting indefinitely
+  if _stop.is_set():
+    return 'skipped', None
+  #end
+  pack = _share if _arrays else _pack
+  try:
+    return 'ok', [pack(out) for out in _task(item)]
+  except click.ClickException as err:
+    return 'error', err.format_message()
+  except SystemExit as err:
+    return 'exit', err.code
+  #end
+#end
+
+def imap(task, items, jobs, arrays=False):
+  """Applies 'task' to the items in 'jobs' processes.
+
+  Args:
+    task (callable): Function returning a list of GData for an item
+    items (iterable): Items to process
+    jobs (int): Number of processes
+    arrays (bool): The task returns lists of NumPy arrays instead
+
+  Returns:
+    An iterator over the lists of GData, in the order of the items.
+  """
+  global _task, _arrays, _stop
+  if jobs <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+    for item in items:
+      yield task(item)
+    #end
+    return
+  #end
+
+  context = multiprocessing.get_context('fork')
+  _task, _arrays, _stop = task, arrays, context.Event()
+  unpack = _unshare if arrays else _unpack
+  free = _discard if arrays else _free
+  # The workers need to share the tracker of the shared memory blocks
+  # with this process as they are unlinked here
+  resource_tracker.ensure_running()
+  try:
+    with context.Pool(jobs) as pool:
+      results = pool.imap(_worker, items)
+      try:
+        for status, out in results:
+          if status == 'error':
+            raise click.ClickException(out)
+          elif status == 'exit':
+            raise SystemExit(out)
+          #end
+          yield [unpack(packed) for packed in out]
+        #end
+      finally:
+        # When the iteration ends early, the remaining items are
+        # skipped and the blocks already returned are unlinked
+        _stop.set()
+        for status, out in results:
+          if status == 'ok':
+            for packed in out:
+              free(packed)
+            #end
+          #end
+        #end
+      #end
+    #end
+  finally:
+    _task = None
+    _arrays = False
+    _stop = None
+  #end
+#end
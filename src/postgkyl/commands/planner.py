@@ -0,0 +1,374 @@
+from importlib import import_module
+
+import click
+import numpy as np
+
+from postgkyl.commands.util import verb_print
+from postgkyl.data import GInterpModal
+from postgkyl.data.select import _parse_indices, _select_grid
+
+# Planner of the command chain ('pgkyl --plan'). The parsed chain is
+# rewritten before it is executed so that fewer and smaller
+# intermediate arrays are created:
+#   - consecutive element-wise 'ev' steps are fused into one
+#     expression (evaluated as a single kernel, see 'ev._compile')
+#   - 'select' is moved ahead of the element-wise 'ev' steps so it
+#     can be pushed down into the readers (see 'pgkyl._pushdown')
+#   - 'interpolate' followed by 'select' evaluates the DG expansion
+#     only at the selected points
+#   - 'interpolate' followed by 'integrate' integrates the DG
+#     expansion directly from the coefficients (see 'dgintegrate')
+#     and only interpolates the result
+# Each command is described by a logical operation ('_operation') and
+# the rules match pairs of consecutive operations. The 'interpolate'
+# rules become the hidden commands below, which fall back to the
+# original pair of commands when the data are not supported.
+
+# Bases supported by the fused 'interpolate' steps (the short names
+# of 'interpolate --basis_type'; None is the basis stored in the file)
+_bases = (None, 'ms', 'mo', 'mt')
+_basisNames = ('serendipity', 'maximal-order', 'tensor')
+
+
+def _operation(ctx, steps, i):
+  """Returns the logical operation of the i-th step of the chain.
+
+  The operation is a tuple starting with its kind: 'elementwise'
+  (with the data reference of an in-place element-wise 'ev'),
+  'select', 'interpolate', 'integrate', or 'opaque' for everything
+  the planner does not reorder.
+  """
+  command, sub_ctx = steps[i]
+  params = sub_ctx.params
+  if command.name == 'ev':
+    token = _elementwise(params, _tags(steps[:i]))
+    if token:
+      return ('elementwise', token)
+    #end
+  elif command.name == 'select':
+    if not params['tag'] and not params['label']:
+      return ('select',)
+    #end
+  elif command.name == 'interpolate':
+    if not params['tag'] and not params['read'] and not params['cellavg'] \
+       and not params['at'] \
+       and params['basis_type'] in _bases:
+      return ('interpolate',)
+    #end
+  elif command.name == 'integrate':
+    if not params['tag']:
+      return ('integrate',)
+    #end
+  #end
+  return ('opaque',)
+#end
+
+def _tags(steps):
+  # Tags of the datasets created by the steps; used to recognize the
+  # data references in the 'ev' chains
+  tags = set()
+  for _, sub_ctx in steps:
+    if sub_ctx.params.get('tag'):
+      tags.add(sub_ctx.params['tag'])
+    #end
+  #end
+  return tuple(sorted(tags))
+#end
+
+def _dataset(token):
+  # The data reference without the component, e.g., 'f[0]' for 'f[0][1]'
+  return '['.join(token.split('[')[:2])
+#end
+
+def _elementwise(params, tags):
+  # Returns the data reference of an 'ev' which only applies the
+  # element-wise operators to a single reference and scalars, i.e., it
+  # overwrites the dataset in place without changing its grid
+  if params['tag'] or params['all']:
+    return None
+  #end
+  # The module; 'postgkyl.commands.ev' is the command
+  ev = import_module('postgkyl.commands.ev')
+  try:
+    trees, refs = ev._compile(params['chain'], tags)
+  except ValueError:
+    return None
+  #end
+  if len(trees) != 1 or len(refs) != 1 or '.' in refs[0]:
+    return None
+  #end
+  def walk(node):
+    if node.kind == 'value':
+      return np.ndim(node.value) == 0
+    #end
+    return node.kind == 'data' or \
+      (node.kind == 'ufunc' and all(walk(arg) for arg in node.args))
+  #end
+  if walk(trees[0]):
+    return refs[0]
+  #end
+  return None
+#end
+
+def _make(ctx, command, params):
+  # Creates a step of the chain for the hidden commands
+  if 'profiler' in ctx.obj:
+    command = ctx.obj['profiler'].wrap(command)
+  #end
+  sub_ctx = command.make_context(command.name, [], parent=ctx)
+  sub_ctx.params.update(params)
+  return command, sub_ctx
+#end
+
+#---- Rules -----------------------------------------------------------
+# Each rule gets the operations and steps of a pair of consecutive
+# commands and returns the replacement steps with the explanation or
+# None when it does not apply
+
+def _fuseEv(ctx, ops, steps):
+  if ops[0][0] != 'elementwise' or ops[1][0] != 'elementwise' \
+     or ops[1][1] != _dataset(ops[0][1]):
+    return None
+  #end
+  # The second chain takes the result of the first one in place of
+  # its data reference
+  first, second = steps[0][1].params, steps[1][1].params
+  note = "fused ev '{:s}' and ev '{:s}'".format(first['chain'],
+                                                 second['chain'])
+  second['chain'] = ' '.join(first['chain'] if token == ops[1][1] else token
+                             for token in second['chain'].split(' ') if token)
+  return [steps[1]], note
+#end
+
+def _hoistSelect(ctx, ops, steps):
+  if ops[0][0] != 'elementwise' or ops[1][0] != 'select':
+    return None
+  #end
+  # A component of the result cannot be selected before the 'ev'
+  # selects the component of its input
+  if steps[1][1].params['comp'] is not None \
+     and ops[0][1] != _dataset(ops[0][1]):
+    return None
+  #end
+  return [steps[1], steps[0]], 'moved ahead of ev'
+#end
+
+def _interpSelect(ctx, ops, steps):
+  if ops[0][0] != 'interpolate' or ops[1][0] != 'select':
+    return None
+  #end
+  interp, select = steps[0][1].params, steps[1][1].params
+  if select['use'] != interp['use'] \
+     or all(select['z{:d}'.format(d)] is None for d in range(6)):
+    return None
+  #end
+  step = _make(ctx, interpselect,
+               {'interpolate': dict(interp), 'select': dict(select)})
+  return [step], 'evaluates the DG expansion only at the selected points'
+#end
+
+def _interpIntegrate(ctx, ops, steps):
+  if ops[0][0] != 'interpolate' or ops[1][0] != 'integrate':
+    return None
+  #end
+  interp, integrate = steps[0][1].params, steps[1][1].params
+  if integrate['use'] != interp['use']:
+    return None
+  #end
+  step = _make(ctx, interpintegrate,
+               {'interpolate': dict(interp), 'integrate': dict(integrate)})
+  return [step], 'integrates the DG coefficients before interpolating'
+#end
+
+_rules = (_fuseEv, _hoistSelect, _interpSelect, _interpIntegrate)
+
+
+def plan(ctx, chain):
+  """Rewrites the parsed chain.
+
+  The rules are applied to the pairs of consecutive commands until
+  none of them applies anymore.
+
+  Returns:
+    The new chain and a dictionary of the explanations indexed by the
+    ids of the sub-contexts of the rewritten steps.
+  """
+  steps = list(chain)
+  notes = {}
+  changed = True
+  while changed:
+    changed = False
+    for i in range(len(steps)-1):
+      ops = (_operation(ctx, steps, i), _operation(ctx, steps, i+1))
+      for rule in _rules:
+        res = rule(ctx, ops, steps[i:i+2])
+        if res:
+          new, note = res
+          # The explanations of the replaced steps are kept
+          kept = notes.setdefault(id(new[0][1]), [])
+          for _, sub_ctx in steps[i:i+2]:
+            if all(sub_ctx is not s for _, s in new):
+              kept.extend(notes.pop(id(sub_ctx), []))
+            #end
+          #end
+          kept.append(note)
+          steps[i:i+2] = new
+          changed = True
+          break
+        #end
+      #end
+      if changed:
+        break
+      #end
+    #end
+  #end
+  return steps, notes
+#end
+
+def _describe(command, params):
+  # The command with its non-default options as on the command line
+  if command.name in ('interpolate+select', 'interpolate+integrate'):
+    from postgkyl.commands import get_command
+    return ' | '.join(_describe(get_command(name), params[name])
+                      for name in command.name.split('+'))
+  #end
+  words = [command.name]
+  for param in command.params:
+    value = params.get(param.name)
+    if value is None or value is False or value == param.default \
+       or value == ():
+      continue
+    #end
+    if isinstance(param, click.Argument):
+      words.append("'{}'".format(value))
+    elif param.is_flag:
+      words.append(param.opts[0] if value else param.secondary_opts[0])
+    else:
+      words.append('{:s} {}'.format(param.opts[0], value))
+    #end
+  #end
+  return ' '.join(words)
+#end
+
+def explain(ctx, chain, notes):
+  """Prints the chain as it is going to be executed."""
+  inDataStrings = ctx.obj['inDataStrings']
+  numLoads = 0
+  click.echo('Plan:')
+  for i, (command, sub_ctx) in enumerate(chain):
+    line = _describe(command, sub_ctx.params)
+    if command.name == 'load':
+      line = 'load {:s}{:s}'.format(inDataStrings[numLoads], line[4:])
+      numLoads += 1
+    #end
+    click.echo('  {:d}. {:s}'.format(i, line))
+    for note in notes.get(id(sub_ctx), []):
+      click.echo('       ({:s})'.format(note))
+    #end
+  #end
+#end
+
+#---- Fused commands --------------------------------------------------
+def _interpolator(dat, params):
+  # Returns the GInterpModal of 'interpolate' when the fused commands
+  # support the dataset, i.e., modal data on a uniform grid
+  if dat.ctx['grid_type'] != 'uniform':
+    return None
+  #end
+  if params['basis_type'] is None and not dat.ctx['is_modal']:
+    return None
+  #end
+  try:
+    dg = GInterpModal(dat, params['poly_order'], params['basis_type'],
+                      params['interp'], workers=params['jobs'],
+                      engine=params['engine'])
+  except ValueError:
+    return None
+  #end
+  if dg.basis_type not in _basisNames:
+    return None
+  #end
+  return dg
+#end
+
+def _fallback(ctx, *steps):
+  # Executes the original commands
+  from postgkyl.commands import get_command
+  for name, params in steps:
+    ctx.invoke(get_command(name), **params)
+  #end
+#end
+
+@click.command('interpolate+select', hidden=True)
+@click.pass_context
+def interpselect(ctx, interpolate, select):
+  """Interpolate followed by select; only the selected points are
+  evaluated."""
+  verb_print(ctx, 'Starting interpolate+select')
+  data = ctx.obj['data']
+
+  datasets = list(data.iterator(interpolate['use']))
+  dgs = [_interpolator(dat, interpolate) for dat in datasets]
+  if None in dgs:
+    _fallback(ctx, ('interpolate', interpolate), ('select', select))
+    return
+  #end
+
+  zs = tuple(select['z{:d}'.format(d)] for d in range(6))
+  for dat, dg in zip(datasets, dgs):
+    comps = np.arange(int(dg.numEqns))
+    grid = dg.getInterpGrid()
+    grid_idx, values_idx = _parse_indices(grid, dg.getInterpShape(tuple(comps)),
+                                          zs, select['comp'])
+    # The interpolated values are the expansion at the centers of the
+    # sub-cells
+    centers = [0.5*(g[1:]+g[:-1])[idx] for g, idx in zip(grid, values_idx)]
+    comps = tuple(int(c) for c in np.atleast_1d(comps[values_idx[-1]]))
+    points = np.meshgrid(*centers, indexing='ij')
+    values = dg.evaluate(np.stack([p.ravel() for p in points], axis=-1),
+                         comps)
+    dat.push(_select_grid(grid, grid_idx),
+             values.reshape(points[0].shape + (len(comps),)))
+  #end
+  verb_print(ctx, 'Finishing interpolate+select')
+#end
+
+@click.command('interpolate+integrate', hidden=True)
+@click.pass_context
+def interpintegrate(ctx, interpolate, integrate):
+  """Interpolate followed by integrate; the coefficients are
+  integrated exactly and only the result is interpolated."""
+  verb_print(ctx, 'Starting interpolate+integrate')
+  data = ctx.obj['data']
+
+  datasets = list(data.iterator(interpolate['use']))
+  dgs = [_interpolator(dat, interpolate) for dat in datasets]
+  if None in dgs:
+    _fallback(ctx, ('interpolate', interpolate), ('integrate', integrate))
+    return
+  #end
+
+  for dat, dg in zip(datasets, dgs):
+    comps = tuple(range(int(dg.numEqns)))
+    grid = dg.getInterpGrid()
+    axes = dg._getAxes(integrate['axis'])
+    saved = {key: dat.ctx[key] for key in ('basis_type', 'poly_order')}
+    dg.integrate(axes, overwrite=True)
+    if len(axes) < dg.numDims:
+      # Interpolation in the remaining directions with the reduced
+      # basis
+      rem = GInterpModal(dat, dg.poly_order, None, interpolate['interp'],
+                         workers=interpolate['jobs'],
+                         engine=interpolate['engine'])
+      _, values = rem.interpolate(comps)
+      values = np.expand_dims(values, axes)
+    else:
+      values = dat.get_values()
+    #end
+    # The integrated directions are kept as in 'tools.integrate'
+    dat.push([np.array([g.mean()]) if d in axes else g
+              for d, g in enumerate(grid)], values)
+    dat.ctx.update(saved)
+  #end
+  verb_print(ctx, 'Finishing interpolate+integrate')
+#end
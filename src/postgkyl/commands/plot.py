@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 import numpy as np
 import click
 
@@ -140,6 +139,7 @@ def plot(ctx, **kwargs):
   it to PNG files. Plot labels can use a sub-set of LaTeX math
   commands placed between dollar ($) signs.
   """
+  import matplotlib.pyplot as plt
   verb_print(ctx, 'Starting plot')
 
   kwargs['rcParams'] = ctx.obj['rcParams']
@@ -0,0 +1,183 @@
+import copy
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import click
+
+try:
+  import resource
+except ImportError: # Not available on Windows
+  resource = None
+#end
+
+# Per-command instrumentation of the chain ('pgkyl --profile'). Each
+# invocation of a command records its wall and CPU time, the bytes
+# read, the peak resident memory, the memory allocated (tracemalloc),
+# and the number of active datasets after it. In the streaming mode a
+# command is invoked once per frame and the records are summed; with
+# '--jobs', the work done in the worker processes is not included.
+# Note that tracing the allocations slows down the commands; it is
+# not used with cProfile.
+
+def _readBytes():
+  # Bytes read by the process (including the page cache hits)
+  try:
+    with open('/proc/self/io') as fh:
+      for line in fh:
+        if line.startswith('rchar:'):
+          return int(line.split()[1])
+        #end
+      #end
+    #end
+  except OSError:
+    pass
+  #end
+  return None
+#end
+
+def _peakRSS():
+  if resource is None:
+    return None
+  #end
+  rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  # kB on Linux and B on macOS
+  return rss if sys.platform == 'darwin' else rss*1024
+#end
+
+class Profiler(object):
+  """Records the resources used by the commands of the chain.
+
+  Args:
+    output (str): Optional output file; '.json' for the Chrome trace
+      event format (with all the records in the 'args') and '.pstats'
+      or '.prof' for the cProfile statistics of the whole chain
+  """
+  def __init__(self, output=None):
+    self._output = output
+    self._records = []
+    self._start = time.perf_counter()
+    self._cprofile = None
+    if output and output.endswith(('.pstats', '.prof')):
+      import cProfile
+      self._cprofile = cProfile.Profile()
+      self._cprofile.enable()
+    else:
+      tracemalloc.start()
+    #end
+  #end
+
+  def wrap(self, command):
+    """Returns a copy of the command which records its invocations."""
+    wrapped = copy.copy(command)
+    def invoke(sub_ctx):
+      return self._invoke(command, sub_ctx)
+    #end
+    wrapped.invoke = invoke
+    return wrapped
+  #end
+
+  def _invoke(self, command, sub_ctx):
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+      tracemalloc.reset_peak()
+      mem0, _ = tracemalloc.get_traced_memory()
+    #end
+    read0 = _readBytes()
+    cpu0 = time.process_time()
+    wall0 = time.perf_counter()
+
+    rv = command.invoke(sub_ctx)
+
+    wall1 = time.perf_counter()
+    cpu1 = time.process_time()
+    read1 = _readBytes()
+    record = {
+      'command': command.name,
+      'id': id(sub_ctx),
+      'start': wall0 - self._start,
+      'wall': wall1 - wall0,
+      'cpu': cpu1 - cpu0,
+      'read': None if read0 is None else read1 - read0,
+      'peak_rss': _peakRSS(),
+      'alloc': None,
+      'peak_alloc': None,
+      'datasets': sub_ctx.obj['data'].getNumDatasets(),
+    }
+    if tracing:
+      mem1, peak = tracemalloc.get_traced_memory()
+      record['alloc'] = mem1 - mem0
+      record['peak_alloc'] = peak - mem0
+    #end
+    self._records.append(record)
+    return rv
+  #end
+
+  def _summarize(self):
+    # Records of the same command in the chain (e.g., for each frame)
+    # are combined
+    rows = {}
+    for r in self._records:
+      if r['id'] not in rows:
+        rows[r['id']] = dict(r, calls=0, wall=0.0, cpu=0.0, read=r['read'] and 0,
+                             alloc=r['alloc'] and 0, peak_alloc=r['peak_alloc'] and 0)
+      #end
+      row = rows[r['id']]
+      row['calls'] += 1
+      for key in ('wall', 'cpu', 'read', 'alloc'):
+        if r[key] is not None:
+          row[key] += r[key]
+        #end
+      #end
+      for key in ('peak_rss', 'peak_alloc'):
+        if r[key] is not None:
+          row[key] = max(row[key], r[key])
+        #end
+      #end
+      row['datasets'] = r['datasets']
+    #end
+    return list(rows.values())
+  #end
+
+  def finish(self):
+    """Prints the summary table and writes the output file."""
+    if self._cprofile is not None:
+      self._cprofile.disable()
+      self._cprofile.dump_stats(self._output)
+    #end
+    if tracemalloc.is_tracing():
+      tracemalloc.stop()
+    #end
+
+    def mb(value):
+      return '{:12.2f}'.format(value/2**20) if value is not None else '{:>12s}'.format('-')
+    #end
+    rows = self._summarize()
+    width = max([16] + [len(row['command'])+2 for row in rows])
+    click.echo('{:<{w}s}{:>6s}{:>10s}{:>10s}{:>12s}{:>12s}{:>12s}{:>12s}{:>10s}'.format(
+      'Command', 'Calls', 'Wall [s]', 'CPU [s]', 'Read [MB]', 'RSS [MB]',
+      'Alloc [MB]', 'Peak [MB]', 'Datasets', w=width))
+    for row in rows:
+      click.echo('{:<{w}s}{:6d}{:10.3f}{:10.3f}{:s}{:s}{:s}{:s}{:10d}'.format(
+        row['command'], row['calls'], row['wall'], row['cpu'],
+        mb(row['read']), mb(row['peak_rss']), mb(row['alloc']),
+        mb(row['peak_alloc']), row['datasets'], w=width))
+    #end
+
+    if self._output and self._cprofile is None:
+      pid = os.getpid()
+      events = []
+      for r in self._records:
+        args = {k: v for k, v in r.items() if k not in ('command', 'id', 'start')}
+        events.append({'name': r['command'], 'cat': 'command', 'ph': 'X',
+                       'ts': r['start']*1e6, 'dur': r['wall']*1e6,
+                       'pid': pid, 'tid': 0, 'args': args})
+      #end
+      with open(self._output, 'w') as fh:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, fh, indent=1)
+      #end
+    #end
+  #end
+#end
@@ -13,7 +13,7 @@ from postgkyl.data import GData
 @click.option('--label', '-l',
               help="Custom label for the result")
 @click.option('--basis_type', '-b',
-              type=click.Choice(['ms', 'ns', 'mo']),
+              type=click.Choice(['ms', 'mo', 'mt']),
               help='Specify DG basis')
 @click.option('--poly_order', '-p', type=click.INT,
               help='Specify polynomial order')
@@ -28,35 +28,24 @@ def recovery(ctx, **kwargs):
   verb_print(ctx, 'Starting recovery')
   data = ctx.obj['data']
 
-  if kwargs['basis_type'] is not None:
-    if kwargs['basis_type'] == 'ms' or kwargs['basis_type'] == 'ns':
-      basis_type = 'serendipity'
-    elif kwargs['basis_type'] == 'mo':
-      basis_type = 'maximal-order'
-    #end
-  else:
-    basis_type = None
-  #end
-
   for dat in data.iterator(kwargs['use']):
     dg = GInterpModal(dat,
-                      kwargs['poly_order'], basis_type,
+                      kwargs['poly_order'], kwargs['basis_type'],
                       kwargs['interp'], kwargs['periodic'])
     numNodes = dg.numNodes
     numComps = int(dat.get_num_comps() / numNodes)
+    comps = tuple(range(numComps))
 
-    #verb_print(ctx, 'interplolate: interpolating dataset #{:d}'.format(s))
-    #dg.recovery(tuple(range(numComps)), stack=True)
     if kwargs['tag']:
       out = GData(tag=kwargs['tag'],
                   label=kwargs['label'],
                   comp_grid=ctx.obj['compgrid'],
                   ctx=dat.ctx)
-      grid, values = dg.recovery(0, kwargs['c1'])
+      grid, values = dg.recovery(comps, kwargs['c1'])
       out.push(grid, values)
       data.add(out)
     else:
-      dg.recovery(0, kwargs['c1'], overwrite=True)
+      dg.recovery(comps, kwargs['c1'], overwrite=True)
     #end
   #end
   verb_print(ctx, 'Finishing recovery')
@@ -0,0 +1,262 @@
+import hashlib
+import os
+import os.path
+import pickle
+import shutil
+import tempfile
+
+import click
+import numpy as np
+
+from postgkyl import __version__
+from postgkyl.commands.data_space import DataSpace
+from postgkyl.commands.load import get_files
+from postgkyl.commands.util import join_gdata, split_gdata, verb_print
+from postgkyl.data.xform_store import getCacheDir
+
+# Persistent cache of the command chain results ('pgkyl --cache'). The
+# state of the DataSpace after a stage like 'interpolate' or 'collect'
+# is stored under a key combining the loaded files (path, size, and
+# modification time), the commands up to the stage with their options,
+# and the Postgkyl version. A later run of a chain starting the same
+# way restores the longest stored prefix instead of executing it.
+
+# Commands which only depend on their inputs and options and have no
+# other effect; only the chains made of these can be restored
+_pure = ('activate', 'collect', 'deactivate', 'dgintegrate',
+         'differentiate', 'ev', 'fft', 'integrate', 'interpolate',
+         'load', 'magsq', 'recovery', 'select')
+# Commands after which the results are stored
+_stages = ('collect', 'dgintegrate', 'integrate', 'interpolate')
+# Global options changing the results
+_globalOptions = ('z0', 'z1', 'z2', 'z3', 'z4', 'z5', 'component',
+                  'compgrid', 'varname', 'c2p', 'stream')
+
+_defaultSize = 2048 # MB
+
+def getResultDir():
+  return os.path.join(getCacheDir(), 'results')
+#end
+
+def getMaxSize():
+  """Returns the cache size limit in bytes ($POSTGKYL_CACHE_SIZE in MB)."""
+  return int(float(os.environ.get('POSTGKYL_CACHE_SIZE', _defaultSize))*2**20)
+#end
+
+def _stat(fn):
+  st = os.stat(fn)
+  return (os.path.abspath(fn), st.st_size, st.st_mtime_ns)
+#end
+
+def _normalize(params):
+  out = []
+  for name, value in sorted(params.items()):
+    # Files given as options (e.g., c2p) are identified the same way
+    # as the loaded ones
+    if isinstance(value, str) and os.path.isfile(value):
+      value = _stat(value)
+    #end
+    out.append((name, value))
+  #end
+  return repr(out)
+#end
+
+def _entrySize(path):
+  return sum(os.path.getsize(os.path.join(path, fn))
+             for fn in os.listdir(path))
+#end
+
+def _loadArray(fn):
+  try:
+    # Copy-on-write so the commands can modify the values in place
+    return np.load(fn, mmap_mode='c')
+  except ValueError: # Empty arrays cannot be memory-mapped
+    return np.load(fn)
+  #end
+#end
+
+class ResultCache(object):
+  """Stores and restores the DataSpace after the stages of a chain.
+
+  Args:
+    ctx: Context of the pgkyl command group
+    chain (list): Parsed chain of (command, sub-context) pairs
+  """
+  def __init__(self, ctx, chain):
+    self._ctx = ctx
+    self._path = getResultDir()
+    self._keys = []
+    # The keys are computed incrementally for all the prefixes of the
+    # chain made of the pure commands
+    h = hashlib.sha256(__version__.encode())
+    options = {k: ctx.params.get(k) for k in _globalOptions}
+    # The streaming drops the inactive datasets; the number of jobs
+    # does not change the results
+    options['stream'] = ctx.params['stream'] or ctx.params['jobs'] > 1
+    h.update(_normalize(options).encode())
+    numLoads = 0
+    for command, sub_ctx in chain:
+      if command.name not in _pure:
+        break
+      #end
+      h.update(command.name.encode())
+      h.update(_normalize(sub_ctx.params).encode())
+      if command.name == 'load':
+        try:
+          files = get_files(ctx.obj['inDataStrings'][numLoads])
+          h.update(repr([_stat(fn) for fn in files]).encode())
+        except OSError:
+          break
+        #end
+        numLoads += 1
+      #end
+      self._keys.append((command.name, numLoads, h.hexdigest()))
+    #end
+  #end
+
+  def restore(self):
+    """Restores the longest stored prefix of the chain.
+
+    Returns:
+      The number of the commands which do not need to be executed.
+    """
+    for i in reversed(range(len(self._keys))):
+      name, numLoads, key = self._keys[i]
+      path = os.path.join(self._path, key)
+      if name in _stages and os.path.isdir(path):
+        try:
+          data = self._read(path)
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+          continue
+        #end
+        os.utime(path) # Last use for the LRU eviction
+        self._ctx.obj['data'] = data
+        self._ctx.obj['inDataStringsLoaded'] = numLoads
+        verb_print(self._ctx, 'Restored the first {:d} commands from the cache'.format(i+1))
+        return i+1
+      #end
+    #end
+    return 0
+  #end
+
+  def store(self, i):
+    """Stores the results after the i-th command if it is a stage."""
+    if i >= len(self._keys) or self._keys[i][0] not in _stages:
+      return
+    #end
+    key = self._keys[i][2]
+    path = os.path.join(self._path, key)
+    if os.path.isdir(path):
+      return
+    #end
+    # The cache is optional; failing to write it is not an error
+    try:
+      os.makedirs(self._path, exist_ok=True)
+      tmp = tempfile.mkdtemp(dir=self._path, prefix='.tmp')
+      try:
+        self._write(tmp, self._ctx.obj['data'])
+        os.rename(tmp, path)
+      except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+      #end
+      verb_print(self._ctx, 'Stored the results of {:s} in the cache'.format(self._keys[i][0]))
+      evict(getMaxSize())
+    except OSError:
+      pass
+    #end
+  #end
+
+  def _write(self, path, data):
+    index = []
+    for i, dat in enumerate(data.iterator(only_active=False)):
+      state, grid, values = split_gdata(dat)
+      numGrid = None
+      if grid is not None:
+        numGrid = len(grid)
+        for d, g in enumerate(grid):
+          np.save(os.path.join(path, '{:d}_grid{:d}.npy'.format(i, d)), g)
+        #end
+      #end
+      if values is not None:
+        np.save(os.path.join(path, '{:d}_values.npy'.format(i)), values)
+      #end
+      index.append((state, numGrid, values is not None))
+    #end
+    with open(os.path.join(path, 'index.pkl'), 'wb') as fh:
+      pickle.dump(index, fh)
+    #end
+  #end
+
+  def _read(self, path):
+    with open(os.path.join(path, 'index.pkl'), 'rb') as fh:
+      index = pickle.load(fh)
+    #end
+    data = DataSpace()
+    for i, (state, numGrid, hasValues) in enumerate(index):
+      grid, values = None, None
+      if numGrid is not None:
+        grid = [_loadArray(os.path.join(path, '{:d}_grid{:d}.npy'.format(i, d)))
+                for d in range(numGrid)]
+      #end
+      if hasValues:
+        values = _loadArray(os.path.join(path, '{:d}_values.npy'.format(i)))
+      #end
+      data.add(join_gdata(state, grid, values))
+    #end
+    return data
+  #end
+#end
+
+def evict(max_size):
+  """Removes the least recently used entries above 'max_size' bytes."""
+  path = getResultDir()
+  if not os.path.isdir(path):
+    return
+  #end
+  entries = []
+  for key in os.listdir(path):
+    entry = os.path.join(path, key)
+    if not key.startswith('.') and os.path.isdir(entry):
+      entries.append((os.path.getmtime(entry), _entrySize(entry), entry))
+    #end
+  #end
+  total = sum(e[1] for e in entries)
+  for mtime, size, entry in sorted(entries):
+    if total <= max_size:
+      break
+    #end
+    shutil.rmtree(entry, ignore_errors=True)
+    total -= size
+  #end
+#end
+
+@click.command()
+@click.argument('action', type=click.Choice(['clear', 'info']))
+@click.pass_context
+def cache(ctx, **kwargs):
+  """Manage the cache of the results ('pgkyl --cache'). 'clear' removes
+  all the stored results and 'info' prints the location and the size
+  of the cache. The size limit can be set (in MB) with the
+  POSTGKYL_CACHE_SIZE environment variable.
+  """
+  verb_print(ctx, 'Starting cache')
+  path = getResultDir()
+  if kwargs['action'] == 'clear':
+    shutil.rmtree(path, ignore_errors=True)
+  else:
+    numEntries, size = 0, 0
+    if os.path.isdir(path):
+      for key in os.listdir(path):
+        if not key.startswith('.'):
+          numEntries += 1
+          size += _entrySize(os.path.join(path, key))
+        #end
+      #end
+    #end
+    click.echo('Cache: {:s}'.format(path))
+    click.echo('Entries: {:d}; Size: {:.1f} MB (limit {:.1f} MB)'.format(
+      numEntries, size/2**20, getMaxSize()/2**20))
+  #end
+  verb_print(ctx, 'Finishing cache')
+#end
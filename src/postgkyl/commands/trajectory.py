@@ -1,8 +1,5 @@
-import matplotlib.pyplot as plt
 import math
 import numpy as np
-from mpl_toolkits.mplot3d import Axes3D
-from matplotlib.animation import FuncAnimation
 
 import click
 
@@ -12,6 +9,7 @@ from postgkyl.commands.util import verb_print
 def update(i, ax, ctx, leap, vel,
            xmin, xmax, ymin, ymax, zmin, zmax,
            tag):
+  import matplotlib.pyplot as plt
   colors = ['C0', 'C1', 'C2', 'C3', 'C4',
             'C5', 'C6', 'C7', 'C8', 'C9']
 
@@ -143,6 +141,9 @@ def update(i, ax, ctx, leap, vel,
               help='Specify a \'tag\' to apply to (default all tags).')
 @click.pass_context
 def trajectory(ctx, **kwargs):
+  import matplotlib.pyplot as plt
+  from mpl_toolkits.mplot3d import Axes3D
+  from matplotlib.animation import FuncAnimation
   verb_print(ctx, 'Starting trajectory')
   data = ctx.obj['data']
 
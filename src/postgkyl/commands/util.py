@@ -4,6 +4,8 @@ import sys
 from cycler import cycler
 import click
 
+from postgkyl.data import GData
+
 def verb_print(ctx, message):
   if ctx.obj['verbose']:
     elapsedTime = time() - ctx.obj['startTime']
@@ -27,3 +29,22 @@ def load_style(ctx, fn):
   #end
   fh.close()
 #end
+
+def split_gdata(dat):
+  """Splits GData into its (picklable) state, grid, and values."""
+  state = dict(dat.__dict__)
+  # The reader is only needed during the initialization
+  state.pop('_reader', None)
+  grid = state.pop('_grid')
+  values = state.pop('_values')
+  return state, grid, values
+#end
+
+def join_gdata(state, grid, values):
+  """Creates GData from the output of 'split_gdata'."""
+  dat = GData.__new__(GData)
+  dat.__dict__.update(state)
+  dat._grid = grid
+  dat._values = values
+  return dat
+#end
@@ -3,7 +3,7 @@ import click
 from postgkyl.commands.util import verb_print
 from postgkyl.data import GData
 
-@click.command()
+@click.command(help='Compute the flow velocity from the density and momentum.')
 @click.option('--density', '-d',
               default='density', show_default=True,
               help="Tag for density")
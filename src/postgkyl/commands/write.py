@@ -37,6 +37,10 @@ def write(ctx, **kwargs):
   #end
 
   num_files = data.getNumDatasets(tag=kwargs['use'])
+  # In the streaming mode, the files are numbered across the frames
+  # load by load as in the regular mode
+  frame, num_frames = ctx.obj.get('stream', (0, 1))
+  num_files = num_frames*num_files
   for i, dat in data.iterator(tag=kwargs['use'],
                               enum=True):
     out_name = '{:s}.{:s}'.format(fn, mode)
@@ -45,7 +49,7 @@ def write(ctx, **kwargs):
       cleaning = False
     else:
       if num_files > 1:
-        out_name = '{:s}_{:d}.{:s}'.format(fn, i, mode)
+        out_name = '{:s}_{:d}.{:s}'.format(fn, i*num_frames+frame, mode)
       #end
     #end
 
@@ -4,9 +4,15 @@ from .gdata import GData
 #from .dg import GInterpZeroOrder
 from .dg import GInterpNodal
 from .dg import GInterpModal
-# import interpolation matrices computation
-from . import computeInterpolationMatrices
-from . import computeDerivativeMatrices
+# The interpolation matrices computation (sympy) is slow to import and
+# is therefore only loaded on the first access
+def __getattr__(name):
+  if name in ('computeInterpolationMatrices', 'computeDerivativeMatrices'):
+    import importlib
+    return importlib.import_module('.' + name, __name__)
+  #end
+  raise AttributeError("module '{:s}' has no attribute '{:s}'".format(__name__, name))
+#end
 # import select
 from .select import select
 
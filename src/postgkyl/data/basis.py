@@ -0,0 +1,253 @@
+import numpy as np
+
+# The modal bases supported by Postgkyl are polynomials of at most
+# degree 'poly_order' in each direction (degree 2 in the parallel
+# velocity direction of the hybrid bases). Values of a basis function
+# on a tensor mesh of (poly_order+1) points per direction therefore
+# define it uniquely and the basis can be evaluated anywhere in the
+# reference cell using tensor Lagrange interpolation through these
+# values. This allows to reuse the (already verified) interpolation
+# matrices rather than maintaining another set of basis definitions.
+
+_basisMatrices = {}
+
+def getNumNodes1D(dim, poly_order, basis_type):
+  """Returns the number of the reference points in each direction."""
+  numNodes = [poly_order+1]*dim
+  if basis_type == 'gkhybrid':
+    # 1x1v, 1x2v, 2x2v, 3x2v cases, with p=2 in the first velocity dim.
+    vpardir = 1 if (dim==2 or dim==3) else (2 if dim==4 else (3 if dim==5 else 99))
+    if vpardir < dim:
+      numNodes[vpardir] = poly_order+2
+    #end
+  elif basis_type == 'hybrid':
+    numNodes[-1] = poly_order+2
+  #end
+  return numNodes
+#end
+
+def getRefNodes(num):
+  """Returns the cell-centered reference points used by createInterpMatrix."""
+  return -1.0*(num-1)/num + 2.0*np.arange(num)/num
+#end
+
+def _getBasisMatrix(dim, poly_order, basis_type):
+  key = (dim, poly_order, basis_type)
+  if key not in _basisMatrices:
+    from postgkyl.data.computeInterpolationMatrices import createInterpMatrix
+    mat = createInterpMatrix(dim, poly_order, basis_type, poly_order+1,
+                             True)
+    mat = np.ascontiguousarray(mat)
+    mat.flags.writeable = False
+    _basisMatrices[key] = mat
+  #end
+  return _basisMatrices[key]
+#end
+
+def lagrange1D(nodes, x):
+  """Evaluates the 1D Lagrange polynomials through 'nodes' at 'x'.
+
+  Returns:
+    weights (ndarray): Array of shape (len(x), len(nodes))
+  """
+  x = np.atleast_1d(np.asarray(x, np.float64))
+  weights = np.ones((x.shape[0], len(nodes)))
+  for j, xj in enumerate(nodes):
+    for m, xm in enumerate(nodes):
+      if m != j:
+        weights[:, j] *= (x-xm)/(xj-xm)
+      #end
+    #end
+  #end
+  return weights
+#end
+
+def lagrangeND(numNodes, xi):
+  """Evaluates tensor Lagrange polynomials at points 'xi'.
+
+  The node index is ordered with the first direction changing the
+  fastest, i.e., the same way as the rows of the interpolation
+  matrices.
+
+  Args:
+    numNodes (list): Number of reference points in each direction
+    xi (ndarray): Reference coordinates of shape (num_points, dim)
+  """
+  xi = np.atleast_2d(xi)
+  weights = lagrange1D(getRefNodes(numNodes[0]), xi[:, 0])
+  for d in range(1, len(numNodes)):
+    w = lagrange1D(getRefNodes(numNodes[d]), xi[:, d])
+    weights = (w[:, :, np.newaxis]*weights[:, np.newaxis, :]).reshape(xi.shape[0], -1)
+  #end
+  return weights
+#end
+
+def evalBasis(dim, poly_order, basis_type, xi):
+  """Evaluates a modal DG basis at points in the reference cell.
+
+  Args:
+    dim (int): Number of dimensions
+    poly_order (int): Polynomial order
+    basis_type (str): 'serendipity', 'maximal-order', 'tensor',
+      'gkhybrid', or 'hybrid'
+    xi (ndarray): Reference coordinates in [-1, 1] of shape
+      (num_points, dim)
+
+  Returns:
+    values (ndarray): Basis functions at the points of shape
+      (num_points, num_basis)
+  """
+  mat = _getBasisMatrix(dim, poly_order, basis_type)
+  numNodes = getNumNodes1D(dim, poly_order, basis_type)
+  return np.dot(lagrangeND(numNodes, xi), mat)
+#end
+
+_projMatrices = {}
+
+def getReducedBasisType(dim, basis_type, axes):
+  """Returns the basis type after integrating out 'axes'."""
+  if basis_type in ('gkhybrid', 'hybrid'):
+    # The hybrid bases are serendipity in all but the parallel
+    # velocity direction
+    numNodes = getNumNodes1D(dim, 1, basis_type)
+    vpardir = int(np.argmax(numNodes))
+    if numNodes[vpardir] == 2 or vpardir in axes:
+      return 'serendipity'
+    #end
+    raise ValueError(
+      "The parallel velocity direction ({:d}) of the '{:s}' basis must be integrated".
+      format(vpardir, basis_type))
+  #end
+  return basis_type
+#end
+
+def getProjectionMatrix(dim, poly_order, basis_type, axes,
+                        weight_axis=None, weight_power=0):
+  """Projects the integral of the basis over 'axes' onto the reduced basis.
+
+  For an orthonormal modal basis phi_k and the reduced orthonormal
+  basis psi_j of the remaining directions, the matrix is
+
+    P[j, k] = int psi_j(xi_r) xi_w^weight_power phi_k(xi) dxi,
+
+  where the integral is over the whole reference cell. The integral of
+  an expansion over the reference cell 'axes' is then given by P times
+  the expansion coefficients, exactly, with Gauss-Legendre
+  quadrature.
+
+  Args:
+    dim (int): Number of dimensions
+    poly_order (int): Polynomial order
+    basis_type (str): Basis type
+    axes (tuple): Directions integrated over
+    weight_axis (int): Direction of an optional polynomial weight
+    weight_power (int): Power of the weight (0, 1, or 2)
+
+  Returns:
+    mat (ndarray): Array of shape (num_basis_reduced, num_basis)
+  """
+  axes = tuple(sorted(axes))
+  key = (dim, poly_order, basis_type, axes, weight_axis, weight_power)
+  if key in _projMatrices:
+    return _projMatrices[key]
+  #end
+  rem = [d for d in range(dim) if d not in axes]
+
+  # Enough points for the product of the basis, the reduced basis, and
+  # the weight
+  numQuad = max(getNumNodes1D(dim, poly_order, basis_type)) + 2
+  x1, w1 = np.polynomial.legendre.leggauss(numQuad)
+  xi = np.stack([m.ravel() for m in np.meshgrid(*[x1]*dim, indexing='ij')],
+                axis=-1)
+  wq = np.ones(xi.shape[0])
+  for m in np.meshgrid(*[w1]*dim, indexing='ij'):
+    wq *= m.ravel()
+  #end
+  if weight_axis is not None:
+    wq *= xi[:, weight_axis]**weight_power
+  #end
+
+  phi = evalBasis(dim, poly_order, basis_type, xi)
+  if len(rem) > 0:
+    redBasis = getReducedBasisType(dim, basis_type, axes)
+    psi = evalBasis(len(rem), poly_order, redBasis, xi[:, rem])
+  else:
+    psi = np.ones((xi.shape[0], 1))
+  #end
+  mat = np.dot(psi.transpose()*wq, phi)
+  mat[np.abs(mat) < 1e-14] = 0.0
+  mat.flags.writeable = False
+  _projMatrices[key] = mat
+  return mat
+#end
+
+def getInterpMatrix(dim, poly_order, basis_type, nodes):
+  """Generates an interpolation matrix numerically.
+
+  This is equivalent to createInterpMatrix for modal data, i.e., the
+  rows correspond to a tensor mesh of reference points with the first
+  direction changing the fastest, but it does not require the
+  symbolic computation for each number of points.
+
+  Args:
+    dim (int): Number of dimensions
+    poly_order (int): Polynomial order
+    basis_type (str): Basis type
+    nodes (int or ndarray): Number of the (cell-centered) reference
+      points in each direction or the reference points themselves.
+      For the hybrid bases, an int refers to the non-hybrid
+      directions and one more point is used in the parallel velocity
+      direction.
+
+  Returns:
+    mat (ndarray): Array of shape (num_points, num_basis)
+  """
+  if np.ndim(nodes) == 0:
+    numNodes = getNumNodes1D(dim, int(nodes)-1, basis_type)
+    nodes1D = [getRefNodes(n) for n in numNodes]
+  else:
+    nodes1D = [np.asarray(nodes, np.float64)]*dim
+  #end
+  mesh = np.meshgrid(*nodes1D, indexing='ij')
+  xi = np.stack([m.ravel(order='F') for m in mesh], axis=-1)
+  return evalBasis(dim, poly_order, basis_type, xi)
+#end
+
+def getLegendreMatrix(dim, poly_order, basis_type):
+  """Projects a modal basis onto the tensor Legendre basis.
+
+  The rows correspond to the products of the orthonormal 1D Legendre
+  polynomials of degrees up to 'poly_order' with the index of the last
+  direction changing the fastest. The projection is exact for the
+  bases with at most degree 'poly_order' in each direction, i.e., all
+  but the hybrid ones.
+
+  Returns:
+    mat (ndarray): Array of shape ((poly_order+1)^dim, num_basis)
+  """
+  key = ('legendre', dim, poly_order, basis_type)
+  if key in _projMatrices:
+    return _projMatrices[key]
+  #end
+  x1, w1 = np.polynomial.legendre.leggauss(poly_order+2)
+  # Orthonormal Legendre polynomials at the quadrature points
+  leg1 = np.polynomial.legendre.legvander(x1, poly_order)
+  leg1 = leg1*np.sqrt(np.arange(poly_order+1)+0.5)
+
+  mesh = np.meshgrid(*[x1]*dim, indexing='ij')
+  xi = np.stack([m.ravel() for m in mesh], axis=-1)
+  idx = np.stack([m.ravel() for m in np.meshgrid(*[np.arange(len(x1))]*dim,
+                                                   indexing='ij')], axis=-1)
+  leg = leg1[idx[:, 0]]
+  wq = w1[idx[:, 0]]
+  for d in range(1, dim):
+    leg = (leg[:, :, np.newaxis]*leg1[idx[:, d]][:, np.newaxis, :]).reshape(xi.shape[0], -1)
+    wq = wq*w1[idx[:, d]]
+  #end
+  phi = evalBasis(dim, poly_order, basis_type, xi)
+  mat = np.dot(leg.transpose()*wq, phi)
+  mat[np.abs(mat) < 1e-14] = 0.0
+  mat.flags.writeable = False
+  _projMatrices[key] = mat
+  return mat
+#end
@@ -1,14 +1,18 @@
 import os.path
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
 
-import tables
 import numpy as np
 
 from postgkyl.data import GData
-from postgkyl.data.computeInterpolationMatrices import createInterpMatrix
-from postgkyl.data.computeDerivativeMatrices import createDerivativeMatrix
 
 from postgkyl.data.recovData import recovC0Fn, recovC1Fn, recovEdFn
+from postgkyl.data.basis import evalBasis, getInterpMatrix
+from postgkyl.data.basis import getLegendreMatrix, getProjectionMatrix
+from postgkyl.data.basis import getReducedBasisType
+from postgkyl.data.xform_store import loadXformMatrix
 
 path = os.path.dirname(os.path.realpath(__file__))
 
@@ -72,7 +76,44 @@ def _getNumNodes(dim, poly_order, basis_type):
 #end
 
 
-def _loadInterpMatrix(dim, poly_order, basis_type, interp, read, modal, c2p=False):
+# The matrices are expensive to create (symbolic evaluation) and are
+# reused for every component, direction, and dataset
+_matrixCache = {}
+
+def _freeze(mat):
+  mat = np.ascontiguousarray(mat)
+  mat.flags.writeable = False
+  return mat
+#end
+
+def _loadInterpMatrix(dim, poly_order, basis_type, interp, read, modal,
+                      c2p=False, engine='sympy'):
+  # The 'numeric' engine generates the modal matrices from the basis
+  # values (see data/basis.py) instead of the symbolic computation
+  if engine == 'numeric' and modal and not c2p and not read:
+    if interp is None:
+      interp = poly_order+1
+    #end
+    key = ('numeric', int(dim), int(poly_order), basis_type, int(interp))
+    if key not in _matrixCache:
+      _matrixCache[key] = _freeze(
+        getInterpMatrix(int(dim), int(poly_order), basis_type, int(interp)))
+    #end
+    return _matrixCache[key]
+  elif engine not in ('sympy', 'numeric'):
+    raise ValueError("GInterp: unknown engine '{}'".format(engine))
+  #end
+  key = ('interp', int(dim), int(poly_order), basis_type,
+         None if interp is None else int(interp), read, modal, c2p)
+  if key not in _matrixCache:
+    _matrixCache[key] = _freeze(
+      _createInterpMatrix(dim, poly_order, basis_type, interp, read, modal, c2p))
+  #end
+  return _matrixCache[key]
+#end
+
+def _createInterpMatrix(dim, poly_order, basis_type, interp, read, modal, c2p=False):
+  from postgkyl.data.computeInterpolationMatrices import createInterpMatrix
   if (interp is not None and read is None) or c2p:
     if interp is None:
       interp = poly_order+1
@@ -89,45 +130,28 @@ def _loadInterpMatrix(dim, poly_order, basis_type, interp, read, modal, c2p=Fals
     mat = createInterpMatrix(dim, poly_order, 'hybrid', poly_order+1, True, c2p)
     return mat
   else:
-    # Load interpolation matrix from the pre-computed HDF5 file.
-    varid = 'xformMatrix%i%i' % (dim, poly_order)
-    if modal == False and basis_type.lower() == 'serendipity':
-      fileName = path + '/xformMatricesNodalSerendipity.h5'
-    elif modal and basis_type.lower() == 'serendipity':
-      fileName = path + '/xformMatricesModalSerendipity.h5'
-
-    elif modal and basis_type.lower() == 'maximal-order':
-      fileName = path + '/xformMatricesModalMaximal.h5'
-    else:
-      raise NameError(
-        "GInterp: Basis {:s} is not supported!\n"
-        "Supported basis are currently 'ns' (Nodal Serendipity), "
-        "'ms' (Modal Serendipity), and 'mo' (Modal Maximal Order)".
-        format(basis_type))
-    #end
-    fh = tables.open_file(fileName)
-    mat = fh.root.matrices._v_children[varid].read()
-    fh.close()
-    return mat.transpose()
+    # Precomputed (or generated and persisted) HDF5 matrices
+    return loadXformMatrix(dim, poly_order, basis_type, modal)
   #end
 #end
 
 
 def _loadDerivativeMatrix(dim, poly_order, basis_type, interp, read, modal=True):
-  if interp is not None and read is None:
-    mat = createDerivativeMatrix(dim, poly_order, basis_type, interp, modal)
-    return mat
-  else:
+  if interp is None or read is not None:
     interp = poly_order+1
+  #end
+  key = ('derivative', int(dim), int(poly_order), basis_type, int(interp), modal)
+  if key not in _matrixCache:
+    from postgkyl.data.computeDerivativeMatrices import createDerivativeMatrix
     mat = createDerivativeMatrix(dim, poly_order, basis_type, interp, modal)
-    return mat
+    _matrixCache[key] = _freeze(mat)
   #end
+  return _matrixCache[key]
 #end
 
 
 def _makeMesh(nInterp, Xc, xlo=None, xup=None, gridType=None):
   nx = Xc.shape[0]-1 # expecting nodal mesh
-  meshOut = np.zeros(nInterp*nx+1)
   if gridType is None or gridType=="uniform":
     if xlo is None or xup is None:
       xlo = Xc[0]
@@ -136,42 +160,84 @@ def _makeMesh(nInterp, Xc, xlo=None, xup=None, gridType=None):
     meshOut = np.linspace(xlo, xup, nInterp*nx+1)
   elif gridType=="mapped":
     # subdivide every cell in Xc into nInterp cells.
-    for i in range(nx):
-      dx = (Xc[i+1]-Xc[i])/nInterp
-      for j in range(nInterp):
-        meshOut[i*nInterp+j] = Xc[i]+j*dx
-      #end
+    meshOut = _refineMesh([nInterp], Xc)
+  #end
+  return meshOut
+#end
+
+def _refineMesh(nInterp, X):
+  # Subdivides every cell of the nodal coordinate array 'X' into
+  # nInterp[d] cells along each direction d (multilinearly)
+  for d in range(X.ndim):
+    if nInterp[d] == 1:
+      continue
     #end
+    Xd = np.moveaxis(X, d, -1)
+    frac = np.arange(nInterp[d])/nInterp[d]
+    fine = Xd[..., :-1, np.newaxis] + \
+      frac*(Xd[..., 1:, np.newaxis]-Xd[..., :-1, np.newaxis])
+    fine = fine.reshape(Xd.shape[:-1] + (-1,))
     # add the last node.
-    dx = (Xc[-1]-Xc[-2])/nInterp
-    meshOut[nx*nInterp] = Xc[nx-1]+nInterp*dx
+    X = np.moveaxis(np.concatenate((fine, Xd[..., -1:]), axis=-1), -1, d)
   #end
-  return meshOut
+  return X
+#end
+
+# Cache of the interpolation grids keyed by the identity of the
+# arrays describing the geometry. The weak references make sure an
+# entry is not reused for new arrays with a recycled id.
+_gridCache = OrderedDict()
+_gridCacheSize = 16
+
+def _cachedGrid(key, arrays, build):
+  arrays = [a for a in arrays if isinstance(a, np.ndarray)]
+  fullKey = tuple(id(a) for a in arrays) + tuple(key)
+  entry = _gridCache.get(fullKey)
+  if entry is not None and all(r() is a for r, a in zip(entry[0], arrays)):
+    _gridCache.move_to_end(fullKey)
+  else:
+    entry = ([weakref.ref(a) for a in arrays], build())
+    _gridCache[fullKey] = entry
+    if len(_gridCache) > _gridCacheSize:
+      _gridCache.popitem(last=False)
+    #end
+  #end
+  # Copies so the callers are free to modify the grids
+  return [g.copy() for g in entry[1]]
 #end
 
 def _make1Dgrids(nInterp, Xc, numDims, gridType=None):
   # build a list of 1D arrays, each containing the grid in that dimension.
+  return _cachedGrid(('grid', gridType) + tuple(int(n) for n in nInterp),
+                     Xc, lambda: _buildGrids(nInterp, Xc, numDims, gridType))
+#end
+
+def _buildGrids(nInterp, Xc, numDims, gridType=None):
   gridOut = list()
   if gridType is None or gridType=="uniform":
     gridOut = [_makeMesh(nInterp[d], Xc[d])
                for d in range(numDims)]
   elif gridType=="mapped":
-    # back out 1D arrays from Xc.
-    for d in range(numDims):
-      currSlices = [0]*numDims
-      currSlices[-1-d] = np.s_[:]
-      gridOut.append(_makeMesh(nInterp[d], Xc[d][tuple(currSlices)],gridType=gridType))
+    if all(Xc[d].ndim == numDims for d in range(numDims)) and numDims > 1:
+      # Full coordinate arrays are refined in all the directions
+      gridOut = [_refineMesh(nInterp, Xc[d]) for d in range(numDims)]
+    else:
+      gridOut = [_makeMesh(nInterp[d], Xc[d], gridType=gridType)
+                 for d in range(numDims)]
     #end
   #end
   return gridOut
 #end
 
-def _interpOnMesh(cMat, qIn, nInterpIn, basis_type, c2p=False):
-  shift = 0
-  numCells = np.array(qIn.shape)
-  # last entry is indexing nodes, get rid of it
-  numCells = numCells[:-1]
-  numDims = int(len(numCells))
+def _interpC2pGrid(cMat, q, nInterp, basis_type, max_memory=None):
+  # Vertices of the interpolation mesh of c2p data
+  return _cachedGrid(('c2p', nInterp, basis_type, id(cMat)), q,
+                     lambda: [_interpOnMesh(cMat, qd, nInterp, basis_type, True,
+                                            max_memory=max_memory)
+                              for qd in q])
+#end
+
+def _getNumInterp(numDims, nInterpIn, basis_type):
   numInterp = np.array([max(nInterpIn, 2)]*numDims)
   if basis_type == "gkhybrid":
     # 1x1v, 1x2v, 2x2v, 3x2v cases, with p=2 in the first velocity dim.
@@ -181,32 +247,119 @@ def _interpOnMesh(cMat, qIn, nInterpIn, basis_type, c2p=False):
   if basis_type == "hybrid":
     numInterp[-1] = nInterpIn+1
   #end
+  return numInterp
+#end
+
+def _getInterpShape(numCells, nInterpIn, basis_type, c2p=False):
+  numCells = np.array(numCells)
+  numInterp = _getNumInterp(len(numCells), nInterpIn, basis_type)
   if c2p:
-    qOut = np.zeros(numCells*(numInterp-1)+1, np.float64)
+    return tuple(int(n) for n in numCells*(numInterp-1)+1)
+  else:
+    return tuple(int(n) for n in numCells*numInterp)
+  #end
+#end
+
+# Default scratch budget (in bytes) of a single slab of cells; keeps
+# the temporaries of the contraction small compared to the output
+_defaultMaxMemory = 2**28
+
+def _getSlabSize(numCells, numInterp, numNodes, max_memory=None, numOut=1):
+  if max_memory is None:
+    max_memory = _defaultMaxMemory
+  #end
+  # Each cell needs a copy of its expansion coefficients and the
+  # values on all its interpolation nodes
+  bytesPerCell = 8*(int(numNodes) + int(np.prod(numInterp))*int(numOut))
+  bytesPerSlice = bytesPerCell*int(np.prod(numCells[1:]))
+  return int(min(max(max_memory // bytesPerSlice, 1), numCells[0]))
+#end
+
+def _interpSlab(cMat, qIn, numInterp, step, qOut):
+  numCells = qIn.shape[:-1]
+  numDims = len(numCells)
+  # Contract the node index of all the cells in the slab at once; the
+  # result has the interpolation nodes and the stacked outputs (e.g.,
+  # derivative directions) as the last indices
+  if len(cMat.shape) == 2:
+    temp = np.dot(qIn, cMat.transpose())[..., np.newaxis]
+    qOut = qOut[..., np.newaxis]
   else:
-    qOut = np.zeros(numCells*numInterp, np.float64)
+    temp = np.tensordot(qIn, cMat, axes=([-1], [1]))
   #end
-  # move the node index from last to the first
-  qIn = np.moveaxis(qIn, -1, 0)
-  # Main loop
   for n in range(np.prod(numInterp)):
-    # https://docs.scipy.org/doc/numpy/reference/generated/numpy.tensordot.html
-    temp = np.tensordot(cMat[n, :], qIn, axes=1)
     # decompose n to i,j,k,... indices based on the number of dimensions
     startIdx = np.unravel_index(n, numInterp, order='F')
     # define multi-D qOut slices
-    if c2p:
-      idxs = [slice(int(startIdx[i]), int(numCells[i]*(numInterp[i]-1)+startIdx[i]), numInterp[i]-1)
-              for i in range(numDims)]
-    else:
-      idxs = [slice(int(startIdx[i]), int(numCells[i]*numInterp[i]), numInterp[i])
-              for i in range(numDims)]
-    #end
-    qOut[tuple(idxs)] = temp
+    idxs = [slice(int(startIdx[i]), int(numCells[i]*step[i]+startIdx[i]), int(step[i]))
+            for i in range(numDims)]
+    qOut[tuple(idxs)] = temp[..., n, :]
   #end
-  return np.array(qOut)
 #end
 
+def _interpOnMesh(cMat, qIn, nInterpIn, basis_type, c2p=False,
+                  out=None, max_memory=None, workers=None):
+  numCells = np.array(qIn.shape)
+  # last entry is indexing nodes, get rid of it
+  numCells = numCells[:-1]
+  numDims = int(len(numCells))
+  numInterp = _getNumInterp(numDims, nInterpIn, basis_type)
+  if c2p:
+    step = numInterp-1
+  else:
+    step = numInterp
+  #end
+  shape = _getInterpShape(numCells, nInterpIn, basis_type, c2p)
+  numOut = 1
+  if len(cMat.shape) == 3:
+    # Stacked operator; the outputs are stored in the last index
+    numOut = cMat.shape[2]
+    shape = shape + (numOut,)
+  #end
+  if out is None:
+    qOut = np.zeros(shape, np.float64)
+  elif tuple(out.shape) == shape:
+    qOut = out
+  else:
+    raise ValueError(
+      "interpolate: the output array has shape {} but {} is required".
+      format(tuple(out.shape), shape))
+  #end
+
+  # Process the cells in slabs along the leading axis so that only
+  # the temporaries of a single slab are held in memory
+  # c2p slabs share the boundary nodes with their neighbors, so they
+  # are always processed serially
+  numWorkers = 1 if (workers is None or c2p) else max(int(workers), 1)
+  if max_memory is not None:
+    max_memory = max_memory // numWorkers
+  #end
+  slab = _getSlabSize(numCells, numInterp, cMat.shape[1], max_memory, numOut)
+  if numWorkers > 1:
+    # Make sure there is at least a block for each worker
+    slab = min(slab, -(-numCells[0] // numWorkers))
+  #end
+
+  def _run(lo):
+    up = min(lo+slab, numCells[0])
+    outUp = up*step[0]+1 if c2p else up*step[0]
+    _interpSlab(cMat, qIn[lo:up], numInterp, step,
+                qOut[lo*step[0]:outUp])
+  #end
+
+  if numWorkers > 1:
+    # NumPy releases the GIL in the contraction and the strided copies;
+    # the blocks write into disjoint slices of qOut
+    with ThreadPoolExecutor(max_workers=numWorkers) as pool:
+      list(pool.map(_run, range(0, numCells[0], slab)))
+    #end
+  else:
+    for lo in range(0, numCells[0], slab):
+      _run(lo)
+    #end
+  #end
+  return qOut
+#end
 
 
 class GInterp(object):
@@ -220,35 +373,128 @@ class GInterp(object):
   Init Args:
     data (GData): Data to work with
     numNodes (int): Number of nodes
+    max_memory (int): Scratch memory (in bytes) used for a single
+      slab of cells during the interpolation (default: 256 MB)
+    workers (int): Number of threads to interpolate blocks of cells
+      with (default: 1)
   """
 
-  def __init__(self, data, numNodes):
+  def __init__(self, data, numNodes, max_memory=None, workers=None):
     self.data = data
     self.numNodes = numNodes
     self.numEqns = data.get_num_comps()/numNodes
     self.numDims = data.get_num_dims()
     self.Xc = data.get_grid()
     self.gridType = data.get_gridType()
+    self.max_memory = max_memory
+    self.workers = workers
+  #end
+
+  def _getComps(self, comp):
+    if isinstance(comp, int):
+      return [comp]
+    elif isinstance(comp, tuple):
+      return list(comp)
+    elif isinstance(comp, slice):
+      return list(range(comp.start, comp.stop))
+    #end
+    raise TypeError("interpolate: 'comp' must be int, tuple, or slice")
+  #end
+
+  def getInterpShape(self, comp=0):
+    """Returns the shape of the interpolated values.
+
+    Useful for preallocating the 'out' array of interpolate, e.g., as
+    a NumPy memmap.
+    """
+    nInterp = self.numInterp
+    if nInterp is None:
+      nInterp = self.poly_order+1
+    #end
+    shape = _getInterpShape(self.data.get_num_cells(), nInterp,
+                            self.basis_type)
+    return shape + (len(self._getComps(comp)),)
+  #end
+
+  def _getCompGrid(self):
+    # Uniform computational grid (cell edges); for c2p data the grid
+    # stores the mapping coefficients, so it is built from the bounds
+    if self.data.ctx['grid_type'] == 'c2p':
+      lo, up = self.data.ctx['lower'], self.data.ctx['upper']
+      cells = self.data.get_num_cells()
+      return [np.linspace(lo[d], up[d], cells[d]+1)
+              for d in range(self.numDims)]
+    elif self.Xc is not None and all(len(x.shape) == 1 for x in self.Xc):
+      return self.Xc
+    else:
+      raise ValueError('GInterp: only uniform and c2p grids are supported')
+    #end
+  #end
+
+  def _getDirections(self, direction):
+    if direction is None:
+      return list(range(self.numDims))
+    elif isinstance(direction, int):
+      return [direction]
+    #end
+    return list(direction)
+  #end
+
+  def _differentiateComps(self, cMat, nInterp, direction, comp, getRaw):
+    dirs = self._getDirections(direction)
+    comps = self._getComps(comp)
+    grid = self._getCompGrid()
+    # Stack the derivative matrices of all the requested directions
+    # with the cell Jacobians folded in, so that all the directions of
+    # a component are computed in a single contraction
+    dMat = np.stack([cMat[:, :, d]*2/(grid[d][1]-grid[d][0]) for d in dirs],
+                    axis=-1)
+    shape = _getInterpShape(self.data.get_num_cells(), nInterp,
+                            self.basis_type)
+    numComps = len(comps)
+    values = np.zeros(shape + (len(dirs)*numComps,), np.float64)
+    for i, c in enumerate(comps):
+      # Output is ordered direction-major (the same way as 'ev grad')
+      _interpOnMesh(dMat, getRaw(c), nInterp, self.basis_type,
+                    out=values[..., i::numComps],
+                    max_memory=self.max_memory, workers=self.workers)
+    #end
+    return values
+  #end
+
+  def _interpComps(self, cMat, nInterp, comp, getRaw, out=None):
+    comps = self._getComps(comp)
+    shape = _getInterpShape(self.data.get_num_cells(), nInterp,
+                            self.basis_type)
+    shape = shape + (len(comps),)
+    if out is None:
+      values = np.zeros(shape, np.float64)
+    elif tuple(out.shape) == shape:
+      values = out
+    else:
+      raise ValueError(
+        "interpolate: the output array has shape {} but {} is required".
+        format(tuple(out.shape), shape))
+    #end
+    for i, c in enumerate(comps):
+      _interpOnMesh(cMat, getRaw(c), nInterp, self.basis_type,
+                    out=values[..., i], max_memory=self.max_memory,
+                    workers=self.workers)
+    #end
+    return values
   #end
 
   def _getRawNodal(self, component):
     q = self.data.get_values()
-    numEqns = self.numEqns
-    shp = [q.shape[i] for i in range(self.numDims)]
-    shp.append(self.numNodes)
-    rawData = np.zeros(shp, np.float64)
-    for n in range(self.numNodes):
-      rawData[..., n] = q[..., int(component+n*numEqns)]
-    #end
-    return rawData
+    numEqns = int(self.numEqns)
+    # strided view; nodes of a component are numEqns apart
+    lo = int(component)
+    up = int(lo+self.numNodes*numEqns)
+    return q[..., lo:up:numEqns]
   #end
 
   def _getRawModal(self, component):
     q = self.data.get_values()
-    numEqns = self.numEqns
-    shp = [q.shape[i] for i in range(self.numDims)]
-    shp.append(self.numNodes)
-    rawData = np.zeros(shp, np.float64)
     lo = int(component*self.numNodes)
     up = int(lo+self.numNodes)
     rawData = q[..., lo:up]
@@ -274,6 +520,9 @@ class GInterpNodal(GInterp):
     numInterp (int): Specify number of points on which to
       interpolate (default: poly_order + 1)
     read
+    max_memory (int): Scratch memory (in bytes) for a single slab
+      of cells
+    workers (int): Number of threads to interpolate with
 
   Example:
     import postgkyl
@@ -283,7 +532,8 @@ class GInterpNodal(GInterp):
   """
 
   def __init__(self, data, poly_order, basis_type,
-               numInterp=None, read=None):
+               numInterp=None, read=None, max_memory=None,
+               workers=None):
     self.numDims = data.get_num_dims()
     self.poly_order = poly_order
     self.basis_type = basis_type
@@ -294,38 +544,21 @@ class GInterpNodal(GInterp):
     self.numInterp = numInterp
     self.read = read
     numNodes = _getNumNodes(self.numDims, self.poly_order, self.basis_type)
-    GInterp.__init__(self, data, numNodes)
+    GInterp.__init__(self, data, numNodes, max_memory, workers)
   #end
 
-  def interpolate(self, comp=0, overwrite=False, stack=False):
+  def interpolate(self, comp=0, overwrite=False, stack=False, out=None):
     if stack:
       overwrite = stack
       print("Deprecation warning: The 'stack' parameter is going to be replaced with 'overwrite'")
     #end
     cMat = _loadInterpMatrix(self.numDims, self.poly_order,
                              self.basis_type, self.numInterp, self.read, False)
-    if isinstance(comp, int):
-      q = self._getRawNodal(comp)
-      values = _interpOnMesh(cMat, q, self.numInterp, self.basis_type)[..., np.newaxis]
-    elif isinstance(comp, tuple):
-      q = self._getRawNodal(comp[0])
-      values = _interpOnMesh(cMat, q, self.numInterp, self.basis_type)[..., np.newaxis]
-      for c in comp[1:]:
-        q = self._getRawNodal(c)
-        values = np.append(values,
-                           _interpOnMesh(cMat, q, self.numInterp, self.basis_type)[..., np.newaxis],
-                           axis=-1)
-      #end
-    elif isinstance(comp, slice):
-      q = self._getRawNodal(comp.start)
-      values = _interpOnMesh(cMat, q, self.numInterp, self.basis_type)[..., np.newaxis]
-      for c in range(comp.start+1, comp.stop):
-        q = self._getRawNodal(c)
-        values = np.append(values,
-                           _interpOnMesh(cMat, q, self.numInterp, self.basis_type)[..., np.newaxis],
-                           axis=-1)
-      #end
+    nInterp = self.numInterp
+    if nInterp is None:
+      nInterp = int(round(cMat.shape[0] ** (1.0/self.numDims)))
     #end
+    values = self._interpComps(cMat, nInterp, comp, self._getRawNodal, out)
 
     nInterp = [int(round(cMat.shape[0] ** (1.0/self.numDims)))]*self.numDims
     grid = _make1Dgrids(nInterp, self.Xc, self.numDims)
@@ -341,23 +574,13 @@ class GInterpNodal(GInterp):
       overwrite = stack
       print("Deprecation warning: The 'stack' parameter is going to be replaced with 'overwrite'")
     #end
-    q = self._getRawNodal(comp)
     cMat = _loadDerivativeMatrix(self.numDims, self.poly_order,
                                  self.basis_type, self.numInterp, self.read, False)
-    if direction is not None:
-      values = _interpOnMesh(cMat[:, :, direction], q, self.numInterp, self.basis_type) \
-              * 2/(self.Xc[direction][1]-self.Xc[direction][0])
-      values = values[..., np.newaxis]
-    else:
-      values = np.zeros(q.shape, self.numDims)
-      for i in range(self.numDims):
-        values[:,i] = _interpOnMesh(cMat[:,:,i], q, self.numInterp, self.basis_type)
-        values[:,i] *= 2/(self.Xc[i][1]-self.Xc[i][0])
-      #end
-    #end
+    nInterp = int(round(cMat.shape[0] ** (1.0/self.numDims)))
+    values = self._differentiateComps(cMat, nInterp, direction, comp,
+                                      self._getRawNodal)
 
-    nInterp = [int(round(cMat.shape[0] ** (1.0/self.numDims)))]*self.numDims
-    grid = _make1Dgrids(nInterp, self.Xc, self.numDims)
+    grid = _make1Dgrids([nInterp]*self.numDims, self.Xc, self.numDims)
     if overwrite:
       self.data.push(grid, values)
     else:
@@ -385,6 +608,16 @@ class GInterpModal(GInterp):
     numInterp (int): Specify number of points on which to
       interpolate (default: poly_order + 1)
     read
+    max_memory (int): Scratch memory (in bytes) for a single slab
+      of cells; together with a memmapped 'out' array of
+      interpolate, this bounds the memory footprint of the
+      interpolation
+    workers (int): Number of threads to interpolate blocks of cells
+      with
+    engine (str): How the interpolation matrices are generated;
+      'sympy' (default) uses the symbolic computation, 'numeric'
+      evaluates the basis numerically, which is much faster for
+      large numInterp
 
   Example:
     import postgkyl
@@ -394,7 +627,8 @@ class GInterpModal(GInterp):
   """
 
   def __init__(self, data, poly_order=None, basis_type=None,
-               numInterp=None, periodic=False, read=None):
+               numInterp=None, periodic=False, read=None,
+               max_memory=None, workers=None, engine='sympy'):
     self.numDims = data.get_num_dims()
     if poly_order is not None:
       self.poly_order = poly_order
@@ -436,49 +670,48 @@ class GInterpModal(GInterp):
       self.numInterp = self.poly_order + 1
     #end
     self.read = read
+    self.engine = engine
     numNodes = _getNumNodes(self.numDims, self.poly_order, self.basis_type)
-    GInterp.__init__(self, data, numNodes)
+    GInterp.__init__(self, data, numNodes, max_memory, workers)
   #end
 
-  def interpolate(self, comp=0, overwrite=False, stack=False):
+  def interpolate(self, comp=0, overwrite=False, stack=False, out=None):
+    """Interpolates the DG expansion on a uniform sub-cell mesh.
+
+    Args:
+      comp (int, tuple, or slice): Components to interpolate
+      overwrite (bool): Push the result to the GData
+      out (ndarray): Optional preallocated (or memmapped) array of
+        the shape given by getInterpShape to write the values into
+    """
     if stack:
       overwrite = stack
       print("Deprecation warning: The 'stack' parameter is going to be replaced with 'overwrite'")
     #end
     cMat = _loadInterpMatrix(self.numDims, self.poly_order,
-                             self.basis_type, self.numInterp, self.read, True)
-    if isinstance(comp, int):
-      q = self._getRawModal(comp)
-      values = _interpOnMesh(cMat, q, self.numInterp, self.basis_type)[..., np.newaxis]
-    elif isinstance(comp, tuple):
-      q = self._getRawModal(comp[0])
-      values = _interpOnMesh(cMat, q, self.numInterp, self.basis_type)[..., np.newaxis]
-      for c in comp[1:]:
-        q = self._getRawModal(c)
-        values = np.append(values,
-                           _interpOnMesh(cMat, q, self.numInterp, self.basis_type)[..., np.newaxis],
-                           axis=-1)
-      #end
-    elif isinstance(comp, slice):
-      q = self._getRawModal(comp.start)
-      values = _interpOnMesh(cMat, q, self.numInterp, self.basis_type)[..., np.newaxis]
-      for c in range(comp.start+1, comp.stop):
-        q = self._getRawModal(c)
-        values = np.append(values,
-                           _interpOnMesh(cMat, q, self.numInterp, self.basis_type)[..., np.newaxis],
-                           axis=-1)
-      #end
+                             self.basis_type, self.numInterp, self.read, True,
+                             engine=self.engine)
+    values = self._interpComps(cMat, self.numInterp, comp,
+                               self._getRawModal, out)
+    grid = self.getInterpGrid()
+
+    if overwrite:
+      self.data.push(grid, values)
+    else:
+      return grid, values
     #end
+  #end
+
+  def getInterpGrid(self):
+    """Returns the grid of 'interpolate' without interpolating."""
     if self.data.ctx['grid_type'] == 'c2p':
       q = self.data.get_grid()
       num_comp = q[0].shape[-1]
       basis, poly_order = _get_basis_p(self.numDims, num_comp)
       cMat = _loadInterpMatrix(self.numDims, poly_order,
                                basis, self.numInterp, self.read, True, True)
-      grid = []
-      for d in range(self.numDims):
-        grid.append(_interpOnMesh(cMat, q[d], self.numInterp+1, basis, True))
-      #end
+      grid = _interpC2pGrid(cMat, q, self.numInterp+1, basis,
+                            self.max_memory)
     else:
       if self.basis_type == "gkhybrid":
         # 1x1v, 1x2v, 2x2v, 3x2v cases, with p=2 in the first velocity dim.
@@ -488,10 +721,118 @@ class GInterpModal(GInterp):
       elif self.basis_type == 'hybrid':
         nInterp = [self.numInterp]*self.numDims
         nInterp[-1] = self.numInterp+1
+      elif self.read is None:
+        nInterp = [self.numInterp]*self.numDims
       else:
+        cMat = _loadInterpMatrix(self.numDims, self.poly_order,
+                                 self.basis_type, self.numInterp,
+                                 self.read, True, engine=self.engine)
         nInterp = [int(round(cMat.shape[0] ** (1.0/self.numDims)))]*self.numDims
+      #end
       grid = _make1Dgrids(nInterp, self.Xc, self.numDims, self.gridType)
     #end
+    return grid
+  #end
+
+  def evaluate(self, points, comp=None):
+    """Evaluates the DG expansion at arbitrary points.
+
+    The owning cells of the points are found on the computational
+    grid and the basis is evaluated directly at the corresponding
+    reference coordinates, i.e., without interpolating the whole
+    dataset.
+
+    Args:
+      points (ndarray): Coordinates of shape (num_points, num_dims)
+      comp (int, tuple, or slice): Components to evaluate (default:
+        all)
+
+    Returns:
+      values (ndarray): Values of shape (num_points, num_comps); NaN
+        for the points outside of the grid
+    """
+    points = np.atleast_2d(np.asarray(points, np.float64))
+    if points.shape[-1] != self.numDims:
+      raise ValueError('evaluate: points must be of shape (num_points, {:d})'.format(self.numDims))
+    #end
+    if comp is None:
+      comp = tuple(range(int(self.numEqns)))
+    #end
+    comps = self._getComps(comp)
+
+    grid = self._getCompGrid()
+    cellIdx = np.zeros(points.shape, np.int64)
+    xi = np.zeros(points.shape)
+    outside = np.zeros(points.shape[0], bool)
+    for d in range(self.numDims):
+      numCells = len(grid[d])-1
+      outside |= ~((points[:, d] >= grid[d][0]) & (points[:, d] <= grid[d][-1]))
+      idx = np.searchsorted(grid[d], points[:, d], side='right')-1
+      # The upper boundary belongs to the last cell
+      idx = np.clip(idx, 0, numCells-1)
+      dx = grid[d][idx+1]-grid[d][idx]
+      cellIdx[:, d] = idx
+      xi[:, d] = 2.0*(points[:, d]-grid[d][idx])/dx - 1.0
+    #end
+    basis = evalBasis(self.numDims, self.poly_order, self.basis_type, xi)
+
+    # Gather only the coefficients of the owning cells
+    q = self.data.get_values()[tuple(cellIdx.transpose())]
+    values = np.zeros((points.shape[0], len(comps)))
+    for i, c in enumerate(comps):
+      lo = int(c*self.numNodes)
+      values[:, i] = np.sum(basis*q[:, lo:lo+self.numNodes], axis=-1)
+    #end
+    values[outside] = np.nan
+    return values
+  #end
+
+  def cell_average(self, comp=None, scale=True, overwrite=False):
+    """Returns the cell averages of the DG expansion.
+
+    For the orthonormal modal bases, the cell average is the 0th
+    coefficient times 2^(-d/2). No interpolation is performed; the
+    0th coefficients are taken as a strided view of the data.
+
+    Args:
+      comp (int, tuple, or slice): Components (default: all)
+      scale (bool): Multiply by 2^(-d/2); this only touches the 0th
+        coefficients. With scale=False, the returned values are a
+        zero-copy view of the coefficients.
+      overwrite (bool): Push the result to the GData
+
+    Returns:
+      grid, values: Cell edges and cell averages
+    """
+    if comp is None:
+      comp = tuple(range(int(self.numEqns)))
+    #end
+    comps = self._getComps(comp)
+    q = self.data.get_values()
+    numNodes = int(self.numNodes)
+    steps = np.diff(comps)
+    if len(comps) == 1 or (np.all(steps == steps[0]) and steps[0] > 0):
+      step = 1 if len(comps) == 1 else int(steps[0])
+      values = q[..., comps[0]*numNodes:(comps[-1]+1)*numNodes:step*numNodes]
+    else:
+      values = q[..., np.array(comps, np.int64)*numNodes]
+    #end
+    if scale:
+      values = values*2.0**(-0.5*self.numDims)
+    #end
+
+    if self.data.ctx['grid_type'] == 'c2p':
+      # Vertices of the cells
+      q = self.data.get_grid()
+      num_comp = q[0].shape[-1]
+      basis, poly_order = _get_basis_p(self.numDims, num_comp)
+      cMat = _loadInterpMatrix(self.numDims, poly_order,
+                               basis, 1, self.read, True, True)
+      grid = _interpC2pGrid(cMat, q, 2, basis)
+    else:
+      grid = _make1Dgrids([1]*self.numDims, self.Xc, self.numDims,
+                          self.gridType)
+    #end
 
     if overwrite:
       self.data.push(grid, values)
@@ -500,6 +841,172 @@ class GInterpModal(GInterp):
     #end
   #end
 
+  def _getAxes(self, axes):
+    # Same conventions as 'tools.integrate': an int, a tuple, a string
+    # of comma separated ints, or a slice 'int:int'
+    if axes is None:
+      axes = tuple(range(self.numDims))
+    elif isinstance(axes, str):
+      if len(axes.split(':')) == 2:
+        lo, up = axes.split(':')
+        axes = tuple(range(int(lo), int(up)))
+      else:
+        axes = tuple(int(a) for a in axes.split(','))
+      #end
+    elif isinstance(axes, (int, np.integer)):
+      axes = (int(axes),)
+    #end
+    axes = tuple(sorted(set(int(a) for a in axes)))
+    if len(axes) == 0 or axes[0] < 0 or axes[-1] >= self.numDims:
+      raise ValueError('GInterpModal: invalid integration axes {}'.format(axes))
+    #end
+    return axes
+  #end
+
+  def _projectCells(self, axes, comps, weight_axis=None, weight_power=0):
+    # Integrals of each cell over 'axes' (in reference coordinates)
+    # expressed in the reduced basis; only the coefficients with a
+    # nonzero projection are read
+    pMat = getProjectionMatrix(self.numDims, self.poly_order,
+                               self.basis_type, axes,
+                               weight_axis, weight_power)
+    cols = np.nonzero(np.any(pMat != 0.0, axis=0))[0]
+    pMat = pMat[:, cols].transpose()
+    q = self.data.get_values()
+    out = np.zeros(q.shape[:-1] + (len(comps), pMat.shape[1]))
+    for i, c in enumerate(comps):
+      out[..., i, :] = np.dot(q[..., int(c*self.numNodes) + cols], pMat)
+    #end
+    return out
+  #end
+
+  def _cellWidths(self, grid, d):
+    # Cell widths along 'd' shaped to broadcast against the output of
+    # _projectCells
+    shape = [1]*(self.numDims+2)
+    shape[d] = -1
+    return np.diff(grid[d]).reshape(shape)
+  #end
+
+  def _cellCenters(self, grid, d):
+    shape = [1]*(self.numDims+2)
+    shape[d] = -1
+    return (0.5*(grid[d][1:]+grid[d][:-1])).reshape(shape)
+  #end
+
+  def _pushReduced(self, axes, grid, values, overwrite):
+    # 'values' are of shape (cells..., num_comps, num_basis_reduced)
+    # with the integrated axes already summed over
+    rem = [d for d in range(self.numDims) if d not in axes]
+    if len(rem) > 0:
+      outGrid = [grid[d] for d in rem]
+      values = values.reshape(values.shape[:-2] + (-1,))
+    else:
+      # Nothing DG is left; follow 'tools.integrate' and keep
+      # singleton dimensions
+      outGrid = [np.array([grid[d].mean()]) for d in range(self.numDims)]
+      values = values.reshape((1,)*self.numDims + (-1,))
+    #end
+
+    if overwrite:
+      self.data.push(outGrid, values)
+      if len(rem) > 0:
+        self.data.ctx['basis_type'] = getReducedBasisType(
+          self.numDims, self.basis_type, axes)
+      else:
+        self.data.ctx['basis_type'] = None
+        self.data.ctx['poly_order'] = None
+      #end
+      if self.data.ctx['grid_type'] == 'c2p':
+        self.data.ctx['grid_type'] = 'uniform'
+      #end
+    else:
+      return outGrid, values
+    #end
+  #end
+
+  def integrate(self, axes=None, comp=None, average=False, overwrite=False):
+    """Integrates the DG expansion over 'axes' exactly.
+
+    The integral is computed directly from the modal coefficients
+    and the result is the modal expansion (in the basis of the
+    remaining directions) of the integral. No interpolation is
+    involved and the cost is linear in the number of cells.
+
+    Args:
+      axes (int, tuple, or str): Directions to integrate over
+        (default: all)
+      comp (int, tuple, or slice): Components to integrate (default:
+        all)
+      average (bool): Divide by the extents of the integrated
+        directions
+      overwrite (bool): Push the result to the GData
+
+    Returns:
+      grid, values: Modal DG data of the remaining directions or,
+        when all the directions are integrated, a single point
+    """
+    axes = self._getAxes(axes)
+    if comp is None:
+      comp = tuple(range(int(self.numEqns)))
+    #end
+    comps = self._getComps(comp)
+    grid = self._getCompGrid()
+
+    values = self._projectCells(axes, comps)
+    for d in axes:
+      values *= 0.5*self._cellWidths(grid, d)
+    #end
+    values = np.sum(values, axis=axes)
+    if average:
+      values /= np.prod([grid[d][-1]-grid[d][0] for d in axes])
+    #end
+    return self._pushReduced(axes, grid, values, overwrite)
+  #end
+
+  def moments(self, axes, comp=0, overwrite=False):
+    """Computes the velocity moments of a distribution function.
+
+    The zeroth (M0), first (M1i, one for each direction in 'axes'),
+    and second (M2 = int |v|^2 f dv) moments are computed exactly
+    from the modal coefficients.
+
+    Args:
+      axes (int, tuple, or str): Velocity directions
+      comp (int): Component of the distribution function
+      overwrite (bool): Push the result to the GData
+
+    Returns:
+      grid, values: Modal DG data of the remaining directions with
+        the components ordered as M0, M1i, M2
+    """
+    axes = self._getAxes(axes)
+    comps = self._getComps(comp)
+    if len(comps) != 1:
+      raise ValueError('GInterpModal: moments expects a single component')
+    #end
+    grid = self._getCompGrid()
+
+    jacobian = 1.0
+    for d in axes:
+      jacobian = jacobian*0.5*self._cellWidths(grid, d)
+    #end
+    f0 = self._projectCells(axes, comps)*jacobian
+    m0 = np.sum(f0, axis=axes)
+    m1, m2 = [], np.zeros(m0.shape)
+    for d in axes:
+      # v = vc + xi*dv/2 inside a cell
+      vc = self._cellCenters(grid, d)
+      half = 0.5*self._cellWidths(grid, d)
+      f1 = self._projectCells(axes, comps, d, 1)*jacobian*half
+      f2 = self._projectCells(axes, comps, d, 2)*jacobian*half**2
+      m1.append(np.sum(vc*f0 + f1, axis=axes))
+      m2 += np.sum(vc**2*f0 + 2.0*vc*f1 + f2, axis=axes)
+    #end
+    values = np.concatenate([m0] + m1 + [m2], axis=-2)
+    return self._pushReduced(axes, grid, values, overwrite)
+  #end
+
   def interpolateGrid(self, overwrite=False):
     if self.data.ctx['grid_type'] == 'c2p':
       q = self.data.get_grid()
@@ -507,10 +1014,7 @@ class GInterpModal(GInterp):
       basis, poly_order = _get_basis_p(self.numDims, num_comp)
       cMat = _loadInterpMatrix(self.numDims, poly_order,
                                basis, self.numInterp, self.read, True, True)
-      grid = []
-      for d in range(self.numDims):
-        grid.append(_interpOnMesh(cMat, q[d], self.numInterp, self.basis_type, True))
-      #end
+      grid = _interpC2pGrid(cMat, q, self.numInterp, self.basis_type)
     else:
       nInterp = [self.numInterp]*self.numDims
       grid = _make1Dgrids(nInterp, self.Xc, self.numDims, self.gridType)
@@ -524,29 +1028,29 @@ class GInterpModal(GInterp):
   #end
 
   def differentiate(self, direction=None, comp=0, overwrite=False, stack=False):
+    """Interpolates derivatives of the DG expansion.
+
+    Args:
+      direction (int, tuple, or None): Direction(s) of the derivative
+        (default: all)
+      comp (int, tuple, or slice): Components to differentiate
+      overwrite (bool): Push the result to the GData
+
+    Returns:
+      grid, values: The last index of values is ordered as
+        direction*num_comps + comp
+    """
     if stack:
       overwrite = stack
       print("Deprecation warning: The 'stack' parameter is going to be replaced with 'overwrite'")
     #end
-    q = self._getRawModal(comp)
     cMat = _loadDerivativeMatrix(self.numDims, self.poly_order,
                                  self.basis_type, self.numInterp, self.read, True)
-    if direction is not None:
-      values = _interpOnMesh(cMat[:, :, direction], q, self.numInterp, self.basis_type) \
-              * 2/(self.Xc[direction][1]-self.Xc[direction][0])
-      values = values[..., np.newaxis]
-    else:
-      values = _interpOnMesh(cMat[...,0], q, self.numInterp, self.basis_type)
-      values /= (self.Xc[0][1]-self.Xc[0][0])
-      values = values[..., np.newaxis]
-      for i in range(1, self.numDims):
-        values = np.append(values, _interpOnMesh(cMat[...,i], q, self.numInterp, self.basis_type)[...,np.newaxis], axis=self.numDims)
-        values[...,i] *= 2/(self.Xc[i][1]-self.Xc[i][0])
-      #end
-    #end
+    nInterp = int(round(cMat.shape[0] ** (1.0/self.numDims)))
+    values = self._differentiateComps(cMat, nInterp, direction, comp,
+                                      self._getRawModal)
 
-    nInterp = [int(round(cMat.shape[0] ** (1.0/self.numDims)))]*self.numDims
-    grid = _make1Dgrids(nInterp, self.Xc, self.numDims, self.gridType)
+    grid = _make1Dgrids([nInterp]*self.numDims, self.Xc, self.numDims, self.gridType)
     if overwrite:
       self.data.push(grid, values)
     else:
@@ -554,19 +1058,74 @@ class GInterpModal(GInterp):
     #end
   #end
 
+  def _recover1D(self, c, d, N, c1):
+    # Recovers along direction 'd' the tensor coefficients 'c' of shape
+    # (cells..., dirs...), where the entries of the already recovered
+    # directions are points and the others Legendre coefficients
+    numDims = self.numDims
+    dx = self.Xc[d][1]-self.Xc[d][0]
+    xC = np.linspace(-1, 1, N, endpoint=False)*dx/2
+    xL = np.linspace(-1, 0, N, endpoint=False)*dx
+    xR = np.linspace(0, 1, N, endpoint=False)*dx
+    p = self.poly_order
+
+    # Coefficients first (recovData indexes them as f[k]) and a new
+    # last axis for the points
+    f = np.moveaxis(c, numDims+d, 0)[..., np.newaxis]
+    cellAx = d+1
+    numCells = f.shape[cellAx]
+
+    def cells(lo, up):
+      idx = [slice(None)]*f.ndim
+      idx[cellAx] = slice(lo, up)
+      return f[tuple(idx)]
+    #end
+
+    shape = f.shape[1:-1] + (N,)
+    out = np.zeros(shape)
+    outIdx = [slice(None)]*len(shape)
+    recov = recovC1Fn[p-1] if c1 else recovC0Fn[p-1]
+    if self.periodic:
+      fL = np.roll(f, 1, axis=cellAx)
+      fR = np.roll(f, -1, axis=cellAx)
+      out[...] = recov(xC, f, fL, fR, dx)
+    else:
+      # Interior cells with shifted views of the neighbors
+      outIdx[d] = slice(1, numCells-1)
+      out[tuple(outIdx)] = recov(xC, cells(1, numCells-1),
+                                 cells(0, numCells-2), cells(2, numCells), dx)
+      outIdx[d] = slice(0, 1)
+      out[tuple(outIdx)] = recovEdFn[p-1](xL, cells(0, 1), cells(1, 2), dx)
+      outIdx[d] = slice(numCells-1, numCells)
+      out[tuple(outIdx)] = recovEdFn[p-1](xR, cells(numCells-2, numCells-1),
+                                          cells(numCells-1, numCells), dx)
+    #end
+    return np.moveaxis(out, -1, numDims+d)
+  #end
+
   def recovery(self, comp=0, c1=False, overwrite=False, stack=False):
+    """Recovers a smooth function from the DG expansion.
+
+    The recovery polynomials (see recovData.py) are applied to all the
+    cells at once and, in more dimensions, to the tensor Legendre
+    coefficients of the expansion one direction at a time.
+
+    Args:
+      comp (int, tuple, or slice): Components to recover
+      c1 (bool): Enforce continuous first derivatives
+      overwrite (bool): Push the result to the GData
+
+    Returns:
+      grid, values
+    """
     if stack:
       overwrite = stack
       print("Deprecation warning: The 'stack' parameter is going to be replaced with 'overwrite'")
     #end
-    if isinstance(comp, int):
-      q = self._getRawModal(comp)
-    else:
-      raise ValueError("recovery: only 'int' comp implemented so far")
-    #end
-    if self.numDims > 1:
-      raise ValueError("recovery: only 1D implemented so far")
+    if self.basis_type in ('gkhybrid', 'hybrid'):
+      raise ValueError("recovery: hybrid bases are not supported")
     #end
+    comps = self._getComps(comp)
 
     if self.numInterp is not None:
       N = self.numInterp
@@ -575,37 +1134,23 @@ class GInterpModal(GInterp):
     #end
 
     numCells = self.data.get_num_cells()
-    grid = [np.linspace(self.Xc[int(d)][0], self.Xc[int(d)][-1], int(numCells*N+1))
+    grid = [np.linspace(self.Xc[int(d)][0], self.Xc[int(d)][-1], int(numCells[d]*N+1))
             for d in range(self.numDims)]
 
-    values = np.zeros(numCells*N)
-    dx = (self.Xc[0][1]-self.Xc[0][0])
-
-    xC = np.linspace(-1, 1, N, endpoint=False)*dx/2
-    xL = np.linspace(-1, 0, N, endpoint=False)*dx
-    xR = np.linspace(0, 1, N, endpoint=False)*dx
-
-    if self.periodic:
-      if c1:
-        values[:N] = recovC1Fn[self.poly_order-1](xC, q[0],q[-1],q[1], dx)
-        values[-N:] = recovC1Fn[self.poly_order-1](xC, q[-1],q[-2],q[0], dx)
-      else:
-        values[:N] = recovC0Fn[self.poly_order-1](xC, q[0],q[-1],q[1], dx)
-        values[-N:] = recovC0Fn[self.poly_order-1](xC, q[-1],q[-2],q[0], dx)
-      #end
-    else:
-      values[:N] = recovEdFn[self.poly_order-1](xL, q[0], q[1], dx)
-      values[-N:] = recovEdFn[self.poly_order-1](xR, q[-2], q[-1], dx)
-    #end
-    for j in range(1, numCells[0]-1):
-      if c1:
-        values[j*N:(j+1)*N] = recovC1Fn[self.poly_order-1](xC, q[j], q[j-1], q[j+1], dx)
-      else:
-        values[j*N:(j+1)*N] = recovC0Fn[self.poly_order-1](xC, q[j], q[j-1], q[j+1], dx)
+    lMat = getLegendreMatrix(self.numDims, self.poly_order, self.basis_type)
+    values = np.zeros(tuple(np.array(numCells)*N) + (len(comps),))
+    for i, c in enumerate(comps):
+      q = self._getRawModal(c)
+      coeffs = np.dot(q, lMat.transpose())
+      coeffs = coeffs.reshape(tuple(numCells) + (self.poly_order+1,)*self.numDims)
+      for d in range(self.numDims):
+        coeffs = self._recover1D(coeffs, d, N, c1)
       #end
+      # (cells..., points...) -> (cells_0, points_0, cells_1, ...)
+      perm = [ax for d in range(self.numDims) for ax in (d, self.numDims+d)]
+      values[..., i] = coeffs.transpose(perm).reshape(values.shape[:-1])
     #end
 
-    values = values[..., np.newaxis]
     if overwrite:
       self.data.push(grid, values)
     else:
@@ -136,7 +136,10 @@ class GData(object):
       #end
 
       self._reader.preload()
-      if load:
+      if load and (comp is not None or zs != (None,)*6):
+        # The partial load changes the bounds set by 'preload'
+        self.push(*self._reader.load())
+      elif load:
         self._grid, self._values = self._reader.load()
       #end
     #end
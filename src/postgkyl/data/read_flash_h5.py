@@ -1,6 +1,5 @@
 import numpy as np
 import math
-import tables
 
 # ----------------------------------------------------------------------
 # FLASH variable names
@@ -41,6 +40,7 @@ class Read_flash_h5(object):
   def _is_compatible(self) -> bool:
     out = False
     try:
+      import tables
       fh = tables.open_file(self._file_name, 'r')
     except:
       return False
@@ -53,6 +53,7 @@ class Read_flash_h5(object):
   #end
 
   def _read_frame(self) -> tuple:
+    import tables
     fh = tables.open_file(self._file_name, 'r')
     coord = fh.root['coordinates'].read().transpose()
     bsize = fh.root['block size'].read().transpose()
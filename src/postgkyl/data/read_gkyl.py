@@ -2,6 +2,8 @@ import numpy as np
 import msgpack as mp
 import os.path
 
+from postgkyl.data.select import _parse_indices, _select_grid
+
 # Format description for raw Gkeyll output file from
 # gkyl_array_rio_format_desc.h
 
@@ -81,10 +83,15 @@ class Read_gkyl(object):
   def __init__(self, file_name: str,
                ctx: dict = None,
                c2p: str = None,
+               axes: tuple = (None, None, None, None, None, None),
+               comp: int = None,
                **kwargs) -> None:
     self.file_name = file_name
     self.c2p = c2p
 
+    self.axes = axes
+    self.comp = comp
+
     self.dtf = np.dtype('f8')
     self.dti = np.dtype('i8')
 
@@ -203,14 +210,20 @@ class Read_gkyl(object):
                              count=1, offset=self.offset)[0]
     self.offset += 8
 
-  def _read_data_t1_v1(self) -> np.ndarray:
-    data_raw = np.fromfile(self.file_name, dtype=self.dtf,
-                           offset=self.offset)
+  def _read_data_t1_v1(self, idx=None) -> np.ndarray:
     gshape = np.ones(self.num_dims+1, dtype=self.dti)
     for d in range(self.num_dims):
       gshape[d] = self.cells[d]
     #end
     gshape[-1] = self.num_comps
+    if idx is not None:
+      # Partial load; only the selected part is read from the file
+      data = np.memmap(self.file_name, dtype=self.dtf, mode='r',
+                       offset=self.offset, shape=tuple(gshape))
+      return np.array(data[tuple(idx)])
+    #end
+    data_raw = np.fromfile(self.file_name, dtype=self.dtf,
+                           offset=self.offset)
     return data_raw.reshape(gshape)
   #end
 
@@ -314,12 +327,11 @@ class Read_gkyl(object):
 
   def load(self) -> tuple:
     time = None
-    if self.file_type == 1 or self.version == 0:
-      data = self._read_data_t1_v1()
-    elif self.file_type == 2:
+    if self.file_type == 2 and self.version > 0:
       time, data = self._read_t2_v1()
-    elif self.file_type == 3:
-      data = self._read_data_t3_v1()
+      shape = data.shape
+    elif self.file_type in (1, 3) or self.version == 0:
+      shape = tuple(self.cells) + (self.num_comps,)
     else:
       raise TypeError('This g0 format is not presently supported')
     #end
@@ -346,10 +358,10 @@ class Read_gkyl(object):
       # Adjust for ghost cells
       dz = (self.upper - self.lower) / self.cells
       for d in range(num_dims):
-        if self.cells[d] != data.shape[d]:
-          ngl = int(np.floor((self.cells[d] - data.shape[d])*0.5))
-          ngu = int(np.ceil((self.cells[d] - data.shape[d])*0.5))
-          self.cells[d] = data.shape[d]
+        if self.cells[d] != shape[d]:
+          ngl = int(np.floor((self.cells[d] - shape[d])*0.5))
+          ngu = int(np.ceil((self.cells[d] - shape[d])*0.5))
+          self.cells[d] = shape[d]
           self.lower[d] = self.lower[d] - ngl*dz[d]
           self.upper[d] = self.upper[d] + ngu*dz[d]
         #end
@@ -363,6 +375,27 @@ class Read_gkyl(object):
       #end
     #end
 
+    # Partial load; the selection is resolved against the grid
+    # before the data are read
+    idx = None
+    if self.comp is not None or any(z is not None for z in self.axes):
+      grid_idx, idx = _parse_indices(grid, shape, self.axes, self.comp)
+      grid = _select_grid(grid, grid_idx)
+    #end
+
+    if time is not None:
+      if idx is not None:
+        data = data[tuple(idx)]
+      #end
+    elif self.file_type == 3 and self.version > 0:
+      data = self._read_data_t3_v1()
+      if idx is not None:
+        data = np.array(data[tuple(idx)])
+      #end
+    else:
+      data = self._read_data_t1_v1(idx)
+    #end
+
     return grid, data
   #end
-#end
\ No newline at end of file
+#end
@@ -2,7 +2,7 @@ import numpy as np
 import click
 import re
 
-from postgkyl.utils import idxParser
+from postgkyl.data.select import _parse_indices, _select_grid, _bounding_box
 
 class Read_gkyl_adios(object):
   """Provides a framework to read gkyl Adios output
@@ -64,48 +64,6 @@ class Read_gkyl_adios(object):
     #end
   #end
 
-  def _create_offset_count(self, dims, zs, comp, grid=None) -> tuple:
-    num_dims = len(dims)
-    count = np.array(dims)
-    offset = np.zeros(num_dims, np.int32)
-    cnt = 0
-    for d, z in enumerate(zs):
-      if d < num_dims-1 and z is not None:  # Last dim stores comp
-        z = idxParser(z, grid[d])
-        if isinstance(z, int):
-          offset[d] = z
-          count[d] = 1
-        elif isinstance(z, slice):
-          offset[d] = z.start
-          count[d] = z.stop - z.start
-        else:
-          raise TypeError('\'z\' is neither number or slice')
-        #end
-        cnt = cnt + 1
-      #end
-    #end
-
-    if comp is not None:
-      comp = idxParser(comp)
-      if isinstance(comp, int):
-        offset[-1] = comp
-        count[-1] = 1
-      elif isinstance(comp, slice):
-        offset[-1] = comp.start
-        count[-1] = comp.stop - comp.start
-      else:
-        raise TypeError('\'comp\' is neither number or slice')
-      #end
-      cnt = cnt + 1
-    #end
-
-    if cnt > 0:
-      return tuple(offset), tuple(count)
-    else:
-      return (), ()
-    #end
-  #end
-
   def _preload_frame(self) -> None:
     import adios2
     fh = adios2.open(self._file_name, 'rra')
@@ -166,43 +124,8 @@ class Read_gkyl_adios(object):
     #end
 
     num_dims = len(self.cells)
-    grid = [np.linspace(self.lower[d],
-                        self.upper[d],
-                        self.cells[d]+1)
-            for d in range(num_dims)]
     var_dims = fh.available_variables()[self.var_name]['Shape']
     var_dims = [int(v) for v in var_dims.split(',')]
-    offset, count = self._create_offset_count(
-      var_dims, self.axes, self.comp, grid)
-    data = fh.read(self.var_name, start=offset, count=count)
-
-    # Adjust boundaries for 'offset' and 'count'
-    dz = (self.upper - self.lower) / self.cells
-    if offset:
-      if self.ctx['grid_type'] == 'uniform':
-        self.lower = self.lower + offset[:num_dims]*dz
-        self.cells = self.cells - offset[:num_dims]
-      elif self.ctx['grid_type'] == 'mapped':
-        idx = np.full(num_dims, 0)
-        for d in range(num_dims):
-          self.lower[d] = self._grid[d][tuple(idx)]
-          self.cells[d] = self.cells[d] - offset[d]
-        #end
-      #end
-    #end
-    if count:
-      if self.ctx['grid_type']  == 'uniform':
-        self.upper = self.lower + count[:num_dims]*dz
-        self.cells = count[:num_dims]
-      elif self.ctx['grid_type']  == 'mapped':
-        idx = np.full(num_dims, 0)
-        for d in range(num_dims):
-          idx[-d-1] = count[d]-1  #.Reverse indexing of idx because of transpose() in composing self._grid.
-          self.upper[d] = self._grid[d][tuple(idx)]
-          self.cells[d] = count[d]
-        #end
-      #end
-    #end
 
     # Check for mapped grid ...
     #if 'type' in fh.attrs.keys():# and self._comp_grid is False:
@@ -210,10 +133,8 @@ class Read_gkyl_adios(object):
     #end
     if self.c2p:
       grid_fh = adios2.open(self.c2p, 'rra')
-      grid_dims = grid_fh.available_variables()['CartGridField']['Shape']
-      grid_dims = [int(v) for v in grid_dims.split(',')]
-      offset, count = self._create_offset_count(grid_dims, self.axes, None)
-      tmp = grid_fh.read('CartGridField', start=offset, count=count)
+      tmp = grid_fh.read('CartGridField')
+      grid_fh.close()
       num_comps = tmp.shape[-1]
       num_coeff = num_comps/num_dims
       grid = [tmp[..., int(d*num_coeff):int((d+1)*num_coeff)]
@@ -237,10 +158,10 @@ class Read_gkyl_adios(object):
       # Adjust for ghost cells
       dz = (self.upper - self.lower) / self.cells
       for d in range(num_dims):
-        if self.cells[d] != data.shape[d]:
-          ngl = int(np.floor((self.cells[d] - data.shape[d])*0.5))
-          ngu = int(np.ceil((self.cells[d] - data.shape[d])*0.5))
-          self.cells[d] = data.shape[d]
+        if self.cells[d] != var_dims[d]:
+          ngl = int(np.floor((self.cells[d] - var_dims[d])*0.5))
+          ngu = int(np.ceil((self.cells[d] - var_dims[d])*0.5))
+          self.cells[d] = var_dims[d]
           self.lower[d] = self.lower[d] - ngl*dz[d]
           self.upper[d] = self.upper[d] + ngu*dz[d]
         #end
@@ -254,6 +175,18 @@ class Read_gkyl_adios(object):
       #end
     #end
 
+    # Partial load; only the bounding box of the selection is read
+    # from the file
+    if self.comp is not None or any(z is not None for z in self.axes):
+      grid_idx, idx = _parse_indices(grid, var_dims, self.axes, self.comp)
+      start, count, rest = _bounding_box(idx, var_dims)
+      data = fh.read(self.var_name, start=start, count=count)
+      data = data[rest]
+      grid = _select_grid(grid, grid_idx)
+    else:
+      data = fh.read(self.var_name)
+    #end
+
     fh.close()
     return grid, data
 
@@ -314,6 +247,11 @@ class Read_gkyl_adios(object):
     #end
     if self.is_diagnostic:
       grid, data = self._load_diagnostic()
+      if self.comp is not None or any(z is not None for z in self.axes):
+        grid_idx, idx = _parse_indices(grid, data.shape, self.axes, self.comp)
+        grid = _select_grid(grid, grid_idx)
+        data = data[tuple(idx)]
+      #end
     #end
 
     self.ctx['num_comps'] = data.shape[-1]
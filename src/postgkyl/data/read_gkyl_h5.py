@@ -1,16 +1,22 @@
 import numpy as np
-import tables
+
+from postgkyl.data.select import _parse_indices, _select_grid, _bounding_box
 
 class Read_gkyl_h5(object):
-  """Provides a framework to read gkyl Adios output
+  """Provides a framework to read gkyl HDF5 output
   """
 
   def __init__(self,
                file_name : str,
                ctx : dict = None,
+               axes : tuple = (None, None, None, None, None, None),
+               comp : int = None,
                **kwargs) -> None:
     self._file_name = file_name
 
+    self.axes = axes
+    self.comp = comp
+
     self.is_frame = False
     self.is_diagnostic = False
 
@@ -19,6 +25,7 @@ class Read_gkyl_h5(object):
 
   def _is_compatible(self) -> bool:
     try:
+      import tables
       fh = tables.open_file(self._file_name, 'r')
 
       if '/DataStruct/data' in fh:
@@ -35,7 +42,12 @@ class Read_gkyl_h5(object):
     return self.is_frame or self.is_diagnostic
   #end
 
+  def _is_partial(self) -> bool:
+    return self.comp is not None or any(z is not None for z in self.axes)
+  #end
+
   def _read_frame(self) -> tuple:
+    import tables
     fh = tables.open_file(self._file_name, 'r')
 
     # Postgkyl conventions require the attributes to be
@@ -43,47 +55,62 @@ class Read_gkyl_h5(object):
     lower = np.atleast_1d(fh.root.StructGrid._v_attrs.vsLowerBounds)
     upper = np.atleast_1d(fh.root.StructGrid._v_attrs.vsUpperBounds)
     cells = np.atleast_1d(fh.root.StructGrid._v_attrs.vsNumCells)
-    if '/timeData' in fh:
+    if '/timeData' in fh and self.ctx:
       self.ctx['time'] = fh.root.timeData._v_attrs.vsTime
     #end
 
-    data = fh.root.StructGridField.read()
+    num_dims = len(cells)
+    grid = [np.linspace(lower[d],
+                        upper[d],
+                        cells[d]+1)
+            for d in range(num_dims)]
+    field = fh.root.StructGridField
+    if self._is_partial():
+      # Partial load; only the bounding box of the selection is read
+      # from the file
+      grid_idx, idx = _parse_indices(grid, field.shape, self.axes, self.comp)
+      start, count, rest = _bounding_box(idx, field.shape)
+      box = tuple(slice(lo, lo+n) for lo, n in zip(start, count))
+      data = field[box][rest]
+      grid = _select_grid(grid, grid_idx)
+    else:
+      data = field.read()
+    #end
 
     fh.close()
-    return cells, lower, upper, data
+    return grid, data
+  #end
 
-  def _read_diagnostic(self):
+  def _read_diagnostic(self) -> tuple:
+    import tables
     fh = tables.open_file(self._file_name, 'r')
 
-    grid = fh.root.DataStruct.timeMesh.read()
+    grid = [np.squeeze(fh.root.DataStruct.timeMesh.read())]
     data = fh.root.DataStruct.data.read()
 
     fh.close()
-    #end
 
-    return [np.squeeze(grid)], [grid[0]], [grid[-1]], data
+    if self._is_partial():
+      grid_idx, idx = _parse_indices(grid, data.shape, self.axes, self.comp)
+      grid = _select_grid(grid, grid_idx)
+      data = data[tuple(idx)]
+    #end
+    return grid, data
   #end
 
   # ---- Exposed function ----------------------------------------------
-  def get_data(self) -> tuple:
-    grid = None
+  def preload(self) -> None:
+    pass
+  #end
 
+  def load(self) -> tuple:
     if self.is_frame:
-      cells, lower, upper, data = self._read_frame()
+      grid, data = self._read_frame()
+    else:
+      grid, data = self._read_diagnostic()
     #end
-    if self.is_diagnostic:
-      grid, lower, upper, data = self._read_diagnostic()
-      cells = grid[0].shape
-    #end
-
-    num_dims = len(cells)
-    grid = [np.linspace(lower[d],
-                        upper[d],
-                        cells[d]+1)
-            for d in range(num_dims)]
     if self.ctx:
-      self.ctx['grid_type'] = 'uniform'
+      self.ctx['grid_type'] = 'uniform' if self.is_frame else 'nodal'
     #end
-
     return grid, data
-  #end
\ No newline at end of file
+  #end
@@ -1,32 +1,20 @@
-import numpy as np
-
 from postgkyl.utils import idxParser
 
 
-def select(data, comp=None, overwrite=False,
-           z0=None, z1=None, z2=None,
-           z3=None, z4=None, z5=None):
-  """Selects parts of the GData.
+def _parse_indices(grid, shape, zs=(), comp=None):
+  """Resolves the coordinate and component selections.
 
-  Allows to select only a part of GData (both coordinates and
-  components).  Allows for numpy slices, selecting multiple
-  components, and using both indicies (integer) and values (float).
+  The values of 'zs' and 'comp' are the same as in 'select'. Float
+  coordinates are matched against the 'grid'.
 
-  Atributes:
-    data (GData)
-    z0-5 (index, value, or slice (e.g. '1:5')
-    comp (index, slice (e.g. '1:5'), or multiple (e.g. '1,5')
+  Returns:
+    grid_idx (list): slices of the grid for each dimension
+    values_idx (list): indices of the values including the components
   """
-  zs = (z0, z1, z2, z3, z4, z5)
-  grid = data.get_grid()
-  grid = list(grid)  # copy the grid
-  values = data.get_values()
-  num_dims = data.get_num_dims()
-  values_idx = [slice(0, values.shape[d]) for d in range(num_dims+1)]
+  num_dims = len(shape) - 1
   uniform_grid = (len(grid[0].shape) == 1)
-  if not uniform_grid:
-    grid_idx = [slice(0, grid[d].shape[d]) for d in range(num_dims)]
-  #end
+  grid_idx = [slice(None) for d in range(num_dims)]
+  values_idx = [slice(None) for d in range(num_dims+1)]
 
   # Loop for coordinates
   for d, z in enumerate(zs):
@@ -36,7 +24,7 @@ def select(data, comp=None, overwrite=False,
       else:
         len_grid = grid[d].shape[d]
       #end
-      is_matching = (values.shape[d] == len_grid)
+      is_matching = (shape[d] == len_grid)
       idx = idxParser(z, grid[d], is_matching)
       if isinstance(idx, int):
         # when 'slice' is used instead of an integer
@@ -50,30 +38,86 @@ def select(data, comp=None, overwrite=False,
       else:
         raise TypeError('The coordinate select can be only single index (int) or a slice')
       #end
-      if uniform_grid:
-        grid[d] = grid[d][gIdx]
-      else:
-        grid_idx[d] = gIdx
-      #end
+      grid_idx[d] = gIdx
       values_idx[d] = vIdx
     #end
   #end
 
   # Select components
   if comp is not None:
-    values_idx[-1] = idxParser(comp)
-  #end
-  valuesOut = values[tuple(values_idx)]
-  if not uniform_grid:
-    for d in range(num_dims):
-      grid[d] = grid[d][tuple(grid_idx)]
+    comp_idx = idxParser(comp)
+    if isinstance(comp_idx, int):
+      comp_idx = slice(comp_idx, comp_idx+1)
+    elif isinstance(comp_idx, tuple) and len(comp_idx) > 1:
+      # Evenly spaced components (e.g. '0,2,4') are selected with a
+      # slice, which returns a view instead of a copy
+      step = comp_idx[1] - comp_idx[0]
+      if step > 0 and min(comp_idx) >= 0 and \
+         all(b - a == step for a, b in zip(comp_idx[:-1], comp_idx[1:])):
+        comp_idx = slice(comp_idx[0], comp_idx[-1]+1, step)
+      #end
     #end
+    values_idx[-1] = comp_idx
   #end
+  return grid_idx, values_idx
+#end
 
-  # Adding a dummy dimension indicies
-  if num_dims == len(valuesOut.shape):
-    valuesOut = valuesOut[..., np.newaxis]
+def _select_grid(grid, grid_idx):
+  """Applies the grid slices from '_parse_indices'."""
+  if len(grid[0].shape) == 1:
+    return [g[gIdx] for g, gIdx in zip(grid, grid_idx)]
+  else:
+    return [g[tuple(grid_idx)] for g in grid]
   #end
+#end
+
+def _bounding_box(values_idx, shape):
+  """Splits the indices into a contiguous box and the rest.
+
+  Used by the readers for partial reads; the box is what is read
+  from the file and the rest is applied to it in memory.
+
+  Returns:
+    start (tuple), count (tuple), rest (tuple of indices)
+  """
+  start, count, rest = [], [], []
+  for idx, n in zip(values_idx, shape):
+    if isinstance(idx, slice):
+      lo, up, step = idx.indices(n)
+      up = max(up, lo)
+      start.append(lo)
+      count.append(up - lo)
+      rest.append(slice(None, None, step))
+    else: # Multiple components
+      lo = min(idx)
+      start.append(lo)
+      count.append(max(idx) - lo + 1)
+      rest.append([i - lo for i in idx])
+    #end
+  #end
+  return tuple(start), tuple(count), tuple(rest)
+#end
+
+def select(data, comp=None, overwrite=False,
+           z0=None, z1=None, z2=None,
+           z3=None, z4=None, z5=None):
+  """Selects parts of the GData.
+
+  Allows to select only a part of GData (both coordinates and
+  components).  Allows for numpy slices, selecting multiple
+  components, and using both indicies (integer) and values (float).
+
+  Atributes:
+    data (GData)
+    z0-5 (index, value, or slice (e.g. '1:5')
+    comp (index, slice (e.g. '1:5'), or multiple (e.g. '1,5')
+  """
+  zs = (z0, z1, z2, z3, z4, z5)
+  grid = data.get_grid()
+  values = data.get_values()
+  grid_idx, values_idx = _parse_indices(grid, values.shape, zs, comp)
+  valuesOut = values[tuple(values_idx)]
+  grid = _select_grid(grid, grid_idx)
 
   if overwrite:
     data.push(grid, valuesOut)
@@ -0,0 +1,126 @@
+import os.path
+
+import numpy as np
+
+from postgkyl.data.basis import getInterpMatrix
+
+# Store of the precomputed interpolation ('xform') matrices. Each HDF5
+# file is read once and its matrices are kept, transposed and
+# contiguous, in memory. Matrices not shipped with Postgkyl are
+# generated on the first use and persisted in the user cache directory
+# so the (possibly symbolic) computation is done only once.
+
+path = os.path.dirname(os.path.realpath(__file__))
+
+_files = {}
+
+def getCacheDir():
+  """Returns the user cache directory of Postgkyl.
+
+  This is $POSTGKYL_CACHE_DIR if set and $XDG_CACHE_HOME/postgkyl
+  (~/.cache/postgkyl by default) otherwise.
+  """
+  cacheDir = os.environ.get('POSTGKYL_CACHE_DIR')
+  if cacheDir is None:
+    cacheHome = os.environ.get('XDG_CACHE_HOME',
+                               os.path.join(os.path.expanduser('~'), '.cache'))
+    cacheDir = os.path.join(cacheHome, 'postgkyl')
+  #end
+  return cacheDir
+#end
+
+def _getFileName(basis_type, modal):
+  if modal == False and basis_type.lower() == 'serendipity':
+    return 'xformMatricesNodalSerendipity.h5'
+  elif modal and basis_type.lower() == 'serendipity':
+    return 'xformMatricesModalSerendipity.h5'
+  elif modal and basis_type.lower() == 'maximal-order':
+    return 'xformMatricesModalMaximal.h5'
+  else:
+    raise NameError(
+      "GInterp: Basis {:s} is not supported!\n"
+      "Supported basis are currently 'ns' (Nodal Serendipity), "
+      "'ms' (Modal Serendipity), and 'mo' (Modal Maximal Order)".
+      format(basis_type))
+  #end
+#end
+
+def _readFile(fileName):
+  matrices = {}
+  if os.path.isfile(fileName):
+    import tables
+    with tables.open_file(fileName) as fh:
+      if '/matrices' in fh:
+        for varid, node in fh.root.matrices._v_children.items():
+          mat = np.ascontiguousarray(node.read().transpose())
+          mat.flags.writeable = False
+          matrices[varid] = mat
+        #end
+      #end
+    #end
+  #end
+  return matrices
+#end
+
+def _getMatrices(name):
+  # Shipped matrices take precedence over the generated ones
+  if name not in _files:
+    matrices = _readFile(os.path.join(getCacheDir(), name))
+    matrices.update(_readFile(os.path.join(path, name)))
+    _files[name] = matrices
+  #end
+  return _files[name]
+#end
+
+def _persist(name, varid, mat):
+  # The store still works (in memory) when the cache is not writable
+  import tables
+  try:
+    cacheDir = getCacheDir()
+    os.makedirs(cacheDir, exist_ok=True)
+    with tables.open_file(os.path.join(cacheDir, name), mode='a') as fh:
+      if '/matrices' not in fh:
+        fh.create_group('/', 'matrices')
+      #end
+      if varid not in fh.root.matrices:
+        # Stored the same way as the shipped files
+        fh.create_array('/matrices', varid, np.array(mat).transpose())
+      #end
+    #end
+  except (OSError, tables.exceptions.HDF5ExtError):
+    pass
+  #end
+#end
+
+def loadXformMatrix(dim, poly_order, basis_type, modal=True):
+  """Loads the interpolation matrix onto poly_order+1 points.
+
+  Args:
+    dim (int): Number of dimensions
+    poly_order (int): Polynomial order
+    basis_type (str): 'serendipity' or 'maximal-order'
+    modal (bool): Modal (True) or nodal (False, serendipity only)
+      data
+
+  Returns:
+    mat (ndarray): Read-only array of shape (num_points, num_basis)
+  """
+  name = _getFileName(basis_type, modal)
+  matrices = _getMatrices(name)
+  varid = 'xformMatrix%i%i' % (dim, poly_order)
+  if varid not in matrices:
+    if modal:
+      mat = getInterpMatrix(dim, poly_order, basis_type.lower(),
+                            poly_order+1)
+    else:
+      from postgkyl.data.computeInterpolationMatrices import createInterpMatrix
+      mat = createInterpMatrix(dim, poly_order, 'serendipity',
+                               poly_order+1, False)
+    #end
+    mat = np.ascontiguousarray(mat)
+    mat.flags.writeable = False
+    matrices[varid] = mat
+    _persist(name, varid, mat)
+  #end
+  return matrices[varid]
+#end
@@ -1,111 +1,62 @@
 import numpy as np
-#from postgkyl.data.data import Data
 
-from postgkyl.modalDG.kernels import expand_1d, expand_2d, expand_3d, expand_4d, expand_5d, expand_6d
-
-def interpolate(data, poly_order=None, nodes=None, externalGrid=None):
-    if poly_order is None and data.poly_order is not None:
-        poly_order = data.poly_order
-    else:
-        # Something bad happened :D
-        pass
-    #end
-
-    # Read grid information from input file.
-    numDims = data.get_num_dims()
-    lower, upper = data.get_bounds()
-    numCells = data.get_num_cells()
-
-    # If user specifies an interpolation grid, use it. Otherwise calculate.
-    if externalGrid:
-        intGrid = externalGrid
-    else:
-        intGrid = [np.linspace(lower[d],
-                               upper[d],
-                               numCells[d]*(poly_order+1)+1)
-                   for d in range(numDims)]
-    #end
-
-    # Calculate interpolation nodes for each element.
-    if not nodes:
-        dx = 2/(poly_order+1)
-        nodes = np.linspace(-1+dx/2, 1-dx/2, poly_order+1)
-    #end
-
-    # Set up array for interp node values
-    values = data.get_values()
-    intValues = np.zeros(np.int32(numCells*len(nodes)))
-    intValues = intValues[..., np.newaxis]
-
-
-    # Iterating through the node list, calculate value at each node for each element
-    # simultaneously, one dimension at a time.
-    # TODO: Rework for numDims > 3, currently very slow.
-    if numDims == 1:
-        for i, x in enumerate(nodes):
-            intValues[i::len(nodes), 0] = expand_1d[int(poly_order-1)](values, x)
-        #end
-
-    elif numDims == 2:
-        for i, x in enumerate(nodes):
-            for j, y in enumerate(nodes):
-                intValues[i::len(nodes), j::len(nodes), 0] = expand_2d[int(poly_order-1)](values, x, y)
-            #end
-        #end
-    #end
-
-    elif numDims == 3:
-        for i, x in enumerate(nodes):
-            for j, y in enumerate(nodes):
-                for k, z in enumerate(nodes):
-                    intValues[i::len(nodes), j::len(nodes), k::len(nodes), 0] = expand_3d[int(poly_order-1)](values, x, y, z)
-                #end
-            #end
-        #end
-    #end
-
-    elif numDims == 4:
-        for i, x in enumerate(nodes):
-            for j, y in enumerate(nodes):
-                for k, z in enumerate(nodes):
-                    for l, r in enumerate(nodes):
-                        intValues[i::len(nodes), j::len(nodes), k::len(nodes), l::len(nodes), 0] = expand_4d[int(poly_order-1)](values, x, y, z, r)
-                    #end
-                #end
-            #end
-        #end
-    #end
-
-    elif numDims == 5:
-        for i, x in enumerate(nodes):
-            for j, y in enumerate(nodes):
-                for k, z in enumerate(nodes):
-                    for l, r in enumerate(nodes):
-                        for m, s in enumerate(nodes):
-                            intValues[i::len(nodes), j::len(nodes), k::len(nodes), l::len(nodes), m::len(nodes), 0] = expand_5d[int(poly_order-1)](values, x, y, z, r, s)
-                         #end
-                    #end
-                #end
-            #end
-        #end
-    #end
-
-    elif numDims == 6:
-        for i, x in enumerate(nodes):
-            for j, y in enumerate(nodes):
-                for k, z in enumerate(nodes):
-                    for l, r in enumerate(nodes):
-                        for m, s in enumerate(nodes):
-                            for n, t in enumerate(nodes):
-                                intValues[i::len(nodes), j::len(nodes), k::len(nodes), l::len(nodes), m::len(nodes), n::len(nodes), 0] = expand_6d[int(poly_order-1)](values, x, y, z, r, s, t)
-                         #end
-                    #end
-                #end
-            #end
-        #end
-    #end
-
-    # Hardcoded stack
-    data.pushGrid(intGrid)
-    data.pushValues(intValues)
+from postgkyl.data.basis import getInterpMatrix
+from postgkyl.data.dg import _interpOnMesh
+
+def interpolate(data, poly_order=None, nodes=None, externalGrid=None,
+                basis_type=None, overwrite=True):
+  """Interpolates the modal expansion of the first component.
+
+  All the nodes of all the cells are evaluated at once with an
+  interpolation matrix generated from the basis values, i.e., without
+  the symbolic computation of GInterpModal.
+
+  Args:
+    data (GData): Modal DG data
+    poly_order (int): Polynomial order (default: from the data)
+    nodes (int or ndarray): Number of the cell-centered nodes or the
+      reference coordinates of the nodes in [-1, 1] (default:
+      poly_order+1)
+    externalGrid (list): Optional grid of the result
+    basis_type (str): Basis type (default: from the data or
+      'serendipity')
+    overwrite (bool): Push the result to the GData
+  """
+  if poly_order is None:
+    poly_order = data.ctx['poly_order']
+  #end
+  if basis_type is None:
+    basis_type = data.ctx['basis_type'] or 'serendipity'
+  #end
+  if nodes is None:
+    nodes = poly_order+1
+  #end
+  numNodes = nodes if np.ndim(nodes) == 0 else len(nodes)
+
+  # Read grid information from input file.
+  numDims = data.get_num_dims()
+  lower, upper = data.get_bounds()
+  numCells = data.get_num_cells()
+
+  cMat = getInterpMatrix(numDims, poly_order, basis_type, nodes)
+  # The hybrid directions only get an extra node for the default nodes
+  meshBasis = basis_type if np.ndim(nodes) == 0 else 'serendipity'
+  values = data.get_values()[..., :cMat.shape[1]]
+  intValues = _interpOnMesh(cMat, values, numNodes, meshBasis)
+  intValues = intValues[..., np.newaxis]
+
+  # If user specifies an interpolation grid, use it. Otherwise calculate.
+  if externalGrid:
+    intGrid = externalGrid
+  else:
+    shape = intValues.shape[:numDims]
+    intGrid = [np.linspace(lower[d], upper[d], shape[d]+1)
+               for d in range(numDims)]
+  #end
+
+  if overwrite:
+    data.push(intGrid, intValues)
+  else:
+    return intGrid, intValues
+  #end
 #end
@@ -1,6 +1,31 @@
-from .expand1d import expand_1d
-from .expand2d import expand_2d
-from .expand3d import expand_3d
-from .expand4d import expand_4d
-from .expand5d import expand_5d
-from .expand6d import expand_6d
+import numpy as np
+
+from postgkyl.data.basis import evalBasis
+
+# The expansion kernels of the modal serendipity basis used to be
+# generated as explicit polynomials (one file per dimension) and had
+# to be called once per node. They are now generated from the basis
+# values (see data/basis.py) and evaluate all the nodes in one call.
+
+def _makeExpand(dim, poly_order, basis_type='serendipity'):
+  def expand(f, *x):
+    """Evaluates the expansion with coefficients 'f' (last index) at
+    the reference points 'x' (one broadcastable array per dimension).
+    The result has the shape f.shape[:-1] + broadcast(x).shape.
+    """
+    x = np.broadcast_arrays(*[np.asarray(xd, np.float64) for xd in x])
+    shape = x[0].shape
+    xi = np.stack([xd.ravel() for xd in x], axis=-1)
+    basis = evalBasis(dim, poly_order, basis_type, xi)
+    values = np.dot(f[..., :basis.shape[1]], basis.transpose())
+    return values.reshape(f.shape[:-1] + shape)
+  #end
+  return expand
+#end
+
+expand_1d = [_makeExpand(1, p) for p in range(1, 5)]
+expand_2d = [_makeExpand(2, p) for p in range(1, 5)]
+expand_3d = [_makeExpand(3, p) for p in range(1, 5)]
+expand_4d = [_makeExpand(4, p) for p in range(1, 5)]
+expand_5d = [_makeExpand(5, p) for p in range(1, 5)]
+expand_6d = [_makeExpand(6, p) for p in range(1, 5)]
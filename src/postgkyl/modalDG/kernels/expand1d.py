@@ -1,17 +0,0 @@
-def _expand_1d1p(f, x):
-    return 1.224744871391589*f[..., 1]*x+0.7071067811865475*f[..., 0]
-#end
-
-def _expand_1d2p(f, x):
-    return 2.371708245126284*f[..., 2]*(x^2-0.3333333333333333)+1.224744871391589*f[..., 1]*x+0.7071067811865475*f[..., 0]
-#end
-
-def _expand_1d3p(f, x):
-    return 4.677071733467426*f[..., 3]*(x^3-0.6*x)+2.371708245126284*f[..., 2]*(x^2-0.3333333333333333)+1.224744871391589*f[..., 1]*x+0.7071067811865475*f[..., 0]
-#end
-
-def _expand_1d4p(f, x):
-    return 9.280776503073433*f[..., 4]*(x^4-0.8571428571428571*(x^2-0.3333333333333333)-0.2)+4.677071733467426*f[..., 3]*(x^3-0.6*x)+2.371708245126284*f[..., 2]*(x^2-0.3333333333333333)+1.224744871391589*f[..., 1]*x+0.7071067811865475*f[..., 0]
-#end
-
-expand_1d = [_expand_1d1p, _expand_1d2p, _expand_1d3p, _expand_1d4p]
@@ -1,17 +0,0 @@
-def _expand_3d1p(f, x, y, z):
-    return 1.837117307087383*f[..., 7]*x*y*z+1.060660171779821*f[..., 6]*y*z+1.060660171779821*f[..., 5]*x*z+0.6123724356957944*f[..., 3]*z+1.060660171779821*f[..., 4]*x*y+0.6123724356957944*f[..., 2]*y+0.6123724356957944*f[..., 1]*x+0.3535533905932737*f[..., 0]
-#end
-
-def _expand_3d2p(f, x, y, z):
-    return 3.557562367689425*f[..., 19]*(x*y*z**2-0.3333333333333333*x*y)+2.053959590644372*f[..., 16]*(y*z**2-0.3333333333333333*y)+2.053959590644372*f[..., 15]*(x*z**2-0.3333333333333333*x)+1.185854122563142*f[..., 9]*(z**2-0.3333333333333333)+3.557562367689425*f[..., 18]*(x*y**2*z-0.3333333333333333*x*z)+2.053959590644372*f[..., 14]*(y**2*z-0.3333333333333333*z)+3.557562367689425*f[..., 17]*(x**2*y*z-0.3333333333333333*y*z)+2.053959590644372*f[..., 13]*(x**2*z-0.3333333333333333*z)+1.837117307087383*f[..., 10]*x*y*z+1.060660171779821*f[..., 6]*y*z+1.060660171779821*f[..., 5]*x*z+0.6123724356957944*f[..., 3]*z+2.053959590644372*f[..., 12]*(x*y**2-0.3333333333333333*x)+1.185854122563142*f[..., 8]*(y**2-0.3333333333333333)+2.053959590644372*f[..., 11]*(x**2*y-0.3333333333333333*y)+1.060660171779821*f[..., 4]*x*y+0.6123724356957944*f[..., 2]*y+1.185854122563142*f[..., 7]*(x**2-0.3333333333333333)+0.6123724356957944*f[..., 1]*x+0.3535533905932737*f[..., 0]
-#end
-
-def _expand_3d3p(f, x, y, z):
-    return 7.015607600201137*f[..., 31]*(x*y*z**3-0.6*x*y*z)+4.050462936504911*f[..., 28]*(y*z**3-0.6*y*z)+4.050462936504911*f[..., 27]*(x*z**3-0.6*x*z)+2.338535866733713*f[..., 19]*(z**3-0.6*z)+3.557562367689425*f[..., 22]*(x*y*z**2-0.3333333333333333*x*y)+2.053959590644372*f[..., 16]*(y*z**2-0.3333333333333333*y)+2.053959590644372*f[..., 15]*(x*z**2-0.3333333333333333*x)+1.185854122563142*f[..., 9]*(z**2-0.3333333333333333)+7.015607600201137*f[..., 30]*(x*y**3*z-0.6*x*y*z)+4.050462936504911*f[..., 26]*(y**3*z-0.6*y*z)+3.557562367689425*f[..., 21]*(x*y**2*z-0.3333333333333333*x*z)+2.053959590644372*f[..., 14]*(y**2*z-0.3333333333333333*z)+7.015607600201137*f[..., 29]*(x**3*y*z-0.6*x*y*z)+3.557562367689425*f[..., 20]*(x**2*y*z-0.3333333333333333*y*z)+4.050462936504911*f[..., 25]*(x**3*z-0.6*x*z)+2.053959590644372*f[..., 13]*(x**2*z-0.3333333333333333*z)+1.837117307087383*f[..., 10]*x*y*z+1.060660171779821*f[..., 6]*y*z+1.060660171779821*f[..., 5]*x*z+0.6123724356957944*f[..., 3]*z+4.050462936504911*f[..., 24]*(x*y**3-0.6*x*y)+2.338535866733713*f[..., 18]*(y**3-0.6*y)+2.053959590644372*f[..., 12]*(x*y**2-0.3333333333333333*x)+1.185854122563142*f[..., 8]*(y**2-0.3333333333333333)+4.050462936504911*f[..., 23]*(x**3*y-0.6*x*y)+2.053959590644372*f[..., 11]*(x**2*y-0.3333333333333333*y)+1.060660171779821*f[..., 4]*x*y+0.6123724356957944*f[..., 2]*y+2.338535866733713*f[..., 17]*(x**3-0.6*x)+1.185854122563142*f[..., 7]*(x**2-0.3333333333333333)+0.6123724356957944*f[..., 1]*x+0.3535533905932737*f[..., 0]
-#end
-
-def _expand_3d4p(f, x, y, z):
-    return 13.92116475461015*f[..., 49]*(x*y*z**4-0.8571428571428571*(x*y*z**2-0.3333333333333333*x*y)-0.2*x*y)+8.037388218507298*f[..., 46]*(y*z**4-0.8571428571428571*(y*z**2-0.3333333333333333*y)-0.2*y)+8.037388218507298*f[..., 45]*(x*z**4-0.8571428571428571*(x*z**2-0.3333333333333333*x)-0.2*x)+4.640388251536716*f[..., 34]*(z**4-0.8571428571428571*(z**2-0.3333333333333333)-0.2)+7.015607600201137*f[..., 40]*(x*y*z**3-0.6*x*y*z)+4.050462936504911*f[..., 31]*(y*z**3-0.6*y*z)+4.050462936504911*f[..., 30]*(x*z**3-0.6*x*z)+2.338535866733713*f[..., 19]*(z**3-0.6*z)+6.889189901577683*f[..., 36]*+6.889189901577683*f[..., 37]*+3.977475644174328*f[..., 25]*+3.557562367689425*f[..., 22]*(x*y*z**2-0.3333333333333333*x*y)+2.053959590644372*f[..., 16]*(y*z**2-0.3333333333333333*y)+3.977475644174328*f[..., 24]*+2.053959590644372*f[..., 15]*(x*z**2-0.3333333333333333*x)+1.185854122563142*f[..., 9]*(z**2-0.3333333333333333)+13.92116475461015*f[..., 48]*(-0.8571428571428571*(x*y**2*z-0.3333333333333333*x*z)+x*y**4*z-0.2*x*z)+6.889189901577683*f[..., 35]*+8.037388218507298*f[..., 44]*(-0.8571428571428571*(y**2*z-0.3333333333333333*z)+y**4*z-0.2*z)+13.92116475461015*f[..., 47]*(-0.8571428571428571*(x**2*y*z-0.3333333333333333*y*z)+x**4*y*z-0.2*y*z)+8.037388218507298*f[..., 43]*(-0.8571428571428571*(x**2*z-0.3333333333333333*z)+x**4*z-0.2*z)+7.015607600201137*f[..., 39]*(x*y**3*z-0.6*x*y*z)+4.050462936504911*f[..., 29]*(y**3*z-0.6*y*z)+3.557562367689425*f[..., 21]*(x*y**2*z-0.3333333333333333*x*z)+2.053959590644372*f[..., 14]*(y**2*z-0.3333333333333333*z)+7.015607600201137*f[..., 38]*(x**3*y*z-0.6*x*y*z)+3.557562367689425*f[..., 20]*(x**2*y*z-0.3333333333333333*y*z)+4.050462936504911*f[..., 28]*(x**3*z-0.6*x*z)+2.053959590644372*f[..., 13]*(x**2*z-0.3333333333333333*z)+1.837117307087383*f[..., 10]*x*y*z+1.060660171779821*f[..., 6]*y*z+1.060660171779821*f[..., 5]*x*z+0.6123724356957944*f[..., 3]*z+8.037388218507298*f[..., 42]*(x*y**4-0.8571428571428571*(x*y**2-0.3333333333333333*x)-0.2*x)+4.640388251536716*f[..., 33]*(y**4-0.8571428571428571*(y**2-0.3333333333333333)-0.2)+4.050462936504911*f[..., 27]*(x*y**3-0.6*x*y)+2.338535866733713*f[..., 18]*(y**3-0.6*y)+3.977475644174328*f[..., 23]*+2.053959590644372*f[..., 12]*(x*y**2-0.3333333333333333*x)+1.185854122563142*f[..., 8]*(y**2-0.3333333333333333)+8.037388218507298*f[..., 41]*(-0.8571428571428571*(x**2*y-0.3333333333333333*y)+x**4*y-0.2*y)+4.050462936504911*f[..., 26]*(x**3*y-0.6*x*y)+2.053959590644372*f[..., 11]*(x**2*y-0.3333333333333333*y)+1.060660171779821*f[..., 4]*x*y+0.6123724356957944*f[..., 2]*y+4.640388251536716*f[..., 32]*(x**4-0.8571428571428571*(x**2-0.3333333333333333)-0.2)+2.338535866733713*f[..., 17]*(x**3-0.6*x)+1.185854122563142*f[..., 7]*(x**2-0.3333333333333333)+0.6123724356957944*f[..., 1]*x+0.3535533905932737*f[..., 0]
-#end
-
-expand_3d = [_expand_3d1p, _expand_3d2p, _expand_3d3p, _expand_3d4p]
@@ -1,17 +0,0 @@
-def _expand_4d1p(f, x, y, z, vx):
-    return 2.25*f[..., 15]*vx*x*y*z+1.299038105676658*f[..., 11]*x*y*z+1.299038105676658*f[..., 14]*vx*y*z+0.75*f[..., 7]*y*z+1.299038105676658*f[..., 13]*vx*x*z+0.75*f[..., 6]*x*z+0.75*f[..., 10]*vx*z+0.4330127018922193*f[..., 3]*z+1.299038105676658*f[..., 12]*vx*x*y+0.75*f[..., 5]*x*y+0.75*f[..., 9]*vx*y+0.4330127018922193*f[..., 2]*y+0.75*f[..., 8]*vx*x+0.4330127018922193*f[..., 1]*x+0.4330127018922193*f[..., 4]*vx+0.25*f[..., 0]
-#end
-
-def _expand_4d2p(f, x, y, z, vx):
-    return 4.357106264483344*f[..., 46]*(vx*x*y*z**2-0.3333333333333333*vx*x*y)+2.515576474687264*f[..., 34]*(x*y*z**2-0.3333333333333333*x*y)+2.515576474687264*f[..., 40]*(vx*y*z**2-0.3333333333333333*vx*y)+1.452368754827781*f[..., 24]*(y*z**2-0.3333333333333333*y)+2.515576474687264*f[..., 39]*(vx*x*z**2-0.3333333333333333*vx*x)+1.452368754827781*f[..., 23]*(x*z**2-0.3333333333333333*x)+1.452368754827781*f[..., 27]*(vx*z**2-0.3333333333333333*vx)+0.8385254915624212*f[..., 13]*(z**2-0.3333333333333333)+4.357106264483344*f[..., 45]*(vx*x*y**2*z-0.3333333333333333*vx*x*z)+2.515576474687264*f[..., 33]*(x*y**2*z-0.3333333333333333*x*z)+2.515576474687264*f[..., 38]*(vx*y**2*z-0.3333333333333333*vx*z)+1.452368754827781*f[..., 22]*(y**2*z-0.3333333333333333*z)+4.357106264483344*f[..., 44]*(vx*x**2*y*z-0.3333333333333333*vx*y*z)+2.515576474687264*f[..., 32]*(x**2*y*z-0.3333333333333333*y*z)+4.357106264483344*f[..., 47]*(vx**2*x*y*z-0.3333333333333333*x*y*z)+2.515576474687264*f[..., 43]*(vx**2*y*z-0.3333333333333333*y*z)+2.515576474687264*f[..., 37]*(vx*x**2*z-0.3333333333333333*vx*z)+1.452368754827781*f[..., 21]*(x**2*z-0.3333333333333333*z)+2.515576474687264*f[..., 42]*(vx**2*x*z-0.3333333333333333*x*z)+1.452368754827781*f[..., 30]*(vx**2*z-0.3333333333333333*z)+2.25*f[..., 31]*vx*x*y*z+1.299038105676658*f[..., 15]*x*y*z+1.299038105676658*f[..., 18]*vx*y*z+0.75*f[..., 7]*y*z+1.299038105676658*f[..., 17]*vx*x*z+0.75*f[..., 6]*x*z+0.75*f[..., 10]*vx*z+0.4330127018922193*f[..., 3]*z+2.515576474687264*f[..., 36]*(vx*x*y**2-0.3333333333333333*vx*x)+1.452368754827781*f[..., 20]*(x*y**2-0.3333333333333333*x)+1.452368754827781*f[..., 26]*(vx*y**2-0.3333333333333333*vx)+0.8385254915624212*f[..., 12]*(y**2-0.3333333333333333)+2.515576474687264*f[..., 35]*(vx*x**2*y-0.3333333333333333*vx*y)+1.452368754827781*f[..., 19]*(x**2*y-0.3333333333333333*y)+2.515576474687264*f[..., 41]*(vx**2*x*y-0.3333333333333333*x*y)+1.452368754827781*f[..., 29]*(vx**2*y-0.3333333333333333*y)+1.299038105676658*f[..., 16]*vx*x*y+0.75*f[..., 5]*x*y+0.75*f[..., 9]*vx*y+0.4330127018922193*f[..., 2]*y+1.452368754827781*f[..., 25]*(vx*x**2-0.3333333333333333*vx)+0.8385254915624212*f[..., 11]*(x**2-0.3333333333333333)+1.452368754827781*f[..., 28]*(vx**2*x-0.3333333333333333*x)+0.75*f[..., 8]*vx*x+0.4330127018922193*f[..., 1]*x+0.8385254915624212*f[..., 14]*(vx**2-0.3333333333333333)+0.4330127018922193*f[..., 4]*vx+0.25*f[..., 0]
-#end
-
-def _expand_4d3p(f, x, y, z, vx):
-    return 8.5923294280422*f[..., 78]*(vx*x*y*z**3-0.6*vx*x*y*z)+4.960783708246107*f[..., 66]*(x*y*z**3-0.6*x*y*z)+4.960783708246107*f[..., 72]*(vx*y*z**3-0.6*vx*y*z)+2.8641098093474*f[..., 53]*(y*z**3-0.6*y*z)+4.960783708246107*f[..., 71]*(vx*x*z**3-0.6*vx*x*z)+2.8641098093474*f[..., 52]*(x*z**3-0.6*x*z)+2.8641098093474*f[..., 56]*(vx*z**3-0.6*vx*z)+1.653594569415369*f[..., 33]*(z**3-0.6*z)+4.357106264483344*f[..., 62]*(vx*x*y*z**2-0.3333333333333333*vx*x*y)+2.515576474687264*f[..., 38]*(x*y*z**2-0.3333333333333333*x*y)+2.515576474687264*f[..., 44]*(vx*y*z**2-0.3333333333333333*vx*y)+1.452368754827781*f[..., 24]*(y*z**2-0.3333333333333333*y)+2.515576474687264*f[..., 43]*(vx*x*z**2-0.3333333333333333*vx*x)+1.452368754827781*f[..., 23]*(x*z**2-0.3333333333333333*x)+1.452368754827781*f[..., 27]*(vx*z**2-0.3333333333333333*vx)+0.8385254915624212*f[..., 13]*(z**2-0.3333333333333333)+8.5923294280422*f[..., 77]*(vx*x*y**3*z-0.6*vx*x*y*z)+4.960783708246107*f[..., 65]*(x*y**3*z-0.6*x*y*z)+4.960783708246107*f[..., 70]*(vx*y**3*z-0.6*vx*y*z)+2.8641098093474*f[..., 51]*(y**3*z-0.6*y*z)+4.357106264483344*f[..., 61]*(vx*x*y**2*z-0.3333333333333333*vx*x*z)+2.515576474687264*f[..., 37]*(x*y**2*z-0.3333333333333333*x*z)+2.515576474687264*f[..., 42]*(vx*y**2*z-0.3333333333333333*vx*z)+1.452368754827781*f[..., 22]*(y**2*z-0.3333333333333333*z)+8.5923294280422*f[..., 76]*(vx*x**3*y*z-0.6*vx*x*y*z)+4.960783708246107*f[..., 64]*(x**3*y*z-0.6*x*y*z)+4.357106264483344*f[..., 60]*(vx*x**2*y*z-0.3333333333333333*vx*y*z)+2.515576474687264*f[..., 36]*(x**2*y*z-0.3333333333333333*y*z)+8.5923294280422*f[..., 79]*(vx**3*x*y*z-0.6*vx*x*y*z)+4.357106264483344*f[..., 63]*(vx**2*x*y*z-0.3333333333333333*x*y*z)+4.960783708246107*f[..., 75]*(vx**3*y*z-0.6*vx*y*z)+2.515576474687264*f[..., 47]*(vx**2*y*z-0.3333333333333333*y*z)+4.960783708246107*f[..., 69]*(vx*x**3*z-0.6*vx*x*z)+2.8641098093474*f[..., 50]*(x**3*z-0.6*x*z)+2.515576474687264*f[..., 41]*(vx*x**2*z-0.3333333333333333*vx*z)+1.452368754827781*f[..., 21]*(x**2*z-0.3333333333333333*z)+4.960783708246107*f[..., 74]*(vx**3*x*z-0.6*vx*x*z)+2.515576474687264*f[..., 46]*(vx**2*x*z-0.3333333333333333*x*z)+2.8641098093474*f[..., 59]*(vx**3*z-0.6*vx*z)+1.452368754827781*f[..., 30]*(vx**2*z-0.3333333333333333*z)+2.25*f[..., 35]*vx*x*y*z+1.299038105676658*f[..., 15]*x*y*z+1.299038105676658*f[..., 18]*vx*y*z+0.75*f[..., 7]*y*z+1.299038105676658*f[..., 17]*vx*x*z+0.75*f[..., 6]*x*z+0.75*f[..., 10]*vx*z+0.4330127018922193*f[..., 3]*z+4.960783708246107*f[..., 68]*(vx*x*y**3-0.6*vx*x*y)+2.8641098093474*f[..., 49]*(x*y**3-0.6*x*y)+2.8641098093474*f[..., 55]*(vx*y**3-0.6*vx*y)+1.653594569415369*f[..., 32]*(y**3-0.6*y)+2.515576474687264*f[..., 40]*(vx*x*y**2-0.3333333333333333*vx*x)+1.452368754827781*f[..., 20]*(x*y**2-0.3333333333333333*x)+1.452368754827781*f[..., 26]*(vx*y**2-0.3333333333333333*vx)+0.8385254915624212*f[..., 12]*(y**2-0.3333333333333333)+4.960783708246107*f[..., 67]*(vx*x**3*y-0.6*vx*x*y)+2.8641098093474*f[..., 48]*(x**3*y-0.6*x*y)+2.515576474687264*f[..., 39]*(vx*x**2*y-0.3333333333333333*vx*y)+1.452368754827781*f[..., 19]*(x**2*y-0.3333333333333333*y)+4.960783708246107*f[..., 73]*(vx**3*x*y-0.6*vx*x*y)+2.515576474687264*f[..., 45]*(vx**2*x*y-0.3333333333333333*x*y)+2.8641098093474*f[..., 58]*(vx**3*y-0.6*vx*y)+1.452368754827781*f[..., 29]*(vx**2*y-0.3333333333333333*y)+1.299038105676658*f[..., 16]*vx*x*y+0.75*f[..., 5]*x*y+0.75*f[..., 9]*vx*y+0.4330127018922193*f[..., 2]*y+2.8641098093474*f[..., 54]*(vx*x**3-0.6*vx*x)+1.653594569415369*f[..., 31]*(x**3-0.6*x)+1.452368754827781*f[..., 25]*(vx*x**2-0.3333333333333333*vx)+0.8385254915624212*f[..., 11]*(x**2-0.3333333333333333)+2.8641098093474*f[..., 57]*(vx**3*x-0.6*vx*x)+1.452368754827781*f[..., 28]*(vx**2*x-0.3333333333333333*x)+0.75*f[..., 8]*vx*x+0.4330127018922193*f[..., 1]*x+1.653594569415369*f[..., 34]*(vx**3-0.6*vx)+0.8385254915624212*f[..., 14]*(vx**2-0.3333333333333333)+0.4330127018922193*f[..., 4]*vx+0.25*f[..., 0]
-#end
-
-def _expand_4d4p(f, x, y, z, vx):
-    return 17.04987513700613*f[..., 134]*(vx*x*y*z**4-0.8571428571428571*(vx*x*y*z**2-0.3333333333333333*vx*x*y)-0.2*vx*x*y)+9.84375*f[..., 122]*(x*y*z**4-0.8571428571428571*(x*y*z**2-0.3333333333333333*x*y)-0.2*x*y)+9.84375*f[..., 128]*(vx*y*z**4-0.8571428571428571*(vx*y*z**2-0.3333333333333333*vx*y)-0.2*vx*y)+5.683291712335378*f[..., 103]*(y*z**4-0.8571428571428571*(y*z**2-0.3333333333333333*y)-0.2*y)+9.84375*f[..., 127]*(vx*x*z**4-0.8571428571428571*(vx*x*z**2-0.3333333333333333*vx*x)-0.2*vx*x)+5.683291712335378*f[..., 102]*(x*z**4-0.8571428571428571*(x*z**2-0.3333333333333333*x)-0.2*x)+5.683291712335378*f[..., 106]*(vx*z**4-0.8571428571428571*(vx*z**2-0.3333333333333333*vx)-0.2*vx)+3.28125*f[..., 68]*(z**4-0.8571428571428571*(z**2-0.3333333333333333)-0.2)+8.5923294280422*f[..., 118]*(vx*x*y*z**3-0.6*vx*x*y*z)+4.960783708246107*f[..., 88]*(x*y*z**3-0.6*x*y*z)+4.960783708246107*f[..., 94]*(vx*y*z**3-0.6*vx*y*z)+2.8641098093474*f[..., 59]*(y*z**3-0.6*y*z)+4.960783708246107*f[..., 93]*(vx*x*z**3-0.6*vx*x*z)+2.8641098093474*f[..., 58]*(x*z**3-0.6*x*z)+2.8641098093474*f[..., 62]*(vx*z**3-0.6*vx*z)+1.653594569415369*f[..., 33]*(z**3-0.6*z)+8.4375*f[..., 115]*+8.4375*f[..., 111]*+4.871392896287466*f[..., 75]*+4.871392896287466*f[..., 85]*+8.4375*f[..., 112]*+4.871392896287466*f[..., 76]*+4.871392896287466*f[..., 84]*+4.871392896287466*f[..., 79]*+4.871392896287466*f[..., 78]*+2.8125*f[..., 50]*+4.357106264483344*f[..., 72]*(vx*x*y*z**2-0.3333333333333333*vx*x*y)+2.515576474687264*f[..., 38]*(x*y*z**2-0.3333333333333333*x*y)+2.515576474687264*f[..., 44]*(vx*y*z**2-0.3333333333333333*vx*y)+1.452368754827781*f[..., 24]*(y*z**2-0.3333333333333333*y)+2.8125*f[..., 49]*+2.515576474687264*f[..., 43]*(vx*x*z**2-0.3333333333333333*vx*x)+1.452368754827781*f[..., 23]*(x*z**2-0.3333333333333333*x)+2.8125*f[..., 53]*+1.452368754827781*f[..., 27]*(vx*z**2-0.3333333333333333*vx)+0.8385254915624212*f[..., 13]*(z**2-0.3333333333333333)+17.04987513700613*f[..., 133]*(-0.8571428571428571*(vx*x*y**2*z-0.3333333333333333*vx*x*z)+vx*x*y**4*z-0.2*vx*x*z)+8.4375*f[..., 114]*+9.84375*f[..., 121]*(-0.8571428571428571*(x*y**2*z-0.3333333333333333*x*z)+x*y**4*z-0.2*x*z)+8.4375*f[..., 110]*+9.84375*f[..., 126]*(-0.8571428571428571*(vx*y**2*z-0.3333333333333333*vx*z)+vx*y**4*z-0.2*vx*z)+4.871392896287466*f[..., 74]*+4.871392896287466*f[..., 83]*+5.683291712335378*f[..., 101]*(-0.8571428571428571*(y**2*z-0.3333333333333333*z)+y**4*z-0.2*z)+17.04987513700613*f[..., 132]*(-0.8571428571428571*(vx*x**2*y*z-0.3333333333333333*vx*y*z)+vx*x**4*y*z-0.2*vx*y*z)+8.4375*f[..., 113]*+9.84375*f[..., 120]*(-0.8571428571428571*(x**2*y*z-0.3333333333333333*y*z)+x**4*y*z-0.2*y*z)+17.04987513700613*f[..., 135]*(-0.8571428571428571*(vx**2*x*y*z-0.3333333333333333*x*y*z)+vx**4*x*y*z-0.2*x*y*z)+9.84375*f[..., 131]*(-0.8571428571428571*(vx**2*y*z-0.3333333333333333*y*z)+vx**4*y*z-0.2*y*z)+9.84375*f[..., 125]*(-0.8571428571428571*(vx*x**2*z-0.3333333333333333*vx*z)+vx*x**4*z-0.2*vx*z)+4.871392896287466*f[..., 82]*+5.683291712335378*f[..., 100]*(-0.8571428571428571*(x**2*z-0.3333333333333333*z)+x**4*z-0.2*z)+9.84375*f[..., 130]*(-0.8571428571428571*(vx**2*x*z-0.3333333333333333*x*z)+vx**4*x*z-0.2*x*z)+5.683291712335378*f[..., 109]*(-0.8571428571428571*(vx**2*z-0.3333333333333333*z)+vx**4*z-0.2*z)+8.5923294280422*f[..., 117]*(vx*x*y**3*z-0.6*vx*x*y*z)+4.960783708246107*f[..., 87]*(x*y**3*z-0.6*x*y*z)+4.960783708246107*f[..., 92]*(vx*y**3*z-0.6*vx*y*z)+2.8641098093474*f[..., 57]*(y**3*z-0.6*y*z)+4.357106264483344*f[..., 71]*(vx*x*y**2*z-0.3333333333333333*vx*x*z)+2.515576474687264*f[..., 37]*(x*y**2*z-0.3333333333333333*x*z)+2.515576474687264*f[..., 42]*(vx*y**2*z-0.3333333333333333*vx*z)+1.452368754827781*f[..., 22]*(y**2*z-0.3333333333333333*z)+8.5923294280422*f[..., 116]*(vx*x**3*y*z-0.6*vx*x*y*z)+4.960783708246107*f[..., 86]*(x**3*y*z-0.6*x*y*z)+4.357106264483344*f[..., 70]*(vx*x**2*y*z-0.3333333333333333*vx*y*z)+2.515576474687264*f[..., 36]*(x**2*y*z-0.3333333333333333*y*z)+8.5923294280422*f[..., 119]*(vx**3*x*y*z-0.6*vx*x*y*z)+4.357106264483344*f[..., 73]*(vx**2*x*y*z-0.3333333333333333*x*y*z)+4.960783708246107*f[..., 97]*(vx**3*y*z-0.6*vx*y*z)+2.515576474687264*f[..., 47]*(vx**2*y*z-0.3333333333333333*y*z)+4.960783708246107*f[..., 91]*(vx*x**3*z-0.6*vx*x*z)+2.8641098093474*f[..., 56]*(x**3*z-0.6*x*z)+2.515576474687264*f[..., 41]*(vx*x**2*z-0.3333333333333333*vx*z)+1.452368754827781*f[..., 21]*(x**2*z-0.3333333333333333*z)+4.960783708246107*f[..., 96]*(vx**3*x*z-0.6*vx*x*z)+2.515576474687264*f[..., 46]*(vx**2*x*z-0.3333333333333333*x*z)+2.8641098093474*f[..., 65]*(vx**3*z-0.6*vx*z)+1.452368754827781*f[..., 30]*(vx**2*z-0.3333333333333333*z)+2.25*f[..., 35]*vx*x*y*z+1.299038105676658*f[..., 15]*x*y*z+1.299038105676658*f[..., 18]*vx*y*z+0.75*f[..., 7]*y*z+1.299038105676658*f[..., 17]*vx*x*z+0.75*f[..., 6]*x*z+0.75*f[..., 10]*vx*z+0.4330127018922193*f[..., 3]*z+9.84375*f[..., 124]*(vx*x*y**4-0.8571428571428571*(vx*x*y**2-0.3333333333333333*vx*x)-0.2*vx*x)+5.683291712335378*f[..., 99]*(x*y**4-0.8571428571428571*(x*y**2-0.3333333333333333*x)-0.2*x)+5.683291712335378*f[..., 105]*(vx*y**4-0.8571428571428571*(vx*y**2-0.3333333333333333*vx)-0.2*vx)+3.28125*f[..., 67]*(y**4-0.8571428571428571*(y**2-0.3333333333333333)-0.2)+4.960783708246107*f[..., 90]*(vx*x*y**3-0.6*vx*x*y)+2.8641098093474*f[..., 55]*(x*y**3-0.6*x*y)+2.8641098093474*f[..., 61]*(vx*y**3-0.6*vx*y)+1.653594569415369*f[..., 32]*(y**3-0.6*y)+4.871392896287466*f[..., 81]*+4.871392896287466*f[..., 77]*+2.8125*f[..., 48]*+2.515576474687264*f[..., 40]*(vx*x*y**2-0.3333333333333333*vx*x)+1.452368754827781*f[..., 20]*(x*y**2-0.3333333333333333*x)+2.8125*f[..., 52]*+1.452368754827781*f[..., 26]*(vx*y**2-0.3333333333333333*vx)+0.8385254915624212*f[..., 12]*(y**2-0.3333333333333333)+9.84375*f[..., 123]*(-0.8571428571428571*(vx*x**2*y-0.3333333333333333*vx*y)+vx*x**4*y-0.2*vx*y)+4.871392896287466*f[..., 80]*+5.683291712335378*f[..., 98]*(-0.8571428571428571*(x**2*y-0.3333333333333333*y)+x**4*y-0.2*y)+9.84375*f[..., 129]*(-0.8571428571428571*(vx**2*x*y-0.3333333333333333*x*y)+vx**4*x*y-0.2*x*y)+5.683291712335378*f[..., 108]*(-0.8571428571428571*(vx**2*y-0.3333333333333333*y)+vx**4*y-0.2*y)+4.960783708246107*f[..., 89]*(vx*x**3*y-0.6*vx*x*y)+2.8641098093474*f[..., 54]*(x**3*y-0.6*x*y)+2.515576474687264*f[..., 39]*(vx*x**2*y-0.3333333333333333*vx*y)+1.452368754827781*f[..., 19]*(x**2*y-0.3333333333333333*y)+4.960783708246107*f[..., 95]*(vx**3*x*y-0.6*vx*x*y)+2.515576474687264*f[..., 45]*(vx**2*x*y-0.3333333333333333*x*y)+2.8641098093474*f[..., 64]*(vx**3*y-0.6*vx*y)+1.452368754827781*f[..., 29]*(vx**2*y-0.3333333333333333*y)+1.299038105676658*f[..., 16]*vx*x*y+0.75*f[..., 5]*x*y+0.75*f[..., 9]*vx*y+0.4330127018922193*f[..., 2]*y+5.683291712335378*f[..., 104]*(vx*x**4-0.8571428571428571*(vx*x**2-0.3333333333333333*vx)-0.2*vx)+3.28125*f[..., 66]*(x**4-0.8571428571428571*(x**2-0.3333333333333333)-0.2)+2.8641098093474*f[..., 60]*(vx*x**3-0.6*vx*x)+1.653594569415369*f[..., 31]*(x**3-0.6*x)+2.8125*f[..., 51]*+1.452368754827781*f[..., 25]*(vx*x**2-0.3333333333333333*vx)+0.8385254915624212*f[..., 11]*(x**2-0.3333333333333333)+5.683291712335378*f[..., 107]*(-0.8571428571428571*(vx**2*x-0.3333333333333333*x)+vx**4*x-0.2*x)+2.8641098093474*f[..., 63]*(vx**3*x-0.6*vx*x)+1.452368754827781*f[..., 28]*(vx**2*x-0.3333333333333333*x)+0.75*f[..., 8]*vx*x+0.4330127018922193*f[..., 1]*x+3.28125*f[..., 69]*(vx**4-0.8571428571428571*(vx**2-0.3333333333333333)-0.2)+1.653594569415369*f[..., 34]*(vx**3-0.6*vx)+0.8385254915624212*f[..., 14]*(vx**2-0.3333333333333333)+0.4330127018922193*f[..., 4]*vx+0.25*f[..., 0]
-#end
-
-expand_4d = [_expand_4d1p, _expand_4d2p, _expand_4d3p, _expand_4d4p]
\ No newline at end of file
@@ -1,365 +0,0 @@
-def _expand_5d1p(f, x, y, z, vx, vy):
-    return 2.755675960631073*f[..., 31]*vx*vy*x*y*z+1.590990257669731*f[..., 27]*vy*x*y*z+1.590990257669731*f[..., 26]*vx*x*y*z+\
-            0.9185586535436913*f[..., 16]*x*y*z+1.590990257669731*f[..., 30]*vx*vy*y*z+0.9185586535436913*f[..., 22]*vy*y*z+\
-            0.9185586535436913*f[..., 19]*vx*y*z+0.5303300858899105*f[..., 8]*y*z+1.590990257669731*f[..., 29]*vx*vy*x*z+\
-            0.9185586535436913*f[..., 21]*vy*x*z+0.9185586535436913*f[..., 18]*vx*x*z+0.5303300858899105*f[..., 7]*x*z+0.9185586535436913\
-            *f[..., 25]*vx*vy*z+0.5303300858899105*f[..., 14]*vy*z+0.5303300858899105*f[..., 11]*vx*z+0.3061862178478971*f[..., 3]*z+\
-            1.590990257669731*f[..., 28]*vx*vy*x*y+0.9185586535436913*f[..., 20]*vy*x*y+0.9185586535436913*f[..., 17]*vx*x*y+\
-            0.5303300858899105*f[..., 6]*x*y+0.9185586535436913*f[..., 24]*vx*vy*y+0.5303300858899105*f[..., 13]*vy*y+0.5303300858899105*\
-            f[..., 10]*vx*y+0.3061862178478971*f[..., 2]*y+0.9185586535436913*f[..., 23]*vx*vy*x+0.5303300858899105*f[..., 12]*vy*x+\
-            0.5303300858899105*f[..., 9]*vx*x+0.3061862178478971*f[..., 1]*x+0.5303300858899105*f[..., 15]*vx*vy+0.3061862178478971*f[..., 5]*\
-            vy+0.3061862178478971*f[..., 4]*vx+0.1767766952966368*f[..., 0]
-#end
-
-def _expand_5d2p(f, x, y, z, vx, vy):
-    return 5.336343551534138*f[..., 109]*(vx*vy*x*y*z^2-0.3333333333333333*vx*vy*x*y)+3.080939385966558*f[..., 93]*\
-            (vy*x*y*z^2-0.3333333333333333*vy*x*y)+3.080939385966558*f[..., 89]*(vx*x*y*z^2-0.3333333333333333*vx*x*y)+\
-            1.778781183844713*f[..., 58]*(x*y*z^2-0.3333333333333333*x*y)+3.080939385966558*f[..., 99]*\
-            (vx*vy*y*z^2-0.3333333333333333*vx*vy*y)+1.778781183844713*f[..., 73]*(vy*y*z^2-0.3333333333333333*vy*y)+\
-            1.778781183844713*f[..., 64]*(vx*y*z^2-0.3333333333333333*vx*y)+1.026979795322186*f[..., 36]*\
-            (y*z^2-0.3333333333333333*y)+3.080939385966558*f[..., 98]*(vx*vy*x*z^2-0.3333333333333333*vx*vy*x)+\
-            1.778781183844713*f[..., 72]*(vy*x*z^2-0.3333333333333333*vy*x)+1.778781183844713*f[..., 63]*\
-            (vx*x*z^2-0.3333333333333333*vx*x)+1.026979795322186*f[..., 35]*(x*z^2-0.3333333333333333*x)+1.778781183844713\
-            *f[..., 76]*(vx*vy*z^2-0.3333333333333333*vx*vy)+1.026979795322186*f[..., 45]*(vy*z^2-0.3333333333333333*vy)+\
-            1.026979795322186*f[..., 39]*(vx*z^2-0.3333333333333333*vx)+0.592927061281571*f[..., 18]*(z^2-0.3333333333333333)+\
-            5.336343551534138*f[..., 108]*(vx*vy*x*y^2*z-0.3333333333333333*vx*vy*x*z)+3.080939385966558*f[..., 92]*\
-            (vy*x*y^2*z-0.3333333333333333*vy*x*z)+3.080939385966558*f[..., 88]*(vx*x*y^2*z-0.3333333333333333*vx*x*z)+\
-            1.778781183844713*f[..., 57]*(x*y^2*z-0.3333333333333333*x*z)+3.080939385966558*f[..., 97]*\
-            (vx*vy*y^2*z-0.3333333333333333*vx*vy*z)+1.778781183844713*f[..., 71]*(vy*y^2*z-0.3333333333333333*vy*z)+\
-            1.778781183844713*f[..., 62]*(vx*y^2*z-0.3333333333333333*vx*z)+1.026979795322186*f[..., 34]*\
-            (y^2*z-0.3333333333333333*z)+5.336343551534138*f[..., 107]*(vx*vy*x^2*y*z-0.3333333333333333*vx*vy*y*z)+\
-            3.080939385966558*f[..., 91]*(vy*x^2*y*z-0.3333333333333333*vy*y*z)+3.080939385966558*f[..., 87]*\
-            (vx*x^2*y*z-0.3333333333333333*vx*y*z)+1.778781183844713*f[..., 56]*(x^2*y*z-0.3333333333333333*y*z)+\
-            5.336343551534138*f[..., 111]*(vx*vy^2*x*y*z-0.3333333333333333*vx*x*y*z)+3.080939385966558*f[..., 103]*\
-            (vy^2*x*y*z-0.3333333333333333*x*y*z)+5.336343551534138*f[..., 110]*(vx^2*vy*x*y*z-0.3333333333333333*vy*x*y*z)+\
-            3.080939385966558*f[..., 90]*(vx^2*x*y*z-0.3333333333333333*x*y*z)+3.080939385966558*f[..., 106]*\
-            (vx*vy^2*y*z-0.3333333333333333*vx*y*z)+1.778781183844713*f[..., 82]*(vy^2*y*z-0.3333333333333333*y*z)+\
-            3.080939385966558*f[..., 102]*(vx^2*vy*y*z-0.3333333333333333*vy*y*z)+1.778781183844713*f[..., 67]*\
-            (vx^2*y*z-0.3333333333333333*y*z)+3.080939385966558*f[..., 96]*(vx*vy*x^2*z-0.3333333333333333*vx*vy*z)+\
-            1.778781183844713*f[..., 70]*(vy*x^2*z-0.3333333333333333*vy*z)+1.778781183844713*f[..., 61]*\
-            (vx*x^2*z-0.3333333333333333*vx*z)+1.026979795322186*f[..., 33]*(x^2*z-0.3333333333333333*z)+3.080939385966558\
-            *f[..., 105]*(vx*vy^2*x*z-0.3333333333333333*vx*x*z)+1.778781183844713*f[..., 81]*(vy^2*x*z-0.3333333333333333*x*z)+\
-            3.080939385966558*f[..., 101]*(vx^2*vy*x*z-0.3333333333333333*vy*x*z)+1.778781183844713*f[..., 66]*\
-            (vx^2*x*z-0.3333333333333333*x*z)+1.778781183844713*f[..., 85]*(vx*vy^2*z-0.3333333333333333*vx*z)+\
-            1.026979795322186*f[..., 49]*(vy^2*z-0.3333333333333333*z)+1.778781183844713*f[..., 79]*\
-            (vx^2*vy*z-0.3333333333333333*vy*z)+1.026979795322186*f[..., 42]*(vx^2*z-0.3333333333333333*z)+\
-            2.755675960631073*f[..., 86]*vx*vy*x*y*z+1.590990257669731*f[..., 52]*vy*x*y*z+1.590990257669731*f[..., 51]*vx*x*y*z+\
-            0.9185586535436913*f[..., 21]*x*y*z+1.590990257669731*f[..., 55]*vx*vy*y*z+0.9185586535436913*f[..., 27]*vy*y*z+\
-            0.9185586535436913*f[..., 24]*vx*y*z+0.5303300858899105*f[..., 8]*y*z+1.590990257669731*f[..., 54]*vx*vy*x*z+\
-            0.9185586535436913*f[..., 26]*vy*x*z+0.9185586535436913*f[..., 23]*vx*x*z+0.5303300858899105*f[..., 7]*x*z+0.9185586535436913\
-            *f[..., 30]*vx*vy*z+0.5303300858899105*f[..., 14]*vy*z+0.5303300858899105*f[..., 11]*vx*z+0.3061862178478971*f[..., 3]*z+\
-            3.080939385966558*f[..., 95]*(vx*vy*x*y^2-0.3333333333333333*vx*vy*x)+1.778781183844713*f[..., 69]*\
-            (vy*x*y^2-0.3333333333333333*vy*x)+1.778781183844713*f[..., 60]*(vx*x*y^2-0.3333333333333333*vx*x)+\
-            1.026979795322186*f[..., 32]*(x*y^2-0.3333333333333333*x)+1.778781183844713*f[..., 75]*\
-            (vx*vy*y^2-0.3333333333333333*vx*vy)+1.026979795322186*f[..., 44]*(vy*y^2-0.3333333333333333*vy)+\
-            1.026979795322186*f[..., 38]*(vx*y^2-0.3333333333333333*vx)+0.592927061281571*f[..., 17]*(y^2-0.3333333333333333)+\
-            3.080939385966558*f[..., 94]*(vx*vy*x^2*y-0.3333333333333333*vx*vy*y)+1.778781183844713*f[..., 68]*\
-            (vy*x^2*y-0.3333333333333333*vy*y)+1.778781183844713*f[..., 59]*(vx*x^2*y-0.3333333333333333*vx*y)+\
-            1.026979795322186*f[..., 31]*(x^2*y-0.3333333333333333*y)+3.080939385966558*f[..., 104]*\
-            (vx*vy^2*x*y-0.3333333333333333*vx*x*y)+1.778781183844713*f[..., 80]*(vy^2*x*y-0.3333333333333333*x*y)+\
-            3.080939385966558*f[..., 100]*(vx^2*vy*x*y-0.3333333333333333*vy*x*y)+1.778781183844713*f[..., 65]*\
-            (vx^2*x*y-0.3333333333333333*x*y)+1.778781183844713*f[..., 84]*(vx*vy^2*y-0.3333333333333333*vx*y)+\
-            1.026979795322186*f[..., 48]*(vy^2*y-0.3333333333333333*y)+1.778781183844713*f[..., 78]*\
-            (vx^2*vy*y-0.3333333333333333*vy*y)+1.026979795322186*f[..., 41]*(vx^2*y-0.3333333333333333*y)+\
-            1.590990257669731*f[..., 53]*vx*vy*x*y+0.9185586535436913*f[..., 25]*vy*x*y+0.9185586535436913*f[..., 22]*vx*x*y+\
-            0.5303300858899105*f[..., 6]*x*y+0.9185586535436913*f[..., 29]*vx*vy*y+0.5303300858899105*f[..., 13]*vy*y+0.5303300858899105*\
-            f[..., 10]*vx*y+0.3061862178478971*f[..., 2]*y+1.778781183844713*f[..., 74]*(vx*vy*x^2-0.3333333333333333*vx*vy)+\
-            1.026979795322186*f[..., 43]*(vy*x^2-0.3333333333333333*vy)+1.026979795322186*f[..., 37]*\
-            (vx*x^2-0.3333333333333333*vx)+0.592927061281571*f[..., 16]*(x^2-0.3333333333333333)+1.778781183844713*f[..., 83]*\
-            (vx*vy^2*x-0.3333333333333333*vx*x)+1.026979795322186*f[..., 47]*(vy^2*x-0.3333333333333333*x)+\
-            1.778781183844713*f[..., 77]*(vx^2*vy*x-0.3333333333333333*vy*x)+1.026979795322186*f[..., 40]*\
-            (vx^2*x-0.3333333333333333*x)+0.9185586535436913*f[..., 28]*vx*vy*x+0.5303300858899105*f[..., 12]*vy*x+\
-            0.5303300858899105*f[..., 9]*vx*x+0.3061862178478971*f[..., 1]*x+1.026979795322186*f[..., 50]*\
-            (vx*vy^2-0.3333333333333333*vx)+0.592927061281571*f[..., 20]*(vy^2-0.3333333333333333)+1.026979795322186*f[..., 46]*\
-            (vx^2*vy-0.3333333333333333*vy)+0.5303300858899105*f[..., 15]*vx*vy+0.3061862178478971*f[..., 5]*vy+\
-            0.592927061281571*f[..., 19]*(vx^2-0.3333333333333333)+0.3061862178478971*f[..., 4]*vx+0.1767766952966368*f[..., 0]
-#end
-
-def _expand_5d3p(f, x, y, z, vx, vy):
-    return 10.52341140030171*f[..., 189]*(vx*vy*x*y*z^3-0.6*vx*vy*x*y*z)+6.075694404757366*f[..., 173]*\
-            (vy*x*y*z^3-0.6*vy*x*y*z)+6.075694404757366*f[..., 169]*(vx*x*y*z^3-0.6*vx*x*y*z)+3.507803800100568*f[..., 134]*\
-            (x*y*z^3-0.6*x*y*z)+6.075694404757366*f[..., 179]*(vx*vy*y*z^3-0.6*vx*vy*y*z)+3.507803800100568*f[..., 149]*\
-            (vy*y*z^3-0.6*vy*y*z)+3.507803800100568*f[..., 140]*(vx*y*z^3-0.6*vx*y*z)+2.025231468252455*f[..., 96]*(y*z^3-0.6*y*z)+\
-            6.075694404757366*f[..., 178]*(vx*vy*x*z^3-0.6*vx*vy*x*z)+3.507803800100568*f[..., 148]*(vy*x*z^3-0.6*vy*x*z)+\
-            3.507803800100568*f[..., 139]*(vx*x*z^3-0.6*vx*x*z)+2.025231468252455*f[..., 95]*(x*z^3-0.6*x*z)+3.507803800100568*f[..., 152]*\
-            (vx*vy*z^3-0.6*vx*vy*z)+2.025231468252455*f[..., 105]*(vy*z^3-0.6*vy*z)+2.025231468252455*f[..., 99]*(vx*z^3-0.6*vx*z)+\
-            1.169267933366856*f[..., 53]*(z^3-0.6*z)+5.336343551534138*f[..., 164]*(vx*vy*x*y*z^2-0.3333333333333333*vx*vy*x*y)+\
-            3.080939385966558*f[..., 118]*(vy*x*y*z^2-0.3333333333333333*vy*x*y)+3.080939385966558*f[..., 114]*\
-            (vx*x*y*z^2-0.3333333333333333*vx*x*y)+1.778781183844713*f[..., 63]*(x*y*z^2-0.3333333333333333*x*y)+\
-            3.080939385966558*f[..., 124]*(vx*vy*y*z^2-0.3333333333333333*vx*vy*y)+1.778781183844713*f[..., 78]*\
-            (vy*y*z^2-0.3333333333333333*vy*y)+1.778781183844713*f[..., 69]*(vx*y*z^2-0.3333333333333333*vx*y)+\
-            1.026979795322186*f[..., 36]*(y*z^2-0.3333333333333333*y)+3.080939385966558*f[..., 123]*\
-            (vx*vy*x*z^2-0.3333333333333333*vx*vy*x)+1.778781183844713*f[..., 77]*(vy*x*z^2-0.3333333333333333*vy*x)+\
-            1.778781183844713*f[..., 68]*(vx*x*z^2-0.3333333333333333*vx*x)+1.026979795322186*f[..., 35]*\
-            (x*z^2-0.3333333333333333*x)+1.778781183844713*f[..., 81]*(vx*vy*z^2-0.3333333333333333*vx*vy)+\
-            1.026979795322186*f[..., 45]*(vy*z^2-0.3333333333333333*vy)+1.026979795322186*f[..., 39]*\
-            (vx*z^2-0.3333333333333333*vx)+0.592927061281571*f[..., 18]*(z^2-0.3333333333333333)+10.52341140030171*f[..., 188]*\
-            (vx*vy*x*y^3*z-0.6*vx*vy*x*y*z)+6.075694404757366*f[..., 172]*(vy*x*y^3*z-0.6*vy*x*y*z)+6.075694404757366*f[..., 168]*\
-            (vx*x*y^3*z-0.6*vx*x*y*z)+3.507803800100568*f[..., 133]*(x*y^3*z-0.6*x*y*z)+6.075694404757366*f[..., 177]*\
-            (vx*vy*y^3*z-0.6*vx*vy*y*z)+3.507803800100568*f[..., 147]*(vy*y^3*z-0.6*vy*y*z)+3.507803800100568*f[..., 138]*\
-            (vx*y^3*z-0.6*vx*y*z)+2.025231468252455*f[..., 94]*(y^3*z-0.6*y*z)+5.336343551534138*f[..., 163]*\
-            (vx*vy*x*y^2*z-0.3333333333333333*vx*vy*x*z)+3.080939385966558*f[..., 117]*(vy*x*y^2*z-0.3333333333333333*vy*x*z)+3.080939385966558*f[..., 113]*(vx*x*y^2*z-0.3333333333333333*vx*x*z)+1.778781183844713*f[..., 62]*\
-            (x*y^2*z-0.3333333333333333*x*z)+3.080939385966558*f[..., 122]*(vx*vy*y^2*z-0.3333333333333333*vx*vy*z)+\
-            1.778781183844713*f[..., 76]*(vy*y^2*z-0.3333333333333333*vy*z)+1.778781183844713*f[..., 67]*\
-            (vx*y^2*z-0.3333333333333333*vx*z)+1.026979795322186*f[..., 34]*(y^2*z-0.3333333333333333*z)+10.52341140030171\
-            *f[..., 187]*(vx*vy*x^3*y*z-0.6*vx*vy*x*y*z)+6.075694404757366*f[..., 171]*(vy*x^3*y*z-0.6*vy*x*y*z)+6.075694404757366*f[..., 167]*(vx*x^3*y*z-0.6*vx*x*y*z)+3.507803800100568*f[..., 132]*(x^3*y*z-0.6*x*y*z)+5.336343551534138*f[..., 162]*\
-            (vx*vy*x^2*y*z-0.3333333333333333*vx*vy*y*z)+3.080939385966558*f[..., 116]*(vy*x^2*y*z-0.3333333333333333*vy*y*z)+3.080939385966558*f[..., 112]*(vx*x^2*y*z-0.3333333333333333*vx*y*z)+1.778781183844713*f[..., 61]*\
-            (x^2*y*z-0.3333333333333333*y*z)+10.52341140030171*f[..., 191]*(vx*vy^3*x*y*z-0.6*vx*vy*x*y*z)+6.075694404757366*\
-            f[..., 183]*(vy^3*x*y*z-0.6*vy*x*y*z)+5.336343551534138*f[..., 166]*(vx*vy^2*x*y*z-0.3333333333333333*vx*x*y*z)+\
-            3.080939385966558*f[..., 128]*(vy^2*x*y*z-0.3333333333333333*x*y*z)+10.52341140030171*f[..., 190]*\
-            (vx^3*vy*x*y*z-0.6*vx*vy*x*y*z)+5.336343551534138*f[..., 165]*(vx^2*vy*x*y*z-0.3333333333333333*vy*x*y*z)+\
-            6.075694404757366*f[..., 170]*(vx^3*x*y*z-0.6*vx*x*y*z)+3.080939385966558*f[..., 115]*\
-            (vx^2*x*y*z-0.3333333333333333*x*y*z)+6.075694404757366*f[..., 186]*(vx*vy^3*y*z-0.6*vx*vy*y*z)+\
-            3.507803800100568*f[..., 158]*(vy^3*y*z-0.6*vy*y*z)+3.080939385966558*f[..., 131]*\
-            (vx*vy^2*y*z-0.3333333333333333*vx*y*z)+1.778781183844713*f[..., 87]*(vy^2*y*z-0.3333333333333333*y*z)+\
-            6.075694404757366*f[..., 182]*(vx^3*vy*y*z-0.6*vx*vy*y*z)+3.080939385966558*f[..., 127]*\
-            (vx^2*vy*y*z-0.3333333333333333*vy*y*z)+3.507803800100568*f[..., 143]*(vx^3*y*z-0.6*vx*y*z)+1.778781183844713*\
-            f[..., 72]*(vx^2*y*z-0.3333333333333333*y*z)+6.075694404757366*f[..., 176]*(vx*vy*x^3*z-0.6*vx*vy*x*z)+\
-            3.507803800100568*f[..., 146]*(vy*x^3*z-0.6*vy*x*z)+3.507803800100568*f[..., 137]*(vx*x^3*z-0.6*vx*x*z)+\
-            2.025231468252455*f[..., 93]*(x^3*z-0.6*x*z)+3.080939385966558*f[..., 121]*(vx*vy*x^2*z-0.3333333333333333*vx*vy*z)+\
-            1.778781183844713*f[..., 75]*(vy*x^2*z-0.3333333333333333*vy*z)+1.778781183844713*f[..., 66]*\
-            (vx*x^2*z-0.3333333333333333*vx*z)+1.026979795322186*f[..., 33]*(x^2*z-0.3333333333333333*z)+6.075694404757366\
-            *f[..., 185]*(vx*vy^3*x*z-0.6*vx*vy*x*z)+3.507803800100568*f[..., 157]*(vy^3*x*z-0.6*vy*x*z)+3.080939385966558*f[..., 130]*\
-            (vx*vy^2*x*z-0.3333333333333333*vx*x*z)+1.778781183844713*f[..., 86]*(vy^2*x*z-0.3333333333333333*x*z)+\
-            6.075694404757366*f[..., 181]*(vx^3*vy*x*z-0.6*vx*vy*x*z)+3.080939385966558*f[..., 126]*\
-            (vx^2*vy*x*z-0.3333333333333333*vy*x*z)+3.507803800100568*f[..., 142]*(vx^3*x*z-0.6*vx*x*z)+1.778781183844713*\
-            f[..., 71]*(vx^2*x*z-0.3333333333333333*x*z)+3.507803800100568*f[..., 161]*(vx*vy^3*z-0.6*vx*vy*z)+2.025231468252455*\
-            f[..., 109]*(vy^3*z-0.6*vy*z)+1.778781183844713*f[..., 90]*(vx*vy^2*z-0.3333333333333333*vx*z)+1.026979795322186*f[..., 49]*\
-            (vy^2*z-0.3333333333333333*z)+3.507803800100568*f[..., 155]*(vx^3*vy*z-0.6*vx*vy*z)+1.778781183844713*f[..., 84]*\
-            (vx^2*vy*z-0.3333333333333333*vy*z)+2.025231468252455*f[..., 102]*(vx^3*z-0.6*vx*z)+1.026979795322186*f[..., 42]*\
-            (vx^2*z-0.3333333333333333*z)+2.755675960631073*f[..., 111]*vx*vy*x*y*z+1.590990257669731*f[..., 57]*vy*x*y*z+\
-            1.590990257669731*f[..., 56]*vx*x*y*z+0.9185586535436913*f[..., 21]*x*y*z+1.590990257669731*f[..., 60]*vx*vy*y*z+\
-            0.9185586535436913*f[..., 27]*vy*y*z+0.9185586535436913*f[..., 24]*vx*y*z+0.5303300858899105*f[..., 8]*y*z+1.590990257669731*\
-            f[..., 59]*vx*vy*x*z+0.9185586535436913*f[..., 26]*vy*x*z+0.9185586535436913*f[..., 23]*vx*x*z+0.5303300858899105*f[..., 7]*x*z+\
-            0.9185586535436913*f[..., 30]*vx*vy*z+0.5303300858899105*f[..., 14]*vy*z+0.5303300858899105*f[..., 11]*vx*z+\
-            0.3061862178478971*f[..., 3]*z+6.075694404757366*f[..., 175]*(vx*vy*x*y^3-0.6*vx*vy*x*y)+3.507803800100568*f[..., 145]*\
-            (vy*x*y^3-0.6*vy*x*y)+3.507803800100568*f[..., 136]*(vx*x*y^3-0.6*vx*x*y)+2.025231468252455*f[..., 92]*(x*y^3-0.6*x*y)+\
-            3.507803800100568*f[..., 151]*(vx*vy*y^3-0.6*vx*vy*y)+2.025231468252455*f[..., 104]*(vy*y^3-0.6*vy*y)+2.025231468252455*\
-            f[..., 98]*(vx*y^3-0.6*vx*y)+1.169267933366856*f[..., 52]*(y^3-0.6*y)+3.080939385966558*f[..., 120]*\
-            (vx*vy*x*y^2-0.3333333333333333*vx*vy*x)+1.778781183844713*f[..., 74]*(vy*x*y^2-0.3333333333333333*vy*x)+\
-            1.778781183844713*f[..., 65]*(vx*x*y^2-0.3333333333333333*vx*x)+1.026979795322186*f[..., 32]*\
-            (x*y^2-0.3333333333333333*x)+1.778781183844713*f[..., 80]*(vx*vy*y^2-0.3333333333333333*vx*vy)+\
-            1.026979795322186*f[..., 44]*(vy*y^2-0.3333333333333333*vy)+1.026979795322186*f[..., 38]*\
-            (vx*y^2-0.3333333333333333*vx)+0.592927061281571*f[..., 17]*(y^2-0.3333333333333333)+6.075694404757366*f[..., 174]*\
-            (vx*vy*x^3*y-0.6*vx*vy*x*y)+3.507803800100568*f[..., 144]*(vy*x^3*y-0.6*vy*x*y)+3.507803800100568*f[..., 135]*\
-            (vx*x^3*y-0.6*vx*x*y)+2.025231468252455*f[..., 91]*(x^3*y-0.6*x*y)+3.080939385966558*f[..., 119]*\
-            (vx*vy*x^2*y-0.3333333333333333*vx*vy*y)+1.778781183844713*f[..., 73]*(vy*x^2*y-0.3333333333333333*vy*y)+\
-            1.778781183844713*f[..., 64]*(vx*x^2*y-0.3333333333333333*vx*y)+1.026979795322186*f[..., 31]*\
-            (x^2*y-0.3333333333333333*y)+6.075694404757366*f[..., 184]*(vx*vy^3*x*y-0.6*vx*vy*x*y)+3.507803800100568*f[..., 156]*\
-            (vy^3*x*y-0.6*vy*x*y)+3.080939385966558*f[..., 129]*(vx*vy^2*x*y-0.3333333333333333*vx*x*y)+1.778781183844713*\
-            f[..., 85]*(vy^2*x*y-0.3333333333333333*x*y)+6.075694404757366*f[..., 180]*(vx^3*vy*x*y-0.6*vx*vy*x*y)+\
-            3.080939385966558*f[..., 125]*(vx^2*vy*x*y-0.3333333333333333*vy*x*y)+3.507803800100568*f[..., 141]*\
-            (vx^3*x*y-0.6*vx*x*y)+1.778781183844713*f[..., 70]*(vx^2*x*y-0.3333333333333333*x*y)+3.507803800100568*f[..., 160]*\
-            (vx*vy^3*y-0.6*vx*vy*y)+2.025231468252455*f[..., 108]*(vy^3*y-0.6*vy*y)+1.778781183844713*f[..., 89]*\
-            (vx*vy^2*y-0.3333333333333333*vx*y)+1.026979795322186*f[..., 48]*(vy^2*y-0.3333333333333333*y)+\
-            3.507803800100568*f[..., 154]*(vx^3*vy*y-0.6*vx*vy*y)+1.778781183844713*f[..., 83]*(vx^2*vy*y-0.3333333333333333*vy*y)+\
-            2.025231468252455*f[..., 101]*(vx^3*y-0.6*vx*y)+1.026979795322186*f[..., 41]*(vx^2*y-0.3333333333333333*y)+\
-            1.590990257669731*f[..., 58]*vx*vy*x*y+0.9185586535436913*f[..., 25]*vy*x*y+0.9185586535436913*f[..., 22]*vx*x*y+\
-            0.5303300858899105*f[..., 6]*x*y+0.9185586535436913*f[..., 29]*vx*vy*y+0.5303300858899105*f[..., 13]*vy*y+0.5303300858899105*\
-            f[..., 10]*vx*y+0.3061862178478971*f[..., 2]*y+3.507803800100568*f[..., 150]*(vx*vy*x^3-0.6*vx*vy*x)+2.025231468252455*f[..., 103]*\
-            (vy*x^3-0.6*vy*x)+2.025231468252455*f[..., 97]*(vx*x^3-0.6*vx*x)+1.169267933366856*f[..., 51]*(x^3-0.6*x)+\
-            1.778781183844713*f[..., 79]*(vx*vy*x^2-0.3333333333333333*vx*vy)+1.026979795322186*f[..., 43]*\
-            (vy*x^2-0.3333333333333333*vy)+1.026979795322186*f[..., 37]*(vx*x^2-0.3333333333333333*vx)+0.592927061281571*\
-            f[..., 16]*(x^2-0.3333333333333333)+3.507803800100568*f[..., 159]*(vx*vy^3*x-0.6*vx*vy*x)+2.025231468252455*f[..., 107]*\
-            (vy^3*x-0.6*vy*x)+1.778781183844713*f[..., 88]*(vx*vy^2*x-0.3333333333333333*vx*x)+1.026979795322186*f[..., 47]*\
-            (vy^2*x-0.3333333333333333*x)+3.507803800100568*f[..., 153]*(vx^3*vy*x-0.6*vx*vy*x)+1.778781183844713*f[..., 82]*\
-            (vx^2*vy*x-0.3333333333333333*vy*x)+2.025231468252455*f[..., 100]*(vx^3*x-0.6*vx*x)+1.026979795322186*f[..., 40]*\
-            (vx^2*x-0.3333333333333333*x)+0.9185586535436913*f[..., 28]*vx*vy*x+0.5303300858899105*f[..., 12]*vy*x+\
-            0.5303300858899105*f[..., 9]*vx*x+0.3061862178478971*f[..., 1]*x+2.025231468252455*f[..., 110]*(vx*vy^3-0.6*vx*vy)+\
-            1.169267933366856*f[..., 55]*(vy^3-0.6*vy)+1.026979795322186*f[..., 50]*(vx*vy^2-0.3333333333333333*vx)+\
-            0.592927061281571*f[..., 20]*(vy^2-0.3333333333333333)+2.025231468252455*f[..., 106]*(vx^3*vy-0.6*vx*vy)+\
-            1.026979795322186*f[..., 46]*(vx^2*vy-0.3333333333333333*vy)+0.5303300858899105*f[..., 15]*vx*vy+0.3061862178478971*\
-            f[..., 5]*vy+1.169267933366856*f[..., 54]*(vx^3-0.6*vx)+0.592927061281571*f[..., 19]*(vx^2-0.3333333333333333)+\
-            0.3061862178478971*f[..., 4]*vx+0.1767766952966368*f[..., 0]
-#end
-
-def _expand_5d4p(f, x, y, z, vx, vy):
-    return 20.88174713191522*f[..., 349]*+12.05608232776094*f[..., 333]*\
-            (vy*x*y*z^4-0.8571428571428571*(vy*x*y*z^2-0.3333333333333333*vy*x*y)-0.2*vy*x*y)+12.05608232776094*f[..., 329]*\
-            (vx*x*y*z^4-0.8571428571428571*(vx*x*y*z^2-0.3333333333333333*vx*x*y)-0.2*vx*x*y)+6.960582377305072*f[..., 284]*\
-            (x*y*z^4-0.8571428571428571*(x*y*z^2-0.3333333333333333*x*y)-0.2*x*y)+12.05608232776094*f[..., 339]*\
-            (vx*vy*y*z^4-0.8571428571428571*(vx*vy*y*z^2-0.3333333333333333*vx*vy*y)-0.2*vx*vy*y)+6.960582377305072*\
-            f[..., 299]*(vy*y*z^4-0.8571428571428571*(vy*y*z^2-0.3333333333333333*vy*y)-0.2*vy*y)+6.960582377305072*f[..., 290]*\
-            (vx*y*z^4-0.8571428571428571*(vx*y*z^2-0.3333333333333333*vx*y)-0.2*vx*y)+4.018694109253648*f[..., 212]*\
-            (y*z^4-0.8571428571428571*(y*z^2-0.3333333333333333*y)-0.2*y)+12.05608232776094*f[..., 338]*\
-            (vx*vy*x*z^4-0.8571428571428571*(vx*vy*x*z^2-0.3333333333333333*vx*vy*x)-0.2*vx*vy*x)+6.960582377305072*\
-            f[..., 298]*(vy*x*z^4-0.8571428571428571*(vy*x*z^2-0.3333333333333333*vy*x)-0.2*vy*x)+6.960582377305072*f[..., 289]*\
-            (vx*x*z^4-0.8571428571428571*(vx*x*z^2-0.3333333333333333*vx*x)-0.2*vx*x)+4.018694109253648*f[..., 211]*\
-            (x*z^4-0.8571428571428571*(x*z^2-0.3333333333333333*x)-0.2*x)+6.960582377305072*f[..., 302]*\
-            (vx*vy*z^4-0.8571428571428571*(vx*vy*z^2-0.3333333333333333*vx*vy)-0.2*vx*vy)+4.018694109253648*f[..., 221]*\
-            (vy*z^4-0.8571428571428571*(vy*z^2-0.3333333333333333*vy)-0.2*vy)+4.018694109253648*f[..., 215]*\
-            (vx*z^4-0.8571428571428571*(vx*z^2-0.3333333333333333*vx)-0.2*vx)+2.320194125768357*f[..., 123]*\
-            (z^4-0.8571428571428571*(z^2-0.3333333333333333)-0.2)+10.52341140030171*f[..., 324]*\
-            (vx*vy*x*y*z^3-0.6*vx*vy*x*y*z)+6.075694404757366*f[..., 268]*(vy*x*y*z^3-0.6*vy*x*y*z)+6.075694404757366*f[..., 264]*\
-            (vx*x*y*z^3-0.6*vx*x*y*z)+3.507803800100568*f[..., 179]*(x*y*z^3-0.6*x*y*z)+6.075694404757366*f[..., 274]*\
-            (vx*vy*y*z^3-0.6*vx*vy*y*z)+3.507803800100568*f[..., 194]*(vy*y*z^3-0.6*vy*y*z)+3.507803800100568*f[..., 185]*\
-            (vx*y*z^3-0.6*vx*y*z)+2.025231468252455*f[..., 106]*(y*z^3-0.6*y*z)+6.075694404757366*f[..., 273]*\
-            (vx*vy*x*z^3-0.6*vx*vy*x*z)+3.507803800100568*f[..., 193]*(vy*x*z^3-0.6*vy*x*z)+3.507803800100568*f[..., 184]*\
-            (vx*x*z^3-0.6*vx*x*z)+2.025231468252455*f[..., 105]*(x*z^3-0.6*x*z)+3.507803800100568*f[..., 197]*(vx*vy*z^3-0.6*vx*vy*z)+2.025231468252455*f[..., 115]*(vy*z^3-0.6*vy*z)+2.025231468252455*f[..., 109]*(vx*z^3-0.6*vx*z)+1.169267933366856*f[..., 53]*\
-            (z^3-0.6*z)+10.33378485236652*f[..., 317]*+\
-            10.33378485236652*f[..., 320]*+5.966213466261491\
-            *f[..., 252]*+5.966213466261491*f[..., 237]*+10.33378485236652*f[..., 313]*+5.966213466261491*f[..., 239]*+5.966213466261491*f[..., 249]*+5.966213466261491*f[..., 233]*+5.966213466261491*f[..., 258]*+3.444594950788841*f[..., 148]*+3.444594950788841*f[..., 170]*+3.444594950788841*f[..., 158]*+10.33378485236652*f[..., 314]*+5.966213466261491*f[..., 240]*+5.966213466261491*f[..., 248]*+5.966213466261491*f[..., 234]*+5.966213466261491*f[..., 257]*+3.444594950788841*f[..., 149]*+3.444594950788841*f[..., 169]*+3.444594950788841*f[..., 157]*+5.966213466261491*f[..., 243]*+5.966213466261491*f[..., 242]*+3.444594950788841*f[..., 161]*+3.444594950788841*f[..., 160]*+3.444594950788841*f[..., 164]*+3.444594950788841*f[..., 152]*+3.444594950788841*f[..., 151]*+3.444594950788841*f[..., 173]*+1.988737822087164*\
-            f[..., 93]*+5.336343551534138*f[..., 229]*(vx*vy*x*y*z^2-0.3333333333333333*vx*vy*x*y)+\
-            3.080939385966558*f[..., 133]*(vy*x*y*z^2-0.3333333333333333*vy*x*y)+3.080939385966558*f[..., 129]*\
-            (vx*x*y*z^2-0.3333333333333333*vx*x*y)+1.778781183844713*f[..., 63]*(x*y*z^2-0.3333333333333333*x*y)+\
-            3.080939385966558*f[..., 139]*(vx*vy*y*z^2-0.3333333333333333*vx*vy*y)+1.778781183844713*f[..., 78]*\
-            (vy*y*z^2-0.3333333333333333*vy*y)+1.778781183844713*f[..., 69]*(vx*y*z^2-0.3333333333333333*vx*y)+\
-            1.026979795322186*f[..., 36]*(y*z^2-0.3333333333333333*y)+1.988737822087164*f[..., 92]*+\
-            3.080939385966558*f[..., 138]*(vx*vy*x*z^2-0.3333333333333333*vx*vy*x)+1.778781183844713*f[..., 77]*\
-            (vy*x*z^2-0.3333333333333333*vy*x)+1.778781183844713*f[..., 68]*(vx*x*z^2-0.3333333333333333*vx*x)+\
-            1.026979795322186*f[..., 35]*(x*z^2-0.3333333333333333*x)+1.988737822087164*f[..., 99]*+\
-            1.778781183844713*f[..., 81]*(vx*vy*z^2-0.3333333333333333*vx*vy)+1.026979795322186*f[..., 45]*\
-            (vy*z^2-0.3333333333333333*vy)+1.988737822087164*f[..., 96]*+\
-            1.026979795322186*f[..., 39]*(vx*z^2-0.3333333333333333*vx)+0.592927061281571*f[..., 18]*(z^2-0.3333333333333333)+\
-            20.88174713191522*f[..., 348]*+10.33378485236652*f[..., 316]*+\
-            12.05608232776094*f[..., 332]*(-0.8571428571428571*(vy*x*y^2*z-0.3333333333333333*vy*x*z)+vy*x*y^4*z-0.2*vy*x*z)+10.33378485236652*f[..., 319]*+12.05608232776094*f[..., 328]*\
-            (-0.8571428571428571*(vx*x*y^2*z-0.3333333333333333*vx*x*z)+vx*x*y^4*z-0.2*vx*x*z)+5.966213466261491*f[..., 251]*+5.966213466261491*f[..., 236]*+6.960582377305072*f[..., 283]*\
-            (-0.8571428571428571*(x*y^2*z-0.3333333333333333*x*z)+x*y^4*z-0.2*x*z)+10.33378485236652*f[..., 312]*+12.05608232776094*\
-            f[..., 337]*(-0.8571428571428571*(vx*vy*y^2*z-0.3333333333333333*vx*vy*z)+vx*vy*y^4*z-0.2*vx*vy*z)+\
-            5.966213466261491*f[..., 238]*+5.966213466261491*f[..., 247]*+6.960582377305072*f[..., 297]*\
-            (-0.8571428571428571*(vy*y^2*z-0.3333333333333333*vy*z)+vy*y^4*z-0.2*vy*z)+5.966213466261491*f[..., 232]*+5.966213466261491*f[..., 256]*+6.960582377305072*f[..., 288]*\
-            (-0.8571428571428571*(vx*y^2*z-0.3333333333333333*vx*z)+vx*y^4*z-0.2*vx*z)+3.444594950788841*f[..., 147]*+3.444594950788841*f[..., 168]*+3.444594950788841*f[..., 156]*+4.018694109253648*f[..., 210]*\
-            (-0.8571428571428571*(y^2*z-0.3333333333333333*z)+y^4*z-0.2*z)+20.88174713191522*f[..., 347]*+\
-            10.33378485236652*f[..., 315]*+12.05608232776094*f[..., 331]*\
-            (-0.8571428571428571*(vy*x^2*y*z-0.3333333333333333*vy*y*z)+vy*x^4*y*z-0.2*vy*y*z)+10.33378485236652*f[..., 318]*+12.05608232776094*f[..., 327]*\
-            (-0.8571428571428571*(vx*x^2*y*z-0.3333333333333333*vx*y*z)+vx*x^4*y*z-0.2*vx*y*z)+5.966213466261491*f[..., 250]*+5.966213466261491*f[..., 235]*+6.960582377305072*f[..., 282]*\
-            (-0.8571428571428571*(x^2*y*z-0.3333333333333333*y*z)+x^4*y*z-0.2*y*z)+20.88174713191522*f[..., 351]*+\
-            10.33378485236652*f[..., 321]*+12.05608232776094*f[..., 343]*\
-            (-0.8571428571428571*(vy^2*x*y*z-0.3333333333333333*x*y*z)+vy^4*x*y*z-0.2*x*y*z)+20.88174713191522*f[..., 350]*+\
-            12.05608232776094*f[..., 330]*(-0.8571428571428571*(vx^2*x*y*z-0.3333333333333333*x*y*z)+vx^4*x*y*z-0.2*x*y*z)+\
-            12.05608232776094*f[..., 346]*\
-            (-0.8571428571428571*(vx*vy^2*y*z-0.3333333333333333*vx*y*z)+vx*vy^4*y*z-0.2*vx*y*z)+5.966213466261491*\
-            f[..., 261]*+6.960582377305072*f[..., 308]*\
-            (-0.8571428571428571*(vy^2*y*z-0.3333333333333333*y*z)+vy^4*y*z-0.2*y*z)+12.05608232776094*f[..., 342]*\
-            (-0.8571428571428571*(vx^2*vy*y*z-0.3333333333333333*vy*y*z)+vx^4*vy*y*z-0.2*vy*y*z)+6.960582377305072*\
-            f[..., 293]*(-0.8571428571428571*(vx^2*y*z-0.3333333333333333*y*z)+vx^4*y*z-0.2*y*z)+12.05608232776094*f[..., 336]*\
-            (-0.8571428571428571*(vx*vy*x^2*z-0.3333333333333333*vx*vy*z)+vx*vy*x^4*z-0.2*vx*vy*z)+5.966213466261491*\
-            f[..., 246]*+6.960582377305072*f[..., 296]*\
-            (-0.8571428571428571*(vy*x^2*z-0.3333333333333333*vy*z)+vy*x^4*z-0.2*vy*z)+5.966213466261491*f[..., 255]*+6.960582377305072*f[..., 287]*\
-            (-0.8571428571428571*(vx*x^2*z-0.3333333333333333*vx*z)+vx*x^4*z-0.2*vx*z)+3.444594950788841*f[..., 167]*+3.444594950788841*f[..., 155]*+4.018694109253648*f[..., 209]*(-0.8571428571428571*(x^2*z-0.3333333333333333*z)+x^4*z-0.2*z)+12.05608232776094*f[..., 345]*\
-            (-0.8571428571428571*(vx*vy^2*x*z-0.3333333333333333*vx*x*z)+vx*vy^4*x*z-0.2*vx*x*z)+5.966213466261491*\
-            f[..., 260]*+6.960582377305072*f[..., 307]*\
-            (-0.8571428571428571*(vy^2*x*z-0.3333333333333333*x*z)+vy^4*x*z-0.2*x*z)+12.05608232776094*f[..., 341]*\
-            (-0.8571428571428571*(vx^2*vy*x*z-0.3333333333333333*vy*x*z)+vx^4*vy*x*z-0.2*vy*x*z)+6.960582377305072*\
-            f[..., 292]*(-0.8571428571428571*(vx^2*x*z-0.3333333333333333*x*z)+vx^4*x*z-0.2*x*z)+6.960582377305072*f[..., 311]*\
-            (-0.8571428571428571*(vx*vy^2*z-0.3333333333333333*vx*z)+vx*vy^4*z-0.2*vx*z)+3.444594950788841*f[..., 176]*+4.018694109253648*f[..., 225]*\
-            (-0.8571428571428571*(vy^2*z-0.3333333333333333*z)+vy^4*z-0.2*z)+6.960582377305072*f[..., 305]*\
-            (-0.8571428571428571*(vx^2*vy*z-0.3333333333333333*vy*z)+vx^4*vy*z-0.2*vy*z)+4.018694109253648*f[..., 218]*\
-            (-0.8571428571428571*(vx^2*z-0.3333333333333333*z)+vx^4*z-0.2*z)+10.52341140030171*f[..., 323]*\
-            (vx*vy*x*y^3*z-0.6*vx*vy*x*y*z)+6.075694404757366*f[..., 267]*(vy*x*y^3*z-0.6*vy*x*y*z)+6.075694404757366*f[..., 263]*\
-            (vx*x*y^3*z-0.6*vx*x*y*z)+3.507803800100568*f[..., 178]*(x*y^3*z-0.6*x*y*z)+6.075694404757366*f[..., 272]*\
-            (vx*vy*y^3*z-0.6*vx*vy*y*z)+3.507803800100568*f[..., 192]*(vy*y^3*z-0.6*vy*y*z)+3.507803800100568*f[..., 183]*\
-            (vx*y^3*z-0.6*vx*y*z)+2.025231468252455*f[..., 104]*(y^3*z-0.6*y*z)+5.336343551534138*f[..., 228]*\
-            (vx*vy*x*y^2*z-0.3333333333333333*vx*vy*x*z)+3.080939385966558*f[..., 132]*(vy*x*y^2*z-0.3333333333333333*vy*x*z)+3.080939385966558*f[..., 128]*(vx*x*y^2*z-0.3333333333333333*vx*x*z)+1.778781183844713*f[..., 62]*\
-            (x*y^2*z-0.3333333333333333*x*z)+3.080939385966558*f[..., 137]*(vx*vy*y^2*z-0.3333333333333333*vx*vy*z)+\
-            1.778781183844713*f[..., 76]*(vy*y^2*z-0.3333333333333333*vy*z)+1.778781183844713*f[..., 67]*\
-            (vx*y^2*z-0.3333333333333333*vx*z)+1.026979795322186*f[..., 34]*(y^2*z-0.3333333333333333*z)+10.52341140030171\
-            *f[..., 322]*(vx*vy*x^3*y*z-0.6*vx*vy*x*y*z)+6.075694404757366*f[..., 266]*(vy*x^3*y*z-0.6*vy*x*y*z)+6.075694404757366*f[..., 262]*(vx*x^3*y*z-0.6*vx*x*y*z)+3.507803800100568*f[..., 177]*(x^3*y*z-0.6*x*y*z)+5.336343551534138*f[..., 227]*\
-            (vx*vy*x^2*y*z-0.3333333333333333*vx*vy*y*z)+3.080939385966558*f[..., 131]*(vy*x^2*y*z-0.3333333333333333*vy*y*z)+3.080939385966558*f[..., 127]*(vx*x^2*y*z-0.3333333333333333*vx*y*z)+1.778781183844713*f[..., 61]*\
-            (x^2*y*z-0.3333333333333333*y*z)+10.52341140030171*f[..., 326]*(vx*vy^3*x*y*z-0.6*vx*vy*x*y*z)+6.075694404757366*\
-            f[..., 278]*(vy^3*x*y*z-0.6*vy*x*y*z)+5.336343551534138*f[..., 231]*(vx*vy^2*x*y*z-0.3333333333333333*vx*x*y*z)+\
-            3.080939385966558*f[..., 143]*(vy^2*x*y*z-0.3333333333333333*x*y*z)+10.52341140030171*f[..., 325]*\
-            (vx^3*vy*x*y*z-0.6*vx*vy*x*y*z)+5.336343551534138*f[..., 230]*(vx^2*vy*x*y*z-0.3333333333333333*vy*x*y*z)+\
-            6.075694404757366*f[..., 265]*(vx^3*x*y*z-0.6*vx*x*y*z)+3.080939385966558*f[..., 130]*\
-            (vx^2*x*y*z-0.3333333333333333*x*y*z)+6.075694404757366*f[..., 281]*(vx*vy^3*y*z-0.6*vx*vy*y*z)+\
-            3.507803800100568*f[..., 203]*(vy^3*y*z-0.6*vy*y*z)+3.080939385966558*f[..., 146]*\
-            (vx*vy^2*y*z-0.3333333333333333*vx*y*z)+1.778781183844713*f[..., 87]*(vy^2*y*z-0.3333333333333333*y*z)+\
-            6.075694404757366*f[..., 277]*(vx^3*vy*y*z-0.6*vx*vy*y*z)+3.080939385966558*f[..., 142]*\
-            (vx^2*vy*y*z-0.3333333333333333*vy*y*z)+3.507803800100568*f[..., 188]*(vx^3*y*z-0.6*vx*y*z)+1.778781183844713*\
-            f[..., 72]*(vx^2*y*z-0.3333333333333333*y*z)+6.075694404757366*f[..., 271]*(vx*vy*x^3*z-0.6*vx*vy*x*z)+\
-            3.507803800100568*f[..., 191]*(vy*x^3*z-0.6*vy*x*z)+3.507803800100568*f[..., 182]*(vx*x^3*z-0.6*vx*x*z)+\
-            2.025231468252455*f[..., 103]*(x^3*z-0.6*x*z)+3.080939385966558*f[..., 136]*(vx*vy*x^2*z-0.3333333333333333*vx*vy*z)+\
-            1.778781183844713*f[..., 75]*(vy*x^2*z-0.3333333333333333*vy*z)+1.778781183844713*f[..., 66]*\
-            (vx*x^2*z-0.3333333333333333*vx*z)+1.026979795322186*f[..., 33]*(x^2*z-0.3333333333333333*z)+6.075694404757366\
-            *f[..., 280]*(vx*vy^3*x*z-0.6*vx*vy*x*z)+3.507803800100568*f[..., 202]*(vy^3*x*z-0.6*vy*x*z)+3.080939385966558*f[..., 145]*\
-            (vx*vy^2*x*z-0.3333333333333333*vx*x*z)+1.778781183844713*f[..., 86]*(vy^2*x*z-0.3333333333333333*x*z)+\
-            6.075694404757366*f[..., 276]*(vx^3*vy*x*z-0.6*vx*vy*x*z)+3.080939385966558*f[..., 141]*\
-            (vx^2*vy*x*z-0.3333333333333333*vy*x*z)+3.507803800100568*f[..., 187]*(vx^3*x*z-0.6*vx*x*z)+1.778781183844713*\
-            f[..., 71]*(vx^2*x*z-0.3333333333333333*x*z)+3.507803800100568*f[..., 206]*(vx*vy^3*z-0.6*vx*vy*z)+2.025231468252455*\
-            f[..., 119]*(vy^3*z-0.6*vy*z)+1.778781183844713*f[..., 90]*(vx*vy^2*z-0.3333333333333333*vx*z)+1.026979795322186*f[..., 49]*\
-            (vy^2*z-0.3333333333333333*z)+3.507803800100568*f[..., 200]*(vx^3*vy*z-0.6*vx*vy*z)+1.778781183844713*f[..., 84]*\
-            (vx^2*vy*z-0.3333333333333333*vy*z)+2.025231468252455*f[..., 112]*(vx^3*z-0.6*vx*z)+1.026979795322186*f[..., 42]*\
-            (vx^2*z-0.3333333333333333*z)+2.755675960631073*f[..., 126]*vx*vy*x*y*z+1.590990257669731*f[..., 57]*vy*x*y*z+\
-            1.590990257669731*f[..., 56]*vx*x*y*z+0.9185586535436913*f[..., 21]*x*y*z+1.590990257669731*f[..., 60]*vx*vy*y*z+\
-            0.9185586535436913*f[..., 27]*vy*y*z+0.9185586535436913*f[..., 24]*vx*y*z+0.5303300858899105*f[..., 8]*y*z+1.590990257669731*\
-            f[..., 59]*vx*vy*x*z+0.9185586535436913*f[..., 26]*vy*x*z+0.9185586535436913*f[..., 23]*vx*x*z+0.5303300858899105*f[..., 7]*x*z+\
-            0.9185586535436913*f[..., 30]*vx*vy*z+0.5303300858899105*f[..., 14]*vy*z+0.5303300858899105*f[..., 11]*vx*z+\
-            0.3061862178478971*f[..., 3]*z+12.05608232776094*f[..., 335]*\
-            (vx*vy*x*y^4-0.8571428571428571*(vx*vy*x*y^2-0.3333333333333333*vx*vy*x)-0.2*vx*vy*x)+6.960582377305072*\
-            f[..., 295]*(vy*x*y^4-0.8571428571428571*(vy*x*y^2-0.3333333333333333*vy*x)-0.2*vy*x)+6.960582377305072*f[..., 286]*\
-            (vx*x*y^4-0.8571428571428571*(vx*x*y^2-0.3333333333333333*vx*x)-0.2*vx*x)+4.018694109253648*f[..., 208]*\
-            (x*y^4-0.8571428571428571*(x*y^2-0.3333333333333333*x)-0.2*x)+6.960582377305072*f[..., 301]*\
-            (vx*vy*y^4-0.8571428571428571*(vx*vy*y^2-0.3333333333333333*vx*vy)-0.2*vx*vy)+4.018694109253648*f[..., 220]*\
-            (vy*y^4-0.8571428571428571*(vy*y^2-0.3333333333333333*vy)-0.2*vy)+4.018694109253648*f[..., 214]*\
-            (vx*y^4-0.8571428571428571*(vx*y^2-0.3333333333333333*vx)-0.2*vx)+2.320194125768357*f[..., 122]*\
-            (y^4-0.8571428571428571*(y^2-0.3333333333333333)-0.2)+6.075694404757366*f[..., 270]*(vx*vy*x*y^3-0.6*vx*vy*x*y)+3.507803800100568*f[..., 190]*(vy*x*y^3-0.6*vy*x*y)+3.507803800100568*f[..., 181]*(vx*x*y^3-0.6*vx*x*y)+\
-            2.025231468252455*f[..., 102]*(x*y^3-0.6*x*y)+3.507803800100568*f[..., 196]*(vx*vy*y^3-0.6*vx*vy*y)+2.025231468252455*\
-            f[..., 114]*(vy*y^3-0.6*vy*y)+2.025231468252455*f[..., 108]*(vx*y^3-0.6*vx*y)+1.169267933366856*f[..., 52]*(y^3-0.6*y)+\
-            5.966213466261491*f[..., 245]*+5.966213466261491*f[..., 254]*+3.444594950788841*f[..., 166]*+3.444594950788841*f[..., 154]*+5.966213466261491*f[..., 241]*+\
-            3.444594950788841*f[..., 159]*+3.444594950788841*f[..., 163]*+3.444594950788841*f[..., 150]*+3.444594950788841*f[..., 172]*+1.988737822087164*f[..., 91]*+3.080939385966558*f[..., 135]*(vx*vy*x*y^2-0.3333333333333333*vx*vy*x)+1.778781183844713*\
-            f[..., 74]*(vy*x*y^2-0.3333333333333333*vy*x)+1.778781183844713*f[..., 65]*(vx*x*y^2-0.3333333333333333*vx*x)+\
-            1.026979795322186*f[..., 32]*(x*y^2-0.3333333333333333*x)+1.988737822087164*f[..., 98]*+\
-            1.778781183844713*f[..., 80]*(vx*vy*y^2-0.3333333333333333*vx*vy)+1.026979795322186*f[..., 44]*\
-            (vy*y^2-0.3333333333333333*vy)+1.988737822087164*f[..., 95]*+\
-            1.026979795322186*f[..., 38]*(vx*y^2-0.3333333333333333*vx)+0.592927061281571*f[..., 17]*(y^2-0.3333333333333333)+\
-            12.05608232776094*f[..., 334]*\
-            (-0.8571428571428571*(vx*vy*x^2*y-0.3333333333333333*vx*vy*y)+vx*vy*x^4*y-0.2*vx*vy*y)+5.966213466261491*\
-            f[..., 244]*+6.960582377305072*f[..., 294]*\
-            (-0.8571428571428571*(vy*x^2*y-0.3333333333333333*vy*y)+vy*x^4*y-0.2*vy*y)+5.966213466261491*f[..., 253]*+6.960582377305072*f[..., 285]*\
-            (-0.8571428571428571*(vx*x^2*y-0.3333333333333333*vx*y)+vx*x^4*y-0.2*vx*y)+3.444594950788841*f[..., 165]*+3.444594950788841*f[..., 153]*+4.018694109253648*f[..., 207]*(-0.8571428571428571*(x^2*y-0.3333333333333333*y)+x^4*y-0.2*y)+12.05608232776094*f[..., 344]*\
-            (-0.8571428571428571*(vx*vy^2*x*y-0.3333333333333333*vx*x*y)+vx*vy^4*x*y-0.2*vx*x*y)+5.966213466261491*\
-            f[..., 259]*+6.960582377305072*f[..., 306]*\
-            (-0.8571428571428571*(vy^2*x*y-0.3333333333333333*x*y)+vy^4*x*y-0.2*x*y)+12.05608232776094*f[..., 340]*\
-            (-0.8571428571428571*(vx^2*vy*x*y-0.3333333333333333*vy*x*y)+vx^4*vy*x*y-0.2*vy*x*y)+6.960582377305072*\
-            f[..., 291]*(-0.8571428571428571*(vx^2*x*y-0.3333333333333333*x*y)+vx^4*x*y-0.2*x*y)+6.960582377305072*f[..., 310]*\
-            (-0.8571428571428571*(vx*vy^2*y-0.3333333333333333*vx*y)+vx*vy^4*y-0.2*vx*y)+3.444594950788841*f[..., 175]*+4.018694109253648*f[..., 224]*\
-            (-0.8571428571428571*(vy^2*y-0.3333333333333333*y)+vy^4*y-0.2*y)+6.960582377305072*f[..., 304]*\
-            (-0.8571428571428571*(vx^2*vy*y-0.3333333333333333*vy*y)+vx^4*vy*y-0.2*vy*y)+4.018694109253648*f[..., 217]*\
-            (-0.8571428571428571*(vx^2*y-0.3333333333333333*y)+vx^4*y-0.2*y)+6.075694404757366*f[..., 269]*\
-            (vx*vy*x^3*y-0.6*vx*vy*x*y)+3.507803800100568*f[..., 189]*(vy*x^3*y-0.6*vy*x*y)+3.507803800100568*f[..., 180]*\
-            (vx*x^3*y-0.6*vx*x*y)+2.025231468252455*f[..., 101]*(x^3*y-0.6*x*y)+3.080939385966558*f[..., 134]*\
-            (vx*vy*x^2*y-0.3333333333333333*vx*vy*y)+1.778781183844713*f[..., 73]*(vy*x^2*y-0.3333333333333333*vy*y)+\
-            1.778781183844713*f[..., 64]*(vx*x^2*y-0.3333333333333333*vx*y)+1.026979795322186*f[..., 31]*\
-            (x^2*y-0.3333333333333333*y)+6.075694404757366*f[..., 279]*(vx*vy^3*x*y-0.6*vx*vy*x*y)+3.507803800100568*f[..., 201]*\
-            (vy^3*x*y-0.6*vy*x*y)+3.080939385966558*f[..., 144]*(vx*vy^2*x*y-0.3333333333333333*vx*x*y)+1.778781183844713*\
-            f[..., 85]*(vy^2*x*y-0.3333333333333333*x*y)+6.075694404757366*f[..., 275]*(vx^3*vy*x*y-0.6*vx*vy*x*y)+\
-            3.080939385966558*f[..., 140]*(vx^2*vy*x*y-0.3333333333333333*vy*x*y)+3.507803800100568*f[..., 186]*\
-            (vx^3*x*y-0.6*vx*x*y)+1.778781183844713*f[..., 70]*(vx^2*x*y-0.3333333333333333*x*y)+3.507803800100568*f[..., 205]*\
-            (vx*vy^3*y-0.6*vx*vy*y)+2.025231468252455*f[..., 118]*(vy^3*y-0.6*vy*y)+1.778781183844713*f[..., 89]*\
-            (vx*vy^2*y-0.3333333333333333*vx*y)+1.026979795322186*f[..., 48]*(vy^2*y-0.3333333333333333*y)+\
-            3.507803800100568*f[..., 199]*(vx^3*vy*y-0.6*vx*vy*y)+1.778781183844713*f[..., 83]*(vx^2*vy*y-0.3333333333333333*vy*y)+\
-            2.025231468252455*f[..., 111]*(vx^3*y-0.6*vx*y)+1.026979795322186*f[..., 41]*(vx^2*y-0.3333333333333333*y)+\
-            1.590990257669731*f[..., 58]*vx*vy*x*y+0.9185586535436913*f[..., 25]*vy*x*y+0.9185586535436913*f[..., 22]*vx*x*y+\
-            0.5303300858899105*f[..., 6]*x*y+0.9185586535436913*f[..., 29]*vx*vy*y+0.5303300858899105*f[..., 13]*vy*y+0.5303300858899105*\
-            f[..., 10]*vx*y+0.3061862178478971*f[..., 2]*y+6.960582377305072*f[..., 300]*\
-            (vx*vy*x^4-0.8571428571428571*(vx*vy*x^2-0.3333333333333333*vx*vy)-0.2*vx*vy)+4.018694109253648*f[..., 219]*\
-            (vy*x^4-0.8571428571428571*(vy*x^2-0.3333333333333333*vy)-0.2*vy)+4.018694109253648*f[..., 213]*\
-            (vx*x^4-0.8571428571428571*(vx*x^2-0.3333333333333333*vx)-0.2*vx)+2.320194125768357*f[..., 121]*\
-            (x^4-0.8571428571428571*(x^2-0.3333333333333333)-0.2)+3.507803800100568*f[..., 195]*(vx*vy*x^3-0.6*vx*vy*x)+\
-            2.025231468252455*f[..., 113]*(vy*x^3-0.6*vy*x)+2.025231468252455*f[..., 107]*(vx*x^3-0.6*vx*x)+1.169267933366856*f[..., 51]*\
-            (x^3-0.6*x)+3.444594950788841*f[..., 162]*+3.444594950788841*f[..., 171]*+1.988737822087164*f[..., 97]*+1.778781183844713*f[..., 79]*(vx*vy*x^2-0.3333333333333333*vx*vy)+1.026979795322186*f[..., 43]*\
-            (vy*x^2-0.3333333333333333*vy)+1.988737822087164*f[..., 94]*+\
-            1.026979795322186*f[..., 37]*(vx*x^2-0.3333333333333333*vx)+0.592927061281571*f[..., 16]*(x^2-0.3333333333333333)+\
-            6.960582377305072*f[..., 309]*(-0.8571428571428571*(vx*vy^2*x-0.3333333333333333*vx*x)+vx*vy^4*x-0.2*vx*x)+\
-            3.444594950788841*f[..., 174]*+4.018694109253648*f[..., 223]*\
-            (-0.8571428571428571*(vy^2*x-0.3333333333333333*x)+vy^4*x-0.2*x)+6.960582377305072*f[..., 303]*\
-            (-0.8571428571428571*(vx^2*vy*x-0.3333333333333333*vy*x)+vx^4*vy*x-0.2*vy*x)+4.018694109253648*f[..., 216]*\
-            (-0.8571428571428571*(vx^2*x-0.3333333333333333*x)+vx^4*x-0.2*x)+3.507803800100568*f[..., 204]*\
-            (vx*vy^3*x-0.6*vx*vy*x)+2.025231468252455*f[..., 117]*(vy^3*x-0.6*vy*x)+1.778781183844713*f[..., 88]*\
-            (vx*vy^2*x-0.3333333333333333*vx*x)+1.026979795322186*f[..., 47]*(vy^2*x-0.3333333333333333*x)+\
-            3.507803800100568*f[..., 198]*(vx^3*vy*x-0.6*vx*vy*x)+1.778781183844713*f[..., 82]*(vx^2*vy*x-0.3333333333333333*vy*x)+\
-            2.025231468252455*f[..., 110]*(vx^3*x-0.6*vx*x)+1.026979795322186*f[..., 40]*(vx^2*x-0.3333333333333333*x)+\
-            0.9185586535436913*f[..., 28]*vx*vy*x+0.5303300858899105*f[..., 12]*vy*x+0.5303300858899105*f[..., 9]*vx*x+\
-            0.3061862178478971*f[..., 1]*x+4.018694109253648*f[..., 226]*\
-            (vx*vy^4-0.8571428571428571*(vx*vy^2-0.3333333333333333*vx)-0.2*vx)+2.320194125768357*f[..., 125]*\
-            (vy^4-0.8571428571428571*(vy^2-0.3333333333333333)-0.2)+2.025231468252455*f[..., 120]*(vx*vy^3-0.6*vx*vy)+\
-            1.169267933366856*f[..., 55]*(vy^3-0.6*vy)+1.988737822087164*f[..., 100]*+\
-            1.026979795322186*f[..., 50]*(vx*vy^2-0.3333333333333333*vx)+0.592927061281571*f[..., 20]*(vy^2-0.3333333333333333)+\
-            4.018694109253648*f[..., 222]*(-0.8571428571428571*(vx^2*vy-0.3333333333333333*vy)+vx^4*vy-0.2*vy)+\
-            2.025231468252455*f[..., 116]*(vx^3*vy-0.6*vx*vy)+1.026979795322186*f[..., 46]*(vx^2*vy-0.3333333333333333*vy)+\
-            0.5303300858899105*f[..., 15]*vx*vy+0.3061862178478971*f[..., 5]*vy+2.320194125768357*f[..., 124]*\
-            (vx^4-0.8571428571428571*(vx^2-0.3333333333333333)-0.2)+1.169267933366856*f[..., 54]*(vx^3-0.6*vx)+\
-            0.592927061281571*f[..., 19]*(vx^2-0.3333333333333333)+0.3061862178478971*f[..., 4]*vx+0.1767766952966368*f[..., 0]
-#end
-
-expand_5d = [_expand_5d1p, _expand_5d2p, _expand_5d3p, _expand_5d4p]
\ No newline at end of file
@@ -1,174 +0,0 @@
-def _expand_6d1p(f, x, y, z, vx, vy, vz):
-    return 3.375*f[..., 63]*vx*vy*vz*x*y*z+1.948557158514986*f[..., 59]*vy*vz*x*y*z+1.948557158514986*f[..., 58]*vx*vz*x*y*z+1.125*\
-            f[..., 47]*vz*x*y*z+1.948557158514986*f[..., 57]*vx*vy*x*y*z+1.125*f[..., 43]*vy*x*y*z+1.125*f[..., 42]*vx*x*y*z+0.6495190528383289*f[..., 22]*\
-            x*y*z+1.948557158514986*f[..., 62]*vx*vy*vz*y*z+1.125*f[..., 53]*vy*vz*y*z+1.125*f[..., 50]*vx*vz*y*z+0.6495190528383289*f[..., 34]*vz*\
-            y*z+1.125*f[..., 46]*vx*vy*y*z+0.6495190528383289*f[..., 28]*vy*y*z+0.6495190528383289*f[..., 25]*vx*y*z+0.375*f[..., 9]*y*z+\
-            1.948557158514986*f[..., 61]*vx*vy*vz*x*z+1.125*f[..., 52]*vy*vz*x*z+1.125*f[..., 49]*vx*vz*x*z+0.6495190528383289*f[..., 33]*vz*x*z+\
-            1.125*f[..., 45]*vx*vy*x*z+0.6495190528383289*f[..., 27]*vy*x*z+0.6495190528383289*f[..., 24]*vx*x*z+0.375*f[..., 8]*x*z+1.125*f[..., 56]*vx*\
-            vy*vz*z+0.6495190528383289*f[..., 40]*vy*vz*z+0.6495190528383289*f[..., 37]*vx*vz*z+0.375*f[..., 19]*vz*z+0.6495190528383289*\
-            f[..., 31]*vx*vy*z+0.375*f[..., 15]*vy*z+0.375*f[..., 12]*vx*z+0.2165063509461096*f[..., 3]*z+1.948557158514986*f[..., 60]*vx*vy*vz*x*y+1.125\
-            *f[..., 51]*vy*vz*x*y+1.125*f[..., 48]*vx*vz*x*y+0.6495190528383289*f[..., 32]*vz*x*y+1.125*f[..., 44]*vx*vy*x*y+0.6495190528383289*f[..., 26]*\
-            vy*x*y+0.6495190528383289*f[..., 23]*vx*x*y+0.375*f[..., 7]*x*y+1.125*f[..., 55]*vx*vy*vz*y+0.6495190528383289*f[..., 39]*vy*vz*y+\
-            0.6495190528383289*f[..., 36]*vx*vz*y+0.375*f[..., 18]*vz*y+0.6495190528383289*f[..., 30]*vx*vy*y+0.375*f[..., 14]*vy*y+0.375*f[..., 11]*vx*y\
-            +0.2165063509461096*f[..., 2]*y+1.125*f[..., 54]*vx*vy*vz*x+0.6495190528383289*f[..., 38]*vy*vz*x+0.6495190528383289*f[..., 35]*vx*vz\
-            *x+0.375*f[..., 17]*vz*x+0.6495190528383289*f[..., 29]*vx*vy*x+0.375*f[..., 13]*vy*x+0.375*f[..., 10]*vx*x+0.2165063509461096*f[..., 1]*x+\
-            0.6495190528383289*f[..., 41]*vx*vy*vz+0.375*f[..., 21]*vy*vz+0.375*f[..., 20]*vx*vz+0.2165063509461096*f[..., 6]*vz+0.375*f[..., 16]*vx*vy+\
-            0.2165063509461096*f[..., 5]*vy+0.2165063509461096*f[..., 4]*vx+0.125*f[..., 0]
-#end
-
-def _expand_6d2p(f, x, y, z, vx, vy, vz):
-    return 6.535659396725016*f[..., 252]*(vx*vy*vz*x*y*z^2-0.3333333333333333*vx*vy*vz*x*y)+3.773364712030896*f[..., 231]*\
-            (vy*vz*x*y*z^2-0.3333333333333333*vy*vz*x*y)+3.773364712030896*f[..., 227]*\
-            (vx*vz*x*y*z^2-0.3333333333333333*vx*vz*x*y)+2.178553132241672*f[..., 181]*(vz*x*y*z^2-0.3333333333333333*vz*x*y)+3.773364712030896*f[..., 222]*(vx*vy*x*y*z^2-0.3333333333333333*vx*vy*x*y)+2.178553132241672*f[..., 165]*\
-            (vy*x*y*z^2-0.3333333333333333*vy*x*y)+2.178553132241672*f[..., 161]*(vx*x*y*z^2-0.3333333333333333*vx*x*y)+\
-            1.257788237343632*f[..., 95]*(x*y*z^2-0.3333333333333333*x*y)+3.773364712030896*f[..., 237]*\
-            (vx*vy*vz*y*z^2-0.3333333333333333*vx*vy*vz*y)+2.178553132241672*f[..., 196]*\
-            (vy*vz*y*z^2-0.3333333333333333*vy*vz*y)+2.178553132241672*f[..., 187]*(vx*vz*y*z^2-0.3333333333333333*vx*vz*y)+\
-            1.257788237343632*f[..., 128]*(vz*y*z^2-0.3333333333333333*vz*y)+2.178553132241672*f[..., 171]*\
-            (vx*vy*y*z^2-0.3333333333333333*vx*vy*y)+1.257788237343632*f[..., 110]*(vy*y*z^2-0.3333333333333333*vy*y)+\
-            1.257788237343632*f[..., 101]*(vx*y*z^2-0.3333333333333333*vx*y)+0.7261843774138907*f[..., 53]*\
-            (y*z^2-0.3333333333333333*y)+3.773364712030896*f[..., 236]*(vx*vy*vz*x*z^2-0.3333333333333333*vx*vy*vz*x)+\
-            2.178553132241672*f[..., 195]*(vy*vz*x*z^2-0.3333333333333333*vy*vz*x)+2.178553132241672*f[..., 186]*\
-            (vx*vz*x*z^2-0.3333333333333333*vx*vz*x)+1.257788237343632*f[..., 127]*(vz*x*z^2-0.3333333333333333*vz*x)+\
-            2.178553132241672*f[..., 170]*(vx*vy*x*z^2-0.3333333333333333*vx*vy*x)+1.257788237343632*f[..., 109]*\
-            (vy*x*z^2-0.3333333333333333*vy*x)+1.257788237343632*f[..., 100]*(vx*x*z^2-0.3333333333333333*vx*x)+\
-            0.7261843774138907*f[..., 52]*(x*z^2-0.3333333333333333*x)+2.178553132241672*f[..., 199]*\
-            (vx*vy*vz*z^2-0.3333333333333333*vx*vy*vz)+1.257788237343632*f[..., 137]*(vy*vz*z^2-0.3333333333333333*vy*vz)+\
-            1.257788237343632*f[..., 131]*(vx*vz*z^2-0.3333333333333333*vx*vz)+0.7261843774138907*f[..., 70]*\
-            (vz*z^2-0.3333333333333333*vz)+1.257788237343632*f[..., 113]*(vx*vy*z^2-0.3333333333333333*vx*vy)+\
-            0.7261843774138907*f[..., 62]*(vy*z^2-0.3333333333333333*vy)+0.7261843774138907*f[..., 56]*\
-            (vx*z^2-0.3333333333333333*vx)+0.4192627457812106*f[..., 24]*(z^2-0.3333333333333333)+6.535659396725016*f[..., 251]*\
-            (vx*vy*vz*x*y^2*z-0.3333333333333333*vx*vy*vz*x*z)+3.773364712030896*f[..., 230]*\
-            (vy*vz*x*y^2*z-0.3333333333333333*vy*vz*x*z)+3.773364712030896*f[..., 226]*\
-            (vx*vz*x*y^2*z-0.3333333333333333*vx*vz*x*z)+2.178553132241672*f[..., 180]*(vz*x*y^2*z-0.3333333333333333*vz*x*z)+3.773364712030896*f[..., 221]*(vx*vy*x*y^2*z-0.3333333333333333*vx*vy*x*z)+2.178553132241672*f[..., 164]*\
-            (vy*x*y^2*z-0.3333333333333333*vy*x*z)+2.178553132241672*f[..., 160]*(vx*x*y^2*z-0.3333333333333333*vx*x*z)+\
-            1.257788237343632*f[..., 94]*(x*y^2*z-0.3333333333333333*x*z)+3.773364712030896*f[..., 235]*\
-            (vx*vy*vz*y^2*z-0.3333333333333333*vx*vy*vz*z)+2.178553132241672*f[..., 194]*\
-            (vy*vz*y^2*z-0.3333333333333333*vy*vz*z)+2.178553132241672*f[..., 185]*(vx*vz*y^2*z-0.3333333333333333*vx*vz*z)+\
-            1.257788237343632*f[..., 126]*(vz*y^2*z-0.3333333333333333*vz*z)+2.178553132241672*f[..., 169]*\
-            (vx*vy*y^2*z-0.3333333333333333*vx*vy*z)+1.257788237343632*f[..., 108]*(vy*y^2*z-0.3333333333333333*vy*z)+\
-            1.257788237343632*f[..., 99]*(vx*y^2*z-0.3333333333333333*vx*z)+0.7261843774138907*f[..., 51]*\
-            (y^2*z-0.3333333333333333*z)+6.535659396725016*f[..., 250]*(vx*vy*vz*x^2*y*z-0.3333333333333333*vx*vy*vz*y*z)+\
-            3.773364712030896*f[..., 229]*(vy*vz*x^2*y*z-0.3333333333333333*vy*vz*y*z)+3.773364712030896*f[..., 225]*\
-            (vx*vz*x^2*y*z-0.3333333333333333*vx*vz*y*z)+2.178553132241672*f[..., 179]*(vz*x^2*y*z-0.3333333333333333*vz*y*z)+3.773364712030896*f[..., 220]*(vx*vy*x^2*y*z-0.3333333333333333*vx*vy*y*z)+2.178553132241672*f[..., 163]*\
-            (vy*x^2*y*z-0.3333333333333333*vy*y*z)+2.178553132241672*f[..., 159]*(vx*x^2*y*z-0.3333333333333333*vx*y*z)+\
-            1.257788237343632*f[..., 93]*(x^2*y*z-0.3333333333333333*y*z)+6.535659396725016*f[..., 255]*\
-            (vx*vy*vz^2*x*y*z-0.3333333333333333*vx*vy*x*y*z)+3.773364712030896*f[..., 246]*\
-            (vy*vz^2*x*y*z-0.3333333333333333*vy*x*y*z)+3.773364712030896*f[..., 245]*\
-            (vx*vz^2*x*y*z-0.3333333333333333*vx*x*y*z)+2.178553132241672*f[..., 209]*(vz^2*x*y*z-0.3333333333333333*x*y*z)+\
-            6.535659396725016*f[..., 254]*(vx*vy^2*vz*x*y*z-0.3333333333333333*vx*vz*x*y*z)+3.773364712030896*f[..., 241]*\
-            (vy^2*vz*x*y*z-0.3333333333333333*vz*x*y*z)+6.535659396725016*f[..., 253]*\
-            (vx^2*vy*vz*x*y*z-0.3333333333333333*vy*vz*x*y*z)+3.773364712030896*f[..., 228]*\
-            (vx^2*vz*x*y*z-0.3333333333333333*vz*x*y*z)+3.773364712030896*f[..., 224]*\
-            (vx*vy^2*x*y*z-0.3333333333333333*vx*x*y*z)+2.178553132241672*f[..., 175]*(vy^2*x*y*z-0.3333333333333333*x*y*z)+\
-            3.773364712030896*f[..., 223]*(vx^2*vy*x*y*z-0.3333333333333333*vy*x*y*z)+2.178553132241672*f[..., 162]*\
-            (vx^2*x*y*z-0.3333333333333333*x*y*z)+3.773364712030896*f[..., 249]*(vx*vy*vz^2*y*z-0.3333333333333333*vx*vy*y*z)+2.178553132241672*f[..., 215]*(vy*vz^2*y*z-0.3333333333333333*vy*y*z)+2.178553132241672*f[..., 212]*\
-            (vx*vz^2*y*z-0.3333333333333333*vx*y*z)+1.257788237343632*f[..., 145]*(vz^2*y*z-0.3333333333333333*y*z)+\
-            3.773364712030896*f[..., 244]*(vx*vy^2*vz*y*z-0.3333333333333333*vx*vz*y*z)+2.178553132241672*f[..., 205]*\
-            (vy^2*vz*y*z-0.3333333333333333*vz*y*z)+3.773364712030896*f[..., 240]*\
-            (vx^2*vy*vz*y*z-0.3333333333333333*vy*vz*y*z)+2.178553132241672*f[..., 190]*\
-            (vx^2*vz*y*z-0.3333333333333333*vz*y*z)+2.178553132241672*f[..., 178]*(vx*vy^2*y*z-0.3333333333333333*vx*y*z)+\
-            1.257788237343632*f[..., 119]*(vy^2*y*z-0.3333333333333333*y*z)+2.178553132241672*f[..., 174]*\
-            (vx^2*vy*y*z-0.3333333333333333*vy*y*z)+1.257788237343632*f[..., 104]*(vx^2*y*z-0.3333333333333333*y*z)+\
-            3.773364712030896*f[..., 234]*(vx*vy*vz*x^2*z-0.3333333333333333*vx*vy*vz*z)+2.178553132241672*f[..., 193]*\
-            (vy*vz*x^2*z-0.3333333333333333*vy*vz*z)+2.178553132241672*f[..., 184]*(vx*vz*x^2*z-0.3333333333333333*vx*vz*z)+\
-            1.257788237343632*f[..., 125]*(vz*x^2*z-0.3333333333333333*vz*z)+2.178553132241672*f[..., 168]*\
-            (vx*vy*x^2*z-0.3333333333333333*vx*vy*z)+1.257788237343632*f[..., 107]*(vy*x^2*z-0.3333333333333333*vy*z)+\
-            1.257788237343632*f[..., 98]*(vx*x^2*z-0.3333333333333333*vx*z)+0.7261843774138907*f[..., 50]*\
-            (x^2*z-0.3333333333333333*z)+3.773364712030896*f[..., 248]*(vx*vy*vz^2*x*z-0.3333333333333333*vx*vy*x*z)+\
-            2.178553132241672*f[..., 214]*(vy*vz^2*x*z-0.3333333333333333*vy*x*z)+2.178553132241672*f[..., 211]*\
-            (vx*vz^2*x*z-0.3333333333333333*vx*x*z)+1.257788237343632*f[..., 144]*(vz^2*x*z-0.3333333333333333*x*z)+\
-            3.773364712030896*f[..., 243]*(vx*vy^2*vz*x*z-0.3333333333333333*vx*vz*x*z)+2.178553132241672*f[..., 204]*\
-            (vy^2*vz*x*z-0.3333333333333333*vz*x*z)+3.773364712030896*f[..., 239]*\
-            (vx^2*vy*vz*x*z-0.3333333333333333*vy*vz*x*z)+2.178553132241672*f[..., 189]*\
-            (vx^2*vz*x*z-0.3333333333333333*vz*x*z)+2.178553132241672*f[..., 177]*(vx*vy^2*x*z-0.3333333333333333*vx*x*z)+\
-            1.257788237343632*f[..., 118]*(vy^2*x*z-0.3333333333333333*x*z)+2.178553132241672*f[..., 173]*\
-            (vx^2*vy*x*z-0.3333333333333333*vy*x*z)+1.257788237343632*f[..., 103]*(vx^2*x*z-0.3333333333333333*x*z)+\
-            2.178553132241672*f[..., 218]*(vx*vy*vz^2*z-0.3333333333333333*vx*vy*z)+1.257788237343632*f[..., 151]*\
-            (vy*vz^2*z-0.3333333333333333*vy*z)+1.257788237343632*f[..., 148]*(vx*vz^2*z-0.3333333333333333*vx*z)+\
-            0.7261843774138907*f[..., 75]*(vz^2*z-0.3333333333333333*z)+2.178553132241672*f[..., 208]*\
-            (vx*vy^2*vz*z-0.3333333333333333*vx*vz*z)+1.257788237343632*f[..., 141]*(vy^2*vz*z-0.3333333333333333*vz*z)+\
-            2.178553132241672*f[..., 202]*(vx^2*vy*vz*z-0.3333333333333333*vy*vz*z)+1.257788237343632*f[..., 134]*\
-            (vx^2*vz*z-0.3333333333333333*vz*z)+1.257788237343632*f[..., 122]*(vx*vy^2*z-0.3333333333333333*vx*z)+\
-            0.7261843774138907*f[..., 66]*(vy^2*z-0.3333333333333333*z)+1.257788237343632*f[..., 116]*\
-            (vx^2*vy*z-0.3333333333333333*vy*z)+0.7261843774138907*f[..., 59]*(vx^2*z-0.3333333333333333*z)+3.375*f[..., 219]*vx*\
-            vy*vz*x*y*z+1.948557158514986*f[..., 155]*vy*vz*x*y*z+1.948557158514986*f[..., 154]*vx*vz*x*y*z+1.125*f[..., 83]*vz*x*y*z+\
-            1.948557158514986*f[..., 153]*vx*vy*x*y*z+1.125*f[..., 79]*vy*x*y*z+1.125*f[..., 78]*vx*x*y*z+0.6495190528383289*f[..., 28]*x*y*z+\
-            1.948557158514986*f[..., 158]*vx*vy*vz*y*z+1.125*f[..., 89]*vy*vz*y*z+1.125*f[..., 86]*vx*vz*y*z+0.6495190528383289*f[..., 40]*vz*y*z+\
-            1.125*f[..., 82]*vx*vy*y*z+0.6495190528383289*f[..., 34]*vy*y*z+0.6495190528383289*f[..., 31]*vx*y*z+0.375*f[..., 9]*y*z+\
-            1.948557158514986*f[..., 157]*vx*vy*vz*x*z+1.125*f[..., 88]*vy*vz*x*z+1.125*f[..., 85]*vx*vz*x*z+0.6495190528383289*f[..., 39]*vz*x*z+\
-            1.125*f[..., 81]*vx*vy*x*z+0.6495190528383289*f[..., 33]*vy*x*z+0.6495190528383289*f[..., 30]*vx*x*z+0.375*f[..., 8]*x*z+1.125*f[..., 92]*vx*\
-            vy*vz*z+0.6495190528383289*f[..., 46]*vy*vz*z+0.6495190528383289*f[..., 43]*vx*vz*z+0.375*f[..., 19]*vz*z+0.6495190528383289*\
-            f[..., 37]*vx*vy*z+0.375*f[..., 15]*vy*z+0.375*f[..., 12]*vx*z+0.2165063509461096*f[..., 3]*z+3.773364712030896*f[..., 233]*\
-            (vx*vy*vz*x*y^2-0.3333333333333333*vx*vy*vz*x)+2.178553132241672*f[..., 192]*\
-            (vy*vz*x*y^2-0.3333333333333333*vy*vz*x)+2.178553132241672*f[..., 183]*(vx*vz*x*y^2-0.3333333333333333*vx*vz*x)+\
-            1.257788237343632*f[..., 124]*(vz*x*y^2-0.3333333333333333*vz*x)+2.178553132241672*f[..., 167]*\
-            (vx*vy*x*y^2-0.3333333333333333*vx*vy*x)+1.257788237343632*f[..., 106]*(vy*x*y^2-0.3333333333333333*vy*x)+\
-            1.257788237343632*f[..., 97]*(vx*x*y^2-0.3333333333333333*vx*x)+0.7261843774138907*f[..., 49]*\
-            (x*y^2-0.3333333333333333*x)+2.178553132241672*f[..., 198]*(vx*vy*vz*y^2-0.3333333333333333*vx*vy*vz)+\
-            1.257788237343632*f[..., 136]*(vy*vz*y^2-0.3333333333333333*vy*vz)+1.257788237343632*f[..., 130]*\
-            (vx*vz*y^2-0.3333333333333333*vx*vz)+0.7261843774138907*f[..., 69]*(vz*y^2-0.3333333333333333*vz)+\
-            1.257788237343632*f[..., 112]*(vx*vy*y^2-0.3333333333333333*vx*vy)+0.7261843774138907*f[..., 61]*\
-            (vy*y^2-0.3333333333333333*vy)+0.7261843774138907*f[..., 55]*(vx*y^2-0.3333333333333333*vx)+\
-            0.4192627457812106*f[..., 23]*(y^2-0.3333333333333333)+3.773364712030896*f[..., 232]*\
-            (vx*vy*vz*x^2*y-0.3333333333333333*vx*vy*vz*y)+2.178553132241672*f[..., 191]*\
-            (vy*vz*x^2*y-0.3333333333333333*vy*vz*y)+2.178553132241672*f[..., 182]*(vx*vz*x^2*y-0.3333333333333333*vx*vz*y)+\
-            1.257788237343632*f[..., 123]*(vz*x^2*y-0.3333333333333333*vz*y)+2.178553132241672*f[..., 166]*\
-            (vx*vy*x^2*y-0.3333333333333333*vx*vy*y)+1.257788237343632*f[..., 105]*(vy*x^2*y-0.3333333333333333*vy*y)+\
-            1.257788237343632*f[..., 96]*(vx*x^2*y-0.3333333333333333*vx*y)+0.7261843774138907*f[..., 48]*\
-            (x^2*y-0.3333333333333333*y)+3.773364712030896*f[..., 247]*(vx*vy*vz^2*x*y-0.3333333333333333*vx*vy*x*y)+\
-            2.178553132241672*f[..., 213]*(vy*vz^2*x*y-0.3333333333333333*vy*x*y)+2.178553132241672*f[..., 210]*\
-            (vx*vz^2*x*y-0.3333333333333333*vx*x*y)+1.257788237343632*f[..., 143]*(vz^2*x*y-0.3333333333333333*x*y)+\
-            3.773364712030896*f[..., 242]*(vx*vy^2*vz*x*y-0.3333333333333333*vx*vz*x*y)+2.178553132241672*f[..., 203]*\
-            (vy^2*vz*x*y-0.3333333333333333*vz*x*y)+3.773364712030896*f[..., 238]*\
-            (vx^2*vy*vz*x*y-0.3333333333333333*vy*vz*x*y)+2.178553132241672*f[..., 188]*\
-            (vx^2*vz*x*y-0.3333333333333333*vz*x*y)+2.178553132241672*f[..., 176]*(vx*vy^2*x*y-0.3333333333333333*vx*x*y)+\
-            1.257788237343632*f[..., 117]*(vy^2*x*y-0.3333333333333333*x*y)+2.178553132241672*f[..., 172]*\
-            (vx^2*vy*x*y-0.3333333333333333*vy*x*y)+1.257788237343632*f[..., 102]*(vx^2*x*y-0.3333333333333333*x*y)+\
-            2.178553132241672*f[..., 217]*(vx*vy*vz^2*y-0.3333333333333333*vx*vy*y)+1.257788237343632*f[..., 150]*\
-            (vy*vz^2*y-0.3333333333333333*vy*y)+1.257788237343632*f[..., 147]*(vx*vz^2*y-0.3333333333333333*vx*y)+\
-            0.7261843774138907*f[..., 74]*(vz^2*y-0.3333333333333333*y)+2.178553132241672*f[..., 207]*\
-            (vx*vy^2*vz*y-0.3333333333333333*vx*vz*y)+1.257788237343632*f[..., 140]*(vy^2*vz*y-0.3333333333333333*vz*y)+\
-            2.178553132241672*f[..., 201]*(vx^2*vy*vz*y-0.3333333333333333*vy*vz*y)+1.257788237343632*f[..., 133]*\
-            (vx^2*vz*y-0.3333333333333333*vz*y)+1.257788237343632*f[..., 121]*(vx*vy^2*y-0.3333333333333333*vx*y)+\
-            0.7261843774138907*f[..., 65]*(vy^2*y-0.3333333333333333*y)+1.257788237343632*f[..., 115]*\
-            (vx^2*vy*y-0.3333333333333333*vy*y)+0.7261843774138907*f[..., 58]*(vx^2*y-0.3333333333333333*y)+\
-            1.948557158514986*f[..., 156]*vx*vy*vz*x*y+1.125*f[..., 87]*vy*vz*x*y+1.125*f[..., 84]*vx*vz*x*y+0.6495190528383289*f[..., 38]*vz*x*y+\
-            1.125*f[..., 80]*vx*vy*x*y+0.6495190528383289*f[..., 32]*vy*x*y+0.6495190528383289*f[..., 29]*vx*x*y+0.375*f[..., 7]*x*y+1.125*f[..., 91]*vx*\
-            vy*vz*y+0.6495190528383289*f[..., 45]*vy*vz*y+0.6495190528383289*f[..., 42]*vx*vz*y+0.375*f[..., 18]*vz*y+0.6495190528383289*\
-            f[..., 36]*vx*vy*y+0.375*f[..., 14]*vy*y+0.375*f[..., 11]*vx*y+0.2165063509461096*f[..., 2]*y+2.178553132241672*f[..., 197]*\
-            (vx*vy*vz*x^2-0.3333333333333333*vx*vy*vz)+1.257788237343632*f[..., 135]*(vy*vz*x^2-0.3333333333333333*vy*vz)+\
-            1.257788237343632*f[..., 129]*(vx*vz*x^2-0.3333333333333333*vx*vz)+0.7261843774138907*f[..., 68]*\
-            (vz*x^2-0.3333333333333333*vz)+1.257788237343632*f[..., 111]*(vx*vy*x^2-0.3333333333333333*vx*vy)+\
-            0.7261843774138907*f[..., 60]*(vy*x^2-0.3333333333333333*vy)+0.7261843774138907*f[..., 54]*\
-            (vx*x^2-0.3333333333333333*vx)+0.4192627457812106*f[..., 22]*(x^2-0.3333333333333333)+2.178553132241672*f[..., 216]*\
-            (vx*vy*vz^2*x-0.3333333333333333*vx*vy*x)+1.257788237343632*f[..., 149]*(vy*vz^2*x-0.3333333333333333*vy*x)+\
-            1.257788237343632*f[..., 146]*(vx*vz^2*x-0.3333333333333333*vx*x)+0.7261843774138907*f[..., 73]*\
-            (vz^2*x-0.3333333333333333*x)+2.178553132241672*f[..., 206]*(vx*vy^2*vz*x-0.3333333333333333*vx*vz*x)+\
-            1.257788237343632*f[..., 139]*(vy^2*vz*x-0.3333333333333333*vz*x)+2.178553132241672*f[..., 200]*\
-            (vx^2*vy*vz*x-0.3333333333333333*vy*vz*x)+1.257788237343632*f[..., 132]*(vx^2*vz*x-0.3333333333333333*vz*x)+\
-            1.257788237343632*f[..., 120]*(vx*vy^2*x-0.3333333333333333*vx*x)+0.7261843774138907*f[..., 64]*\
-            (vy^2*x-0.3333333333333333*x)+1.257788237343632*f[..., 114]*(vx^2*vy*x-0.3333333333333333*vy*x)+\
-            0.7261843774138907*f[..., 57]*(vx^2*x-0.3333333333333333*x)+1.125*f[..., 90]*vx*vy*vz*x+0.6495190528383289*f[..., 44]*vy*vz*x+\
-            0.6495190528383289*f[..., 41]*vx*vz*x+0.375*f[..., 17]*vz*x+0.6495190528383289*f[..., 35]*vx*vy*x+0.375*f[..., 13]*vy*x+0.375*f[..., 10]*vx*x\
-            +0.2165063509461096*f[..., 1]*x+1.257788237343632*f[..., 152]*(vx*vy*vz^2-0.3333333333333333*vx*vy)+\
-            0.7261843774138907*f[..., 77]*(vy*vz^2-0.3333333333333333*vy)+0.7261843774138907*f[..., 76]*\
-            (vx*vz^2-0.3333333333333333*vx)+0.4192627457812106*f[..., 27]*(vz^2-0.3333333333333333)+1.257788237343632*\
-            f[..., 142]*(vx*vy^2*vz-0.3333333333333333*vx*vz)+0.7261843774138907*f[..., 72]*(vy^2*vz-0.3333333333333333*vz)+\
-            1.257788237343632*f[..., 138]*(vx^2*vy*vz-0.3333333333333333*vy*vz)+0.7261843774138907*f[..., 71]*\
-            (vx^2*vz-0.3333333333333333*vz)+0.6495190528383289*f[..., 47]*vx*vy*vz+0.375*f[..., 21]*vy*vz+0.375*f[..., 20]*vx*vz+\
-            0.2165063509461096*f[..., 6]*vz+0.7261843774138907*f[..., 67]*(vx*vy^2-0.3333333333333333*vx)+0.4192627457812106*f[..., 26]*\
-            (vy^2-0.3333333333333333)+0.7261843774138907*f[..., 63]*(vx^2*vy-0.3333333333333333*vy)+0.375*f[..., 16]*vx*vy+\
-            0.2165063509461096*f[..., 5]*vy+0.4192627457812106*f[..., 25]*(vx^2-0.3333333333333333)+0.2165063509461096*f[..., 4]*vx+\
-            0.125*f[..., 0]
-#end
-
-def _expand_6d3p(f, x, y, z, vx, vy, vz):
-    return
-#end
-
-def _expand_6d4p(f, x, y, z, vx, vy, vz):
-    return
-#end
-
-expand_6d = [_expand_6d1p, _expand_6d2p, _expand_6d3p, _expand_6d4p]
\ No newline at end of file
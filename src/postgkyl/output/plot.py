@@ -1,11 +1,5 @@
 import os.path
 
-import matplotlib as mpl
-from matplotlib import cm
-import matplotlib.figure
-import matplotlib.pyplot as plt
-from matplotlib import colors
-from mpl_toolkits.axes_grid1 import make_axes_locatable
 import numpy as np
 
 # this is needed for Python 3.0 compatibility
@@ -15,6 +9,7 @@ if sys.version_info[0] >= 3:
 
 # Helper functions
 def _colorbar(obj, fig, cax, label="", extend=None):
+  from mpl_toolkits.axes_grid1 import make_axes_locatable
   divider = make_axes_locatable(cax)
   cax2 = divider.append_axes("right", size="3%", pad=0.05)
   return fig.colorbar(obj, cax=cax2, label=label or "", extend=extend)
@@ -85,6 +80,11 @@ def plot(data, args=(),
   Unifies the plotting across a wide range of Gkyl applications. Can
   be used for both 1D an 2D data. Uses a proper colormap by default.
   """
+  import matplotlib as mpl
+  from matplotlib import cm
+  import matplotlib.figure
+  import matplotlib.pyplot as plt
+  from matplotlib import colors
 
   if group is not None:
     lineouts=group
@@ -240,7 +240,7 @@ def plot(data, args=(),
     #end
   else:
     if squeeze:  # Plotting into 1 panel
-      plt.subplots(1, 1, num=fig.number)
+      fig.subplots(1, 1)
       ax = fig.axes
       ax[0].set_xlabel(xlabel)
       ax[0].set_ylabel(ylabel)
@@ -269,13 +269,9 @@ def plot(data, args=(),
       #end
 
       if num_dims == 1 or lineouts is not None:
-        plt.subplots(num_rows, num_cols,
-                     sharex=True,
-                     num=fig.number)
+        fig.subplots(num_rows, num_cols, sharex=True)
       else: # In 2D, share y-axis as well
-        plt.subplots(num_rows, num_cols,
-                     sharex=True, sharey=True,
-                     num=fig.number)
+        fig.subplots(num_rows, num_cols, sharex=True, sharey=True)
       #end
       ax = fig.axes
       # Removing extra axes
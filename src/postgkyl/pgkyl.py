@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import copy
 from glob import glob
 import os
 import time
@@ -28,13 +29,305 @@ def _printVersion(ctx, param, value):
   ctx.exit()
 #end
 
+# Commands which process each dataset on its own and can, therefore,
+# be applied frame by frame in the streaming mode; the printing ones
+# ('info', 'pr') are not, as they would list the datasets frame by frame
+_frameLocal = ('differentiate', 'dgintegrate', 'integrate',
+               'interpolate', 'interpolate+integrate',
+               'interpolate+select', 'magsq', 'recovery', 'select')
+
+def _isFrameLocal(command, sub_ctx):
+  if command.name == 'load':
+    return True
+  elif command.name in ('activate', 'deactivate'):
+    return sub_ctx.params['index'] is None
+  elif command.name == 'write':
+    return not sub_ctx.params['single']
+  elif command.name == 'ev':
+    from postgkyl.commands.ev import _frameLocal as evFrameLocal
+    return not sub_ctx.params['all'] \
+      and evFrameLocal(sub_ctx.params['chain'])
+  #end
+  return command.name in _frameLocal
+#end
+
+def _defer(command):
+  # Returns a copy of the command which only records its context so
+  # the chain can be executed by '_execute' once it is fully parsed
+  deferred = copy.copy(command)
+  deferred.invoke = lambda sub_ctx: (command, sub_ctx)
+  return deferred
+#end
+
+def _stream(ctx, chain, start, done):
+  """Executes the command chain frame by frame.
+
+  The part of the chain from 'start' consisting of the loads and the
+  frame-local commands is applied to one file (of each load) at a
+  time, in parallel with '--jobs'. Only the active datasets are kept
+  after each frame and passed, in the order of a regular execution
+  (load by load and frame by frame), to the rest of the chain, e.g.,
+  'collect' or 'plot'. With a single load, a following 'collect'
+  receives the frames as they are processed (see
+  'collect.StreamCollect').
+
+  Returns:
+    The index of the first command which was not executed.
+  """
+  from postgkyl.commands import parallel
+  from postgkyl.commands.load import get_files
+
+  end = start
+  while end < len(chain) and _isFrameLocal(*chain[end]):
+    end += 1
+  #end
+  streamed = chain[start:end]
+  numLoads = len([c for c, _ in streamed if c.name == 'load'])
+  if numLoads == 0:
+    return start
+  #end
+
+  inDataStrings = ctx.obj['inDataStrings']
+  numLoaded = ctx.obj['inDataStringsLoaded']
+  fileLists = [get_files(s) for s in inDataStrings[numLoaded:numLoaded+numLoads]]
+  numFrames = len(fileLists[0])
+  if any(len(files) != numFrames for files in fileLists):
+    ctx.fail(click.style(
+      "ERROR in stream: all the loaded datasets need the same number of files",
+      fg='red'))
+  #end
+  verb_print(ctx, 'Streaming {:d} frames'.format(numFrames))
+
+  def runFrame(frame):
+    ctx.obj['data'] = DataSpace()
+    ctx.obj['inDataStrings'] = [files[frame] for files in fileLists]
+    ctx.obj['inDataStringsLoaded'] = 0
+    ctx.obj['stream'] = (frame, numFrames)
+    for command, sub_ctx in streamed:
+      command.invoke(sub_ctx)
+    #end
+    return list(ctx.obj['data'].iterator())
+  #end
+
+  # When 'collect' follows, the frames are written directly into the
+  # collected arrays instead of being kept in the DataSpace; this
+  # requires the frames to arrive in the order of a regular execution,
+  # i.e., a single load
+  data = ctx.obj['data']
+  sink = None
+  if end < len(chain) and chain[end][0].name == 'collect' \
+     and numLoads == 1 and data.getNumDatasets(only_active=False) == 0:
+    from postgkyl.commands.collect import StreamCollect
+    sink = StreamCollect(chain[end][1].params, numFrames)
+  #end
+
+  # The frames are processed in the worker processes with '--jobs'.
+  # Otherwise, the datasets are buffered by their position within the
+  # tag in a frame, i.e., by the load they come from, and added load by
+  # load
+  buffers = {}
+  for datasets in parallel.imap(runFrame, range(numFrames),
+                                ctx.params['jobs']):
+    if sink:
+      sink.add(datasets, data)
+      continue
+    #end
+    positions = {}
+    for dat in datasets:
+      tag = dat.get_tag()
+      positions[tag] = positions.get(tag, -1) + 1
+      buffers.setdefault((tag, positions[tag]), []).append(dat)
+    #end
+  #end
+  for key in sorted(buffers, key=lambda key: key[1]):
+    for dat in buffers[key]:
+      data.add(dat)
+    #end
+  #end
+  if sink:
+    ctx.obj['collect'] = sink
+  #end
+  if data.getNumDatasets() > 0:
+    data.setUniqueLabels()
+  #end
+  ctx.obj['data'] = data
+  ctx.obj['inDataStrings'] = inDataStrings
+  ctx.obj['inDataStringsLoaded'] = numLoaded + numLoads
+  ctx.obj.pop('stream', None)
+  if not sink: # Otherwise, the frames are not in the DataSpace
+    done(end-1)
+  #end
+  return end
+#end
+
+def _pushSelect(ctx, loads, params):
+  # Merges the 'select' options into the parameters of the preceding
+  # loads so the readers do the selection as a partial load. Returns
+  # the parameters of the changed loads or None when this would not
+  # be equivalent to the regular 'select'.
+  if params['tag'] or params['label']:
+    return None
+  #end
+  tags = params['use'].split(',') if params['use'] else None
+  if tags and not set(tags) <= set(p['tag'] for p in loads):
+    return None
+  #end
+  names = {'z0': 0, 'z1': 1, 'z2': 2, 'z3': 3, 'z4': 4, 'z5': 5,
+           'comp': 6}
+  cuts = {}
+  for name, zn in names.items():
+    if params[name] is not None:
+      cuts[zn] = params[name]
+    #end
+  #end
+  targets = [p for p in loads if not tags or p['tag'] in tags]
+  for p in targets:
+    if not p['load'] or p['fv'] or p['c2p'] or ctx.obj['global_c2p']:
+      return None
+    #end
+    for zn in cuts:
+      nm = 'component' if zn == 6 else 'z{:d}'.format(zn)
+      if p[nm] or ctx.obj['globalCuts'][zn]:
+        return None
+      #end
+    #end
+  #end
+  for p in targets:
+    for zn, cut in cuts.items():
+      p['component' if zn == 6 else 'z{:d}'.format(zn)] = cut
+    #end
+  #end
+  return targets
+#end
+
+def _pushdown(ctx, chain, notes=None):
+  """Pushes the 'select' following the loads down into the readers.
+
+  Only the selected part of each file is then read instead of the
+  whole file being loaded and sliced afterwards. Float coordinates
+  are resolved by the readers against the grid from the header.
+
+  Returns:
+    The chain without the pushed-down commands; the explanations are
+    added to 'notes' (see 'planner.plan').
+  """
+  out = []
+  for command, sub_ctx in chain:
+    targets = None
+    if command.name == 'select' and out \
+       and all(c.name == 'load' for c, _ in out):
+      targets = _pushSelect(ctx, [s.params for _, s in out], sub_ctx.params)
+    #end
+    if targets:
+      verb_print(ctx, 'Pushing select down into the load')
+      if notes is not None:
+        for _, s in out:
+          if any(s.params is p for p in targets):
+            notes.setdefault(id(s), []).append('select read by the reader')
+          #end
+        #end
+      #end
+      continue
+    #end
+    out.append((command, sub_ctx))
+  #end
+  return out
+#end
+
+def _execute(ctx, chain):
+  """Executes the parsed command chain.
+
+  This is used instead of the regular click execution so that the
+  chain can be rewritten before it runs (see '_pushdown' and '--plan'),
+  executed frame by frame ('--stream' and '--jobs'), and its results
+  reused ('--cache').
+  """
+  notes = None
+  if ctx.params['plan'] or ctx.params['explain']:
+    from postgkyl.commands import planner
+    chain, notes = planner.plan(ctx, chain)
+  #end
+  chain = _pushdown(ctx, chain, notes)
+  if ctx.params['explain']:
+    planner.explain(ctx, chain, notes)
+    return
+  #end
+  cache = None
+  start = 0
+  if ctx.params['cache']:
+    from postgkyl.commands.result_cache import ResultCache
+    cache = ResultCache(ctx, chain)
+    start = cache.restore()
+  #end
+
+  def done(i):
+    if cache:
+      cache.store(i)
+    #end
+  #end
+
+  i = start
+  while i < len(chain):
+    if ctx.params['stream'] or ctx.params['jobs'] > 1:
+      i = _stream(ctx, chain, i, done)
+      if i == len(chain):
+        break
+      #end
+    #end
+    command, sub_ctx = chain[i]
+    command.invoke(sub_ctx)
+    done(i)
+    i += 1
+  #end
+#end
+
 # Custom click class that allows to
 #   a) use shortened versions of command names
 #   b) use a file name as a command
+#   c) import the commands only when they are used
+#   d) execute the chain frame by frame ('--stream' and '--jobs')
+#   e) reuse the stored results ('--cache')
+#   f) instrument the commands ('--profile')
+#   g) push 'select' down into the readers as a partial load
+#   h) optimize the chain ('--plan' and '--explain')
 class PgkylCommandGroup(click.Group):
+  def invoke(self, ctx):
+    rv = click.Group.invoke(self, ctx)
+    # The commands were only parsed; see 'get_command'
+    _execute(ctx, rv)
+    rv = []
+    if 'profiler' in ctx.obj:
+      ctx.obj['profiler'].finish()
+    #end
+    return rv
+  #end
+
+  def list_commands(self, ctx):
+    return sorted(set(cmd.list_commands()) | set(self.commands))
+  #end
+
+  def _get_command(self, ctx, cmd_name):
+    rv = click.Group.get_command(self, ctx, cmd_name)
+    if rv is None:
+      rv = cmd.get_command(cmd_name)
+    #end
+    return rv
+  #end
+
   def get_command(self, ctx, cmd_name):
+    rv = self._get_pgkyl_command(ctx, cmd_name)
+    if rv is not None and ctx.obj and 'profiler' in ctx.obj:
+      rv = ctx.obj['profiler'].wrap(rv)
+    #end
+    if rv is not None:
+      rv = _defer(rv)
+    #end
+    return rv
+  #end
+
+  def _get_pgkyl_command(self, ctx, cmd_name):
     # cmd_name is a full name of a pgkyl command
-    rv = click.Group.get_command(self, ctx, cmd_name)
+    rv = self._get_command(ctx, cmd_name)
     if rv is not None:
       return rv
     #end
@@ -43,7 +336,7 @@ class PgkylCommandGroup(click.Group):
     matches = [x for x in self.list_commands(ctx)
                if x.startswith(cmd_name)]
     if matches and len(matches) == 1:
-      return click.Group.get_command(self, ctx, matches[0])
+      return self._get_command(ctx, matches[0])
     elif matches:
       ctx.fail("Too many matches for '{:s}': {:s}".format(cmd_name, ', '.join(sorted(matches))))
     #end
@@ -51,7 +344,7 @@ class PgkylCommandGroup(click.Group):
     # cmd_name is a data set
     if glob(cmd_name):
       ctx.obj['inDataStrings'].append(cmd_name)
-      return click.Group.get_command(self, ctx, 'load')
+      return self._get_command(ctx, 'load')
     #end
 
     ctx.fail("'{:s}' does not match either command name nor a data file".format(cmd_name))
@@ -82,6 +375,20 @@ class PgkylCommandGroup(click.Group):
               help="Specify the file name containing c2p mapped coordinates")
 @click.option('--style',
               help="Sets Maplotlib rcParams style file.")
+@click.option('--stream', is_flag=True,
+              help="Process the files one frame at a time through the frame-local part of the chain; the datasets inactive after it are dropped.")
+@click.option('--jobs', '-j', type=click.INT, default=1,
+              help="Number of processes for the frame-local part of the chain (implies '--stream'); the datasets inactive after it are dropped.")
+@click.option('--cache/--no-cache', default=False, envvar='POSTGKYL_CACHE',
+              help="Reuse the stored results of the chain stages from the previous runs.")
+@click.option('--plan', is_flag=True,
+              help="Optimize the command chain before executing it, e.g., fuse the element-wise 'ev' steps and evaluate 'interpolate' only where it is needed.")
+@click.option('--explain', is_flag=True,
+              help="Print the optimized command chain instead of executing it (implies '--plan').")
+@click.option('--profile', is_flag=True,
+              help="Print the time and memory used by each command.")
+@click.option('--profile-output',
+              help="Write the profile to a file; '.json' for the Chrome trace format, '.pstats' for cProfile (implies '--profile').")
 @click.pass_context
 def cli(ctx, **kwargs):
   """Postprocessing and plotting tool for Gkeyll
@@ -118,49 +425,16 @@ def cli(ctx, **kwargs):
                            kwargs['component'])
   ctx.obj['global_c2p'] = kwargs['c2p']
 
+  if kwargs['profile'] or kwargs['profile_output']:
+    from postgkyl.commands.profiler import Profiler
+    ctx.obj['profiler'] = Profiler(kwargs['profile_output'])
+  #end
+
   ctx.obj['rcParams'] = {}
   fn = kwargs['style'] if kwargs['style'] else '{:s}/output/postgkyl.mplstyle'.format(os.path.dirname(os.path.realpath(__file__)))
   load_style(ctx, fn)
 #end
 
-# Hook the individual commands into pgkyl
-cli.add_command(cmd.activate)
-cli.add_command(cmd.agyro)
-cli.add_command(cmd.mom_agyro)
-cli.add_command(cmd.animate)
-cli.add_command(cmd.collect)
-cli.add_command(cmd.current)
-cli.add_command(cmd.deactivate)
-cli.add_command(cmd.differentiate)
-cli.add_command(cmd.energetics)
-cli.add_command(cmd.euler)
-cli.add_command(cmd.mhd)
-cli.add_command(cmd.ev)
-cli.add_command(cmd.extractinput)
-cli.add_command(cmd.fft)
-cli.add_command(cmd.growth)
-cli.add_command(cmd.info)
-cli.add_command(cmd.integrate)
-cli.add_command(cmd.interpolate)
-cli.add_command(cmd.laguerrecompose)
-cli.add_command(cmd.listoutputs)
-cli.add_command(cmd.load)
-cli.add_command(cmd.magsq)
-cli.add_command(cmd.mask)
-cli.add_command(cmd.plot)
-cli.add_command(cmd.pr)
-cli.add_command(cmd.recovery)
-cli.add_command(cmd.relchange)
-cli.add_command(cmd.select)
-cli.add_command(cmd.style)
-cli.add_command(cmd.tenmoment)
-cli.add_command(cmd.trajectory)
-cli.add_command(cmd.val2coord)
-cli.add_command(cmd.velocity)
-cli.add_command(cmd.write)
-cli.add_command(cmd.transformframe)
-cli.add_command(cmd.pkpm)
-
 if __name__ == '__main__':
   ctx = []
   cli(ctx)
@@ -1,12 +1,124 @@
 import numpy as np
 
+_blockSize = 2**22 # Number of elements per block of the contraction
+_maxWeights = 2**24 # Maximum size of the combined weights
+
+def _mappedWeights(grid, shape, axes):
+    # Volume elements of the integrated axes for a mapped (nodal) grid:
+    # sqrt(det(G)) of the Gram matrix of the cell edge vectors, i.e.,
+    # the product of the edge lengths for an orthogonal mapping
+    num_dims = len(shape)
+    if True in (g.shape != tuple(n+1 for n in shape) for g in grid):
+        raise ValueError("integrate: mapped grids need to be nodal")
+    #end
+    edges = []
+    for ax in axes:
+        edge = []
+        for coord in grid:
+            e = np.diff(coord, axis=ax)
+            for d in range(num_dims):
+                if d != ax:
+                    e = np.moveaxis(e, d, 0)
+                    e = 0.5*(e[1:] + e[:-1])
+                    e = np.moveaxis(e, 0, d)
+                #end
+            #end
+            edge.append(e)
+        #end
+        edges.append(np.stack(edge, axis=-1))
+    #end
+    gram = np.empty(shape + (len(axes), len(axes)))
+    for i in range(len(axes)):
+        for j in range(len(axes)):
+            gram[..., i, j] = np.sum(edges[i]*edges[j], axis=-1)
+        #end
+    #end
+    return np.sqrt(np.abs(np.linalg.det(gram)))
+#end
+
+def _weights(grid, values, axes):
+    # Returns the list of the weight arrays and their axes
+    num_dims = len(grid)
+    if len(grid[0].shape) > 1:
+        return [(_mappedWeights(grid, values.shape[:num_dims], axes),
+                 list(range(num_dims)))]
+    #end
+    weights = []
+    for ax in axes:
+        coord = grid[ax]
+        if len(coord) > 1:
+            dz = coord[1:] - coord[:-1]
+            if len(coord) == values.shape[ax]:
+                dz = np.append(dz, dz[-1])
+            #end
+        else:
+            dz = np.full(values.shape[ax], 1.0/values.shape[ax])
+        #end
+        weights.append((dz, [ax]))
+    #end
+    # A single combined weight array is faster to contract
+    if np.prod([len(w) for w, _ in weights]) <= _maxWeights:
+        operands = []
+        for w, ws in weights:
+            operands += [w, ws]
+        #end
+        weights = [(np.einsum(*operands, list(axes)), list(axes))]
+    #end
+    return weights
+#end
+
+def _integrate(grid, values, axes):
+    """Integrates the values over 'axes' in a single contraction.
+
+    Assumes the values are cell centered averages and works for both
+    the nonuniform and the mapped grids. The integrated axes are kept
+    with the length of one. The contraction is done block by block
+    along the first axis, so the memory-mapped values are read only
+    once.
+    """
+    axes = sorted(set(axes))
+    num_dims = len(grid)
+    weights = _weights(grid, values, axes)
+    inAxes = list(range(num_dims+1))
+    outAxes = [d for d in inAxes if d not in axes]
+
+    step = max(1, _blockSize // max(1, int(np.prod(values.shape[1:]))))
+    out = None
+    for lo in range(0, values.shape[0], step):
+        blk = slice(lo, lo+step)
+        operands = [values[blk], inAxes]
+        for w, ws in weights:
+            operands += [w[blk] if 0 in ws else w, ws]
+        #end
+        part = np.einsum(*operands, outAxes)
+        if 0 in axes:
+            # Accumulate the partial integrals
+            if out is None:
+                out = part
+            else:
+                out += part
+            #end
+        else:
+            if out is None:
+                out = np.empty((values.shape[0],) + part.shape[1:],
+                               part.dtype)
+            #end
+            out[blk] = part
+        #end
+    #end
+    for ax in axes:
+        out = np.expand_dims(out, ax)
+    #end
+    return out
+#end
+
 def integrate(data, axis, overwrite=False, stack=False):
     if stack:
         overwrite = stack
         print("Deprecation warning: The 'stack' parameter is going to be replaced with 'overwrite'")
     #end
     grid = list(data.get_grid())
-    values = np.copy(data.get_values())
+    values = data.get_values()
 
     # Convert Python input to an input Numpy understands
     if axis is not None:
@@ -20,9 +132,7 @@ def integrate(data, axis, overwrite=False, stack=False):
                 axis = tuple([int(a) for a in axes])
             elif len(axis.split(':')) == 2:
                 bounds = axis.split(':')
-                #axis = np.zeros(bounds[1]-bounds[0], np.int)
-                #axis += int(bounds[0])
-                axis = tuple(range(bounds[0], bounds[1]))
+                axis = tuple(range(int(bounds[0]), int(bounds[1])))
             else:
                 axis = tuple([int(axis)])
             #end
@@ -34,29 +144,9 @@ def integrate(data, axis, overwrite=False, stack=False):
         axis = tuple(range(numDims))
     #end
 
-    # Get dz elements
-    dz = []
-    for d, coord in enumerate(grid):
-        dz.append(coord[1:] - coord[:-1])
-        if len(coord) > 1 and len(coord) == values.shape[d]:
-            dz[-1] = np.append(dz[-1], dz[-1][-1])
-        #end
-    #end
-
-    # Integration assuming values are cell centered averages
-    # Should work for nonuniform meshes
-    for ax in sorted(axis, reverse=True):
-        if len(grid[ax]) > 1:
-            values = np.moveaxis(values, ax, -1)
-            values = np.dot(values, dz[ax])
-        else:
-            values = values.mean(axis=ax)
-        #end
-    #end
-
+    values = _integrate(grid, values, axis)
     for ax in sorted(axis):
         grid[ax] = np.array([grid[ax].mean()])
-        values = np.expand_dims(values, ax)
     #end
 
     if overwrite:
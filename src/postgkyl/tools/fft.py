@@ -1,8 +1,8 @@
 import numpy as np
-import scipy.fft
 from .. import tools as diag
 
 def fft(data, psd=False, iso=False, overwrite=False, stack=False):
+    import scipy.fft
     if stack:
         overwrite = stack
         print("Deprecation warning: The 'stack' parameter is going to be replaced with 'overwrite'")
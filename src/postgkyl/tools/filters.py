@@ -3,11 +3,10 @@
 Postgkyl sub-module for filtering
 """
 import numpy
-import matplotlib.pyplot as plt
-from scipy.signal import butter, lfilter, freqz
 
 
 def _clickCoords(event):
+    import matplotlib.pyplot as plt
     global ix, iy
     ix, iy = event.xdata, event.ydata
     plt.close()
@@ -48,6 +47,7 @@ def fftFiltering(data, dt=1, cutoff=None):
 
     # Get the cut-off frequency if not specified
     if cutoff is None:
+        import matplotlib.pyplot as plt
         fig, ax = plt.subplots(1, 1)
         # plot just N/2 points
         ax.semilogy(freq[1:N/2], 2.0/N*numpy.abs(FT[1:N/2]))
@@ -70,6 +70,7 @@ def fftFiltering(data, dt=1, cutoff=None):
 
 
 def _butterLowpass(cutoff, fs, order=5):
+    from scipy.signal import butter
     nyq = 0.5 * fs
     normalCutoff = cutoff / nyq
     b, a = butter(order, normalCutoff, btype='low', analog=False)
@@ -77,6 +78,7 @@ def _butterLowpass(cutoff, fs, order=5):
 
 
 def _butterLowpassFilter(data, cutoff, fs, order=5):
+    from scipy.signal import lfilter
     b, a = _butterLowpass(cutoff, fs, order=order)
     y = lfilter(b, a, data)
     return y
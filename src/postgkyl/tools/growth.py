@@ -3,7 +3,6 @@
 Postgkyl module for computing growth rates
 """
 import numpy as np
-import scipy.optimize as opt
 import sys
 
 # --------------------------------------------------------------------
@@ -36,6 +35,7 @@ def fitGrowth(x, y, function=exp2, minN=None, p0=(1, 1)):
     The best is determined based on the coeficient of determination,
       R^2 https://en.wikipedia.org/wiki/Coefficient_of_determination
     """
+    import scipy.optimize as opt
     bestR2 : float = 0
     if minN is None:
       minN = int(len(x)/10)
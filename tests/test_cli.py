@@ -0,0 +1,387 @@
+import click
+import json
+import os
+import shutil
+import numpy as np
+import pytest
+
+from click.testing import CliRunner
+
+from postgkyl.commands import parallel
+from postgkyl.commands.collect import Collector
+from postgkyl.data import GData
+from postgkyl import pgkyl
+from postgkyl.pgkyl import cli
+
+
+class TestCli:
+  dir_path = os.path.dirname(__file__)
+
+  def _frames(self, tmp_path, num):
+    for i in range(num):
+      shutil.copy('{:s}/test_data/shock-f-ser-p1.gkyl'.format(self.dir_path),
+                  tmp_path / 'shock_{:d}.gkyl'.format(i))
+    #end
+    return str(tmp_path / 'shock_*.gkyl')
+  #end
+
+  def _loads(self, tmp_path):
+    # Two loads of two files each, with the values 1, 2 and 10, 20
+    file_name = '{:s}/test_data/shock-f-ser-p1.gkyl'.format(self.dir_path)
+    for prefix, scale in (('a', 1), ('b', 10)):
+      for i in range(2):
+        dat = GData(file_name)
+        dat.push(dat.get_grid(), np.full_like(dat.get_values(), scale*(i+1)))
+        dat.write(str(tmp_path / '{:s}_{:d}.gkyl'.format(prefix, i)))
+      #end
+    #end
+    return [str(tmp_path / 'a_*.gkyl'), str(tmp_path / 'b_*.gkyl')]
+  #end
+
+  def test_stream(self, tmp_path):
+    files = self._frames(tmp_path, 3)
+    chain = [files, 'interp', '-b', 'ms', '-p', '1', 'integrate', '0',
+             'collect', 'write', '-f']
+    runner = CliRunner()
+    res = runner.invoke(cli, chain + [str(tmp_path / 'a.npy')])
+    assert res.exit_code == 0, res.output
+    res = runner.invoke(cli, ['--stream'] + chain + [str(tmp_path / 'b.npy')])
+    assert res.exit_code == 0, res.output
+    a = np.load(tmp_path / 'a.npy')
+    b = np.load(tmp_path / 'b.npy')
+    assert np.array_equal(a.shape, (3, 16))
+    assert np.array_equal(a, b)
+  #end
+
+  def test_jobs(self, tmp_path):
+    files = self._frames(tmp_path, 4)
+    chain = [files, 'interp', '-b', 'ms', '-p', '1', 'sel', '--z1', '0',
+             'collect', 'write', '-f']
+    runner = CliRunner()
+    res = runner.invoke(cli, chain + [str(tmp_path / 'a.npy')])
+    assert res.exit_code == 0, res.output
+    res = runner.invoke(cli, ['--jobs', '2'] + chain + [str(tmp_path / 'b.npy')])
+    assert res.exit_code == 0, res.output
+    a = np.load(tmp_path / 'a.npy')
+    b = np.load(tmp_path / 'b.npy')
+    assert np.array_equal(a.shape, (4, 16))
+    assert np.array_equal(a, b)
+    # Two loads; the datasets are ordered load by load
+    files = self._loads(tmp_path)
+    fn = str(tmp_path / 'ev.npy')
+    res = runner.invoke(cli, ['--jobs', '2'] + files + ['ev', 'f[1] f[2] -',
+                                                       'write', '-f', fn])
+    assert res.exit_code == 0, res.output
+    assert np.all(np.load(fn) == -8)
+    res = runner.invoke(cli, ['--jobs', '2'] + files + [
+      'sel', '--z0', '0', 'collect', 'write', '-f', fn])
+    assert res.exit_code == 0, res.output
+    assert np.array_equal(np.load(fn)[:, 0, 0], [1, 2, 10, 20])
+  #end
+
+  @pytest.mark.skipif(not os.path.isdir('/dev/shm'),
+                      reason='Shared memory blocks are not listed')
+  def test_jobs_shm(self):
+    def task(item):
+      if item == 5:
+        raise click.ClickException('failed')
+      #end
+      return [np.full(10, item)]
+    #end
+    blocks = set(os.listdir('/dev/shm'))
+    out = [arrs[0] for arrs in parallel.imap(task, range(4), 2, arrays=True)]
+    # The arrays view the shared memory instead of being copied
+    assert isinstance(out[1].base, parallel._Block)
+    assert np.array_equal(out[3], np.full(10, 3))
+    # The blocks returned before the error are released as well
+    with pytest.raises(click.ClickException):
+      for _ in parallel.imap(task, range(20), 2, arrays=True):
+        pass
+      #end
+    #end
+    assert set(os.listdir('/dev/shm')) <= blocks
+  #end
+
+  def test_collect(self, tmp_path):
+    files = self._frames(tmp_path, 5)
+    runner = CliRunner()
+    for opts in (['-c', '2'], ['-s'], ['-m']):
+      out = []
+      for mode in ([], ['--stream']):
+        chain = mode + [files, 'interp', '-b', 'ms', '-p', '1', 'collect'] \
+          + opts + ['write', '-f', str(tmp_path / 'out.npy')]
+        res = runner.invoke(cli, chain)
+        assert res.exit_code == 0, res.output
+        out.append([np.load(fn) for fn in sorted(tmp_path.glob('out*.npy'))])
+        for fn in tmp_path.glob('out*.npy'):
+          fn.unlink()
+        #end
+      #end
+      assert len(out[0]) == len(out[1])
+      for a, b in zip(*out):
+        assert np.array_equal(a, b)
+      #end
+    #end
+    assert np.array_equal(out[0][0].shape, (5, 16, 16))
+
+    # Sorting by time in place; the array grows past the estimate
+    coll = Collector(2)
+    for t in (3.0, 1.0, 4.0, 2.0):
+      dat = GData()
+      dat.push([np.linspace(0, 1, 3)], np.full((2, 1), t))
+      coll.add(dat, t)
+    #end
+    time, grid, values = coll.finish()
+    assert np.array_equal(time, [1.0, 2.0, 3.0, 4.0])
+    assert np.array_equal(values[:, 0, 0], time)
+  #end
+
+  def test_stream_write(self, tmp_path):
+    files = self._frames(tmp_path, 2)
+    res = CliRunner().invoke(cli, ['--stream', files, 'sel', '--z0', '0',
+                                   'write', '-f', str(tmp_path / 'w.npy')])
+    assert res.exit_code == 0, res.output
+    assert os.path.isfile(tmp_path / 'w_0.npy')
+    assert os.path.isfile(tmp_path / 'w_1.npy')
+  #end
+
+  def test_stream_ev(self, tmp_path):
+    from postgkyl.commands.ev import _frameLocal
+    assert _frameLocal('f 2 * sqrt')
+    assert _frameLocal('f[:][0] f[:][1] +')
+    assert not _frameLocal('f[1] f[0] -')
+    assert not _frameLocal('a b +')
+    file_name = '{:s}/test_data/shock-f-ser-p1.gkyl'.format(self.dir_path)
+    for i in range(3):
+      dat = GData(file_name)
+      dat.push(dat.get_grid(), (i+1)*dat.get_values())
+      dat.write(str(tmp_path / 'frame_{:d}.gkyl'.format(i)))
+    #end
+    files = str(tmp_path / 'frame_*.gkyl')
+    runner = CliRunner()
+    values = GData(file_name).get_values()
+    for chain, scale in ((['ev', 'f[1] f[0] -'], 1),
+                         (['ev', 'f 2 *', 'ev', 'f[2] f[0] -'], 4)):
+      out = []
+      for mode in ([], ['--stream'], ['--jobs', '2']):
+        fn = tmp_path / 'ev.npy'
+        res = runner.invoke(cli, mode + [files] + chain
+                            + ['write', '-f', str(fn)])
+        assert res.exit_code == 0, res.output
+        assert 'ERROR' not in res.output
+        out.append(np.load(fn))
+        fn.unlink()
+      #end
+      assert np.array_equal(out[0], out[1])
+      assert np.array_equal(out[0], out[2])
+      assert np.allclose(out[0], scale*values)
+    #end
+  #end
+
+  def test_stream_loads(self, tmp_path):
+    # The datasets are ordered load by load as in a regular execution
+    files = self._loads(tmp_path)
+    runner = CliRunner()
+    info = []
+    for mode in ([], ['--stream']):
+      res = runner.invoke(cli, mode + files + ['info', '-c'])
+      assert res.exit_code == 0, res.output
+      info.append(res.output)
+      fn = str(tmp_path / 'ev.npy')
+      res = runner.invoke(cli, mode + files + ['ev', 'f[1] f[2] -',
+                                               'write', '-f', fn])
+      assert res.exit_code == 0, res.output
+      assert np.all(np.load(fn) == -8)
+      res = runner.invoke(cli, mode + files + ['sel', '--z0', '0', 'write',
+                                               '-f', str(tmp_path / 'w.npy')])
+      assert res.exit_code == 0, res.output
+      for i, value in enumerate((1, 2, 10, 20)):
+        assert np.all(np.load(tmp_path / 'w_{:d}.npy'.format(i)) == value)
+      #end
+    #end
+    lines = info[0].split('\n')
+    for i, label in enumerate(('a_0', 'a_1', 'b_0', 'b_1')):
+      assert lines[i].endswith('{:s} (default#{:d})'.format(label, i))
+    #end
+    assert info[0] == info[1]
+  #end
+
+  def test_cache(self, tmp_path, monkeypatch):
+    monkeypatch.setenv('POSTGKYL_CACHE_DIR', str(tmp_path / 'cache'))
+    files = self._frames(tmp_path, 2)
+    chain = ['-v', '--cache', files, 'interp', '-b', 'ms', '-p', '1',
+             'integrate', '0', 'collect', 'write', '-f']
+    runner = CliRunner()
+    res = runner.invoke(cli, chain + [str(tmp_path / 'a.npy')])
+    assert res.exit_code == 0, res.output
+    assert 'Stored the results of collect' in res.output
+    res = runner.invoke(cli, chain + [str(tmp_path / 'b.npy')])
+    assert res.exit_code == 0, res.output
+    assert 'Restored the first 4 commands' in res.output
+    a = np.load(tmp_path / 'a.npy')
+    b = np.load(tmp_path / 'b.npy')
+    assert np.array_equal(a, b)
+
+    res = runner.invoke(cli, ['cache', 'clear'])
+    assert res.exit_code == 0, res.output
+    assert not os.path.exists(tmp_path / 'cache' / 'results')
+  #end
+
+  def test_profile(self, tmp_path):
+    files = self._frames(tmp_path, 2)
+    trace = str(tmp_path / 'trace.json')
+    res = CliRunner().invoke(cli, ['--profile-output', trace, files,
+                                   'interp', '-b', 'ms', '-p', '1'])
+    assert res.exit_code == 0, res.output
+    assert 'interpolate' in res.output
+    with open(trace) as fh:
+      events = json.load(fh)['traceEvents']
+    #end
+    assert [e['name'] for e in events] == ['load', 'interpolate']
+    assert events[1]['args']['datasets'] == 2
+  #end
+
+  def test_pushdown(self, tmp_path, monkeypatch):
+    file_name = '{:s}/test_data/shock-f-ser-p1.gkyl'.format(self.dir_path)
+    chain = [file_name, 'select', '--z0', '3', '--z1', '0.5:3.0', '-c',
+             '0,2', 'info', 'write', '-f']
+    runner = CliRunner()
+    res = runner.invoke(cli, ['-v'] + chain + [str(tmp_path / 'a.npy')])
+    assert res.exit_code == 0, res.output
+    assert 'Pushing select down' in res.output
+    assert 'Starting select' not in res.output
+    info = runner.invoke(cli, chain + [str(tmp_path / 'a.npy')]).output
+    # Reference with the regular 'select'
+    monkeypatch.setattr(pgkyl, '_pushdown', lambda ctx, chain, notes: chain)
+    ref = runner.invoke(cli, chain + [str(tmp_path / 'b.npy')])
+    assert ref.exit_code == 0, ref.output
+    assert info == ref.output
+    a = np.load(tmp_path / 'a.npy')
+    b = np.load(tmp_path / 'b.npy')
+    assert np.array_equal(a, b)
+    # Not pushed into a load which already has a cut
+    res = runner.invoke(cli, ['-v', '--z0', '1', file_name, 'select',
+                              '--z0', '0', 'info'])
+    assert res.exit_code == 0, res.output
+    assert 'Starting select' in res.output
+  #end
+
+  def test_plan(self, tmp_path):
+    file_name = '{:s}/test_data/shock-f-ser-p1.gkyl'.format(self.dir_path)
+    chains = (['ev', 'f[0] 2 *', 'ev', 'f[0] abs sqrt', 'select', '--z1',
+               '1:5', 'ev', 'f[0] 1 +'],
+              ['interp', '-b', 'ms', '-p', '1', 'select', '--z0', '0.8',
+               '--z1', '2.0:4.0', '-c', '0,2'],
+              ['interp', '-b', 'ms', '-p', '1', 'integrate', '1'])
+    runner = CliRunner()
+    res = runner.invoke(cli, ['--explain', file_name] + chains[0])
+    assert res.exit_code == 0, res.output
+    lines = res.output.splitlines()
+    assert lines[1].endswith('--z1 1:5')
+    assert "ev 'f[0] 2 * abs sqrt 1 +'" in lines[3]
+    assert len(lines) == 6
+    res = runner.invoke(cli, ['--explain', file_name] + chains[1])
+    assert res.exit_code == 0, res.output
+    assert 'interpolate --basis_type ms --poly_order 1 | select' in res.output
+    for chain in chains:
+      out = [str(tmp_path / 'a.npy'), str(tmp_path / 'b.npy')]
+      res = runner.invoke(cli, [file_name] + chain + ['write', '-f', out[0]])
+      assert res.exit_code == 0, res.output
+      res = runner.invoke(cli, ['--plan', file_name] + chain
+                          + ['write', '-f', out[1]])
+      assert res.exit_code == 0, res.output
+      a, b = np.load(out[0]), np.load(out[1])
+      assert a.shape == b.shape
+      np.testing.assert_allclose(a, b, rtol=1e-12, atol=1e-14)
+    #end
+  #end
+
+  def test_animate(self, tmp_path):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.image as mpimg
+    file_name = '{:s}/test_data/shock-f-ser-p1.gkyl'.format(self.dir_path)
+    rng = np.random.default_rng(0)
+    for i in range(3):
+      dat = GData(file_name)
+      values = dat.get_values()
+      dat.push(dat.get_grid(), (i+1)*values + rng.random(values.shape))
+      dat.write(str(tmp_path / 'frame_{:d}.gkyl'.format(i)))
+    #end
+    files = str(tmp_path / 'frame_*.gkyl')
+    chains = (['interp', '-b', 'ms', '-p', '1', 'animate'],
+              ['interp', '-b', 'ms', '-p', '1', 'animate', '--float', '-d'],
+              ['interp', '-b', 'ms', '-p', '1', 'sel', '--z1', '0.',
+               'animate', '--float'])
+    runner = CliRunner()
+    for chain in chains:
+      for mode in ('a', 'b'):
+        opts = ['--redraw'] if mode == 'b' else []
+        res = runner.invoke(cli, [files] + chain + opts + [
+          '--saveframes', str(tmp_path / mode), '--no-show'])
+        assert res.exit_code == 0, res.output
+      #end
+      for i in range(3):
+        a = mpimg.imread(str(tmp_path / 'a_{:d}.png'.format(i)))
+        b = mpimg.imread(str(tmp_path / 'b_{:d}.png'.format(i)))
+        assert np.array_equal(a, b)
+      #end
+    #end
+  #end
+
+  def test_animate_jobs(self, tmp_path, monkeypatch):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.image as mpimg
+    # Stand-in for ffmpeg which stores the piped raw frames
+    ffmpeg = tmp_path / 'ffmpeg'
+    ffmpeg.write_text('#!/bin/sh\nfor last; do :; done\ncat > "$last"\n')
+    ffmpeg.chmod(0o755)
+    monkeypatch.setitem(matplotlib.rcParams, 'animation.ffmpeg_path',
+                        str(ffmpeg))
+    files = self._frames(tmp_path, 5)
+    chain = [files, 'interp', '-b', 'ms', '-p', '1', 'animate', '--no-show']
+    runner = CliRunner()
+    for jobs in ('1', '2'):
+      movie = str(tmp_path / 'anim_{:s}.mp4'.format(jobs))
+      res = runner.invoke(cli, chain + ['-j', jobs, '--saveas', movie])
+      assert res.exit_code == 0, res.output
+      frames = str(tmp_path / 'frame_{:s}'.format(jobs))
+      res = runner.invoke(cli, chain + ['-j', jobs, '--saveframes', frames])
+      assert res.exit_code == 0, res.output
+    #end
+    a = (tmp_path / 'anim_1.mp4').read_bytes()
+    b = (tmp_path / 'anim_2.mp4').read_bytes()
+    assert len(a) == 5*640*480*4
+    assert a == b
+    for i in range(5):
+      a = mpimg.imread(str(tmp_path / 'frame_1_{:d}.png'.format(i)))
+      b = mpimg.imread(str(tmp_path / 'frame_2_{:d}.png'.format(i)))
+      assert np.array_equal(a, b)
+    #end
+  #end
+
+  def test_interpolate_at(self, tmp_path):
+    file_name = '{:s}/test_data/twostream-f-p2.gkyl'.format(self.dir_path)
+    runner = CliRunner()
+    out = [str(tmp_path / 'a.npy'), str(tmp_path / 'b.npy')]
+    # The center of the last cell is the middle node of its three
+    res = runner.invoke(cli, [file_name, 'interp', 'sel', '--z1', '94',
+                              'write', '-f', out[0]])
+    assert res.exit_code == 0, res.output
+    # Negative indices count from the last cell
+    res = runner.invoke(cli, [file_name, 'interp', '--at', '--z1', '-1',
+                              'write', '-f', out[1]])
+    assert res.exit_code == 0, res.output
+    a, b = np.load(out[0]), np.load(out[1])
+    assert a.shape == b.shape
+    np.testing.assert_allclose(a, b, atol=1e-14)
+    for z in ('32', '-33', '10.0'):
+      res = runner.invoke(cli, [file_name, 'interp', '--at', '--z1', z])
+      assert res.exit_code != 0
+      assert 'ERROR in interpolate' in res.output
+    #end
+    res = runner.invoke(cli, [file_name, 'li'])
+    assert res.exit_code == 0, res.output
+  #end
+#end
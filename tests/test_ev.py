@@ -0,0 +1,119 @@
+import importlib
+import os
+import numpy as np
+import pytest
+
+from click.testing import CliRunner
+
+import postgkyl as pg
+from postgkyl.pgkyl import cli
+
+# The module, not the command exported by postgkyl.commands
+ev = importlib.import_module('postgkyl.commands.ev')
+
+
+class TestEv:
+  dir_path = os.path.dirname(__file__)
+  file_name = '{:s}/test_data/twostream-f-p2.gkyl'.format(dir_path)
+
+  def _ev(self, tmp_path, chain):
+    out = str(tmp_path / 'out.npy')
+    res = CliRunner().invoke(cli, [self.file_name, 'ev', chain,
+                                   'write', '-f', out])
+    assert res.exit_code == 0, res.output
+    return np.load(out)
+  #end
+
+  @pytest.mark.parametrize('engine', ['numexpr', 'numpy'])
+  def test_fused(self, tmp_path, monkeypatch, engine):
+    if engine == 'numpy':
+      monkeypatch.setattr(ev, 'numexpr', None)
+      monkeypatch.setattr(ev, '_blockSize', 100) # Multiple blocks
+    #end
+    f = pg.GData(self.file_name).get_values()
+    values = self._ev(tmp_path, 'f[0][0] f[0][1] * 2 + sqrt f[0][0] / abs')
+    expected = np.abs(np.sqrt(f[..., 0]*f[..., 1] + 2)/f[..., 0])
+    np.testing.assert_allclose(values, expected, rtol=1e-12)
+    # Element-wise subtree under a reduction
+    values = self._ev(tmp_path, 'f[0] f[0] * 1 int sqrt')
+    expected = np.sqrt(self._ev(tmp_path, 'f[0] sq 1 int'))
+    np.testing.assert_allclose(values, expected, rtol=1e-12)
+  #end
+
+  def test_compile(self):
+    trees, refs = ev._compile('f[0] f[1] - 2 pow sqrt', ())
+    assert len(trees) == 1
+    assert refs == ('f[0]', 'f[1]')
+    assert trees[0].kind == 'ufunc'
+    assert [leaf.token for leaf in trees[0].leaves] == ['f[0]', 'f[1]', '2']
+    assert trees[0].expr == 'sqrt(((v0 - v1) ** v2))'
+    # The plan is reused
+    assert ev._compile('f[0] f[1] - 2 pow sqrt', ())[0] is trees
+    with pytest.raises(ValueError):
+      ev._compile('f[0] bar', ())
+    #end
+    with pytest.raises(ValueError):
+      ev._compile('f[0] +', ())
+    #end
+  #end
+
+  def test_cse(self, tmp_path, monkeypatch):
+    chain = 'f[0][1] f[0][0] / f[0][2] f[0][0] / * f[0][1] f[0][0] / +'
+    trees, refs = ev._compile(chain, ())
+    assert refs == ('f[0][1]', 'f[0][0]', 'f[0][2]')
+    # 'f[0][1] f[0][0] /' is evaluated once and enters the sum twice
+    assert trees[0].expr == '((v0 * (v1 / v2)) + v0)'
+    assert trees[0].leaves[0].isRoot()
+
+    calls = []
+    def pselect(dat, comp=None):
+      calls.append(comp)
+      return select(dat, comp=comp)
+    #end
+    select = ev.pselect
+    monkeypatch.setattr(ev, 'pselect', pselect)
+    values = self._ev(tmp_path, chain)
+    assert calls == ['1', '0', '2']
+    f = pg.GData(self.file_name).get_values()
+    expected = f[..., 1]/f[..., 0]*(f[..., 2]/f[..., 0] + 1)
+    np.testing.assert_allclose(values, expected, rtol=1e-12)
+  #end
+
+  def test_select_view(self):
+    dat = pg.GData(self.file_name)
+    _, values = pg.data.select(dat, comp='0,2,4')
+    assert np.shares_memory(values, dat.get_values())
+    np.testing.assert_array_equal(values, dat.get_values()[..., [0, 2, 4]])
+  #end
+
+  def test_batch(self, tmp_path, monkeypatch):
+    files = [self.file_name]*3
+    chain = ['ev', 'f[:][0] f[:][1] * f[:][2] + abs sqrt',
+             'collect', 'write', '-f']
+    runner = CliRunner()
+    res = runner.invoke(cli, files + chain + [str(tmp_path / 'a.npy')])
+    assert res.exit_code == 0, res.output
+    # Per-dataset evaluation in threads
+    monkeypatch.setattr(ev, '_batchable', lambda *args: False)
+    monkeypatch.setattr(ev, '_numThreads', 2)
+    res = runner.invoke(cli, files + chain + [str(tmp_path / 'b.npy')])
+    assert res.exit_code == 0, res.output
+    a = np.load(tmp_path / 'a.npy')
+    b = np.load(tmp_path / 'b.npy')
+    assert a.shape[0] == 3
+    np.testing.assert_array_equal(a, b)
+  #end
+
+  def test_out_tag(self):
+    # The result is tagged with the last dataset of the chain
+    runner = CliRunner()
+    for chain, tag in (('a b + a *', 'a'), ('a b a + +', 'a'),
+                       ('b a + b *', 'b'), ('a b +', 'b')):
+      res = runner.invoke(cli, [self.file_name, '-t', 'a',
+                                self.file_name, '-t', 'b',
+                                'ev', chain, 'info', '-c'])
+      assert res.exit_code == 0, res.output
+      assert '({:s}#'.format(tag) in res.output
+    #end
+  #end
+#end
@@ -0,0 +1,54 @@
+import subprocess
+import sys
+
+import click
+from click.testing import CliRunner
+
+import postgkyl.commands as cmd
+from postgkyl.pgkyl import cli
+
+# Code run in a fresh interpreter to measure the start of 'pgkyl'
+_script = """
+import sys, time
+start = time.perf_counter()
+import postgkyl.pgkyl
+elapsed = time.perf_counter() - start
+heavy = [m for m in ('matplotlib', 'scipy', 'sympy', 'tables', 'adios2')
+         if m in sys.modules]
+print(elapsed, ','.join(heavy))
+"""
+
+
+class TestImport:
+  # Generous budget; the eager imports used to take several seconds
+  budget = 1.5
+
+  def test_import_time(self):
+    out = subprocess.run([sys.executable, '-c', _script], check=True,
+                         capture_output=True, text=True).stdout.split()
+    assert len(out) == 1, 'heavy modules imported: {:s}'.format(out[-1])
+    assert float(out[0]) < self.budget
+  #end
+
+  def test_commands(self):
+    ctx = click.Context(cli, obj={})
+    names = cli.list_commands(ctx)
+    assert names == cmd.list_commands()
+    for name in names:
+      assert cli.get_command(ctx, name).name == name
+    #end
+    # Abbreviations of the lazily loaded commands
+    assert cli.get_command(ctx, 'interp').name == 'interpolate'
+    assert cmd.plot is cmd.get_command('plot')
+  #end
+
+  def test_help(self):
+    for name in cmd.list_commands():
+      command = cmd.get_command(name)
+      assert command.help and command.help.strip(), name
+    #end
+    res = CliRunner().invoke(cli, ['animate', '--help'])
+    assert res.exit_code == 0, res.output
+    assert 'Animate the actively loaded dataset' in res.output
+  #end
+#end
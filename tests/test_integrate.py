@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+import postgkyl as pg
+from postgkyl.tools import calculus
+
+
+class TestIntegrate:
+  def _data(self, shape, nodal=True):
+    rng = np.random.default_rng(0)
+    grid = [np.sort(rng.random(n+1 if nodal else n)) for n in shape[:-1]]
+    dat = pg.GData()
+    dat.push(grid, rng.random(shape))
+    return dat
+  #end
+
+  @pytest.mark.parametrize('nodal', [True, False])
+  def test_axes(self, nodal, monkeypatch):
+    dat = self._data((6, 5, 4, 3, 3, 2, 2), nodal)
+    grid, values = dat.get_grid(), dat.get_values()
+    # Reference: one axis at a time
+    expected = values
+    for ax in (5, 4, 3):
+      dz = np.diff(grid[ax])
+      if not nodal:
+        dz = np.append(dz, dz[-1])
+      #end
+      expected = np.moveaxis(np.dot(np.moveaxis(expected, ax, -1), dz), -1, ax)
+      expected = np.expand_dims(expected, ax)
+    #end
+    expected = expected.reshape(6, 5, 4, 1, 1, 1, 2)
+    _, out = pg.tools.integrate(dat, '3,4,5')
+    np.testing.assert_allclose(out, expected, rtol=1e-12)
+    # Blocked along the first axis, integrated or not
+    monkeypatch.setattr(calculus, '_blockSize', 50)
+    _, out = pg.tools.integrate(dat, '3,4,5')
+    np.testing.assert_allclose(out, expected, rtol=1e-12)
+    _, out = pg.tools.integrate(dat, '0:3')
+    _, ref = pg.tools.integrate(self._data((6, 5, 4, 3, 3, 2, 2), nodal),
+                                (0, 1, 2))
+    np.testing.assert_allclose(out, ref, rtol=1e-12)
+  #end
+
+  def test_mapped(self):
+    # Quarter of an annulus in the polar coordinates
+    r = np.linspace(1.0, 2.0, 41)
+    theta = np.linspace(0.0, 0.5*np.pi, 61)
+    r, theta = np.meshgrid(r, theta, indexing='ij')
+    dat = pg.GData()
+    dat.push([r*np.cos(theta), r*np.sin(theta)], np.ones((40, 60, 1)))
+    _, values = pg.tools.integrate(dat, None)
+    np.testing.assert_allclose(values.ravel(), 0.75*np.pi, rtol=1e-3)
+  #end
+#end
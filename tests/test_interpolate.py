@@ -46,4 +46,126 @@ class TestGkylInterpolate:
     grid, values = dg.interpolate()
     assert np.array_equal(values.shape, (16, 16, 1))
   #end
+
+  def test_ser_p2_chunked(self):
+    data = pg.GData('{:s}/test_data/twostream-f-p2.gkyl'.format(self.dir_path))
+    _, values = pg.GInterpModal(data).interpolate()
+    dg = pg.GInterpModal(data, max_memory=1)  # one cell per slab
+    out = np.zeros(dg.getInterpShape())
+    _, values_chunked = dg.interpolate(out=out)
+    assert values_chunked is out
+    np.testing.assert_allclose(values_chunked, values, atol=1e-14)
+  #end
+
+  def test_ser_p2_threaded(self):
+    data = pg.GData('{:s}/test_data/twostream-f-p2.gkyl'.format(self.dir_path))
+    _, values = pg.GInterpModal(data).interpolate()
+    _, values_threaded = pg.GInterpModal(data, workers=4).interpolate()
+    assert np.array_equal(values_threaded, values)
+  #end
+
+  def test_ser_p2_evaluate(self):
+    data = pg.GData('{:s}/test_data/twostream-f-p2.gkyl'.format(self.dir_path))
+    dg = pg.GInterpModal(data)
+    grid, values = dg.interpolate()
+    # evaluate at the nodes of the interpolation mesh
+    xc = [0.5*(g[1:] + g[:-1]) for g in grid]
+    x, y = np.meshgrid(xc[0], xc[1][[3, 50]], indexing='ij')
+    points = np.stack([x.ravel(), y.ravel()], axis=-1)
+    lineouts = dg.evaluate(points).reshape(x.shape)
+    np.testing.assert_allclose(lineouts, values[:, [3, 50], 0], atol=1e-14)
+    # Points outside of the grid
+    outside = dg.evaluate([[-10.0, 0.0], [0.0, 0.0], [0.0, 10.0]])
+    assert np.isnan(outside[[0, 2]]).all()
+    assert np.isfinite(outside[1]).all()
+  #end
+
+  def test_ser_p2_gradient(self):
+    data = pg.GData('{:s}/test_data/twostream-f-p2.gkyl'.format(self.dir_path))
+    dg = pg.GInterpModal(data)
+    _, grad = dg.differentiate()
+    for d in range(2):
+      _, deriv = dg.differentiate(d)
+      np.testing.assert_allclose(grad[..., d], deriv[..., 0], atol=1e-13)
+    #end
+  #end
+
+  def test_ser_p2_moments(self):
+    data = pg.GData('{:s}/test_data/twostream-f-p2.gkyl'.format(self.dir_path))
+    dg = pg.GInterpModal(data)
+    _, total = dg.integrate()
+    grid, moms = dg.moments(1)
+    assert np.array_equal(moms.shape, (64, 9))
+    # The cell averages of the density integrate to the total number
+    dx = grid[0][1]-grid[0][0]
+    np.testing.assert_allclose(np.sum(moms[:, 0])*dx/np.sqrt(2), total.ravel()[0])
+    # Density agrees with the trapezoid rule on the interpolated data
+    igrid, values = dg.interpolate()
+    _, m0 = pg.GInterpModal(pg.GData().push(grid, moms[:, :3]), 2, 'ms').interpolate()
+    dv = igrid[1][1]-igrid[1][0]
+    np.testing.assert_allclose(m0[:, 0], np.sum(values[..., 0], axis=1)*dv, rtol=1e-3)
+  #end
+
+  def test_ser_p2_cell_average(self):
+    data = pg.GData('{:s}/test_data/twostream-f-p2.gkyl'.format(self.dir_path))
+    dg = pg.GInterpModal(data)
+    grid, values = dg.cell_average()
+    assert np.array_equal(values.shape, (64, 32, 1))
+    assert np.array_equal(grid[0], data.get_grid()[0])
+    _, raw = dg.cell_average(scale=False)
+    assert np.shares_memory(raw, data.get_values())
+    _, total = dg.integrate(average=True)
+    np.testing.assert_allclose(values.mean(), total.ravel()[0])
+  #end
+
+  def test_ser_p2_numeric_engine(self):
+    data = pg.GData('{:s}/test_data/twostream-f-p2.gkyl'.format(self.dir_path))
+    _, values = pg.GInterpModal(data, numInterp=4).interpolate()
+    dg = pg.GInterpModal(data, numInterp=4, engine='numeric')
+    _, numeric = dg.interpolate()
+    np.testing.assert_allclose(numeric, values, atol=1e-14)
+    _, kernels = pg.modalDG.interpolate(data, nodes=4, overwrite=False)
+    np.testing.assert_allclose(kernels, values, atol=1e-14)
+  #end
+
+  def test_ten_p1_recovery(self):
+    data = pg.GData('{:s}/test_data/shock-f-ten-p1.gkyl'.format(self.dir_path))
+    dg = pg.GInterpModal(data, poly_order=1, basis_type='mt')
+    grid, values = dg.recovery()
+    assert np.array_equal(values.shape, (16, 16, 1))
+    # Recovery in 2D is the tensor product of the 1D recoveries, so
+    # constant data stay constant
+    const = pg.GData()
+    const.push(data.get_grid(), np.zeros(data.get_values().shape))
+    const.get_values()[..., 0] = 2.0
+    _, values = pg.GInterpModal(const, 1, 'mt').recovery(c1=True)
+    np.testing.assert_allclose(values, 1.0, rtol=1e-12)
+  #end
+
+  def test_ser_p2_xform_store(self, tmp_path, monkeypatch):
+    from postgkyl.data import xform_store
+    monkeypatch.setenv('POSTGKYL_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(xform_store, '_files', {})
+    data = pg.GData('{:s}/test_data/twostream-f-p2.gkyl'.format(self.dir_path))
+    _, values = pg.GInterpModal(data).interpolate()
+    # The modal serendipity matrices are not shipped; they are generated
+    # and persisted on the first use
+    _, stored = pg.GInterpModal(data, read=True).interpolate()
+    np.testing.assert_allclose(stored, values, atol=1e-14)
+    assert os.path.isfile(tmp_path / 'xformMatricesModalSerendipity.h5')
+    mat = xform_store.loadXformMatrix(2, 2, 'serendipity')
+    assert mat is xform_store.loadXformMatrix(2, 2, 'serendipity')
+  #end
+
+  def test_mapped_mesh(self):
+    from postgkyl.data.dg import _make1Dgrids
+    x, y = np.meshgrid(np.linspace(0, 1, 5), np.linspace(0, 2, 4),
+                       indexing='ij')
+    # Bilinear maps are refined exactly
+    grid = _make1Dgrids([3, 2], [x+x*y, y-x*y], 2, 'mapped')
+    x, y = np.meshgrid(np.linspace(0, 1, 13), np.linspace(0, 2, 7),
+                       indexing='ij')
+    np.testing.assert_allclose(grid[0], x+x*y, atol=1e-14)
+    np.testing.assert_allclose(grid[1], y-x*y, atol=1e-14)
+  #end
 #end
@@ -38,6 +38,23 @@ class TestGkyl:
     data = pg.GData('{:s}/test_data/hll-euler.gkyl'.format(self.dir_path))
     assert data.ctx['frame'] == 1
   #end
+
+  def test_gkyl_partial(self):  # Partial load matches 'select'
+    for name in ('shock-f-ser-p1', 'hll-euler', 'twostream-field-energy'):
+      file_name = '{:s}/test_data/{:s}.gkyl'.format(self.dir_path, name)
+      full = pg.GData(file_name)
+      for kwargs in ({'z0': 3}, {'z0': '2:5', 'comp': '1,3'},
+                     {'z0': '0.5', 'comp': 0}):
+        data = pg.GData(file_name, **kwargs)
+        grid, values = pg.data.select(full, **kwargs)
+        assert np.array_equal(data.get_values(), values)
+        for g0, g1 in zip(data.get_grid(), grid):
+          assert np.array_equal(g0, g1)
+        #end
+        assert np.array_equal(data.get_num_cells(), values.shape[:-1])
+      #end
+    #end
+  #end
 #end
 
 